@@ -6,19 +6,14 @@
  */
 import request from 'supertest';
 import express, { RequestHandler } from 'express';
-import { execFile } from 'child_process';
 import router from 'chaire-lib-backend/lib/api/admin.routes';
 import '../admin.routes';
 
-jest.mock('child_process', () => {
-    const execFileMock = jest.fn();
-    const util = jest.requireActual<typeof import('util')>('util');
-    // Mimic Node's execFile promisification behavior ({ stdout, stderr }).
-    // The route uses `promisify(execFile)`, so we need the mock to expose the same custom promisify hook.
-    (execFileMock as unknown as { [key: symbol]: unknown })[util.promisify.custom] = (file, args, options) =>
-        Promise.resolve(execFileMock(file, args, options));
-    return { execFile: execFileMock };
-});
+// Mock the generator worker, the route sends it one check request per upload.
+const mockWorkerRequest = jest.fn();
+jest.mock('../../services/generator/generatorWorker', () => ({
+    getGeneratorWorker: jest.fn().mockImplementation(() => ({ request: mockWorkerRequest }))
+}));
 
 // Mock authorization middleware so the route is reachable.
 jest.mock('chaire-lib-backend/lib/services/auth/authorization', () => ({
@@ -27,10 +22,6 @@ jest.mock('chaire-lib-backend/lib/services/auth/authorization', () => ({
     isAdmin: jest.fn().mockReturnValue(jest.fn().mockImplementation((_req, _res, next) => next()))
 }));
 
-const execFileMock = execFile as jest.MockedFunction<typeof execFile>;
-
-
-
 let app: express.Application;
 
 beforeAll(() => {
@@ -41,7 +32,7 @@ beforeAll(() => {
 
 describe('/generator/verify route', () => {
     beforeEach(() => {
-        execFileMock.mockReset();
+        mockWorkerRequest.mockReset();
     });
 
     it('Should return 400 when no file is uploaded', async () => {
@@ -55,10 +46,7 @@ describe('/generator/verify route', () => {
     });
 
     it('Should return 200 when Excel integrity check passes', async () => {
-        const stdout = JSON.stringify({ ok: true, integrityOk: true, errors: [] });
-        const stderr = '';
-
-        execFileMock.mockReturnValueOnce({ stdout, stderr } as unknown as ReturnType<typeof execFile>);
+        mockWorkerRequest.mockResolvedValueOnce({ id: 1, ok: true, integrityOk: true, errors: [] });
 
         const response = await request(app)
             .post('/api/admin/generator/verify')
@@ -78,13 +66,15 @@ describe('/generator/verify route', () => {
                 integrityOk: true
             }
         });
+        expect(mockWorkerRequest).toHaveBeenCalledWith({
+            command: 'check',
+            excelFilePath: expect.stringMatching(/\.xlsx$/)
+        });
     });
 
     it('Should return 200 with integrityOk false when Excel integrity check fails', async () => {
         const errors = ['Missing required sheet', 'Invalid data'];
-        const stdout = JSON.stringify({ ok: true, integrityOk: false, errors });
-
-        execFileMock.mockReturnValueOnce({ stdout, stderr: '' } as unknown as ReturnType<typeof execFile>);
+        mockWorkerRequest.mockResolvedValueOnce({ id: 1, ok: true, integrityOk: false, errors });
 
         const response = await request(app)
             .post('/api/admin/generator/verify')
@@ -107,8 +97,8 @@ describe('/generator/verify route', () => {
         });
     });
 
-    it('Should return 500 when Excel integrity check produces no output', async () => {
-        execFileMock.mockReturnValueOnce({ stdout: '', stderr: '' } as unknown as ReturnType<typeof execFile>);
+    it('Should return 500 when the Excel integrity check raises an error', async () => {
+        mockWorkerRequest.mockResolvedValueOnce({ id: 1, ok: false, error: 'File is not a zip file' });
 
         const response = await request(app)
             .post('/api/admin/generator/verify')
@@ -124,14 +114,12 @@ describe('/generator/verify route', () => {
         expect(response.status).toBe(500);
         expect(response.body).toMatchObject({
             status: 'error',
-            error: 'Excel integrity check produced no output'
+            error: 'Excel integrity check failed: File is not a zip file'
         });
     });
 
-    it('Should return 500 when child process execution fails', async () => {
-        execFileMock.mockImplementationOnce(() => {
-            throw new Error('boom');
-        });
+    it('Should return 500 when the generator worker fails', async () => {
+        mockWorkerRequest.mockRejectedValueOnce(new Error('boom'));
 
         const response = await request(app)
             .post('/api/admin/generator/verify')
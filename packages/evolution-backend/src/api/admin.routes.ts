@@ -10,11 +10,10 @@ import multer from 'multer';
 import os from 'os';
 import path from 'path';
 import { Response, Request } from 'express';
-import { execFile } from 'child_process';
-import { promisify } from 'util';
 import router from 'chaire-lib-backend/lib/api/admin.routes';
 import { addExportRoutes } from './admin/exports.routes';
 import { RespondentBehaviorService } from '../services/paradata/respondentBehavior';
+import { getGeneratorWorker } from '../services/generator/generatorWorker';
 import * as Status from 'chaire-lib-common/lib/utils/Status';
 import {
     getStartedInterviewsCount,
@@ -25,7 +24,6 @@ import {
 } from '../models/monitoring.db.queries';
 
 addExportRoutes();
-const execFileAsync = promisify(execFile);
 
 /** Subfolder under OS temp dir for generator Excel uploads; cleaned per request after processing. */
 const GENERATOR_UPLOAD_SUBDIR = 'evolution-generator-temp';
@@ -138,7 +136,7 @@ router.all('/data/widgets/:widget/', (req: Request, res: Response, _next) => {
     }
 });
 
-// POST /generator/verify — multipart upload (multer field: generatorFile), temp file, then Excel integrity CLI (generator package).
+// POST /generator/verify — multipart upload (multer field: generatorFile), temp file, then Excel integrity check by the generator worker.
 router.post('/generator/verify', (req: Request, res: Response) => {
     generatorExcelUpload.single(GENERATOR_UPLOAD_FIELD)(req, res, (err: unknown) => {
         if (err) {
@@ -159,10 +157,6 @@ router.post('/generator/verify', (req: Request, res: Response) => {
 
             const resolvedExcelPath = uploaded.path;
 
-            // Run the CLI via Poetry so generator deps (openpyxl, etc.) match pyproject.toml.
-            const generatorPackageDirectory = path.resolve(__dirname, '../../../evolution-generator');
-            const cliScriptPath = path.resolve(generatorPackageDirectory, 'src/scripts/check_excel_integrity_cli.py');
-
             try {
                 if (!fs.existsSync(resolvedExcelPath)) {
                     return respondError({
@@ -172,48 +166,12 @@ router.post('/generator/verify', (req: Request, res: Response) => {
                     });
                 }
 
-                // Spawn Poetry in the generator package so `poetry run` uses that project's venv and pyproject.toml.
-                // Args: run python <script> <excel path> — the script prints one JSON object per run on stdout.
-                const { stdout, stderr } = await execFileAsync(
-                    'poetry',
-                    ['run', 'python', cliScriptPath, resolvedExcelPath],
-                    {
-                        cwd: generatorPackageDirectory,
-                        timeout: 60_000, // 60 seconds before killing the process
-                        killSignal: 'SIGKILL'
-                    }
-                );
-
-                // Stderr may contain warnings even on success; log it but do not treat it as failure by itself.
-                if (stderr?.trim()) {
-                    console.warn('Python stderr for /api/admin/generator/verify:', stderr);
-                }
-
-                // Last non-empty line: one JSON object from the CLI.
-                const outputLines = stdout
-                    .trim()
-                    .split('\n')
-                    .map((line) => line.trim())
-                    .filter((line) => line.length > 0);
-
-                // No output from the CLI → error
-                if (outputLines.length === 0) {
-                    return respondError({
-                        res,
-                        error: 'Excel integrity check produced no output',
-                        httpStatus: 500
-                    });
-                }
-
-                // Contract: stdout is a single JSON object (human-readable issues are inside `errors`, see check_excel_integrity_cli.py).
-                const lastLine = outputLines[outputLines.length - 1];
-                const parsedResult = JSON.parse(lastLine) as {
-                    ok: boolean;
-                    integrityOk?: boolean;
-                    error?: string;
-                    errors?: string[];
-                    excelFilePath?: string;
-                };
+                // Ask the long-lived generator worker, which keeps the Python modules imported and the
+                // parsed Excel files in memory. Contract: one JSON object per request (see generator_worker.py).
+                const parsedResult = await getGeneratorWorker().request({
+                    command: 'check',
+                    excelFilePath: resolvedExcelPath
+                });
 
                 // Python exception or crash → ok: false
                 if (parsedResult.ok !== true) {
@@ -244,7 +202,7 @@ router.post('/generator/verify', (req: Request, res: Response) => {
                     }
                 });
             } catch (error) {
-                // Covers: poetry missing, venv not installed, process non-zero, invalid JSON, empty stdout, etc.
+                // Covers: poetry missing, venv not installed, worker exited or timed out, etc.
                 console.error('Failed to execute generator integrity check:', error);
                 if (error instanceof Error) {
                     return respondError({
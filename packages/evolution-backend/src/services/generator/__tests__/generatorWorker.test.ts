@@ -0,0 +1,86 @@
+/*
+ * Copyright 2026, Polytechnique Montreal and contributors
+ *
+ * This file is licensed under the MIT License.
+ * License text available at https://opensource.org/licenses/MIT
+ */
+import { EventEmitter } from 'events';
+import { PassThrough } from 'stream';
+import { spawn } from 'child_process';
+import { GeneratorWorker } from '../generatorWorker';
+
+jest.mock('child_process', () => ({
+    spawn: jest.fn()
+}));
+const spawnMock = spawn as jest.MockedFunction<typeof spawn>;
+
+// Fake worker process, answering each request line with the response of `answer`
+const createWorkerProcess = (answer?: (request: { id: number; command: string }) => object | undefined) => {
+    const workerProcess = Object.assign(new EventEmitter(), {
+        stdin: new PassThrough(),
+        stdout: new PassThrough(),
+        stderr: new PassThrough(),
+        kill: jest.fn()
+    });
+    workerProcess.stdin.on('data', (data: Buffer) => {
+        for (const line of data.toString().split('\n').filter((line) => line.length > 0)) {
+            const request = JSON.parse(line);
+            const response = answer?.(request);
+            if (response !== undefined) {
+                workerProcess.stdout.write(`${JSON.stringify({ id: request.id, ...response })}\n`);
+            }
+        }
+    });
+    return workerProcess;
+};
+
+const options = { command: 'poetry', args: ['run', 'python', 'generator_worker.py'], cwd: '/generator', requestTimeoutMs: 1000 };
+
+describe('GeneratorWorker', () => {
+    beforeEach(() => {
+        spawnMock.mockReset();
+    });
+
+    test('Should start the worker once and resolve the responses by request', async () => {
+        const workerProcess = createWorkerProcess((request) => ({ ok: true, command: request.command }));
+        spawnMock.mockReturnValue(workerProcess as any);
+        const worker = new GeneratorWorker(options);
+
+        const responses = await Promise.all([
+            worker.request({ command: 'check', excelFilePath: '/tmp/survey.xlsx' }),
+            worker.request({ command: 'ping' })
+        ]);
+
+        expect(responses).toEqual([
+            { id: 1, ok: true, command: 'check' },
+            { id: 2, ok: true, command: 'ping' }
+        ]);
+        expect(spawnMock).toHaveBeenCalledTimes(1);
+        expect(spawnMock).toHaveBeenCalledWith('poetry', ['run', 'python', 'generator_worker.py'], { cwd: '/generator' });
+    });
+
+    test('Should reject the pending requests when the worker exits and start it again', async () => {
+        const exitingProcess = createWorkerProcess();
+        const workerProcess = createWorkerProcess(() => ({ ok: true }));
+        spawnMock.mockReturnValueOnce(exitingProcess as any).mockReturnValueOnce(workerProcess as any);
+        const worker = new GeneratorWorker(options);
+
+        const pendingResponse = worker.request({ command: 'ping' });
+        exitingProcess.emit('exit', 1, null);
+
+        await expect(pendingResponse).rejects.toThrow('Generator worker exited (code: 1, signal: null)');
+        await expect(worker.request({ command: 'ping' })).resolves.toEqual({ id: 2, ok: true });
+        expect(spawnMock).toHaveBeenCalledTimes(2);
+    });
+
+    test('Should kill the worker when a request times out', async () => {
+        const workerProcess = createWorkerProcess();
+        spawnMock.mockReturnValue(workerProcess as any);
+        const worker = new GeneratorWorker({ ...options, requestTimeoutMs: 10 });
+
+        await expect(worker.request({ command: 'check', excelFilePath: '/tmp/survey.xlsx' })).rejects.toThrow(
+            'Generator worker did not answer in 10 ms'
+        );
+        expect(workerProcess.kill).toHaveBeenCalledWith('SIGKILL');
+    });
+});
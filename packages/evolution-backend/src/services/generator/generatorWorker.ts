@@ -0,0 +1,174 @@
+/*
+ * Copyright 2026, Polytechnique Montreal and contributors
+ *
+ * This file is licensed under the MIT License.
+ * License text available at https://opensource.org/licenses/MIT
+ */
+import { ChildProcessWithoutNullStreams, spawn } from 'child_process';
+import path from 'path';
+import readline from 'readline';
+
+/** Response of the generator worker, see generator_worker.py in the generator package. */
+export type GeneratorWorkerResponse = {
+    id?: number | null;
+    ok: boolean;
+    error?: string;
+    // `check` command
+    integrityOk?: boolean;
+    errors?: string[];
+    /** The same issues as `errors`, with their sheet, row, column and rule */
+    issues?: {
+        sheet: string | null;
+        row: number | null;
+        column: string | null;
+        rule: string;
+        message: string;
+    }[];
+    /** True when the check stopped after the `maxErrors` of the request */
+    maxErrorsReached?: boolean;
+    excelFilePath?: string;
+    // `generate` command
+    output?: string;
+    generatedFiles?: string;
+    files?: { [filePath: string]: string };
+};
+
+export type GeneratorWorkerOptions = {
+    command: string;
+    args: string[];
+    cwd: string;
+    /** Time before a request fails and the worker is killed, it is started again on the next request. */
+    requestTimeoutMs: number;
+};
+
+type PendingRequest = {
+    resolve: (response: GeneratorWorkerResponse) => void;
+    reject: (error: Error) => void;
+    timeout: NodeJS.Timeout;
+};
+
+/**
+ * Long-lived Python process of the generator package, answering JSON requests,
+ * one per line, on its standard input and output. The Python modules are
+ * imported once and the parsed Excel files are kept in memory, instead of
+ * starting a new Python process for each request. The worker is started on the
+ * first request and started again after it exits.
+ */
+export class GeneratorWorker {
+    private workerProcess: ChildProcessWithoutNullStreams | undefined = undefined;
+    private pendingRequests = new Map<number, PendingRequest>();
+    private nextRequestId = 1;
+
+    constructor(private readonly options: GeneratorWorkerOptions) {}
+
+    /**
+     * Send a request to the worker.
+     * @param request The request, with its `command` and arguments
+     * @returns The response of the worker, rejected if the worker exits or does
+     * not answer in time
+     */
+    request(request: { command: string; [key: string]: unknown }): Promise<GeneratorWorkerResponse> {
+        const workerProcess = this.workerProcess ?? this.start();
+        const id = this.nextRequestId++;
+        return new Promise<GeneratorWorkerResponse>((resolve, reject) => {
+            const timeout = setTimeout(() => {
+                this.pendingRequests.delete(id);
+                reject(new Error(`Generator worker did not answer in ${this.options.requestTimeoutMs} ms`));
+                // The worker answers in order, a stuck request would block the next ones
+                this.stop();
+            }, this.options.requestTimeoutMs);
+            this.pendingRequests.set(id, { resolve, reject, timeout });
+            workerProcess.stdin.write(`${JSON.stringify({ ...request, id })}\n`);
+        });
+    }
+
+    /** Kill the worker, failing its pending requests. */
+    stop(): void {
+        const workerProcess = this.workerProcess;
+        if (workerProcess === undefined) {
+            return;
+        }
+        this.workerProcess = undefined;
+        this.rejectPendingRequests(new Error('Generator worker stopped'));
+        workerProcess.kill('SIGKILL');
+    }
+
+    private start(): ChildProcessWithoutNullStreams {
+        const workerProcess = spawn(this.options.command, this.options.args, { cwd: this.options.cwd });
+        this.workerProcess = workerProcess;
+
+        // Each line of the standard output is the JSON response of one request
+        readline.createInterface({ input: workerProcess.stdout }).on('line', (line) => {
+            this.handleResponseLine(line);
+        });
+        // Stderr has the output of the generator scripts and warnings, log it without failing
+        workerProcess.stderr.on('data', (data) => {
+            console.warn('Generator worker stderr:', data.toString());
+        });
+        workerProcess.on('error', (error) => {
+            this.handleExit(workerProcess, error);
+        });
+        workerProcess.on('exit', (code, signal) => {
+            this.handleExit(workerProcess, new Error(`Generator worker exited (code: ${code}, signal: ${signal})`));
+        });
+        return workerProcess;
+    }
+
+    private handleResponseLine(line: string): void {
+        if (line.trim().length === 0) {
+            return;
+        }
+        let response: GeneratorWorkerResponse;
+        try {
+            response = JSON.parse(line) as GeneratorWorkerResponse;
+        } catch {
+            console.warn('Invalid response from the generator worker:', line);
+            return;
+        }
+        const pendingRequest = typeof response.id === 'number' ? this.pendingRequests.get(response.id) : undefined;
+        if (pendingRequest === undefined) {
+            // Request that timed out, or an error on a line that was not a request
+            console.warn('Unexpected response from the generator worker:', line);
+            return;
+        }
+        this.pendingRequests.delete(response.id as number);
+        clearTimeout(pendingRequest.timeout);
+        pendingRequest.resolve(response);
+    }
+
+    private handleExit(workerProcess: ChildProcessWithoutNullStreams, error: Error): void {
+        // Ignore the exit of a worker that was already stopped and replaced
+        if (this.workerProcess !== workerProcess) {
+            return;
+        }
+        this.workerProcess = undefined;
+        this.rejectPendingRequests(error);
+    }
+
+    private rejectPendingRequests(error: Error): void {
+        for (const pendingRequest of this.pendingRequests.values()) {
+            clearTimeout(pendingRequest.timeout);
+            pendingRequest.reject(error);
+        }
+        this.pendingRequests.clear();
+    }
+}
+
+let generatorWorker: GeneratorWorker | undefined = undefined;
+
+/**
+ * Get the worker of the generator package, run with Poetry so its dependencies
+ * (openpyxl, etc.) match its pyproject.toml.
+ */
+export const getGeneratorWorker = (): GeneratorWorker => {
+    if (generatorWorker === undefined) {
+        const generatorPackageDirectory = path.resolve(__dirname, '../../../../evolution-generator');
+        generatorWorker = new GeneratorWorker({
+            command: 'poetry',
+            args: ['run', 'python', path.resolve(generatorPackageDirectory, 'src/scripts/generator_worker.py')],
+            cwd: generatorPackageDirectory,
+            requestTimeoutMs: 60_000 // 60 seconds before killing the worker
+        });
+    }
+    return generatorWorker;
+};
@@ -0,0 +1,62 @@
+# Copyright 2026, Polytechnique Montreal and contributors
+# This file is licensed under the MIT License.
+# License text available at https://opensource.org/licenses/MIT
+
+# Note: This script includes the baselines of the benchmarks of the generation
+# steps, the times of each step per workbook scale, and the check of the steps
+# that became slower than their baseline.
+# These functions are intended to be invoked from the benchmark tests.
+import json  # Baselines file format
+import os  # File system operations
+
+# Seconds added to the allowed time of each step, so the fastest steps do not fail on noise
+BENCHMARK_SLACK_SECONDS = 0.05
+
+
+# Read the baselines, as {scale: {step name: seconds}}, or no baselines if the file does not exist
+def read_benchmark_baselines(baselines_file_path: str) -> dict[str, dict[str, float]]:
+    try:
+        with open(baselines_file_path, "r", encoding="utf-8") as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {}
+
+
+# Write the baselines to a JSON file
+def write_benchmark_baselines(
+    baselines_file_path: str, baselines: dict[str, dict[str, float]]
+) -> None:
+    folder_path = os.path.dirname(baselines_file_path)
+    if folder_path:
+        os.makedirs(folder_path, exist_ok=True)
+    with open(baselines_file_path, mode="w", encoding="utf-8", newline="\n") as file:
+        json.dump(baselines, file, indent=2, sort_keys=True)
+        file.write("\n")
+
+
+# Get a message for each step slower than its baseline by more than the threshold
+def get_benchmark_regressions(
+    step_times: dict[str, float],
+    step_baselines: dict[str, float],
+    threshold: float,
+    slack_seconds: float = BENCHMARK_SLACK_SECONDS,
+) -> list[str]:
+    """
+    Compare the times of the steps to their baselines.
+
+    A step regresses when its time is above ``baseline * (1 + threshold)`` plus
+    ``slack_seconds``. Steps without a baseline are not checked.
+    """
+    regressions = []
+    for step_name, step_time in step_times.items():
+        baseline = step_baselines.get(step_name)
+        if baseline is None:
+            continue
+        allowed_time = baseline * (1 + threshold) + slack_seconds
+        if step_time > allowed_time:
+            regressions.append(
+                f"{step_name}: {step_time:.3f}s, baseline {baseline:.3f}s "
+                f"(+{(step_time / baseline - 1) * 100 if baseline else 0:.0f}%, "
+                f"allowed {allowed_time:.3f}s)"
+            )
+    return regressions
@@ -0,0 +1,179 @@
+# Copyright 2026, Polytechnique Montreal and contributors
+# This file is licensed under the MIT License.
+# License text available at https://opensource.org/licenses/MIT
+
+# Note: This script includes the build manifest that records, after each
+# generation, the hash of the sheets read and of the files written by each step,
+# so the next generation can skip the steps whose inputs and outputs did not change.
+# These functions are intended to be invoked from the generate_survey.py script.
+import functools  # Compute the Generator version once per process
+import glob  # Expand the wildcards of the outputs paths
+import hashlib  # Hashes of the sheets, outputs and Generator sources
+import json  # Manifest file format
+import os  # File system operations
+from helpers.generator_helpers import WorkbookSnapshot
+from helpers.step_scheduler import GeneratorStep
+from helpers.workbook_cache import get_file_sha256
+
+MANIFEST_FILE_NAME = ".generator_manifest.json"
+# Bump when the content of the manifest changes, so older manifests are ignored
+MANIFEST_FORMAT_VERSION = 1
+# Hash recorded for the folders written by a step, only their existence is checked
+FOLDER_HASH = "folder"
+
+
+# Get the SHA-256 of the Generator sources, so any change to the scripts runs every step again.
+# It is computed once per process, like the sources are imported once.
+@functools.cache
+def get_generator_version() -> str:
+    sha256 = hashlib.sha256()
+    src_folder_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    for package_name in ["helpers", "scripts"]:
+        package_path = os.path.join(src_folder_path, package_name)
+        for file_name in sorted(os.listdir(package_path)):
+            if file_name.endswith(".py"):
+                sha256.update(file_name.encode("utf-8"))
+                with open(os.path.join(package_path, file_name), "rb") as file:
+                    sha256.update(file.read())
+    return sha256.hexdigest()
+
+
+# Get the SHA-256 of the values of a sheet, computed once per snapshot
+def get_sheet_sha256(workbook_snapshot: WorkbookSnapshot, sheet_name: str) -> str:
+    return workbook_snapshot.get_sheet_sha256(sheet_name)
+
+
+class BuildManifest:
+    """
+    Hashes of the inputs and outputs of the generation steps, saved next to the survey.
+
+    A step is up to date when the sheets it reads, its arguments and the
+    Generator sources did not change since the manifest was saved, and when every
+    file it wrote still has the same content.
+    """
+
+    def __init__(
+        self,
+        survey_folder_path: str,
+        workbook_snapshot: WorkbookSnapshot,
+        force: bool = False,
+    ):
+        self.survey_folder_path = survey_folder_path
+        self.manifest_file_path = os.path.join(survey_folder_path, MANIFEST_FILE_NAME)
+        self.force = force
+        self.generator_version = get_generator_version()
+        self.sheets = {
+            sheet_name: get_sheet_sha256(workbook_snapshot, sheet_name)
+            for sheet_name in workbook_snapshot.sheetnames
+        }
+        self.steps = self._read_manifest_steps()
+        self.skipped_steps: list[str] = []
+
+    # Read the steps of the saved manifest, ignoring a manifest from another Generator version
+    def _read_manifest_steps(self) -> dict:
+        try:
+            with open(self.manifest_file_path, "r", encoding="utf-8") as file:
+                manifest = json.load(file)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(
+                f"Warning: ignoring unreadable manifest {self.manifest_file_path}: {e}"
+            )
+            return {}
+
+        if (
+            not isinstance(manifest, dict)
+            or manifest.get("version") != MANIFEST_FORMAT_VERSION
+            or manifest.get("generator_version") != self.generator_version
+        ):
+            return {}
+        return manifest.get("steps", {})
+
+    # Get the hash of the inputs of a step: the sheets it reads, its arguments and outputs paths
+    def get_step_inputs_sha256(self, step: GeneratorStep) -> str:
+        inputs = {
+            "function": f"{step.function.__module__}.{step.function.__qualname__}",
+            "args": repr(step.args),
+            "kwargs": repr(step.kwargs),
+            "writes": list(step.writes),
+            "sheets": {
+                sheet_name: self.sheets.get(sheet_name) for sheet_name in step.reads
+            },
+        }
+        return hashlib.sha256(
+            json.dumps(inputs, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+    # Get the hash of each file and folder matching the outputs of a step, relative to the survey folder
+    def get_step_outputs(self, step: GeneratorStep) -> dict[str, str]:
+        outputs = {}
+        for output_pattern in step.writes:
+            for output_path in sorted(glob.glob(output_pattern)):
+                relative_path = os.path.relpath(output_path, self.survey_folder_path)
+                if os.path.isdir(output_path):
+                    outputs[relative_path] = FOLDER_HASH
+                else:
+                    outputs[relative_path] = get_file_sha256(output_path)
+        return outputs
+
+    # Check if the step can be skipped, adding it to the skipped steps if so
+    def is_step_up_to_date(self, step: GeneratorStep) -> bool:
+        if self.force:
+            return False
+        step_manifest = self.steps.get(step.name)
+        if step_manifest is None:
+            return False
+        if step_manifest.get("inputs") != self.get_step_inputs_sha256(step):
+            return False
+        for relative_path, output_hash in step_manifest.get("outputs", {}).items():
+            if not self._is_output_unchanged(relative_path, output_hash):
+                return False
+        self.skipped_steps.append(step.name)
+        return True
+
+    def _is_output_unchanged(self, relative_path: str, output_hash: str) -> bool:
+        output_path = os.path.join(self.survey_folder_path, relative_path)
+        if output_hash == FOLDER_HASH:
+            return os.path.isdir(output_path)
+        return (
+            os.path.isfile(output_path) and get_file_sha256(output_path) == output_hash
+        )
+
+    # Record the inputs and outputs of the steps and save the manifest
+    def save(self, steps: list[GeneratorStep], succeeded: bool = True) -> None:
+        for step in steps:
+            if succeeded or step.name in self.skipped_steps:
+                # The outputs are hashed again, as later steps can write in the same files
+                self.steps[step.name] = {
+                    "inputs": self.get_step_inputs_sha256(step),
+                    "outputs": self.get_step_outputs(step),
+                }
+            else:
+                # The step may not have run, it must run again next time
+                self.steps.pop(step.name, None)
+
+        manifest = {
+            "version": MANIFEST_FORMAT_VERSION,
+            "generator_version": self.generator_version,
+            "sheets": self.sheets,
+            "steps": self.steps,
+        }
+        try:
+            with open(
+                self.manifest_file_path, mode="w", encoding="utf-8", newline="\n"
+            ) as file:
+                json.dump(manifest, file, indent=2, sort_keys=True)
+                file.write("\n")
+        except OSError as e:
+            # The manifest is only an optimization, the generation succeeded without it
+            print(f"Warning: could not write manifest {self.manifest_file_path}: {e}")
+
+    # Print the steps that were skipped because nothing changed
+    def print_summary(self, steps: list[GeneratorStep]) -> None:
+        if not self.skipped_steps:
+            return
+        print(
+            f"Skipped {len(self.skipped_steps)} of {len(steps)} steps with unchanged "
+            f"sheets and outputs (use --force to run them): {', '.join(self.skipped_steps)}"
+        )
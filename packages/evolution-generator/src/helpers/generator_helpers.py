@@ -3,11 +3,27 @@
 # License text available at https://opensource.org/licenses/MIT
 
 # Note: This script includes functions that help generate and test Generator scripts.
+import hashlib  # Hashes of the sheets values
 import os  # File system operations
 import re  # Regular expression module for pattern matching
-import openpyxl  # Read data from Excel
-from openpyxl import Workbook  # Read data from Excel, File system operations
-from typing import List, Optional, Tuple, Union  # Types for Python
+from collections.abc import Mapping  # Dict-like row views
+from itertools import zip_longest  # Transpose rows of different widths
+from helpers.output_writer import OUTPUT_UNCHANGED, write_output_file
+from typing import (  # Types for Python
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+# openpyxl is imported when an Excel file is read or written, not when the parsed
+# sheets are read from the cache, as its import is a large part of the startup time
+if TYPE_CHECKING:
+    from openpyxl import Workbook
 
 # Define constants
 MOCKER_EXCEL_FILE = "src/tests/references/test.xlsx"
@@ -34,68 +50,363 @@ def add_generator_yaml_header() -> str:
 
 
 # Get sections names of Sections sheet
-def get_sections_names(rows: List, headers: List) -> List[str]:
-    # Find the index of 'section' in headers
-    section_index = headers.index("section")
-
+def get_sections_names(table: "SheetTable") -> List[str]:
     # Get all unique section names
-    sections_names = []
-    for row in rows[1:]:
-        section_name = row[section_index].value
-        if section_name not in sections_names:
-            sections_names.append(section_name)
-    return sections_names
+    return table.unique("section")
 
 
-# Read data from Excel and return rows and headers
-def get_data_from_excel(excel_file_path: str, sheet_name: str) -> tuple:
-    try:
-        # Load Excel file
-        workbook: Workbook = openpyxl.load_workbook(excel_file_path, data_only=True)
-        sheet = workbook[sheet_name]  # Get sheet
-        rows: List = list(sheet.rows)  # Get all rows in the sheet
-
-        # Filter out None values from headers
-        headers = []
-        for cell in rows[0]:
-            if cell.value is not None:
-                headers.append(cell.value)
-            else:
-                # If we find an empty header, stop reading columns here
-                break
-
-        # Error when header has spaces
-        if any(" " in str(header) for header in headers):
-            raise Exception("Header has spaces")
-
-        # Error when header is None
-        if None in headers:
-            raise Exception("Header is None")
-
-        return rows, headers
+class SheetRow(Mapping):
+    """
+    Read-only view of one data row of a ``SheetTable``.
+
+    Values are read from the table columns by header, like a dict built from the
+    row (``row["section"]``, ``row.get("path")``, ``"path" in row``), without
+    allocating a dict per row.
+    """
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: "SheetTable", index: int):
+        self._table = table
+        self._index = index
+
+    # Index of the row in the table data rows
+    @property
+    def index(self) -> int:
+        return self._index
+
+    # Excel row number, the first data row being row 2
+    @property
+    def row_number(self) -> int:
+        return self._index + 2
+
+    def __getitem__(self, header: str) -> Any:
+        return self._table._columns[self._table.header_index[header]][self._index]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._table.header_index)
+
+    def __len__(self) -> int:
+        return len(self._table.header_index)
+
+    def __contains__(self, header: object) -> bool:
+        return header in self._table.header_index
+
+    def __repr__(self) -> str:
+        return f"SheetRow({dict(self)!r})"
+
+    def get(self, header: str, default: Any = None) -> Any:
+        column_index = self._table.header_index.get(header)
+        if column_index is None:
+            return default
+        return self._table._columns[column_index][self._index]
+
+
+class SheetTable:
+    """
+    Values of a sheet stored column-wise, with a precomputed header-to-column map.
+
+    Generators read cells by header name through ``SheetRow`` views or whole
+    columns, instead of looking up ``headers.index(...)`` and building a dict for
+    every row. Empty rows in the middle of the data are kept so that row numbers
+    match the Excel file.
+    """
+
+    def __init__(self, headers: List[str], rows: List[tuple], sheet_name: str = ""):
+        self.sheet_name = sheet_name
+        self.headers = list(headers)
+        # Keep the first column for duplicated headers, like headers.index()
+        self.header_index = _get_header_index(self.headers)
+        self._row_count = len(rows)
+        # Transpose the rows, ignoring the columns after the last header
+        columns = list(zip_longest(*rows)) if rows else []
+        self._columns = [
+            list(columns[index]) if index < len(columns) else [None] * len(rows)
+            for index in range(len(self.headers))
+        ]
+
+    @classmethod
+    def from_rows(cls, rows: List[tuple], sheet_name: str = "") -> "SheetTable":
+        """Build a table from sheet rows, the first one being the headers row."""
+        return cls(_read_headers(rows), rows[1:], sheet_name)
+
+    def __len__(self) -> int:
+        return self._row_count
+
+    def __iter__(self) -> Iterator[SheetRow]:
+        for index in range(self._row_count):
+            yield SheetRow(self, index)
+
+    def __getitem__(self, index: int) -> SheetRow:
+        if not -self._row_count <= index < self._row_count:
+            raise IndexError(f"Row {index} does not exist in {self.sheet_name} sheet")
+        return SheetRow(self, index % self._row_count)
+
+    # Check if the table has a column for the header
+    def has_column(self, header: str) -> bool:
+        return header in self.header_index
+
+    # Get the values of a column, one per data row
+    def column(self, header: str) -> List[Any]:
+        if header not in self.header_index:
+            raise KeyError(f"Missing header in {self.sheet_name} sheet: {header}")
+        return self._columns[self.header_index[header]]
+
+    # Get the unique values of a column, in the order they first appear
+    def unique(self, header: str) -> List[Any]:
+        return list(dict.fromkeys(self.column(header)))
+
+    # Get the rows for which the predicate returns True
+    def filter(self, predicate: Callable[[SheetRow], bool]) -> List[SheetRow]:
+        return [row for row in self if predicate(row)]
+
+    # Get the rows with the given value in a column
+    def where(self, header: str, value: Any) -> List[SheetRow]:
+        return [
+            SheetRow(self, index)
+            for index, cell_value in enumerate(self.column(header))
+            if cell_value == value
+        ]
+
+    # Group the rows by the value of a column, in the order the values first appear
+    def group_by(self, header: str) -> dict[Any, List[SheetRow]]:
+        groups: dict[Any, List[SheetRow]] = {}
+        for index, value in enumerate(self.column(header)):
+            groups.setdefault(value, []).append(SheetRow(self, index))
+        return groups
+
+    # Get a copy of the table with empty cells replaced by a value (e.g. "")
+    def fill_empty(self, fill_value: Any) -> "SheetTable":
+        table = SheetTable.__new__(SheetTable)
+        table.sheet_name = self.sheet_name
+        table.headers = self.headers
+        table.header_index = self.header_index
+        table._row_count = self._row_count
+        table._columns = [
+            [fill_value if value is None else value for value in column]
+            for column in self._columns
+        ]
+        return table
 
-    except Exception as e:
-        print(f"Error reading Excel in {sheet_name} sheet: {e}")
-        raise e
 
+class WorkbookSnapshot:
+    """
+    Parsed Generator Excel file, shared by every generator of a ``generate_survey`` run.
+
+    The workbook is streamed once in read-only mode and only the cell values of each
+    sheet are kept, as one tuple per row. Generators reading the same sheets do not
+    parse the Excel file again.
+    """
 
-# TODO: Add types for rows and headers
-# Get values from the row
-def get_values_from_row(row, headers) -> tuple:
+    def __init__(
+        self, excel_file_path: str, sheets_rows: dict[str, List[tuple]] | None = None
+    ):
+        if sheets_rows is None:
+            is_excel_file(excel_file_path)  # Check if the input file is an Excel file
+            sheets_rows = _read_workbook_rows(excel_file_path)
+        self.excel_file_path = excel_file_path
+        self._sheets_rows = sheets_rows
+        self._sheets_data: dict[str, tuple] = {}
+        self._sheets_tables: dict[str, SheetTable] = {}
+        self._sheets_sha256: dict[str, str] = {}
+
+    @classmethod
+    def from_workbook(
+        cls, workbook: "Workbook", excel_file_path: str = ""
+    ) -> "WorkbookSnapshot":
+        """Build a snapshot from a workbook already loaded with openpyxl (e.g. in tests)."""
+        return cls(
+            excel_file_path,
+            {
+                worksheet.title: _read_worksheet_rows(worksheet)
+                for worksheet in workbook.worksheets
+            },
+        )
+
+    @property
+    def sheetnames(self) -> List[str]:
+        return list(self._sheets_rows.keys())
+
+    # Get the rows of a sheet, the first one being the headers row
+    def get_rows(self, sheet_name: str) -> List[tuple]:
+        if sheet_name not in self._sheets_rows:
+            raise KeyError(f"Worksheet {sheet_name} does not exist.")
+        return self._sheets_rows[sheet_name]
+
+    # Read data from a sheet and return rows and headers, checking the headers only once
+    def get_data(self, sheet_name: str) -> tuple:
+        if sheet_name not in self._sheets_data:
+            try:
+                rows = self.get_rows(sheet_name)
+                self._sheets_data[sheet_name] = (rows, _read_headers(rows))
+            except Exception as e:
+                print(f"Error reading Excel in {sheet_name} sheet: {e}")
+                raise e
+        return self._sheets_data[sheet_name]
+
+    # Read data from a sheet as a table, checking the headers only once
+    def get_table(self, sheet_name: str) -> SheetTable:
+        if sheet_name not in self._sheets_tables:
+            rows, headers = self.get_data(sheet_name)
+            self._sheets_tables[sheet_name] = SheetTable(headers, rows[1:], sheet_name)
+        return self._sheets_tables[sheet_name]
+
+    # Get the SHA-256 of the values of a sheet, computed only once
+    def get_sheet_sha256(self, sheet_name: str) -> str:
+        if sheet_name not in self._sheets_sha256:
+            rows = self.get_rows(sheet_name)
+            self._sheets_sha256[sheet_name] = hashlib.sha256(
+                repr(rows).encode("utf-8")
+            ).hexdigest()
+        return self._sheets_sha256[sheet_name]
+
+    def reuse_unchanged_sheets(
+        self, previous_snapshot: "WorkbookSnapshot"
+    ) -> List[str]:
+        """
+        Share the rows, headers and tables of the sheets with the same values in previous_snapshot.
+
+        The sheets already read as tables by the previous run are not transposed
+        and checked again. Return the names of the reused sheets.
+        """
+        reused_sheet_names = []
+        for sheet_name in self.sheetnames:
+            if sheet_name not in previous_snapshot._sheets_rows or (
+                previous_snapshot.get_sheet_sha256(sheet_name)
+                != self.get_sheet_sha256(sheet_name)
+            ):
+                continue
+            self._sheets_rows[sheet_name] = previous_snapshot._sheets_rows[sheet_name]
+            if sheet_name in previous_snapshot._sheets_data:
+                self._sheets_data[sheet_name] = previous_snapshot._sheets_data[
+                    sheet_name
+                ]
+            if sheet_name in previous_snapshot._sheets_tables:
+                self._sheets_tables[sheet_name] = previous_snapshot._sheets_tables[
+                    sheet_name
+                ]
+            reused_sheet_names.append(sheet_name)
+        return reused_sheet_names
+
+
+# An Excel file path, a workbook loaded with openpyxl or the snapshot already loaded from them
+ExcelSource = Union[str, "Workbook", WorkbookSnapshot]
+
+
+# Return the snapshot for an Excel source, loading the Excel file if a path is given
+def get_workbook_snapshot(excel_source: ExcelSource) -> WorkbookSnapshot:
+    if isinstance(excel_source, WorkbookSnapshot):
+        return excel_source
+    if isinstance(excel_source, str):
+        return WorkbookSnapshot(excel_source)
+    return WorkbookSnapshot.from_workbook(excel_source)
+
+
+# Return the path of the Excel file of an Excel source
+def get_excel_file_path(excel_source: ExcelSource) -> str:
+    if isinstance(excel_source, WorkbookSnapshot):
+        return excel_source.excel_file_path
+    if isinstance(excel_source, str):
+        return excel_source
+    return ""
+
+
+# Read the values of every worksheet of an Excel file in read-only mode
+def _read_workbook_rows(excel_file_path: str) -> dict[str, List[tuple]]:
+    import openpyxl  # Read data from Excel
+
+    workbook = openpyxl.load_workbook(excel_file_path, data_only=True, read_only=True)
     try:
-        # Create a dictionary from the row values and headers
-        row_dict = dict(zip(headers, (cell.value for cell in row)))
-        values = []  # List of values from the row
+        return {
+            worksheet.title: _read_worksheet_rows(worksheet)
+            for worksheet in workbook.worksheets
+        }
+    finally:
+        workbook.close()
+
+
+# Read the values of a worksheet, one tuple per row, up to the last row with data
+def _read_worksheet_rows(worksheet) -> List[tuple]:
+    rows: List[tuple] = []
+    empty_rows_count = 0  # Empty rows kept only if data is found below them
+    width = 0
+    for row in worksheet.iter_rows(values_only=True):
+        # Stray formatting can make max_row much larger than the real data, so
+        # trailing empty rows are not added to the rows
+        if all(value is None for value in row):
+            empty_rows_count += 1
+            continue
+        rows.extend([()] * empty_rows_count)
+        empty_rows_count = 0
+        rows.append(row)
+        width = max(width, len(row))
+
+    # Make every row as wide as the sheet, like openpyxl does in full mode
+    return [row + (None,) * (width - len(row)) for row in rows]
+
+
+# Get headers from the first row, stopping at the first empty header
+def _read_headers(rows: List[tuple]) -> List:
+    # Filter out None values from headers
+    headers = []
+    for value in rows[0]:
+        if value is not None:
+            headers.append(value)
+        else:
+            # If we find an empty header, stop reading columns here
+            break
+
+    # Error when header has spaces
+    if any(" " in str(header) for header in headers):
+        raise Exception("Header has spaces")
+
+    # Error when header is None
+    if None in headers:
+        raise Exception("Header is None")
+
+    return headers
+
+
+# Map each header to its column index, keeping the first column for duplicated headers
+def _get_header_index(headers: List) -> dict:
+    header_index = {}
+    for index, header in enumerate(headers):
+        header_index.setdefault(header, index)
+    return header_index
+
+
+# Read data from Excel and return rows and headers
+def get_data_from_excel(excel_source: ExcelSource, sheet_name: str) -> tuple:
+    return get_workbook_snapshot(excel_source).get_data(sheet_name)
 
-        # Get values from the row dictionary
-        for header in headers:
-            header = row_dict[header]
-            values.append(header)
 
-        return values
+# Read data from Excel and return a table of the sheet values
+def get_table_from_excel(excel_source: ExcelSource, sheet_name: str) -> SheetTable:
+    return get_workbook_snapshot(excel_source).get_table(sheet_name)
 
+
+# Stream a single sheet of an Excel file and return its values as a table
+def read_sheet_table(excel_file_path: str, sheet_name: str) -> SheetTable:
+    """
+    Read one sheet with openpyxl's read-only mode, keeping only the cell values.
+
+    Returns:
+        The data rows of the sheet (without the headers row), up to the last row
+        with data, as a SheetTable.
+    """
+    is_excel_file(excel_file_path)  # Check if the input file is an Excel file
+    import openpyxl  # Read data from Excel
+
+    workbook = openpyxl.load_workbook(excel_file_path, data_only=True, read_only=True)
+    try:
+        sheet_exists(workbook, sheet_name)  # Check if the sheet exists
+        rows = _read_worksheet_rows(workbook[sheet_name])
+    finally:
+        workbook.close()
+    try:
+        return SheetTable.from_rows(rows, sheet_name)
     except Exception as e:
-        print(f"Error getting values from row: {e}")
+        print(f"Error reading Excel in {sheet_name} sheet: {e}")
         raise e
 
 
@@ -116,13 +427,15 @@ def error_when_missing_required_fields(
         )
 
 
-# Generate output file
-def generate_output_file(ts_code: str, output_file: str):
+# Generate output file, only written if its content changed
+def generate_output_file(ts_code: str, output_file: str, newline: str = "\n"):
     try:
-        with open(output_file, mode="w", encoding="utf-8", newline="\n") as ts_file:
-            ts_file.write(ts_code)
+        status = write_output_file(ts_code, output_file, newline=newline)
 
-        print(f"Generated {output_file} successfully")
+        if status == OUTPUT_UNCHANGED:
+            print(f"Unchanged {output_file}")
+        else:
+            print(f"Generated {output_file} successfully")
 
     except Exception as e:
         print(f"Error generating {output_file}: {e}")
@@ -132,7 +445,7 @@ def generate_output_file(ts_code: str, output_file: str):
 # Create mocked Excel data for testing
 def create_mocked_excel_data(
     sheet_name: str, headers: List[str], rows_data: List[List[Union[str, int, float]]]
-) -> Workbook:
+) -> "Workbook":
     """
     Build an in-memory workbook with one sheet and save it to the test references path.
 
@@ -149,7 +462,9 @@ def create_mocked_excel_data(
         are not stored as formulas and are read back correctly when the file is loaded
         with data_only=True.
     """
-    workbook: Workbook = openpyxl.Workbook()  # Create a workbook
+    import openpyxl  # Write data to Excel
+
+    workbook: "Workbook" = openpyxl.Workbook()  # Create a workbook
     sheet = workbook.active  # Get the active sheet
     sheet.title = sheet_name  # Change sheet title
 
@@ -205,21 +520,18 @@ def is_ts_file(file: str) -> None:
 
 
 # Check if the sheet exists
-def sheet_exists(workbook: Workbook, sheet_name: str) -> None:
+def sheet_exists(
+    workbook: Union["Workbook", WorkbookSnapshot], sheet_name: str
+) -> None:
     if sheet_name not in workbook.sheetnames:
         raise Exception(f"Sheet with name {sheet_name} does not exist")
 
 
-# Get workbook from Excel file
-def get_workbook(input_file: str) -> Workbook:
-    workbook = openpyxl.load_workbook(input_file, data_only=True)
-    return workbook
-
-
-# Get headers from the first row
-def get_headers(sheet, expected_headers: List[str], sheet_name: str) -> List[str]:
-    # Get headers from the first row
-    current_headers = [cell.value for cell in list(sheet.rows)[0]]
+# Check the headers of a sheet table and return them
+def get_headers(
+    table: SheetTable, expected_headers: List[str], sheet_name: str
+) -> List[str]:
+    current_headers = table.headers
 
     # Check if the right numbers of headers
     if len(current_headers) < len(expected_headers):
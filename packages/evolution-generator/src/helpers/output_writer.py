@@ -0,0 +1,308 @@
+# Copyright 2026, Polytechnique Montreal and contributors
+# This file is licensed under the MIT License.
+# License text available at https://opensource.org/licenses/MIT
+
+# Note: This script includes the writer used by every generation script for the
+# generated files. A file whose content did not change is not written again, so
+# its modification time is kept and the survey is not rebuilt for nothing. The
+# files go to an output sink, the disk by default or a mapping of path to content.
+import contextlib  # Use an output sink in a with statement
+import os  # File system operations
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+OUTPUT_CREATED = "created"
+OUTPUT_CHANGED = "changed"
+OUTPUT_UNCHANGED = "unchanged"
+
+
+@dataclass
+class OutputCounts:
+    """Number of generated files created, changed and left unchanged, and bytes written."""
+
+    created: int = 0
+    changed: int = 0
+    unchanged: int = 0
+    bytes_written: int = 0
+
+    def add(self, other: "OutputCounts") -> None:
+        self.created += other.created
+        self.changed += other.changed
+        self.unchanged += other.unchanged
+        self.bytes_written += other.bytes_written
+
+    def __str__(self) -> str:
+        return (
+            f"{self.created} created, {self.changed} changed, "
+            f"{self.unchanged} unchanged"
+        )
+
+
+# Counts of the files written by the current process, reset for each generation
+_output_counts = OutputCounts()
+
+
+def get_output_counts() -> OutputCounts:
+    return _output_counts
+
+
+def reset_output_counts() -> OutputCounts:
+    """Reset the counts of the current process and return the previous counts."""
+    global _output_counts
+    previous_counts = _output_counts
+    _output_counts = OutputCounts()
+    return previous_counts
+
+
+# Check if a file already has the given content, comparing the sizes before the bytes
+def _has_content(file_path: str, content: bytes) -> bool:
+    try:
+        if os.path.getsize(file_path) != len(content):
+            return False
+        with open(file_path, "rb") as file:
+            return file.read() == content
+    except FileNotFoundError:
+        return False
+
+
+class OutputSink(ABC):
+    """
+    Destination of the generated files, through which the generation scripts
+    write, read, list and remove their outputs.
+
+    A sink must implement every method, so an incomplete sink fails when it is
+    created, not while the survey is being written.
+    """
+
+    # False when the files are not on the disk, so the build manifest cannot check them
+    writes_to_disk = True
+
+    @abstractmethod
+    def write(self, output_file: str, content: bytes) -> str:
+        """Write the file if its content changed, returning created, changed or unchanged."""
+
+    @abstractmethod
+    def read(self, output_file: str) -> Optional[bytes]:
+        """Return the content of the file, or None if it does not exist."""
+
+    @abstractmethod
+    def is_file(self, output_file: str) -> bool:
+        """Return True if the file exists."""
+
+    @abstractmethod
+    def remove(self, output_file: str) -> bool:
+        """Remove the file, returning False if it did not exist."""
+
+    @abstractmethod
+    def make_folder(self, folder_path: str) -> bool:
+        """Create the folder and its parents, returning False if it already existed."""
+
+    @abstractmethod
+    def list_files(self, folder_path: str) -> list[str]:
+        """Return the names of the files of the folder."""
+
+
+class FileOutputSink(OutputSink):
+    """Write the generated files to the disk, the default sink."""
+
+    def write(self, output_file: str, content: bytes) -> str:
+        if _has_content(output_file, content):
+            return OUTPUT_UNCHANGED
+        status = OUTPUT_CHANGED if os.path.exists(output_file) else OUTPUT_CREATED
+        with open(output_file, "wb") as file:
+            file.write(content)
+        return status
+
+    def read(self, output_file: str) -> Optional[bytes]:
+        try:
+            with open(output_file, "rb") as file:
+                return file.read()
+        except FileNotFoundError:
+            return None
+
+    def is_file(self, output_file: str) -> bool:
+        return os.path.isfile(output_file)
+
+    def remove(self, output_file: str) -> bool:
+        if not os.path.isfile(output_file):
+            return False
+        os.remove(output_file)
+        return True
+
+    def make_folder(self, folder_path: str) -> bool:
+        if os.path.isdir(folder_path):
+            return False
+        os.makedirs(folder_path, exist_ok=True)
+        return True
+
+    def list_files(self, folder_path: str) -> list[str]:
+        if not os.path.isdir(folder_path):
+            return []
+        return [
+            file_name
+            for file_name in os.listdir(folder_path)
+            if os.path.isfile(os.path.join(folder_path, file_name))
+        ]
+
+
+class MemoryOutputSink(OutputSink):
+    """
+    Keep the generated files in memory, by absolute path, instead of writing them.
+
+    With read_from_disk, the files not generated in memory are read from the
+    disk, so the generation sees the existing survey like a normal run, and
+    get_changed_paths lists the files that a normal run would create, change or
+    remove. Without it, the generation starts from an empty survey folder.
+    """
+
+    writes_to_disk = False
+
+    def __init__(self, read_from_disk: bool = False):
+        self.read_from_disk = read_from_disk
+        self.files: dict[str, bytes] = {}
+        self.folders: set[str] = set()
+        self.removed_files: set[str] = set()  # Files of the disk removed in memory
+
+    @staticmethod
+    def _get_key(path: str) -> str:
+        return os.path.abspath(path)
+
+    def write(self, output_file: str, content: bytes) -> str:
+        previous_content = self.read(output_file)
+        key = self._get_key(output_file)
+        self.files[key] = content
+        self.removed_files.discard(key)
+        if previous_content is None:
+            return OUTPUT_CREATED
+        return OUTPUT_UNCHANGED if previous_content == content else OUTPUT_CHANGED
+
+    def read(self, output_file: str) -> Optional[bytes]:
+        key = self._get_key(output_file)
+        if key in self.files:
+            return self.files[key]
+        if key in self.removed_files or not self.read_from_disk:
+            return None
+        return FileOutputSink().read(key)
+
+    def is_file(self, output_file: str) -> bool:
+        key = self._get_key(output_file)
+        if key in self.files:
+            return True
+        return (
+            self.read_from_disk
+            and key not in self.removed_files
+            and os.path.isfile(key)
+        )
+
+    def remove(self, output_file: str) -> bool:
+        key = self._get_key(output_file)
+        existed = self.is_file(key)
+        self.files.pop(key, None)
+        if self.read_from_disk and os.path.isfile(key):
+            self.removed_files.add(key)
+        return existed
+
+    def make_folder(self, folder_path: str) -> bool:
+        key = self._get_key(folder_path)
+        existed = key in self.folders or (self.read_from_disk and os.path.isdir(key))
+        self.folders.add(key)
+        return not existed
+
+    def list_files(self, folder_path: str) -> list[str]:
+        key = self._get_key(folder_path)
+        file_names = {
+            os.path.basename(file_path)
+            for file_path in self.files
+            if os.path.dirname(file_path) == key
+        }
+        if self.read_from_disk:
+            file_names.update(
+                file_name
+                for file_name in FileOutputSink().list_files(key)
+                if os.path.join(key, file_name) not in self.removed_files
+            )
+        return sorted(file_names)
+
+    def get_text_files(self, root_folder_path: Optional[str] = None) -> dict[str, str]:
+        """
+        Return the UTF-8 content of the generated files by path, relative to
+        root_folder_path with / separators when it is set.
+        """
+        if root_folder_path is None:
+            return {
+                file_path: content.decode("utf-8")
+                for file_path, content in sorted(self.files.items())
+            }
+        root_key = self._get_key(root_folder_path)
+        return {
+            os.path.relpath(file_path, root_key).replace(os.sep, "/"): content.decode(
+                "utf-8"
+            )
+            for file_path, content in sorted(self.files.items())
+        }
+
+    def get_changed_paths(self) -> list[str]:
+        """Return the paths of the files whose content differs from the disk, or removed."""
+        return sorted(
+            [
+                file_path
+                for file_path, content in self.files.items()
+                if not _has_content(file_path, content)
+            ]
+            + list(self.removed_files)
+        )
+
+
+# Sink of the generated files of the current process
+_output_sink: OutputSink = FileOutputSink()
+
+
+def get_output_sink() -> OutputSink:
+    return _output_sink
+
+
+def set_output_sink(output_sink: OutputSink) -> OutputSink:
+    """Set the sink of the generated files and return the previous sink."""
+    global _output_sink
+    previous_sink = _output_sink
+    _output_sink = output_sink
+    return previous_sink
+
+
+@contextlib.contextmanager
+def use_output_sink(output_sink: Optional[OutputSink]) -> Iterator[OutputSink]:
+    """Write the generated files to the sink in the with statement, if set."""
+    if output_sink is None:
+        yield _output_sink
+        return
+    previous_sink = set_output_sink(output_sink)
+    try:
+        yield output_sink
+    finally:
+        set_output_sink(previous_sink)
+
+
+# Write a generated file only if its content changed, returning created, changed or unchanged
+def write_output_file(content: str, output_file: str, newline: str = "\n") -> str:
+    """
+    Write the UTF-8 content to the output file of the current sink, unless the
+    file already has this content.
+
+    ``newline`` replaces the ``\\n`` line endings of the content, like the
+    ``newline`` argument of ``open``.
+    """
+    if newline != "\n":
+        content = content.replace("\n", newline)
+    encoded_content = content.encode("utf-8")
+
+    status = _output_sink.write(output_file, encoded_content)
+    if status == OUTPUT_CREATED:
+        _output_counts.created += 1
+    elif status == OUTPUT_CHANGED:
+        _output_counts.changed += 1
+    else:
+        _output_counts.unchanged += 1
+        return status
+    _output_counts.bytes_written += len(encoded_content)
+    return status
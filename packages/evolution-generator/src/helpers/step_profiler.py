@@ -0,0 +1,141 @@
+# Copyright 2026, Polytechnique Montreal and contributors
+# This file is licensed under the MIT License.
+# License text available at https://opensource.org/licenses/MIT
+
+# Note: This script includes the profiler of the generation steps, measuring the
+# time, memory, rows read and bytes written by each step of generate_survey.py.
+# These functions are intended to be invoked from the generate_survey.py script.
+import contextlib  # Profile a step with a with statement
+import cProfile  # Optional profile of the functions called by each step
+import json  # Report file format
+import os  # File system operations
+import time  # Wall and CPU times
+import tracemalloc  # Memory peak of each step
+from dataclasses import asdict, dataclass
+from typing import Iterator, Optional
+from helpers.output_writer import get_output_counts
+
+
+@dataclass
+class StepProfile:
+    """Measures of one generation step."""
+
+    name: str
+    wall_time: float = 0.0  # Seconds
+    cpu_time: float = 0.0  # Seconds, in the process running the step
+    memory_peak: int = 0  # Bytes allocated by the step at its peak
+    rows_read: int = 0  # Data rows of the sheets read by the step
+    bytes_written: int = 0  # Bytes of the generated files written by the step
+
+
+class StepProfiler:
+    """
+    Profile the generation steps and report their measures.
+
+    The memory peak is measured with tracemalloc, which slows down the steps, so
+    the times are only comparable between profiled runs. When profile_folder_path
+    is set, the functions called by each step are also profiled with cProfile and
+    saved to ``<profile_folder_path>/<step name>.prof``. When json_file_path is
+    set, the report is also written to this JSON file. With trace_memory False,
+    the memory peak is not measured and the times are those of a normal run.
+    """
+
+    def __init__(
+        self,
+        profile_folder_path: Optional[str] = None,
+        json_file_path: Optional[str] = None,
+        trace_memory: bool = True,
+    ):
+        self.profile_folder_path = profile_folder_path
+        self.json_file_path = json_file_path
+        self.trace_memory = trace_memory
+        self.profiles: list[StepProfile] = []
+
+    @contextlib.contextmanager
+    def profile(self, name: str, rows_read: int = 0) -> Iterator[StepProfile]:
+        """Measure the code run in the with statement, adding its profile to the report."""
+        step_profile = StepProfile(name=name, rows_read=rows_read)
+        started_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            start_memory = tracemalloc.get_traced_memory()[0]
+        start_bytes_written = get_output_counts().bytes_written
+        profiler = cProfile.Profile() if self.profile_folder_path else None
+        start_wall_time = time.perf_counter()
+        start_cpu_time = time.process_time()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield step_profile
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            step_profile.wall_time = time.perf_counter() - start_wall_time
+            step_profile.cpu_time = time.process_time() - start_cpu_time
+            if self.trace_memory:
+                step_profile.memory_peak = max(
+                    0, tracemalloc.get_traced_memory()[1] - start_memory
+                )
+            step_profile.bytes_written = (
+                get_output_counts().bytes_written - start_bytes_written
+            )
+            if started_tracing:
+                tracemalloc.stop()
+            if profiler is not None:
+                os.makedirs(self.profile_folder_path, exist_ok=True)
+                profiler.dump_stats(
+                    os.path.join(self.profile_folder_path, f"{name}.prof")
+                )
+            self.profiles.append(step_profile)
+
+    def add(self, step_profile: StepProfile) -> None:
+        """Add the profile of a step measured in another process."""
+        self.profiles.append(step_profile)
+
+    def report(self) -> None:
+        """Print the report, and write it to the JSON file if set."""
+        self.print_report()
+        if self.json_file_path:
+            self.write_json(self.json_file_path)
+
+    def print_report(self) -> None:
+        """Print the profiles sorted from the slowest step to the fastest."""
+        headers = ["Step", "Wall (s)", "CPU (s)", "Memory (MB)", "Rows", "Bytes"]
+        lines = [
+            [
+                step_profile.name,
+                f"{step_profile.wall_time:.3f}",
+                f"{step_profile.cpu_time:.3f}",
+                f"{step_profile.memory_peak / (1024 * 1024):.1f}",
+                str(step_profile.rows_read),
+                str(step_profile.bytes_written),
+            ]
+            for step_profile in sorted(
+                self.profiles, key=lambda step_profile: -step_profile.wall_time
+            )
+        ]
+        widths = [
+            max(len(line[index]) for line in [headers] + lines)
+            for index in range(len(headers))
+        ]
+        for line in [headers] + lines:
+            print(
+                "  ".join(
+                    # Left align the step names, right align the numbers
+                    value.ljust(width) if index == 0 else value.rjust(width)
+                    for index, (value, width) in enumerate(zip(line, widths))
+                )
+            )
+
+    def write_json(self, json_file_path: str) -> None:
+        """Write the profiles, in the order the steps ended, to a JSON file."""
+        with open(json_file_path, mode="w", encoding="utf-8", newline="\n") as file:
+            json.dump(
+                {"steps": [asdict(step_profile) for step_profile in self.profiles]},
+                file,
+                indent=2,
+            )
+            file.write("\n")
+        print(f"Generated {json_file_path} successfully")
@@ -0,0 +1,273 @@
+# Copyright 2026, Polytechnique Montreal and contributors
+# This file is licensed under the MIT License.
+# License text available at https://opensource.org/licenses/MIT
+
+# Note: This script includes the scheduler that runs the generation steps of the
+# survey, declared with the sheets they read and the outputs they write.
+# These functions are intended to be invoked from the generate_survey.py script.
+import contextlib  # Capture the output of the steps run in parallel
+import io  # Buffers for the captured output
+import traceback  # Report the errors of the steps run in parallel
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase  # Match the wildcards of the outputs paths
+from pathlib import PurePath  # Compare the outputs paths by components
+from typing import Callable, Optional
+from helpers.generator_helpers import WorkbookSnapshot
+from helpers.output_writer import OutputCounts, get_output_counts, reset_output_counts
+from helpers.step_profiler import StepProfile, StepProfiler
+
+
+@dataclass(frozen=True, eq=False)
+class GeneratorStep:
+    """
+    One generation step, called as ``function(workbook_snapshot, *args, **kwargs)``.
+
+    ``run_kwargs`` are also passed to the function, but do not change its outputs
+    (e.g. its number of worker processes), so the build manifest ignores them.
+    ``reads`` lists the sheets read by the step and ``writes`` the files and
+    folders it writes, where ``*`` matches any file or folder name (e.g.
+    ``survey/src/survey/sections/*/widgets.tsx``). A step runs after every
+    previous step writing an overlapping output, so steps are independent when
+    their outputs do not overlap.
+    """
+
+    name: str
+    function: Callable
+    args: tuple = ()
+    kwargs: dict = field(default_factory=dict)
+    run_kwargs: dict = field(default_factory=dict)
+    reads: tuple[str, ...] = ()
+    writes: tuple[str, ...] = ()
+
+    def run(self, workbook_snapshot: WorkbookSnapshot):
+        return self.function(
+            workbook_snapshot, *self.args, **self.kwargs, **self.run_kwargs
+        )
+
+
+@dataclass
+class StepResult:
+    """Captured output of a step run in a worker, with the error if it failed."""
+
+    name: str
+    output: str = ""
+    error: Optional[str] = None
+    output_counts: OutputCounts = field(default_factory=OutputCounts)
+    profile: Optional[StepProfile] = None
+
+
+class StepError(Exception):
+    """Raised when a step run in a worker failed."""
+
+
+# Check if two outputs paths can be the same file or if one contains the other
+def outputs_overlap(first_path: str, second_path: str) -> bool:
+    first_parts = PurePath(first_path).parts
+    second_parts = PurePath(second_path).parts
+    return all(
+        fnmatchcase(first_part, second_part) or fnmatchcase(second_part, first_part)
+        for first_part, second_part in zip(first_parts, second_parts)
+    )
+
+
+# Get the names of the previous steps each step must wait for, from their outputs
+def get_step_dependencies(steps: list[GeneratorStep]) -> dict[str, list[str]]:
+    dependencies: dict[str, list[str]] = {}
+    for index, step in enumerate(steps):
+        if step.name in dependencies:
+            raise Exception(f"Duplicate step name: {step.name}")
+        dependencies[step.name] = [
+            previous_step.name
+            for previous_step in steps[:index]
+            if any(
+                outputs_overlap(output, previous_output)
+                for output in step.writes
+                for previous_output in previous_step.writes
+            )
+        ]
+    return dependencies
+
+
+# Run the steps, with up to jobs steps at the same time
+def run_steps(
+    steps: list[GeneratorStep],
+    workbook_snapshot: WorkbookSnapshot,
+    jobs: int = 1,
+    skip_step: Optional[Callable[[GeneratorStep], bool]] = None,
+    profiler: Optional[StepProfiler] = None,
+) -> None:
+    """
+    Run the steps in their declared order, or on a pool of jobs worker processes.
+
+    With more than one job, a step starts as soon as the steps it depends on are
+    done. The output of each step is captured and printed in the declared order
+    of the steps, so it does not depend on which step finishes first. When a step
+    fails, the steps depending on it are skipped, the other steps still run, and
+    the error of the first failed step is raised.
+
+    ``skip_step`` is called when a step is ready to run, after the steps it
+    depends on, and the step is not run when it returns True. When ``profiler``
+    is set, each step run is profiled, in the process running it.
+    """
+    dependencies = get_step_dependencies(steps)
+    if jobs <= 1 or len(steps) <= 1:
+        for step in steps:
+            if skip_step is None or not skip_step(step):
+                _run_step(step, workbook_snapshot, profiler)
+        return
+
+    # Imported here as it loads multiprocessing, which the sequential runs do not need
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+    results: dict[str, StepResult] = {}
+    skipped: dict[str, str] = {}  # Skipped step name -> failed step name
+    pending = list(steps)
+    running = {}
+    printed_count = 0
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_worker,
+        initargs=(workbook_snapshot,),
+    ) as executor:
+        while pending or running:
+            for step in list(pending):
+                failed_dependency = _get_failed_dependency(
+                    dependencies[step.name], results, skipped
+                )
+                if failed_dependency is not None:
+                    skipped[step.name] = failed_dependency
+                    pending.remove(step)
+                elif all(name in results for name in dependencies[step.name]):
+                    pending.remove(step)
+                    if skip_step is not None and skip_step(step):
+                        results[step.name] = StepResult(name=step.name)
+                    else:
+                        future = executor.submit(
+                            _run_step_in_worker,
+                            step,
+                            profiler is not None,
+                            profiler.profile_folder_path if profiler else None,
+                            profiler.trace_memory if profiler else True,
+                        )
+                        running[future] = step
+
+            if not running:
+                printed_count = _print_step_outputs(
+                    steps, printed_count, results, skipped
+                )
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                step = running.pop(future)
+                results[step.name] = future.result()
+                # Add the files written by the worker to the counts of this process
+                get_output_counts().add(results[step.name].output_counts)
+                if profiler is not None and results[step.name].profile is not None:
+                    profiler.add(results[step.name].profile)
+
+            # Print the outputs of the steps done, up to the first step still running
+            printed_count = _print_step_outputs(steps, printed_count, results, skipped)
+
+    _print_step_outputs(steps, printed_count, results, skipped)
+    failed_results = [
+        results[step.name]
+        for step in steps
+        if step.name in results and results[step.name].error is not None
+    ]
+    if failed_results:
+        raise StepError(
+            f"Step {failed_results[0].name} failed:\n{failed_results[0].error}"
+        )
+
+
+# Get the name of a failed or skipped dependency, if any
+def _get_failed_dependency(
+    dependency_names: list[str],
+    results: dict[str, StepResult],
+    skipped: dict[str, str],
+) -> Optional[str]:
+    for name in dependency_names:
+        if name in skipped:
+            return skipped[name]
+        if name in results and results[name].error is not None:
+            return name
+    return None
+
+
+# Print the outputs of the next finished steps in declared order, returning the count printed
+def _print_step_outputs(
+    steps: list[GeneratorStep],
+    printed_count: int,
+    results: dict[str, StepResult],
+    skipped: dict[str, str],
+) -> int:
+    while printed_count < len(steps):
+        name = steps[printed_count].name
+        if name in results:
+            print(results[name].output, end="")
+        elif name in skipped:
+            print(f"Skipped {name}: {skipped[name]} failed")
+        else:
+            break
+        printed_count += 1
+    return printed_count
+
+
+# Workbook snapshot of the worker process, sent once when the worker starts
+_worker_workbook_snapshot: Optional[WorkbookSnapshot] = None
+
+
+def _init_worker(workbook_snapshot: WorkbookSnapshot) -> None:
+    global _worker_workbook_snapshot
+    _worker_workbook_snapshot = workbook_snapshot
+
+
+# Get the number of data rows of the sheets read by a step
+def get_rows_read(step: GeneratorStep, workbook_snapshot: WorkbookSnapshot) -> int:
+    return sum(
+        max(0, len(workbook_snapshot.get_rows(sheet_name)) - 1)
+        for sheet_name in step.reads
+        if sheet_name in workbook_snapshot.sheetnames
+    )
+
+
+# Run a step, profiling it if a profiler is set
+def _run_step(
+    step: GeneratorStep,
+    workbook_snapshot: WorkbookSnapshot,
+    profiler: Optional[StepProfiler],
+) -> None:
+    if profiler is None:
+        step.run(workbook_snapshot)
+        return
+    with profiler.profile(step.name, get_rows_read(step, workbook_snapshot)):
+        step.run(workbook_snapshot)
+
+
+# Run a step in a worker process and capture its output
+def _run_step_in_worker(
+    step: GeneratorStep,
+    profile: bool = False,
+    profile_folder_path: Optional[str] = None,
+    trace_memory: bool = True,
+) -> StepResult:
+    output = io.StringIO()
+    error = None
+    profiler = (
+        StepProfiler(profile_folder_path, trace_memory=trace_memory)
+        if profile
+        else None
+    )
+    reset_output_counts()
+    with contextlib.redirect_stdout(output):
+        try:
+            _run_step(step, _worker_workbook_snapshot, profiler)
+        except Exception:
+            error = traceback.format_exc()
+    return StepResult(
+        name=step.name,
+        output=output.getvalue(),
+        error=error,
+        output_counts=reset_output_counts(),
+        profile=profiler.profiles[0] if profiler and profiler.profiles else None,
+    )
@@ -0,0 +1,340 @@
+# Copyright 2026, Polytechnique Montreal and contributors
+# This file is licensed under the MIT License.
+# License text available at https://opensource.org/licenses/MIT
+
+# Note: This script builds synthetic Generator workbooks of any size, with the
+# sheets and columns of a real survey, for the benchmarks of the generation scripts.
+# These functions are intended to be invoked from the tests.
+import random  # Deterministic variations of the synthetic rows
+from dataclasses import dataclass
+import openpyxl  # Save the synthetic workbook to an Excel file
+from openpyxl.cell import WriteOnlyCell
+
+SECTIONS_HEADERS = (
+    "section",
+    "abbreviation",
+    "title_fr",
+    "title_en",
+    "in_nav",
+    "template",
+    "has_preload",
+    "parent_section",
+    "enable_conditional",
+    "completion_conditional",
+)
+WIDGETS_HEADERS = (
+    "questionName",
+    "inputType",
+    "active",
+    "section",
+    "group",
+    "path",
+    "label::fr",
+    "label::en",
+    "label_one::fr",
+    "label_one::en",
+    "parameters",
+    "appearance",
+    "conditional",
+    "validation",
+    "choices",
+    "help_popup",
+    "inputRange",
+    "comments",
+    "confirm_popup",
+    "containsHtml",
+    "customPath",
+    "customChoice",
+    "defaultValue",
+    "includeNotApplicable",
+)
+CONDITIONALS_HEADERS = (
+    "conditional_name",
+    "logical_operator",
+    "path",
+    "comparison_operator",
+    "value",
+    "parentheses",
+)
+CHOICES_HEADERS = (
+    "choicesName",
+    "value",
+    "label::fr",
+    "label::en",
+    "label_one::fr",
+    "label_one::en",
+    "spreadChoicesName",
+    "conditional",
+)
+INPUT_RANGE_HEADERS = (
+    "inputRangeName",
+    "labelFrMin",
+    "labelFrMiddle",
+    "labelFrMax",
+    "labelEnMin",
+    "labelEnMiddle",
+    "labelEnMax",
+    "minValue",
+    "maxValue",
+    "unitFr",
+    "unitEn",
+    "input_color",
+)
+LABELS_HEADERS = (
+    "namespace",
+    "key",
+    "label::fr",
+    "label::en",
+    "label_one::fr",
+    "label_one::en",
+)
+
+# Input types of the widgets before the NextButton closing each section
+WIDGETS_INPUT_TYPES = ("String", "Radio", "Number", "Checkbox", "InfoText", "Range")
+CHOICES_PER_LIST = 5
+
+
+@dataclass(frozen=True)
+class SyntheticWorkbookScale:
+    """Number of sections and of rows of each sheet of a synthetic workbook."""
+
+    sections: int
+    widgets: int
+    conditionals: int  # Rows of the Conditionals sheet, 1 to 3 rows per conditional
+    choices: int  # Rows of the Choices sheet, 5 choices per list
+    labels: int = 0
+    input_ranges: int = 1
+
+
+SYNTHETIC_WORKBOOK_SCALES = {
+    "tiny": SyntheticWorkbookScale(
+        sections=3, widgets=30, conditionals=20, choices=50, labels=6, input_ranges=2
+    ),
+    "small": SyntheticWorkbookScale(
+        sections=10,
+        widgets=2000,
+        conditionals=500,
+        choices=5000,
+        labels=200,
+        input_ranges=10,
+    ),
+    "large": SyntheticWorkbookScale(
+        sections=50,
+        widgets=20000,
+        conditionals=5000,
+        choices=50000,
+        labels=2000,
+        input_ranges=50,
+    ),
+}
+
+
+# Build the rows of every sheet of a synthetic workbook, with the headers first
+def get_synthetic_sheets_rows(
+    scale: SyntheticWorkbookScale, seed: int = 0
+) -> dict[str, list[tuple]]:
+    """
+    Build a valid Generator workbook with the sections and rows of the scale.
+
+    The rows mimic a real survey: markdown and gender context in the labels,
+    widgets using choices, conditionals and input ranges, multi-row conditionals
+    with logical operators and current person paths. The same scale and seed
+    always give the same rows.
+    """
+    randomizer = random.Random(seed)
+    section_names = [f"section{index}" for index in range(scale.sections)]
+    input_range_names = [f"range{index}Range" for index in range(scale.input_ranges)]
+    conditionals_rows = _get_conditionals_rows(scale, section_names, randomizer)
+    conditional_names = list(dict.fromkeys(row[0] for row in conditionals_rows))
+    choices_rows = _get_choices_rows(scale, conditional_names, randomizer)
+    choices_names = list(dict.fromkeys(row[0] for row in choices_rows))
+
+    return {
+        "Widgets": [WIDGETS_HEADERS]
+        + _get_widgets_rows(
+            scale,
+            section_names,
+            conditional_names,
+            choices_names,
+            input_range_names,
+            randomizer,
+        ),
+        "Conditionals": [CONDITIONALS_HEADERS] + conditionals_rows,
+        "Sections": [SECTIONS_HEADERS]
+        + [
+            (
+                section,
+                f"s{index}_",
+                f"Section {index}",
+                f"Section {index}",
+                True,
+                False,
+                False,
+                None,
+                None,
+                None,
+            )
+            for index, section in enumerate(section_names)
+        ],
+        "Choices": [CHOICES_HEADERS] + choices_rows,
+        "InputRange": [INPUT_RANGE_HEADERS]
+        + [
+            (name, "Pas du tout", "", "Beaucoup", "Not at all", "", "A lot")
+            + (0, 100, "%", "%", "blue")
+            for name in input_range_names
+        ],
+        "Labels": [LABELS_HEADERS]
+        + [
+            (
+                section_names[index % len(section_names)],
+                f"customLabel{index}",
+                f"**Étiquette {index}** pour {{{{nickname}}}}",
+                f"**Label {index}** for {{{{nickname}}}}",
+                None,
+                None,
+            )
+            for index in range(scale.labels)
+        ],
+    }
+
+
+def _get_widgets_rows(
+    scale: SyntheticWorkbookScale,
+    section_names: list[str],
+    conditional_names: list[str],
+    choices_names: list[str],
+    input_range_names: list[str],
+    randomizer: random.Random,
+) -> list[tuple]:
+    rows = []
+    for section_index, section in enumerate(section_names):
+        # Spread the widgets over the sections, the last one of each section is a NextButton
+        widgets_count = scale.widgets // len(section_names) + (
+            1 if section_index < scale.widgets % len(section_names) else 0
+        )
+        for index in range(widgets_count):
+            question_name = f"{section}_question{index}"
+            path = f"{section}.question{index}"
+            if index == widgets_count - 1:
+                rows.append(
+                    (question_name, "NextButton", True, section, None, path)
+                    + ("Enregistrer et continuer", "Save and continue")
+                    + (None,) * 11
+                    + (True, None, None, None, None)
+                )
+                continue
+
+            input_type = randomizer.choice(WIDGETS_INPUT_TYPES)
+            has_gender = randomizer.random() < 0.2
+            label_fr = (
+                f"**Question {index}** de la section {section}"
+                + (" pour {{nickname}}, né{{gender:/e/·e}}" if has_gender else "")
+                + "\n__Précision sur la question.__"
+            )
+            label_en = (
+                f"**Question {index}** of section {section}"
+                + (" for {{nickname}}" if has_gender else "")
+                + "\n__Details about the question.__"
+            )
+            conditional = (
+                randomizer.choice(conditional_names)
+                if conditional_names and randomizer.random() < 0.3
+                else None
+            )
+            choices = (
+                randomizer.choice(choices_names)
+                if input_type in ("Radio", "Checkbox") and choices_names
+                else None
+            )
+            input_range = (
+                randomizer.choice(input_range_names)
+                if input_type == "Range" and input_range_names
+                else None
+            )
+            if input_type == "Range" and input_range is None:
+                input_type = "String"
+            if input_type in ("Radio", "Checkbox") and choices is None:
+                input_type = "String"
+            rows.append(
+                (question_name, input_type, True, section, None, path)
+                + (label_fr, label_en, None, None, None, None)
+                + (conditional, None, choices, None, input_range, None, None)
+                + (True, None, None, None, None)
+            )
+    return rows
+
+
+def _get_conditionals_rows(
+    scale: SyntheticWorkbookScale,
+    section_names: list[str],
+    randomizer: random.Random,
+) -> list[tuple]:
+    rows = []
+    conditional_index = 0
+    while len(rows) < scale.conditionals:
+        name = f"synthetic{conditional_index}Conditional"
+        rows_count = min(randomizer.randint(1, 3), scale.conditionals - len(rows))
+        logical_operator = randomizer.choice(("&&", "||"))
+        for index in range(rows_count):
+            if randomizer.random() < 0.5:
+                path, operator, value = (
+                    "${currentPerson}.age",
+                    randomizer.choice((">=", "<=", ">", "<")),
+                    randomizer.randint(0, 99),
+                )
+            else:
+                section = randomizer.choice(section_names)
+                path, operator, value = (
+                    f"{section}.question{randomizer.randint(0, 99)}",
+                    randomizer.choice(("===", "!==")),
+                    randomizer.choice(("yes", "no", "dontKnow")),
+                )
+            rows.append(
+                (name, logical_operator if index > 0 else None)
+                + (path, operator, value, None)
+            )
+        conditional_index += 1
+    return rows
+
+
+def _get_choices_rows(
+    scale: SyntheticWorkbookScale,
+    conditional_names: list[str],
+    randomizer: random.Random,
+) -> list[tuple]:
+    rows = []
+    for index in range(scale.choices):
+        list_index, value_index = divmod(index, CHOICES_PER_LIST)
+        conditional = (
+            randomizer.choice(conditional_names)
+            if conditional_names and randomizer.random() < 0.1
+            else None
+        )
+        rows.append(
+            (f"choiceList{list_index}", f"value{value_index}")
+            + (f"Choix **{value_index}**", f"Choice **{value_index}**")
+            + (None, None, None, conditional)
+        )
+    return rows
+
+
+# Save the rows of the sheets to an Excel file
+def save_synthetic_workbook(
+    excel_file_path: str, sheets_rows: dict[str, list[tuple]]
+) -> None:
+    # The write-only mode streams the rows, so large workbooks are saved quickly
+    workbook = openpyxl.Workbook(write_only=True)
+    for sheet_name, rows in sheets_rows.items():
+        sheet = workbook.create_sheet(sheet_name)
+        for row in rows:
+            sheet.append([_get_cell(sheet, value) for value in row])
+    workbook.save(excel_file_path)
+
+
+# Force string type for values that start with "=" so they are not stored as formulas
+def _get_cell(sheet, value):
+    if isinstance(value, str) and value.startswith("="):
+        cell = WriteOnlyCell(sheet, value=value)
+        cell.data_type = "s"
+        return cell
+    return value
@@ -0,0 +1,126 @@
+# Copyright 2026, Polytechnique Montreal and contributors
+# This file is licensed under the MIT License.
+# License text available at https://opensource.org/licenses/MIT
+
+# Note: This script includes the cache of the issues found by the last integrity check
+# of an Excel file, by hash of each row and of each group of rows, so the next check
+# only validates again the rows and groups that changed.
+# These functions are intended to be invoked from the ConditionalsGenerator checks.
+import hashlib  # For the rows, groups and file path hashes
+import os  # File system operations
+from helpers.validation_issues import ValidationIssue
+from helpers.workbook_cache import (
+    get_cache_folder_path,
+    read_pickle_file,
+    write_pickle_file,
+)
+
+# Bump when the content of the cached issues changes, so older cache files are ignored
+VALIDATION_CACHE_FORMAT_VERSION = 2
+
+
+# Get the hash of the values of a row
+def get_values_hash(values: tuple) -> bytes:
+    # repr keeps the types apart (e.g. 1, 1.0, True and "1"), unlike str
+    return hashlib.blake2b(repr(values).encode("utf-8"), digest_size=16).digest()
+
+
+# Get the hash of a group of rows from the hashes of its rows, in order
+def get_group_hash(row_hashes: list[bytes]) -> bytes:
+    return hashlib.blake2b(b"".join(row_hashes), digest_size=16).digest()
+
+
+class ValidationCache:
+    """
+    Issues of the rows and groups of rows of the last check of an Excel file.
+
+    The issues of the previous check are read by hash of the row or group values,
+    and the issues of the current check are recorded to be saved for the next one.
+    The hashes include the row numbers, since the messages include them.
+    """
+
+    def __init__(
+        self,
+        cache_file_path: str,
+        checks_signature: str,
+        previous_row_issues: dict[bytes, list[ValidationIssue]] | None = None,
+        previous_group_issues: dict[bytes, list[list[ValidationIssue]]] | None = None,
+    ):
+        self.cache_file_path = cache_file_path
+        # Identifies the code of the checks, the cached issues of other checks are not used
+        self.checks_signature = checks_signature
+        self._previous_row_issues = previous_row_issues or {}
+        self._previous_group_issues = previous_group_issues or {}
+        self.row_issues: dict[bytes, list[ValidationIssue]] = {}
+        # None until the groups are checked, they are not when a row has issues
+        self.group_issues: dict[bytes, list[list[ValidationIssue]]] | None = None
+
+    # Get the issues of a row in the previous check, or None if the row changed
+    def get_row_issues(self, row_hash: bytes) -> list[ValidationIssue] | None:
+        return self._previous_row_issues.get(row_hash)
+
+    def set_row_issues(self, row_hash: bytes, issues: list[ValidationIssue]) -> None:
+        self.row_issues[row_hash] = issues
+
+    # Get the issues of each rule for a group in the previous check, or None if the group changed
+    def get_group_issues(self, group_hash: bytes) -> list[list[ValidationIssue]] | None:
+        return self._previous_group_issues.get(group_hash)
+
+    def set_group_issues(
+        self, group_hash: bytes, issues: list[list[ValidationIssue]]
+    ) -> None:
+        if self.group_issues is None:
+            self.group_issues = {}
+        self.group_issues[group_hash] = issues
+
+    # Save the issues of the current check, keeping the previous groups when they were not checked
+    def save(self) -> None:
+        write_pickle_file(
+            self.cache_file_path,
+            {
+                "version": VALIDATION_CACHE_FORMAT_VERSION,
+                "checks_signature": self.checks_signature,
+                "row_issues": self.row_issues,
+                "group_issues": (
+                    self._previous_group_issues
+                    if self.group_issues is None
+                    else self.group_issues
+                ),
+            },
+        )
+
+
+# Get the path of the validation cache file of an Excel file, by hash of its absolute path
+def get_validation_cache_file_path(cache_folder_path: str, excel_file_path: str) -> str:
+    path_sha256 = hashlib.sha256(
+        os.path.abspath(excel_file_path).encode("utf-8")
+    ).hexdigest()
+    # Same extension as the parsed sheets cache files, so both are evicted together
+    return os.path.join(
+        cache_folder_path,
+        f"validation-{path_sha256}.v{VALIDATION_CACHE_FORMAT_VERSION}.pickle",
+    )
+
+
+# Load the issues of the last check of an Excel file, or an empty cache if there is none
+def load_validation_cache(
+    excel_file_path: str,
+    checks_signature: str,
+    cache_folder_path: str | None = None,
+) -> ValidationCache:
+    cache_file_path = get_validation_cache_file_path(
+        cache_folder_path or get_cache_folder_path(), excel_file_path
+    )
+    cached = read_pickle_file(cache_file_path)
+    if (
+        not isinstance(cached, dict)
+        or cached.get("version") != VALIDATION_CACHE_FORMAT_VERSION
+        or cached.get("checks_signature") != checks_signature
+    ):
+        return ValidationCache(cache_file_path, checks_signature)
+    return ValidationCache(
+        cache_file_path,
+        checks_signature,
+        previous_row_issues=cached["row_issues"],
+        previous_group_issues=cached["group_issues"],
+    )
@@ -0,0 +1,77 @@
+# Copyright 2026, Polytechnique Montreal and contributors
+# This file is licensed under the MIT License.
+# License text available at https://opensource.org/licenses/MIT
+
+# Note: This script includes the issues found by the Excel integrity checks, with the
+# sheet, row, column and rule of each one, and the stream sending them to a callback
+# as soon as they are found, stopping the check after a maximum number of issues.
+# These classes are intended to be used by the integrity checks and their CLI.
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+
+
+@dataclass(frozen=True)
+class ValidationIssue:
+    """One issue of an integrity check, with where it is and the rule that found it."""
+
+    # The sheet of the issue, or None for an issue with the whole file.
+    sheet: str | None
+    # The Excel row number (the first data row being row 2), or None for a sheet or group issue.
+    row: int | None
+    # The column of the issue (several columns separated by ", "), or None.
+    column: str | None
+    # Identifier of the check that found the issue (e.g. "parentheses_balance").
+    rule: str
+    # Human-readable message, as listed by check_with_messages.
+    message: str
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class MaxErrorsReached(Exception):
+    """Raised by an ``IssueStream`` to stop the check once the maximum number of issues is reported."""
+
+
+class IssueStream:
+    """
+    Send each issue of a check to a callback as soon as it is found.
+
+    When max_errors is set, the stream sends at most that many issues. It raises
+    ``MaxErrorsReached`` on the next issue, without sending it, so the checks stop
+    early instead of collecting every issue, and ``max_errors_reached`` is only
+    True when issues were left out. The checks send each issue to the stream
+    before recording it, so the issue left out is not recorded either.
+    """
+
+    def __init__(
+        self,
+        on_issue: Callable[[ValidationIssue], None] | None = None,
+        max_errors: int | None = None,
+    ):
+        self.on_issue = on_issue
+        self.max_errors = max_errors
+        self.count = 0
+        self.max_errors_reached = False
+
+    def __call__(self, issue: ValidationIssue) -> None:
+        if self.max_errors is not None and self.count >= self.max_errors:
+            self.max_errors_reached = True
+            raise MaxErrorsReached()
+        if self.on_issue is not None:
+            self.on_issue(issue)
+        self.count += 1
+
+
+# Send an issue found after the checks (e.g. an unexpected error), ignoring the maximum
+def report_issue(
+    on_issue: Callable[[ValidationIssue], None] | None, issue: ValidationIssue
+) -> None:
+    if isinstance(on_issue, IssueStream):
+        on_issue = on_issue.on_issue
+    if on_issue is None:
+        return
+    try:
+        on_issue(issue)
+    except MaxErrorsReached:
+        pass
@@ -0,0 +1,159 @@
+# Copyright 2026, Polytechnique Montreal and contributors
+# This file is licensed under the MIT License.
+# License text available at https://opensource.org/licenses/MIT
+
+# Note: This script includes functions that keep the parsed sheets of the Generator
+# Excel file on disk, so an unchanged Excel file is not parsed again with openpyxl.
+# These functions are intended to be invoked from the generate_survey.py script.
+import hashlib  # For the Excel file content hash
+import os  # File system operations
+import pickle  # Compact binary format for the sheets values
+import tempfile  # Atomic writes of the cache files
+from helpers.generator_helpers import WorkbookSnapshot, is_excel_file
+
+# Bump when the content of the cached snapshots changes, so older cache files are ignored
+CACHE_FORMAT_VERSION = 1
+CACHE_FILE_EXTENSION = ".pickle"
+# Maximum total size of the cache folder, the least recently used files are removed first
+DEFAULT_CACHE_MAX_SIZE_BYTES = 200 * 1024 * 1024
+
+
+# Get the cache folder, set with the GENERATOR_CACHE_FOLDER environment variable or in the user cache folder
+def get_cache_folder_path() -> str:
+    cache_folder_path = os.getenv("GENERATOR_CACHE_FOLDER")
+    if cache_folder_path:
+        return cache_folder_path
+    return os.path.join(os.path.expanduser("~"), ".cache", "evolution-generator")
+
+
+# Get the SHA-256 of the content of a file
+def get_file_sha256(file_path: str) -> str:
+    sha256 = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+# Get the path of the cache file for an Excel file content hash
+def get_cache_file_path(cache_folder_path: str, excel_sha256: str) -> str:
+    return os.path.join(
+        cache_folder_path,
+        f"{excel_sha256}.v{CACHE_FORMAT_VERSION}{CACHE_FILE_EXTENSION}",
+    )
+
+
+# Load the snapshot of an Excel file, from the cache when the file content did not change
+def load_workbook_snapshot(
+    excel_file_path: str,
+    use_cache: bool = True,
+    cache_folder_path: str | None = None,
+    cache_max_size_bytes: int = DEFAULT_CACHE_MAX_SIZE_BYTES,
+) -> WorkbookSnapshot:
+    if not use_cache:
+        return WorkbookSnapshot(excel_file_path)
+
+    is_excel_file(excel_file_path)  # Check if the input file is an Excel file
+    cache_folder_path = cache_folder_path or get_cache_folder_path()
+    excel_sha256 = get_file_sha256(excel_file_path)
+    cache_file_path = get_cache_file_path(cache_folder_path, excel_sha256)
+
+    sheets_rows = _read_cache_file(cache_file_path)
+    if sheets_rows is not None:
+        print(f"Read {excel_file_path} from the cache")
+        return WorkbookSnapshot(excel_file_path, sheets_rows)
+
+    snapshot = WorkbookSnapshot(excel_file_path)
+    _write_cache_file(cache_file_path, snapshot)
+    evict_cache_files(cache_folder_path, cache_max_size_bytes)
+    return snapshot
+
+
+# Read the sheets rows from a cache file, or None if it is missing or unreadable
+def _read_cache_file(cache_file_path: str) -> dict | None:
+    cached = read_pickle_file(cache_file_path)
+    if not isinstance(cached, dict) or cached.get("version") != CACHE_FORMAT_VERSION:
+        return None
+    return cached["sheets_rows"]
+
+
+# Read the value of a pickle file of the cache folder, or None if it is missing or unreadable
+def read_pickle_file(file_path: str):
+    try:
+        with open(file_path, "rb") as cache_file:
+            value = pickle.load(cache_file)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Warning: ignoring unreadable cache file {file_path}: {e}")
+        return None
+    try:
+        # Mark the file as recently used for the eviction
+        os.utime(file_path)
+    except OSError:
+        pass  # e.g. a read-only cache folder, the value is still valid
+    return value
+
+
+# Write the sheets rows of a snapshot to a cache file
+def _write_cache_file(cache_file_path: str, snapshot: WorkbookSnapshot) -> None:
+    sheets_rows = {
+        sheet_name: snapshot.get_rows(sheet_name) for sheet_name in snapshot.sheetnames
+    }
+    write_pickle_file(
+        cache_file_path, {"version": CACHE_FORMAT_VERSION, "sheets_rows": sheets_rows}
+    )
+
+
+# Write a value to a pickle file of the cache folder, warning instead of failing
+def write_pickle_file(file_path: str, value) -> None:
+    cache_folder_path = os.path.dirname(file_path)
+    try:
+        os.makedirs(cache_folder_path, exist_ok=True)
+        # Write to a temporary file first, so a concurrent run never reads a partial file
+        file_descriptor, temp_file_path = tempfile.mkstemp(
+            dir=cache_folder_path, suffix=".tmp"
+        )
+        try:
+            with os.fdopen(file_descriptor, "wb") as cache_file:
+                pickle.dump(value, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file_path, file_path)
+        finally:
+            if os.path.exists(temp_file_path):
+                os.remove(temp_file_path)
+    except OSError as e:
+        # The cache is only an optimization, the generation continues without it
+        print(f"Warning: could not write cache file {file_path}: {e}")
+
+
+# Remove the least recently used cache files until the folder fits in the maximum size
+def evict_cache_files(cache_folder_path: str, max_size_bytes: int) -> list[str]:
+    cache_files = []
+    try:
+        file_names = os.listdir(cache_folder_path)
+    except OSError:
+        return []  # The cache folder could not be created, there is nothing to evict
+    for file_name in file_names:
+        if not file_name.endswith(CACHE_FILE_EXTENSION):
+            continue
+        file_path = os.path.join(cache_folder_path, file_name)
+        try:
+            file_stat = os.stat(file_path)
+        except OSError:
+            continue  # Removed by another run since the folder was listed
+        cache_files.append((file_stat.st_mtime, file_stat.st_size, file_path))
+
+    total_size = sum(size for _mtime, size, _path in cache_files)
+    removed_files = []
+    for _mtime, size, file_path in sorted(cache_files):
+        if total_size <= max_size_bytes:
+            break
+        try:
+            os.remove(file_path)
+        except FileNotFoundError:
+            pass  # Already removed by another run
+        except OSError:
+            continue  # e.g. not allowed to remove it, the file is kept
+        total_size -= size
+        removed_files.append(file_path)
+    return removed_files
@@ -3,33 +3,79 @@
 # This file is licensed under the MIT License.
 # License text available at https://opensource.org/licenses/MIT
 
+# Note: This script checks the integrity of an Excel file and prints the result as JSON.
+# By default, it prints one JSON object with every issue. With --jsonl, it prints one
+# JSON line per issue as soon as it is found, then a summary line, and with
+# --max-errors N, the check stops after N issues.
+#   python check_excel_integrity_cli.py survey.xlsx [--jsonl] [--max-errors N]
+import argparse  # For command-line arguments
 import json
 import sys
 
+from helpers.validation_issues import IssueStream, ValidationIssue
+
 try:
-    from scripts.conditionals_generator import ConditionalsGenerator
+    from scripts.references_checker import check_workbook_integrity
 except ModuleNotFoundError:
-    from conditionals_generator import ConditionalsGenerator
+    from references_checker import check_workbook_integrity
+
+
+# Parse the command-line arguments, the Excel file path being optional to report it as JSON
+def _parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("excel_file_path", nargs="?", help="Path of the Excel file")
+    parser.add_argument(
+        "--jsonl",
+        action="store_true",
+        help="Print one JSON line per issue as soon as it is found, then a summary line",
+    )
+    parser.add_argument(
+        "--max-errors",
+        type=int,
+        default=None,
+        help="Stop the check after this number of issues",
+    )
+    args = parser.parse_args(argv)
+    if args.max_errors is not None and args.max_errors < 1:
+        parser.error("--max-errors must be at least 1")
+    return args
+
 
+# Print one JSON line and flush it, so the reader gets each issue as soon as it is found
+def _print_json_line(value: dict) -> None:
+    print(json.dumps(value), flush=True)
 
-def main() -> int:
-    if len(sys.argv) < 2:
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
+    if args.excel_file_path is None:
         print(json.dumps({"ok": False, "error": "Missing excel file path argument"}))
         return 2
 
-    excel_file_path = sys.argv[1]
+    excel_file_path = args.excel_file_path
+    issues: list[ValidationIssue] = []
+
+    def on_issue(issue: ValidationIssue) -> None:
+        issues.append(issue)
+        if args.jsonl:
+            _print_json_line({"issue": issue.to_dict()})
 
+    issue_stream = IssueStream(on_issue, args.max_errors)
     try:
-        integrity_ok, errors = ConditionalsGenerator().check_with_messages(
-            excel_file_path
+        integrity_ok, errors = check_workbook_integrity(
+            excel_file_path, issue_stream=issue_stream
         )
         payload: dict = {
             "ok": True,
             "integrityOk": integrity_ok,
             "excelFilePath": excel_file_path,
-            # Always send the list so the admin API can forward every validation line to the UI.
-            "errors": errors,
+            "errorsCount": len(errors),
+            "maxErrorsReached": issue_stream.max_errors_reached,
         }
+        if not args.jsonl:
+            # Always send the list so the admin API can forward every validation line to the UI.
+            payload["errors"] = errors
+            payload["issues"] = [issue.to_dict() for issue in issues]
         print(json.dumps(payload))
         return 0
     except Exception as error:
@@ -0,0 +1,751 @@
+# Copyright 2026, Polytechnique Montreal and contributors
+# This file is licensed under the MIT License.
+# License text available at https://opensource.org/licenses/MIT
+
+# Note: This script evaluates the conditionals of the Conditionals sheet against
+# exported interviews, with the same result as the checkConditionals function called by
+# the generated conditionals.tsx, without replaying the frontend. The interviews are read
+# from a JSON-lines file and evaluated in chunks: each path is read once per chunk for
+# every interview, each distinct condition is compared once over that column, and the
+# results are combined for all the interviews of the chunk at once.
+#   python conditionals_evaluator.py survey.xlsx interviews.jsonl [--path <widget path>] [--output results.jsonl]
+import argparse  # For command-line arguments
+import functools  # Cache of the numbers of the string responses
+import json  # Interviews and results format
+import math  # Finite numbers check
+import operator  # Comparisons of the responses columns
+import re  # Path placeholders and JavaScript number formats
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from itertools import repeat
+
+from helpers.generator_helpers import ExcelSource, get_table_from_excel
+from scripts.conditionals_generator import ConditionalsGenerator
+
+# Number of interviews evaluated together, limiting the memory used by the columns
+CONDITIONALS_EVALUATOR_CHUNK_SIZE = 5000
+
+# Precedence of the logical operators, && before || like in JavaScript
+_LOGICAL_OPERATORS_PRECEDENCE = {"&&": 2, "||": 1}
+
+# Placeholders of a path, replaced by a response by interpolatePath (e.g. {_activePersonId})
+_PATH_PLACEHOLDER_REGEX = re.compile(r"\{(.+?)\}")
+# Variables of a generated template path (e.g. ${relativePath} or ${currentPersonId})
+_TEMPLATE_VARIABLE_REGEX = re.compile(r"\$\{(\w+)\}")
+# Keys of a lodash path, separated by dots or between brackets (e.g. a.b[0].c)
+_PATH_KEY_REGEX = re.compile(r"[^.[\]]+")
+
+# Numbers accepted by the JavaScript Number() function, once trimmed
+_JS_DECIMAL_NUMBER_REGEX = re.compile(r"[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?")
+_JS_RADIX_NUMBER_REGEXES = (
+    (re.compile(r"0[xX][0-9a-fA-F]+"), 16),
+    (re.compile(r"0[oO][0-7]+"), 8),
+    (re.compile(r"0[bB][01]+"), 2),
+)
+
+# Regexes of the objects of the current context in a widget path, as in the odSurvey helpers
+_PERSON_PATH_REGEX = re.compile(r"household\.persons\.([^.]+)\.")
+_JOURNEY_PATH_REGEX = re.compile(
+    r"household\.persons\.([^.]+)\.journeys\.([^.]+)(?:\.|$)"
+)
+_TRIP_PATH_REGEX = re.compile(
+    r"household\.persons\.([^.]+)\.journeys\.([^.]+)\.trips\.([^.]+)(?:\.|$)"
+)
+_SEGMENT_PATH_REGEX = re.compile(
+    r"household\.persons\.([^.]+)\.journeys\.([^.]+)\.trips\.([^.]+)\.segments\.([^.]+)(?:\.|$)"
+)
+_VISITED_PLACE_PATH_REGEX = re.compile(
+    r"household\.persons\.([^.]+)\.journeys\.([^.]+)\.visitedPlaces\.([^.]+)(?:\.|$)"
+)
+
+
+# Get the keys of a lodash path (e.g. "a.b[0]" -> ["a", "b", "0"])
+def _split_path(path: str) -> tuple[str, ...]:
+    return tuple(_PATH_KEY_REGEX.findall(path))
+
+
+# Get the child of a response value like lodash get, or None if there is none
+def _get_child(value, key: str):
+    if isinstance(value, dict):
+        return value.get(key)
+    if isinstance(value, list) and key.isdigit():
+        index = int(key)
+        return value[index] if index < len(value) else None
+    return None
+
+
+# Get the value of a path in a response like getResponse, null and missing values being None
+def _get_response(response, keys: Iterable[str]):
+    value = response
+    for key in keys:
+        value = _get_child(value, key)
+        if value is None:
+            return None
+    return value
+
+
+# Get the name of the JavaScript type of a JSON value, arrays apart from the other objects
+def _js_type(value) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, (int, float)):
+        return "number"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, list):
+        return "array"
+    return "object"
+
+
+# Convert a value to a string like the JavaScript String() function, for the paths
+def _js_string(value) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, float) and value.is_integer() and abs(value) < 1e21:
+        return str(int(value))
+    return str(value)
+
+
+# Convert a non-empty string to a number like the JavaScript Number() function, NaN when it is not finite
+def _js_string_to_number(value: str) -> float:
+    value = value.strip()
+    number = math.nan
+    if _JS_DECIMAL_NUMBER_REGEX.fullmatch(value):
+        number = float(value)
+    else:
+        for regex, base in _JS_RADIX_NUMBER_REGEXES:
+            if regex.fullmatch(value):
+                number = float(int(value[2:], base))
+                break
+    return number if math.isfinite(number) else math.nan
+
+
+# Check if an array includes a value, like the JavaScript includes function
+def _js_includes(array: list, value) -> bool:
+    value_type = _js_type(value)
+    return any(item == value and _js_type(item) == value_type for item in array)
+
+
+# Convert a string response to a number like checkConditionals, the same strings being often repeated
+@functools.lru_cache(maxsize=65536)
+def _js_string_response_to_number(value: str) -> float:
+    return _js_string_to_number(value) if value.strip() != "" else math.nan
+
+
+# Comparisons of a number response with a number value
+_NUMBER_COMPARISONS: dict[str, Callable[[object, object], bool]] = {
+    "===": operator.eq,
+    "!==": operator.ne,
+    ">": operator.gt,
+    "<": operator.lt,
+    ">=": operator.ge,
+    "<=": operator.le,
+}
+
+# Python types of the JSON values by JavaScript type, see _js_type
+_JS_TYPE_CLASSES = {"boolean": bool, "string": str, "array": list}
+_NUMBER_CLASSES = (int, float)
+
+
+class _Column:
+    """
+    The responses at a path for the interviews of a chunk, with the results of a comparison
+    packed in an integer with one byte per interview (1 if true). The views used by the
+    comparisons (types, numbers) are computed once, on first use.
+    """
+
+    def __init__(self, values: list):
+        self.values = values
+        self.size = len(values)
+        # Every interview of the chunk
+        self.all = self.pack([True] * self.size)
+        self._type_masks: dict[str, int] = {}
+        self._numbers: list | None = None
+        self._array_indexes: list[int] | None = None
+        # Responses equal to a value, or arrays including it, by value type and value
+        self._equal_masks: dict[tuple, int] = {}
+
+    @staticmethod
+    def pack(results: Iterable[bool]) -> int:
+        return int.from_bytes(bytes(results), "little")
+
+    def type_mask(self, js_type: str) -> int:
+        """Return the interviews with a response of this JavaScript type."""
+        mask = self._type_masks.get(js_type)
+        if mask is None:
+            if js_type == "null":
+                mask = self.pack(map(operator.is_, self.values, repeat(None)))
+            elif js_type == "number":
+                # bool is a subclass of int
+                mask = self.pack(
+                    map(isinstance, self.values, repeat(_NUMBER_CLASSES))
+                ) ^ self.type_mask("boolean")
+            else:
+                mask = self.pack(
+                    map(isinstance, self.values, repeat(_JS_TYPE_CLASSES[js_type]))
+                )
+            self._type_masks[js_type] = mask
+        return mask
+
+    def numbers(self) -> list:
+        """Return the responses as numbers like checkConditionals, NaN when they are not numbers or numeric strings."""
+        if self._numbers is None:
+            self._numbers = [
+                (
+                    value
+                    if value.__class__ in _NUMBER_CLASSES
+                    else (
+                        _js_string_response_to_number(value)
+                        if value.__class__ is str
+                        else math.nan
+                    )
+                )
+                for value in self.values
+            ]
+        return self._numbers
+
+    def array_mask(self, predicate: Callable[[list], bool]) -> int:
+        """Return the interviews with an array response for which predicate is true."""
+        if self._array_indexes is None:
+            self._array_indexes = (
+                [
+                    index
+                    for index, value in enumerate(self.values)
+                    if value.__class__ is list
+                ]
+                if self.type_mask("array")
+                else []
+            )
+        mask = 0
+        for index in self._array_indexes:
+            if predicate(self.values[index]):
+                mask |= 1 << (8 * index)
+        return mask
+
+    def compare(self, comparison_operator: str, value) -> int:
+        """Compare each response with the value of a conditional, as checkConditionals does."""
+        value_type = _js_type(value)
+        is_equal = None
+        if comparison_operator in ("===", "!=="):
+            is_equal = comparison_operator == "==="
+
+        if value_type == "null":
+            # For null value, check if the response is null / empty array
+            if is_equal is None:
+                return 0
+            mask = self.type_mask("null") | self.array_mask(lambda array: not array)
+            return mask if is_equal else self.all ^ mask
+
+        if value_type == "number":
+            # Numbers, and strings converted to numbers, are compared with every operator
+            compared_mask = self.type_mask("number") | self.type_mask("string")
+            if is_equal is None:
+                compare = _NUMBER_COMPARISONS.get(comparison_operator)
+                if compare is None:
+                    return 0
+                return (
+                    self.pack(map(compare, self.numbers(), repeat(value)))
+                    & compared_mask
+                )
+        elif is_equal is None:
+            return 0
+        else:
+            # Strings and booleans are only compared with a response of the same type
+            compared_mask = self.type_mask(value_type)
+
+        # === and !== of the same value share the responses equal to it
+        key = (value_type, value)
+        equal_mask = self._equal_masks.get(key)
+        if equal_mask is None:
+            values = self.numbers() if value_type == "number" else self.values
+            equal_mask = self._equal_masks[key] = (
+                self.pack(map(operator.eq, values, repeat(value))) & compared_mask
+            ) | self.array_mask(lambda array: _js_includes(array, value))
+        if is_equal:
+            return equal_mask
+        return (compared_mask | self.type_mask("array")) ^ equal_mask
+
+
+@dataclass(frozen=True)
+class _Condition:
+    """One row of a conditional: the comparison of the response at a path with a value."""
+
+    # The path of the generated code, with its ${...} variables (e.g. ${relativePath}.age)
+    path_template: str
+    comparison_operator: str
+    value: object
+    # JavaScript type of the value, so 1, 1.0, True and "1" are different conditions
+    value_type: str
+
+
+@dataclass
+class _CompiledConditional:
+    """A conditional_name compiled to the postfix expression of its conditions."""
+
+    # Indexes of the conditions, and "&&" or "||" for the logical operators, in postfix order
+    program: list
+    value_when_hidden: object
+    # True if the paths need the widget path (${relativePath})
+    needs_widget_path: bool
+
+
+class ConditionalsEvaluator:
+    """
+    Evaluate the conditionals of the Conditionals sheet against interview responses.
+
+    Each conditional_name is compiled once, with the same semantics as checkConditionals:
+    ``&&`` before ``||``, the parentheses, the ``${relativePath}`` and ``${current...}``
+    paths of the generated code, the ``{...}`` placeholders of the paths and the
+    valueWhenHidden. The conditionals that checkConditionals would reject (e.g. unbalanced
+    parentheses) are not evaluated and are listed in ``errors``.
+    """
+
+    def __init__(self, conditional_by_name: Mapping[str, list[dict]]):
+        self.conditions: list[_Condition] = []
+        self.conditionals: dict[str, _CompiledConditional] = {}
+        # conditional_name -> why it cannot be evaluated
+        self.errors: dict[str, str] = {}
+        condition_indexes: dict[_Condition, int] = {}
+        for conditional_name, conditionals in conditional_by_name.items():
+            try:
+                self.conditionals[conditional_name] = self._compile(
+                    conditionals, condition_indexes
+                )
+            except ValueError as e:
+                self.errors[conditional_name] = str(e)
+        self.conditions = list(condition_indexes)
+
+    @classmethod
+    def from_excel(cls, input_file: ExcelSource) -> "ConditionalsEvaluator":
+        """Compile the conditionals of the Conditionals sheet of ``input_file``."""
+        table = get_table_from_excel(input_file, sheet_name="Conditionals")
+        return cls(ConditionalsGenerator.extract_conditionals_from_data(table))
+
+    @staticmethod
+    def _compile(
+        conditionals: list[dict], condition_indexes: dict[_Condition, int]
+    ) -> _CompiledConditional:
+        """Compile the rows of a conditional_name to a postfix expression (shunting-yard), adding its conditions to condition_indexes."""
+        to_primitive = ConditionalsGenerator._conditional_cell_to_primitive
+        current_context_specs = ConditionalsGenerator.CONDITIONALS_CURRENT_CONTEXT_SPECS
+        known_variables = {"relativePath"} | {
+            spec["id_var"] for spec in current_context_specs
+        }
+        program: list = []
+        operators: list[str] = []
+        needs_widget_path = False
+        parentheses_balance = 0
+        for index, conditional in enumerate(conditionals):
+            raw_path = conditional.get("path") or ""
+            expanded_path = ConditionalsGenerator._expand_tokenized_path(
+                raw_path, current_context_specs=current_context_specs
+            )
+            path_template = raw_path if expanded_path is None else expanded_path[1:-1]
+            if expanded_path is not None:
+                variables = set(_TEMPLATE_VARIABLE_REGEX.findall(path_template))
+                if not variables <= known_variables:
+                    raise ValueError(
+                        f"Unknown variables in path {repr(raw_path)}: {sorted(variables - known_variables)}"
+                    )
+                needs_widget_path = needs_widget_path or "relativePath" in variables
+            value = to_primitive(conditional.get("value"))
+            condition = _Condition(
+                path_template=path_template,
+                comparison_operator=conditional.get("comparison_operator"),
+                value=value,
+                value_type=_js_type(value),
+            )
+            condition_index = condition_indexes.setdefault(
+                condition, len(condition_indexes)
+            )
+
+            if index > 0:
+                logical_operator = conditional.get("logical_operator")
+                if logical_operator not in _LOGICAL_OPERATORS_PRECEDENCE:
+                    raise ValueError(
+                        f"Missing logicalOperator for non-first conditional (index={index})"
+                    )
+                precedence = _LOGICAL_OPERATORS_PRECEDENCE[logical_operator]
+                while (
+                    operators
+                    and operators[-1] != "("
+                    and _LOGICAL_OPERATORS_PRECEDENCE[operators[-1]] >= precedence
+                ):
+                    program.append(operators.pop())
+                operators.append(logical_operator)
+
+            parentheses = conditional.get("parentheses")
+            if parentheses == "(":
+                parentheses_balance += 1
+                operators.append("(")
+            program.append(condition_index)
+            if parentheses == ")":
+                parentheses_balance -= 1
+                if parentheses_balance < 0:
+                    raise ValueError(
+                        f"Unbalanced parentheses (closing without opening) in conditionals (index={index})"
+                    )
+                while operators[-1] != "(":
+                    program.append(operators.pop())
+                operators.pop()
+
+        if parentheses_balance != 0:
+            raise ValueError(
+                f"Unbalanced parentheses (missing closing parenthesis) in conditionals (balance={parentheses_balance})"
+            )
+        program.extend(reversed(operators))
+
+        value_when_hidden = next(
+            (
+                c.get("value_when_hidden")
+                for c in conditionals
+                if c.get("value_when_hidden") is not None
+            ),
+            None,
+        )
+        return _CompiledConditional(
+            program=program,
+            value_when_hidden=(
+                None if value_when_hidden is None else to_primitive(value_when_hidden)
+            ),
+            needs_widget_path=needs_widget_path,
+        )
+
+    def evaluate(
+        self, interview: Mapping, path: str | None = None
+    ) -> dict[str, tuple[bool, object]]:
+        """
+        Evaluate every conditional for one interview, for the widget at ``path`` if any.
+
+        Returns the [result, valueWhenHidden] tuple of checkConditionals by conditional_name.
+        """
+        results = self.evaluate_batch([interview], path)
+        return {
+            conditional_name: (
+                bool(result[0]),
+                self.conditionals[conditional_name].value_when_hidden,
+            )
+            for conditional_name, result in results.items()
+        }
+
+    def evaluate_batch(
+        self, interviews: list[Mapping], path: str | None = None
+    ) -> dict[str, bytes]:
+        """
+        Evaluate every conditional for a list of interviews at once.
+
+        Returns, by conditional_name, one byte per interview: 1 if the conditional is true
+        for the interview, 0 otherwise. The results of a condition are packed in an integer
+        with one byte per interview, so the logical operators of the conditionals combine
+        the results of all the interviews in one operation. The conditionals with a
+        ``${relativePath}`` are only evaluated with a widget ``path``.
+        """
+        responses = [interview.get("response") or {} for interview in interviews]
+        columns = _ResponseColumns(responses, path)
+        conditions_results: dict[int, int] = {}
+        results: dict[str, bytes] = {}
+        interviews_count = len(responses)
+        for conditional_name, conditional in self.conditionals.items():
+            if conditional.needs_widget_path and path is None:
+                continue
+            stack: list[int] = []
+            for step in conditional.program:
+                if step == "&&":
+                    right = stack.pop()
+                    stack.append(stack.pop() & right)
+                elif step == "||":
+                    right = stack.pop()
+                    stack.append(stack.pop() | right)
+                else:
+                    result = conditions_results.get(step)
+                    if result is None:
+                        condition = self.conditions[step]
+                        result = conditions_results[step] = columns.get(
+                            condition.path_template
+                        ).compare(condition.comparison_operator, condition.value)
+                    stack.append(result)
+            results[conditional_name] = stack[0].to_bytes(interviews_count, "little")
+        return results
+
+    def evaluate_jsonl(
+        self,
+        interviews_lines: Iterable[str],
+        path: str | None = None,
+        chunk_size: int = CONDITIONALS_EVALUATOR_CHUNK_SIZE,
+    ) -> Iterator[tuple[list[dict], dict[str, bytes]]]:
+        """Evaluate the interviews of JSON lines by chunk, yielding the interviews of each chunk with their results."""
+        chunk: list[dict] = []
+        for line in interviews_lines:
+            if not line.strip():
+                continue
+            interview = json.loads(line)
+            # Accept the interviews with their response, or the responses only
+            if "response" not in interview:
+                interview = {"response": interview}
+            chunk.append(interview)
+            if len(chunk) >= chunk_size:
+                yield chunk, self.evaluate_batch(chunk, path)
+                chunk = []
+        if chunk:
+            yield chunk, self.evaluate_batch(chunk, path)
+
+
+class _ResponseColumns:
+    """The responses at each path for the interviews of a chunk, each path read once."""
+
+    def __init__(self, responses: list, widget_path: str | None):
+        self.responses = responses
+        self.widget_path = widget_path
+        # Values by path keys, the columns of the parent paths reused for their children
+        self._columns_by_keys: dict[tuple[str, ...], list] = {(): responses}
+        self._columns_by_template: dict[str, _Column] = {}
+        self._variables_columns: dict[str, list] = {}
+
+    def get(self, path_template: str) -> _Column:
+        """Return the response at the path for each interview, with the variables and placeholders of each interview."""
+        column = self._columns_by_template.get(path_template)
+        if column is None:
+            column = self._columns_by_template[path_template] = _Column(
+                self._get_column(path_template)
+            )
+        return column
+
+    def _get_column(self, path_template: str) -> list:
+        if "${relativePath}" in path_template:
+            path_template = path_template.replace(
+                "${relativePath}", self._get_relative_path()
+            )
+        if "${" in path_template:
+            paths = self._get_interviews_paths(path_template)
+        elif "{" in path_template:
+            paths = [path_template] * len(self.responses)
+        else:
+            # Same path for every interview
+            return self._get_keys_column(_split_path(path_template))
+        return [
+            _get_response(response, _split_path(_interpolate_path(response, path)))
+            for response, path in zip(self.responses, paths)
+        ]
+
+    def _get_relative_path(self) -> str:
+        # Remove the last key from the path, like the generated code
+        return self.widget_path[: max(self.widget_path.rfind("."), 0)]
+
+    def _get_keys_column(self, keys: tuple[str, ...]) -> list:
+        column = self._columns_by_keys.get(keys)
+        if column is None:
+            key = keys[-1]
+            column = [
+                (value.get(key) if value.__class__ is dict else _get_child(value, key))
+                for value in self._get_keys_column(keys[:-1])
+            ]
+            self._columns_by_keys[keys] = column
+        return column
+
+    def _get_interviews_paths(self, path_template: str) -> list[str]:
+        """Replace the ${current...Id} variables of the path with the ids of each interview."""
+        variables = _TEMPLATE_VARIABLE_REGEX.findall(path_template)
+        variables_columns = [self._get_variable_column(name) for name in variables]
+        paths = []
+        for values in zip(*variables_columns):
+            path = path_template
+            for name, value in zip(variables, values):
+                path = path.replace(f"${{{name}}}", _js_string(value))
+            paths.append(path)
+        return paths
+
+    def _get_variable_column(self, name: str) -> list:
+        column = self._variables_columns.get(name)
+        if column is None:
+            get_current_id = _CURRENT_ID_GETTERS[name]
+            column = [
+                get_current_id(response, self.widget_path)
+                for response in self.responses
+            ]
+            self._variables_columns[name] = column
+        return column
+
+
+# Replace the {...} placeholders of a path with the responses, like interpolatePath
+def _interpolate_path(response, path: str) -> str:
+    for placeholder in dict.fromkeys(_PATH_PLACEHOLDER_REGEX.findall(path)):
+        value = _get_response(response, _split_path(placeholder))
+        replacement = (
+            _js_string(value)
+            if isinstance(value, (str, int, float, bool))
+            else "unknown"
+        )
+        path = path.replace(f"{{{placeholder}}}", replacement)
+    return path
+
+
+# Get the _uuid of the object at the keys of the household persons, or None if it does not exist
+def _get_context_object_uuid(response, keys: tuple[str, ...]):
+    value = _get_response(response, ("household", "persons") + keys)
+    if not isinstance(value, dict):
+        return None
+    # An object without _uuid is interpolated as undefined in the generated code
+    return value.get("_uuid", "undefined")
+
+
+def _get_current_person_id(response, widget_path: str | None):
+    match = widget_path and _PERSON_PATH_REGEX.search(widget_path)
+    if match:
+        return match.group(1)
+    return response.get("_activePersonId")
+
+
+def _get_current_journey_id(response, widget_path: str | None):
+    match = widget_path and _JOURNEY_PATH_REGEX.search(widget_path)
+    if match:
+        person_id, journey_id = match.groups()
+        journey_uuid = _get_context_object_uuid(
+            response, (person_id, "journeys", journey_id)
+        )
+        if journey_uuid is not None:
+            return journey_uuid
+    return response.get("_activeJourneyId")
+
+
+def _get_current_trip_id(response, widget_path: str | None):
+    match = widget_path and _TRIP_PATH_REGEX.search(widget_path)
+    if match:
+        person_id, journey_id, trip_id = match.groups()
+        trip_uuid = _get_context_object_uuid(
+            response, (person_id, "journeys", journey_id, "trips", trip_id)
+        )
+        if trip_uuid is not None:
+            return trip_uuid
+    return response.get("_activeTripId")
+
+
+def _get_current_segment_id(response, widget_path: str | None):
+    match = widget_path and _SEGMENT_PATH_REGEX.search(widget_path)
+    if match:
+        person_id, journey_id, trip_id, segment_id = match.groups()
+        # The active segment id is not stored in the response
+        return _get_context_object_uuid(
+            response,
+            (person_id, "journeys", journey_id, "trips", trip_id, "segments")
+            + (segment_id,),
+        )
+    return None
+
+
+def _get_current_visited_place_id(response, widget_path: str | None):
+    match = widget_path and _VISITED_PLACE_PATH_REGEX.search(widget_path)
+    if match:
+        person_id, journey_id, visited_place_id = match.groups()
+        visited_place_uuid = _get_context_object_uuid(
+            response,
+            (person_id, "journeys", journey_id, "visitedPlaces", visited_place_id),
+        )
+        if visited_place_uuid is not None:
+            return visited_place_uuid
+    return response.get("_activeVisitedPlaceId")
+
+
+# Getters of the ${current...Id} variables of the generated code, as the odSurvey helpers
+_CURRENT_ID_GETTERS: dict[str, Callable] = {
+    "currentPersonId": _get_current_person_id,
+    "currentJourneyId": _get_current_journey_id,
+    "currentTripId": _get_current_trip_id,
+    "currentSegmentId": _get_current_segment_id,
+    "currentVisitedPlaceId": _get_current_visited_place_id,
+}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Evaluate the conditionals of an Excel file against interviews."
+    )
+    parser.add_argument(
+        "excel_file_path", help="Excel file with the Conditionals sheet"
+    )
+    parser.add_argument(
+        "interviews_path",
+        help="JSON-lines file of the interviews, or of their responses",
+    )
+    parser.add_argument(
+        "--path",
+        default=None,
+        help="Path of the widget, for the ${relativePath} and ${current...} paths",
+    )
+    parser.add_argument(
+        "--output",
+        default=None,
+        help="JSON-lines file of the true conditionals of each interview",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=CONDITIONALS_EVALUATOR_CHUNK_SIZE,
+        help="Number of interviews evaluated together",
+    )
+    args = parser.parse_args(argv)
+
+    evaluator = ConditionalsEvaluator.from_excel(args.excel_file_path)
+    true_counts: dict[str, int] = {}
+    interviews_count = 0
+    output_file = (
+        open(args.output, "w", encoding="utf-8") if args.output is not None else None
+    )
+    try:
+        with open(args.interviews_path, encoding="utf-8") as interviews_file:
+            for interviews, results in evaluator.evaluate_jsonl(
+                interviews_file, args.path, args.chunk_size
+            ):
+                interviews_count += len(interviews)
+                for conditional_name, result in results.items():
+                    true_counts[conditional_name] = true_counts.get(
+                        conditional_name, 0
+                    ) + result.count(1)
+                if output_file is not None:
+                    for index, interview in enumerate(interviews):
+                        true_conditionals = [
+                            conditional_name
+                            for conditional_name, result in results.items()
+                            if result[index]
+                        ]
+                        output_file.write(
+                            json.dumps(
+                                {
+                                    "uuid": interview.get("uuid"),
+                                    "trueConditionals": true_conditionals,
+                                }
+                            )
+                            + "\n"
+                        )
+    finally:
+        if output_file is not None:
+            output_file.close()
+
+    print(
+        json.dumps(
+            {
+                "interviewsCount": interviews_count,
+                "trueCounts": true_counts,
+                "errors": evaluator.errors,
+                # Conditionals with a ${relativePath} path, only evaluated with --path
+                "needWidgetPath": (
+                    [
+                        conditional_name
+                        for conditional_name, conditional in evaluator.conditionals.items()
+                        if conditional.needs_widget_path
+                    ]
+                    if args.path is None
+                    else []
+                ),
+            },
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
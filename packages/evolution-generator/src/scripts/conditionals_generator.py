@@ -6,21 +6,35 @@
 # TypeScript generation for survey conditionals. It is used from generate_survey.py and from CLI/API checks.
 
 from collections import defaultdict
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
+import functools
 import json
-from openpyxl import Workbook
+import re
 
 from helpers.generator_helpers import (
     INDENT,
+    ExcelSource,
+    SheetTable,
     add_generator_comment,
     get_headers,
-    get_values_from_row,
-    get_workbook,
-    is_excel_file,
+    get_workbook_snapshot,
     sheet_exists,
-    get_data_from_excel,
+    get_table_from_excel,
     generate_output_file,
 )
+from helpers.validation_issues import (
+    MaxErrorsReached,
+    ValidationIssue,
+    report_issue,
+)
+from helpers.validation_cache import (
+    ValidationCache,
+    get_group_hash,
+    get_values_hash,
+    load_validation_cache,
+)
+from helpers.workbook_cache import get_file_sha256
 
 
 @dataclass(frozen=True)
@@ -37,6 +51,280 @@ class _ColumnSpec:
     allowed_types: tuple[type, ...] | None = None
 
 
+_RELATIVE_PATH_TOKEN = "${relativePath}"
+
+
+@dataclass(frozen=True)
+class _PathExpansion:
+    """Expansion tokens of a conditional path, with its TypeScript path and the id variables it needs."""
+
+    # Distinct tokens of the path: ${relativePath} first, then the ${current...} tokens in spec order.
+    tokens: tuple[str, ...]
+    # The path as a TS template string (with backticks), or None when the path has no token.
+    template_path: str | None
+    # The id variables to declare for the ${current...} tokens, with their dependencies.
+    id_vars: frozenset[str]
+
+
+class _PathTokenExpander:
+    """
+    Expander of the tokens of conditional paths, compiled once from the current context specs.
+
+    Every token of a path is found in one regex pass, and the expansion of each distinct path
+    is cached, since the same paths come back in many rows. Only the ``token`` key of
+    the specs is required, ``prefix``, ``id_var`` and ``deps`` are used when present.
+    """
+
+    MAX_CACHED_PATHS = 100_000
+
+    def __init__(self, current_context_specs: tuple[dict, ...]):
+        self._specs_by_token = {spec["token"]: spec for spec in current_context_specs}
+        # Order of the tokens in the results, ${relativePath} first
+        self._token_order = {
+            token: index
+            for index, token in enumerate([_RELATIVE_PATH_TOKEN, *self._specs_by_token])
+        }
+        self._token_regex = re.compile(
+            "|".join(re.escape(token) for token in self._token_order)
+        )
+        self._expansions: dict[str, _PathExpansion] = {}
+
+    def expand(self, path: str) -> _PathExpansion:
+        """Return the tokens, template path and id variables of ``path``, in one regex pass."""
+        expansion = self._expansions.get(path)
+        if expansion is None:
+            # Bound the cache of a long-lived process (e.g. generator_worker.py)
+            if len(self._expansions) >= self.MAX_CACHED_PATHS:
+                self._expansions.clear()
+            expansion = self._expansions[path] = self._get_expansion(path)
+        return expansion
+
+    def _get_expansion(self, path: str) -> _PathExpansion:
+        tokens = tuple(
+            sorted(
+                set(self._token_regex.findall(path)),
+                key=self._token_order.__getitem__,
+            )
+        )
+        context_specs = [
+            self._specs_by_token[token]
+            for token in tokens
+            if token != _RELATIVE_PATH_TOKEN
+        ]
+        id_vars = frozenset(
+            id_var
+            for spec in context_specs
+            for id_var in (spec.get("id_var"), *spec.get("deps", ()))
+            if id_var is not None
+        )
+        if not tokens:
+            template_path = None
+        elif tokens[0] == _RELATIVE_PATH_TOKEN:
+            # Keep the path as-is, the backticks interpolate ${relativePath}
+            template_path = f"`{path}`"
+        else:
+            # Expand the first ${current...} token to the canonical interview path prefix
+            spec = context_specs[0]
+            suffix = path.replace(f"{spec['token']}.", "")
+            template_path = f"`{spec.get('prefix', '')}{suffix}`"
+        return _PathExpansion(tokens, template_path, id_vars)
+
+
+# Get the expander of the specs, compiled once for each content of the specs
+def _get_path_token_expander(
+    current_context_specs: tuple[dict, ...],
+) -> _PathTokenExpander:
+    # The specs are keyed by the values read by the expander, so equal specs share
+    # an expander and a spec changed in place gets a new one
+    specs_key = tuple(
+        (
+            spec["token"],
+            spec.get("prefix", ""),
+            spec.get("id_var"),
+            tuple(spec.get("deps", ())),
+        )
+        for spec in current_context_specs
+    )
+    return _get_cached_path_token_expander(specs_key)
+
+
+@functools.lru_cache(maxsize=16)
+def _get_cached_path_token_expander(specs_key: tuple[tuple, ...]) -> _PathTokenExpander:
+    return _PathTokenExpander(
+        tuple(
+            {"token": token, "prefix": prefix, "id_var": id_var, "deps": deps}
+            for token, prefix, id_var, deps in specs_key
+        )
+    )
+
+
+class _ConditionalRule:
+    """
+    Cross-row rule of the Conditionals sheet, checking the rows of each conditional_name.
+
+    ``ConditionalsGenerator._run_conditional_rules`` walks the rows once and, for each
+    conditional_name, creates the rule state with ``new_group_state``, calls ``on_row``
+    for each of its rows in sheet order and ``on_group_end`` after the last row. Both
+    return the issues found. To add a rule, subclass it and add an instance to
+    ``ConditionalsGenerator.CONDITIONALS_LOGIC_RULES``.
+    """
+
+    # Identifier of the rule and column it checks, reported with each issue.
+    rule_id: str = ""
+    column: str | None = None
+
+    def new_group_state(self) -> dict:
+        return {}
+
+    def on_row(
+        self,
+        state: dict,
+        name: str,
+        row_number: int,
+        row_dict: Mapping,
+        is_first_row: bool,
+    ) -> list[ValidationIssue]:
+        return []
+
+    def on_group_end(self, state: dict, name: str) -> list[ValidationIssue]:
+        return []
+
+    def _issue(self, message: str, row_number: int | None = None) -> ValidationIssue:
+        """Return an issue of the rule, with the Conditionals sheet prefix in its message."""
+        prefix = ConditionalsGenerator._sheet_error_prefix("Conditionals")
+        return ValidationIssue(
+            sheet="Conditionals",
+            row=row_number,
+            column=self.column,
+            rule=self.rule_id,
+            message=f"{prefix}{message}",
+        )
+
+
+class _ParenthesesBalanceRule(_ConditionalRule):
+    """Every '(' has a matching ')' and the balance never goes negative."""
+
+    rule_id = "parentheses_balance"
+    column = "parentheses"
+
+    def new_group_state(self) -> dict:
+        return {"balance": 0, "too_many_closing": False, "last_row_number": None}
+
+    def on_row(
+        self, state, name, row_number, row_dict, is_first_row
+    ) -> list[ValidationIssue]:
+        state["last_row_number"] = row_number
+        # Only the first closing parenthesis without matching opening is reported
+        if state["too_many_closing"]:
+            return []
+        paren = ConditionalsGenerator._empty_to_none(row_dict.get("parentheses"))
+        # Running balance: '(' +1, ')' -1. Must never go negative and must end at 0.
+        if paren == "(":
+            state["balance"] += 1
+        elif paren == ")":
+            state["balance"] -= 1
+            if state["balance"] < 0:
+                state["too_many_closing"] = True
+                return [
+                    self._issue(
+                        f"Unbalanced parentheses for conditional_name '{name}' in row {row_number}: "
+                        "too many ')' (closing parenthesis without matching opening).",
+                        row_number,
+                    )
+                ]
+        return []
+
+    def on_group_end(self, state, name) -> list[ValidationIssue]:
+        if state["too_many_closing"] or state["balance"] == 0:
+            return []
+        return [
+            self._issue(
+                f"Unbalanced parentheses for conditional_name '{name}' (e.g. row {state['last_row_number']}): "
+                f"{state['balance']} unclosed opening parenthesis/parentheses.",
+                state["last_row_number"],
+            )
+        ]
+
+
+class _FirstRowNoLogicalOperatorRule(_ConditionalRule):
+    """The first row of a conditional_name has an empty logical_operator."""
+
+    rule_id = "first_row_logical_operator"
+    column = "logical_operator"
+
+    def on_row(
+        self, state, name, row_number, row_dict, is_first_row
+    ) -> list[ValidationIssue]:
+        if not is_first_row:
+            return []
+        logical_operator = ConditionalsGenerator._empty_to_none(
+            row_dict.get("logical_operator")
+        )
+        if logical_operator is None:
+            return []
+        return [
+            self._issue(
+                f"Invalid logical_operator in row {row_number}: "
+                f"first row of a conditional must have empty logical_operator, got {repr(logical_operator)}",
+                row_number,
+            )
+        ]
+
+
+class _LogicalOperatorOnNonFirstRowsRule(_ConditionalRule):
+    """Every row after the first of a conditional_name has a logical_operator."""
+
+    rule_id = "logical_operator_on_non_first_rows"
+    column = "logical_operator"
+
+    def on_row(
+        self, state, name, row_number, row_dict, is_first_row
+    ) -> list[ValidationIssue]:
+        if is_first_row or (
+            ConditionalsGenerator._empty_to_none(row_dict.get("logical_operator"))
+            is not None
+        ):
+            return []
+        return [
+            self._issue(
+                f"Missing logical_operator in row {row_number}: "
+                f"non-first row of a conditional must have a logical_operator for conditional_name '{name}'",
+                row_number,
+            )
+        ]
+
+
+class _UniqueValueWhenHiddenRule(_ConditionalRule):
+    """The optional value_when_hidden is the same on every row of a conditional_name."""
+
+    rule_id = "unique_value_when_hidden"
+    column = "value_when_hidden"
+
+    def new_group_state(self) -> dict:
+        return {"values_when_hidden": set()}
+
+    def on_row(
+        self, state, name, row_number, row_dict, is_first_row
+    ) -> list[ValidationIssue]:
+        # Treat empty string as None for optional Excel cells (e.g. value_when_hidden).
+        value_when_hidden = ConditionalsGenerator._empty_to_none(
+            row_dict.get("value_when_hidden")
+        )
+        if value_when_hidden is not None:
+            state["values_when_hidden"].add(value_when_hidden)
+        return []
+
+    def on_group_end(self, state, name) -> list[ValidationIssue]:
+        values_when_hidden = state["values_when_hidden"]
+        if len(values_when_hidden) <= 1:
+            return []
+        return [
+            self._issue(
+                f"Multiple value_when_hidden for conditional_name '{name}': {sorted(values_when_hidden)}"
+            )
+        ]
+
+
 class ConditionalsGenerator:
     """Validate the Conditionals Excel sheet and generate TypeScript (conditionals.tsx) output."""
 
@@ -86,6 +374,14 @@ class ConditionalsGenerator:
     # All column names in spec order (e.g. for building a full sheet in tests).
     CONDITIONALS_ALL_HEADERS = tuple(s.name for s in CONDITIONALS_COLUMN_SPECS)
 
+    # Cross-row rules, run in a single pass over the rows by ``_validate_conditional_logic``.
+    CONDITIONALS_LOGIC_RULES: tuple[_ConditionalRule, ...] = (
+        _ParenthesesBalanceRule(),
+        _FirstRowNoLogicalOperatorRule(),
+        _LogicalOperatorOnNonFirstRowsRule(),
+        _UniqueValueWhenHiddenRule(),
+    )
+
     # Tokens used when expanding conditional paths in generated TypeScript (see ``generate_typescript_code``).
     CONDITIONALS_CURRENT_CONTEXT_SPECS: tuple[dict, ...] = (
         {
@@ -132,6 +428,10 @@ class ConditionalsGenerator:
 
     def __init__(self) -> None:
         self._validation_errors = []
+        # The same issues with their sheet, row, column and rule
+        self._validation_issues: list[ValidationIssue] = []
+        # Called with each issue as soon as it is found, see check_with_messages
+        self._on_issue: Callable[[ValidationIssue], None] | None = None
 
     @staticmethod
     def _sheet_error_prefix(sheet_name: str) -> str:
@@ -141,60 +441,117 @@ class ConditionalsGenerator:
     def _clear_validation_errors(self) -> None:
         """Start a fresh validation run."""
         self._validation_errors.clear()
+        self._validation_issues.clear()
 
-    def _append_validation_error(self, message: str, *, echo: bool = False) -> None:
-        """Append one issue to ``_validation_errors``; when echo is True, also print (human-facing check). When False, messages stay in the list only (e.g. check_with_messages / JSON)."""
-        self._validation_errors.append(message)
+    def _append_validation_issue(
+        self, issue: ValidationIssue, *, echo: bool = False
+    ) -> None:
+        """Send one issue to ``_on_issue``, then append it to ``_validation_errors`` and ``_validation_issues``; when echo is True, also print (human-facing check). When False, messages stay in the list only (e.g. check_with_messages / JSON). An issue over the maximum of the stream is not appended."""
+        if self._on_issue is not None:
+            self._on_issue(issue)
+        self._validation_errors.append(issue.message)
+        self._validation_issues.append(issue)
         if echo:
-            print(message)
-
-    def check_with_messages(self, excel_file_path: str) -> tuple[bool, list[str]]:
+            print(issue.message)
+
+    def check_with_messages(
+        self,
+        excel_file_path: ExcelSource,
+        use_cache: bool = False,
+        cache_folder_path: str | None = None,
+        on_issue: Callable[[ValidationIssue], None] | None = None,
+    ) -> tuple[bool, list[str]]:
         """
-        Check the integrity of the Excel file.
+        Check the integrity of the Excel file (path or already loaded snapshot).
 
         Returns (True, []) when valid, or (False, messages) with human-readable issues.
+        With use_cache, only the rows and conditionals that changed since the last check
+        of the same file are validated again, with the same messages as a full check.
+        on_issue is called with each issue as soon as it is found, and stops the check
+        early by raising ``MaxErrorsReached`` (see ``IssueStream``).
         """
         self._clear_validation_errors()
+        self._on_issue = on_issue
         try:
-            is_excel_file(excel_file_path)
-            workbook = get_workbook(excel_file_path)
-            result = self._check_conditionals_sheet(workbook, print_errors=False)
+            workbook = get_workbook_snapshot(excel_file_path)
+            validation_cache = (
+                load_validation_cache(
+                    workbook.excel_file_path,
+                    _get_checks_signature(),
+                    cache_folder_path=cache_folder_path,
+                )
+                if use_cache
+                else None
+            )
+            result = self._check_conditionals_sheet(
+                workbook, print_errors=False, validation_cache=validation_cache
+            )
+            if validation_cache is not None:
+                validation_cache.save()
             # Pass only if the sheet check returned True and the error list is still empty (see _check_conditionals_sheet).
             integrity_ok = bool(result) and len(self._validation_errors) == 0
             return integrity_ok, self._validation_errors
+        except MaxErrorsReached:
+            # The issues found until now are returned, the cache is not saved
+            return False, self._validation_errors
         except Exception as e:
-            self._append_validation_error(
-                f"An error occurred during the Excel integrity check: {e}"
+            issue = ValidationIssue(
+                sheet=None,
+                row=None,
+                column=None,
+                rule="check_error",
+                message=f"An error occurred during the Excel integrity check: {e}",
             )
+            self._validation_errors.append(issue.message)
+            self._validation_issues.append(issue)
+            report_issue(self._on_issue, issue)
             return False, self._validation_errors
+        finally:
+            self._on_issue = None
 
     def _check_conditionals_sheet(
-        self, workbook: Workbook, *, print_errors: bool = True
+        self,
+        workbook: ExcelSource,
+        *,
+        print_errors: bool = True,
+        validation_cache: ValidationCache | None = None,
     ) -> bool:
-        """Check the integrity of the Conditionals sheet. Issues are appended to ``self._validation_errors``; row-level issues echo when print_errors is True, and cross-row issues print only when that flag is True."""
+        """Check the integrity of the Conditionals sheet. Issues are appended to ``self._validation_errors``; row-level issues echo when print_errors is True, and cross-row issues print only when that flag is True. With a validation cache, the issues of the unchanged rows and conditionals are read from it."""
         self._clear_validation_errors()
         try:
             # Require the Conditionals sheet and validate its column headers.
+            workbook = get_workbook_snapshot(workbook)
             sheet_exists(workbook, "Conditionals")
-            sheet = workbook["Conditionals"]
-            headers = get_headers(
-                sheet,
+            table = workbook.get_table("Conditionals")
+            get_headers(
+                table,
                 expected_headers=self.CONDITIONALS_EXPECTED_HEADERS,
                 sheet_name="Conditionals",
             )
 
-            # Walk data rows (skip header); row_number is 1-based for error messages (e.g. row 2 = first data row).
-            rows = list(sheet.rows)
+            # Walk data rows; row_number is the Excel row number for error messages (e.g. row 2 = first data row).
             row_data = []
             row_errors: list[str] = []
-            for row_number, row in enumerate(rows[1:], start=2):
-                values = get_values_from_row(row, headers)
-                row_dict = dict(zip(headers, values, strict=True))
-                row_issues = self._collect_row_validation_issues(row_dict, row_number)
+            # Hash of each row by row number, when the issues are cached
+            row_hashes: dict[int, bytes] = (
+                dict(zip(range(2, len(table) + 2), self._get_row_hashes(table)))
+                if validation_cache is not None
+                else {}
+            )
+            for row_dict in table:
+                row_number = row_dict.row_number
+                if validation_cache is None:
+                    row_issues = self._collect_row_issues(row_dict, row_number)
+                else:
+                    row_hash = row_hashes[row_number]
+                    row_issues = validation_cache.get_row_issues(row_hash)
+                    if row_issues is None:
+                        row_issues = self._collect_row_issues(row_dict, row_number)
+                    validation_cache.set_row_issues(row_hash, row_issues)
                 if row_issues:
-                    for message in row_issues:
-                        self._append_validation_error(message, echo=print_errors)
-                        row_errors.append(message)
+                    for issue in row_issues:
+                        self._append_validation_issue(issue, echo=print_errors)
+                        row_errors.append(issue.message)
                 else:
                     row_data.append((row_number, row_dict))
 
@@ -204,7 +561,12 @@ class ConditionalsGenerator:
 
             # Cross-row rules: collect every issue (do not stop at the first group or first rule).
             cross_before = len(self._validation_errors)
-            self._validate_conditional_logic(row_data)
+            if validation_cache is None:
+                self._validate_conditional_logic(row_data)
+            else:
+                self._validate_changed_conditional_logic(
+                    row_data, row_hashes, validation_cache
+                )
             if len(self._validation_errors) > cross_before:
                 if print_errors:
                     for line in self._validation_errors[cross_before:]:
@@ -212,24 +574,55 @@ class ConditionalsGenerator:
                 return False
 
             return True
+        except MaxErrorsReached:
+            raise
         except Exception as e:
             message = str(e)
             prefix = self._sheet_error_prefix("Conditionals")
             # If the message does not start with the prefix, add the prefix to the message.
             line = message if message.startswith(prefix) else f"{prefix}{message}"
-            self._append_validation_error(line, echo=print_errors)
+            self._append_validation_issue(
+                ValidationIssue(
+                    sheet="Conditionals",
+                    row=None,
+                    column=None,
+                    rule="sheet_structure",
+                    message=line,
+                ),
+                echo=print_errors,
+            )
             return False
 
     def _collect_row_validation_issues(
-        self, row_dict: dict, row_number: int
+        self, row_dict: Mapping, row_number: int
     ) -> list[str]:
         """
-        Return every validation issue for this row (empty if the row is valid).
+        Return every validation issue message for this row (empty if the row is valid).
 
         Collects all missing required fields and all invalid columns in one pass (no early exit on the first problem) so one verify run can list every row issue.
         """
-        issues: list[str] = []
+        return [
+            issue.message for issue in self._collect_row_issues(row_dict, row_number)
+        ]
+
+    def _collect_row_issues(
+        self, row_dict: Mapping, row_number: int
+    ) -> list[ValidationIssue]:
+        """Return every validation issue for this row, with its column and rule (see ``_collect_row_validation_issues``)."""
+        issues: list[ValidationIssue] = []
         prefix = self._sheet_error_prefix("Conditionals")
+
+        def add_issue(column: str, rule: str, message: str) -> None:
+            issues.append(
+                ValidationIssue(
+                    sheet="Conditionals",
+                    row=row_number,
+                    column=column,
+                    rule=rule,
+                    message=f"{prefix}{message}",
+                )
+            )
+
         required_values = [
             row_dict.get(name) for name in self.CONDITIONALS_EXPECTED_HEADERS
         ]
@@ -241,9 +634,11 @@ class ConditionalsGenerator:
             if field_value is None
         ]
         if missing_fields:
-            issues.append(
-                f"{prefix}Required field is missing in row {row_number}. "
-                f"Missing fields: {missing_fields}"
+            add_issue(
+                ", ".join(missing_fields),
+                "required_fields",
+                f"Required field is missing in row {row_number}. "
+                f"Missing fields: {missing_fields}",
             )
 
         missing_set = set(missing_fields)
@@ -257,17 +652,21 @@ class ConditionalsGenerator:
             if spec.allowed_types is not None and raw_value is not None:
                 if not isinstance(raw_value, spec.allowed_types):
                     type_names = ", ".join(t.__name__ for t in spec.allowed_types)
-                    issues.append(
-                        f"{prefix}Invalid {spec.name} in row {row_number}: "
-                        f"must be one of types ({type_names}), got {type(raw_value).__name__} with value {repr(raw_value)}"
+                    add_issue(
+                        spec.name,
+                        "column_type",
+                        f"Invalid {spec.name} in row {row_number}: "
+                        f"must be one of types ({type_names}), got {type(raw_value).__name__} with value {repr(raw_value)}",
                     )
 
             if spec.allowed_values is not None:
                 cell_value = self._empty_to_none(raw_value)
                 if cell_value not in spec.allowed_values:
-                    issues.append(
-                        f"{prefix}Invalid {spec.name} in row {row_number}: "
-                        f"must be one of {sorted(spec.allowed_values - {None})!r} or empty, got {repr(cell_value)}"
+                    add_issue(
+                        spec.name,
+                        "column_value",
+                        f"Invalid {spec.name} in row {row_number}: "
+                        f"must be one of {sorted(spec.allowed_values - {None})!r} or empty, got {repr(cell_value)}",
                     )
 
         # Validate that the path contains only one expansion token
@@ -282,135 +681,171 @@ class ConditionalsGenerator:
                 current_context_specs=ConditionalsGenerator.CONDITIONALS_CURRENT_CONTEXT_SPECS,
             )
             if len(tokens) > 1:
-                issues.append(
-                    f"{prefix}Invalid path in row {row_number}: "
+                add_issue(
+                    "path",
+                    "path_expansion_tokens",
+                    f"Invalid path in row {row_number}: "
                     "only one expansion token is allowed in the path; "
-                    f"found {', '.join(tokens)} in {repr(raw_path)}"
+                    f"found {', '.join(tokens)} in {repr(raw_path)}",
                 )
 
         return issues
 
-    def _validate_conditionals_row(self, row_dict: dict, row_number: int) -> list[str]:
+    def _get_row_hashes(self, table: SheetTable) -> list[bytes]:
+        """Return the hash of the row number and of every checked column of each row, read column-wise."""
+        columns = [
+            (
+                table.column(spec.name)
+                if table.has_column(spec.name)
+                else [None] * len(table)
+            )
+            for spec in self.CONDITIONALS_COLUMN_SPECS
+        ]
+        # The first data row is row 2 of the Excel sheet
+        row_numbers = range(2, len(table) + 2)
+        return [get_values_hash(values) for values in zip(row_numbers, *columns)]
+
+    def _validate_conditionals_row(
+        self, row_dict: Mapping, row_number: int
+    ) -> list[str]:
         """Return all validation issues for this row (empty if valid); for unit tests."""
         return self._collect_row_validation_issues(row_dict, row_number)
 
-    def _group_row_data_by_conditional_name(
-        self, row_data: list[tuple[int, dict]]
-    ) -> dict:
+    def _validate_conditional_logic(self, row_data: list[tuple[int, Mapping]]) -> None:
         """
-        Build one list per distinct conditional_name across the entire sheet (not split by consecutive blocks).
-        Returns a dict mapping conditional_name -> list of (row_number, row_dict) in sheet order for that name
-        (dict insertion order follows first occurrence of each name; all rows sharing a name are grouped).
+        Run all cross-row logical validations that depend on grouping by conditional_name.
+
+        Appends every violation to ``self._validation_errors`` (never raises).
         """
-        groups = {}
+        self._run_conditional_rules(row_data, self.CONDITIONALS_LOGIC_RULES)
+
+    def _validate_changed_conditional_logic(
+        self,
+        row_data: list[tuple[int, Mapping]],
+        row_hashes: dict[int, bytes],
+        validation_cache: ValidationCache,
+    ) -> None:
+        """
+        Run the cross-row validations only for the conditional_name groups with changed rows.
+
+        A group changed when the hashes of its rows (values and row numbers) changed.
+        The issues of the other groups are read from the validation cache, and every
+        issue is appended in the same order as ``_validate_conditional_logic``.
+        """
+        rules = self.CONDITIONALS_LOGIC_RULES
+        groups_row_hashes: dict = {}
         for row_number, row_dict in row_data:
-            name = row_dict.get("conditional_name")
-            if name not in groups:
-                groups[name] = []
-            groups[name].append((row_number, row_dict))
-        return groups
+            groups_row_hashes.setdefault(row_dict.get("conditional_name"), []).append(
+                row_hashes[row_number]
+            )
+        # The row hashes include the conditional_name, so they identify the group
+        group_hashes = {
+            name: get_group_hash(group_row_hashes)
+            for name, group_row_hashes in groups_row_hashes.items()
+        }
+
+        groups_issues = {
+            name: validation_cache.get_group_issues(group_hash)
+            for name, group_hash in group_hashes.items()
+        }
+        changed_names = {
+            name for name, issues in groups_issues.items() if issues is None
+        }
+        if changed_names:
+            groups_issues.update(
+                self._get_conditional_rules_issues(
+                    [
+                        (row_number, row_dict)
+                        for row_number, row_dict in row_data
+                        if row_dict.get("conditional_name") in changed_names
+                    ],
+                    rules,
+                )
+            )
+        for name, group_hash in group_hashes.items():
+            validation_cache.set_group_issues(group_hash, groups_issues[name])
+        self._append_conditional_rules_issues(groups_issues, len(rules))
+
+    def _run_conditional_rules(
+        self,
+        row_data: list[tuple[int, Mapping]],
+        rules: tuple[_ConditionalRule, ...],
+    ) -> None:
+        """Run the rules over the rows and append their issues to ``self._validation_errors`` and ``self._validation_issues``."""
+        self._append_conditional_rules_issues(
+            self._get_conditional_rules_issues(row_data, rules), len(rules)
+        )
 
-    def _validate_conditional_logic(self, row_data: list[tuple[int, dict]]) -> None:
+    @staticmethod
+    def _get_conditional_rules_issues(
+        row_data: list[tuple[int, Mapping]],
+        rules: tuple[_ConditionalRule, ...],
+    ) -> dict:
         """
-        Run all cross-row logical validations that depend on grouping by conditional_name.
+        Walk the rows once and dispatch each row to every rule, grouped by conditional_name.
 
-        Appends every violation to ``self._validation_errors`` (never raises).
+        A group has every row sharing a conditional_name across the entire sheet (not split by
+        consecutive blocks). Returns the issues of each rule by conditional_name, the groups
+        in order of first occurrence.
         """
-        self._validate_conditionals_parentheses_balance(row_data)
-        self._validate_conditionals_first_row_no_logical_operator(row_data)
-        self._validate_conditionals_logical_operator_on_non_first_rows(row_data)
-        self._validate_conditionals_value_when_hidden_logic(row_data)
+        # conditional_name -> (state, issues) of each rule, in the order of the rules
+        groups: dict = {}
+        for row_number, row_dict in row_data:
+            name = row_dict.get("conditional_name")
+            group = groups.get(name)
+            is_first_row = group is None
+            if is_first_row:
+                group = groups[name] = [(rule.new_group_state(), []) for rule in rules]
+            for rule, (state, issues) in zip(rules, group):
+                issues.extend(
+                    rule.on_row(state, name, row_number, row_dict, is_first_row)
+                )
+
+        groups_issues = {}
+        for name, group in groups.items():
+            for rule, (state, issues) in zip(rules, group):
+                issues.extend(rule.on_group_end(state, name))
+            groups_issues[name] = [issues for _state, issues in group]
+        return groups_issues
+
+    def _append_conditional_rules_issues(
+        self, groups_issues: dict, rules_count: int
+    ) -> None:
+        """Append the issues rule by rule, then by group, so the messages do not depend on how the rows of the groups are interleaved."""
+        for rule_index in range(rules_count):
+            for rules_issues in groups_issues.values():
+                for issue in rules_issues[rule_index]:
+                    self._append_validation_issue(issue)
 
     def _validate_conditionals_value_when_hidden_logic(
-        self, row_data: list[tuple[int, dict]]
+        self, row_data: list[tuple[int, Mapping]]
     ) -> None:
         """
         Validate that for each conditional_name group, the optional value_when_hidden is either absent
         or unique across all rows of that conditional_name.
         """
-        prefix = self._sheet_error_prefix("Conditionals")
-        groups = self._group_row_data_by_conditional_name(row_data)
-        for name, group_rows in groups.items():
-
-            # Get all values_when_hidden for the conditional_name
-            # Treat empty string as None for optional Excel cells (e.g. value_when_hidden).
-            values_when_hidden = {
-                self._empty_to_none(row_dict.get("value_when_hidden"))
-                for _row_number, row_dict in group_rows
-                if self._empty_to_none(row_dict.get("value_when_hidden")) is not None
-            }
-
-            # Check if there are multiple values_when_hidden for the same conditional_name
-            if len(values_when_hidden) > 1:
-                self._validation_errors.append(
-                    f"{prefix}Multiple value_when_hidden for conditional_name '{name}': {sorted(values_when_hidden)}"
-                )
+        self._run_conditional_rules(row_data, (_UniqueValueWhenHiddenRule(),))
 
     def _validate_conditionals_parentheses_balance(
-        self, row_data: list[tuple[int, dict]]
+        self, row_data: list[tuple[int, Mapping]]
     ) -> None:
         """
         Validate that for each conditional_name group (all rows with that name),
         parentheses are balanced: every '(' has a matching ')' and the balance never goes negative.
         """
-        prefix = self._sheet_error_prefix("Conditionals")
-        groups = self._group_row_data_by_conditional_name(row_data)
-        for name, group_rows in groups.items():
-            # Collect (row_number, paren) for this group in order.
-            group: list[tuple[int, str | None]] = [
-                (row_number, self._empty_to_none(row_dict.get("parentheses")))
-                for row_number, row_dict in group_rows
-            ]
-
-            # Running balance: '(' +1, ')' -1. Must never go negative and must end at 0.
-            balance = 0
-            start_row_number = group_rows[0][0] if group_rows else 0
-            bad_negative = False
-            for rn, paren in group:
-                if paren == "(":
-                    balance += 1
-                elif paren == ")":
-                    balance -= 1
-                    if balance < 0:
-                        self._validation_errors.append(
-                            f"{prefix}Unbalanced parentheses for conditional_name '{name}' in row {rn}: "
-                            "too many ')' (closing parenthesis without matching opening)."
-                        )
-                        bad_negative = True
-                        break
-            if bad_negative:
-                continue
-            if balance != 0:
-                last_row = group[-1][0] if group else start_row_number
-                self._validation_errors.append(
-                    f"{prefix}Unbalanced parentheses for conditional_name '{name}' (e.g. row {last_row}): "
-                    f"{balance} unclosed opening parenthesis/parentheses."
-                )
+        self._run_conditional_rules(row_data, (_ParenthesesBalanceRule(),))
 
     def _validate_conditionals_first_row_no_logical_operator(
-        self, row_data: list[tuple[int, dict]]
+        self, row_data: list[tuple[int, Mapping]]
     ) -> None:
         """
         For each distinct conditional_name, require empty logical_operator on that name's first sheet row only;
         later rows with the same name may use "||" or "&&".
         """
-        prefix = self._sheet_error_prefix("Conditionals")
-        groups = self._group_row_data_by_conditional_name(row_data)
-        for name, group_rows in groups.items():
-            if not group_rows:
-                continue
-            first_row_number, first_row_dict = group_rows[0]
-            logical_operator = self._empty_to_none(
-                first_row_dict.get("logical_operator")
-            )
-            if logical_operator is not None:
-                self._validation_errors.append(
-                    f"{prefix}Invalid logical_operator in row {first_row_number}: "
-                    f"first row of a conditional must have empty logical_operator, got {repr(logical_operator)}"
-                )
+        self._run_conditional_rules(row_data, (_FirstRowNoLogicalOperatorRule(),))
 
     def _validate_conditionals_logical_operator_on_non_first_rows(
-        self, row_data: list[tuple[int, dict]]
+        self, row_data: list[tuple[int, Mapping]]
     ) -> None:
         """
         For each distinct conditional_name, require a non-empty logical_operator on every row after the first.
@@ -419,18 +854,7 @@ class ConditionalsGenerator:
         - First row must have empty logical_operator
         - All subsequent rows must have a logical_operator (typically "||" or "&&")
         """
-        prefix = self._sheet_error_prefix("Conditionals")
-        groups = self._group_row_data_by_conditional_name(row_data)
-        for name, group_rows in groups.items():
-            if len(group_rows) <= 1:
-                continue
-            for row_number, row_dict in group_rows[1:]:
-                logical_operator = self._empty_to_none(row_dict.get("logical_operator"))
-                if logical_operator is None:
-                    self._validation_errors.append(
-                        f"{prefix}Missing logical_operator in row {row_number}: "
-                        f"non-first row of a conditional must have a logical_operator for conditional_name '{name}'"
-                    )
+        self._run_conditional_rules(row_data, (_LogicalOperatorOnNonFirstRowsRule(),))
 
     @staticmethod
     def _empty_to_none(value) -> str | None:
@@ -446,14 +870,7 @@ class ConditionalsGenerator:
         ``${relativePath}`` first (if present), then each ``${current...}`` token from
         ``current_context_specs`` if present.
         """
-        ordered: list[str] = []
-        if "${relativePath}" in path:
-            ordered.append("${relativePath}")
-        for spec in current_context_specs:
-            token = spec["token"]
-            if token in path:
-                ordered.append(token)
-        return list(dict.fromkeys(ordered))
+        return list(_get_path_token_expander(current_context_specs).expand(path).tokens)
 
     @staticmethod
     def _expand_tokenized_path(
@@ -465,26 +882,20 @@ class ConditionalsGenerator:
         - For `${relativePath}`: keep the path as-is but wrap in backticks so interpolation works.
         - For `${current...}`: expand to the canonical interview path prefix.
         """
-        if "${relativePath}" in original_path:
-            return f"`{original_path}`"
-        for spec in current_context_specs:
-            token = spec["token"]
-            if token in original_path:
-                suffix = original_path.replace(f"{token}.", "")
-                return f"`{spec['prefix']}{suffix}`"
-        return None
+        return (
+            _get_path_token_expander(current_context_specs)
+            .expand(original_path)
+            .template_path
+        )
 
     @staticmethod
     def _current_context_vars_needed(
         conditionals: list[dict], *, current_context_specs: tuple[dict, ...]
     ) -> set[str]:
+        expander = _get_path_token_expander(current_context_specs)
         needed: set[str] = set()
         for conditional in conditionals:
-            conditional_path = conditional.get("path") or ""
-            for spec in current_context_specs:
-                if spec["token"] in conditional_path:
-                    needed.add(spec["id_var"])
-                    needed.update(spec["deps"])
+            needed.update(expander.expand(conditional.get("path") or "").id_vars)
         return needed
 
     @staticmethod
@@ -523,30 +934,36 @@ class ConditionalsGenerator:
         return str(value)
 
     @staticmethod
-    def extract_conditionals_from_data(rows, headers) -> defaultdict:
-        """Extract conditionals from rows and group them by conditional_name."""
+    def _strip_cell(value):
+        """Remove the leading and trailing whitespace of a text cell, other values are returned as is."""
+        return value.strip() if isinstance(value, str) else value
+
+    @staticmethod
+    def extract_conditionals_from_data(table: SheetTable) -> defaultdict:
+        """Extract conditionals from the Conditionals sheet table and group them by conditional_name."""
         conditional_by_name = defaultdict(list)
 
         try:
-            for row_number, row in enumerate(rows[1:], start=2):
-                values = get_values_from_row(row, headers)
-                row_dict = dict(zip(headers, values, strict=True))
-
-                # Get values from the row dictionary
-                conditional_name = row_dict.get("conditional_name")
-                logical_operator = row_dict.get("logical_operator")
-                path = row_dict.get("path")
-                comparison_operator = row_dict.get("comparison_operator")
-                value = row_dict.get("value")
-                parentheses = row_dict.get("parentheses")
-                value_when_hidden = row_dict.get("value_when_hidden")
+            for row in table:
+                # Get values from the row
+                conditional_name = row.get("conditional_name")
+                logical_operator = row.get("logical_operator")
+                path = row.get("path")
+                comparison_operator = row.get("comparison_operator")
+                value = row.get("value")
+                parentheses = row.get("parentheses")
+                value_when_hidden = row.get("value_when_hidden")
 
                 conditional = {
-                    "logical_operator": logical_operator,
-                    "path": path,
-                    "comparison_operator": comparison_operator,
+                    "logical_operator": ConditionalsGenerator._strip_cell(
+                        logical_operator
+                    ),
+                    "path": ConditionalsGenerator._strip_cell(path),
+                    "comparison_operator": ConditionalsGenerator._strip_cell(
+                        comparison_operator
+                    ),
                     "value": value,
-                    "parentheses": parentheses,
+                    "parentheses": ConditionalsGenerator._strip_cell(parentheses),
                 }
                 value_when_hidden = ConditionalsGenerator._empty_to_none(
                     value_when_hidden
@@ -563,15 +980,119 @@ class ConditionalsGenerator:
         return conditional_by_name
 
     @staticmethod
-    def generate_typescript_code(conditional_by_name: defaultdict) -> str:
-        """Generate TypeScript code based on conditionals grouped by name."""
+    def _get_conditional_expression(conditionals: list[dict]) -> tuple:
+        """
+        Return the normalised expression of the rows of a conditional_name.
+
+        checkConditionals evaluates the rows in order, so the expression is the tuple of
+        the rows as they are emitted in TypeScript (text cells trimmed by
+        ``extract_conditionals_from_data``, empty operators and parentheses as None,
+        values as their TypeScript literal, so ``1``, ``"1"`` and ``"1.0"`` are the same),
+        with the valueWhenHidden. Parentheses around the whole expression are removed.
+        The operands are not reordered: ``a && b`` and ``b && a`` are different
+        expressions. Two conditional_names with the same expression have the same
+        implementation.
+        """
+        to_literal = ConditionalsGenerator._conditional_cell_to_primitive
+        value_when_hidden = next(
+            (
+                c.get("value_when_hidden")
+                for c in conditionals
+                if c.get("value_when_hidden") is not None
+            ),
+            None,
+        )
+        rows = [
+            [
+                conditional["logical_operator"] or None,
+                conditional["path"],
+                conditional["comparison_operator"],
+                json.dumps(to_literal(conditional["value"])),
+                conditional["parentheses"] or None,
+            ]
+            for conditional in conditionals
+        ]
+        if ConditionalsGenerator._has_outer_parentheses(rows):
+            rows[0][4] = None
+            rows[-1][4] = None
+        return (
+            (
+                None
+                if value_when_hidden is None
+                else json.dumps(to_literal(value_when_hidden))
+            ),
+            tuple(tuple(row) for row in rows),
+        )
+
+    # Check if the '(' of the first row is closed by the ')' of the last row
+    @staticmethod
+    def _has_outer_parentheses(rows: list[list]) -> bool:
+        if len(rows) < 2 or rows[0][4] != "(" or rows[-1][4] != ")":
+            return False
+        balance = 0
+        for row in rows[:-1]:
+            if row[4] == "(":
+                balance += 1
+            elif row[4] == ")":
+                balance -= 1
+            # The first parenthesis is closed before the last row
+            if balance == 0:
+                return False
+        return balance == 1
+
+    @staticmethod
+    def get_duplicate_conditionals(conditional_by_name: Mapping) -> dict[str, str]:
+        """Return the conditional_names with the same expression as a previous one, with the name of that first one."""
+        first_name_by_expression: dict[tuple, str] = {}
+        duplicate_names: dict[str, str] = {}
+        for conditional_name, conditionals in conditional_by_name.items():
+            expression = ConditionalsGenerator._get_conditional_expression(conditionals)
+            first_name = first_name_by_expression.setdefault(
+                expression, conditional_name
+            )
+            if first_name != conditional_name:
+                duplicate_names[conditional_name] = first_name
+        return duplicate_names
+
+    @staticmethod
+    def generate_typescript_code(
+        conditional_by_name: defaultdict,
+        duplicate_names: dict[str, str] | None = None,
+        memoize_context_ids: bool = False,
+        alias_duplicates: bool = True,
+    ) -> str:
+        """
+        Generate TypeScript code based on conditionals grouped by name.
+
+        With alias_duplicates, the conditional_names with the same expression as a
+        previous one (see ``get_duplicate_conditionals``) are emitted as an alias of its
+        implementation. Without it, each conditional_name has its own implementation.
+        With memoize_context_ids, the conditionals get the ``${current...}`` ids from
+        a resolver shared by every conditional (see ``_get_context_ids_resolver_code``),
+        so each id is resolved once per interview and path instead of once per conditional,
+        and again when the response, its active ids or an object of the path change.
+        """
         try:
+            if not alias_duplicates:
+                duplicate_names = {}
+            elif duplicate_names is None:
+                duplicate_names = ConditionalsGenerator.get_duplicate_conditionals(
+                    conditional_by_name
+                )
             NEWLINE = "\n"
             ts_code = ""
 
             current_context_specs = (
                 ConditionalsGenerator.CONDITIONALS_CURRENT_CONTEXT_SPECS
             )
+            # The resolver is only emitted when a conditional has a current context path
+            memoize_context_ids = memoize_context_ids and any(
+                ConditionalsGenerator._current_context_vars_needed(
+                    conditionals, current_context_specs=current_context_specs
+                )
+                for conditional_name, conditionals in conditional_by_name.items()
+                if conditional_name not in duplicate_names
+            )
 
             # Add Generator comment at the start of the file
             ts_code += add_generator_comment()
@@ -583,19 +1104,29 @@ class ConditionalsGenerator:
                 f"{NEWLINE}"
             )
             ts_code += (
-                "import { type WidgetConditional } from "
-                "'evolution-common/lib/services/questionnaire/types';"
-                f"{NEWLINE}"
-            )
+                "import { type UserInterviewAttributes, type WidgetConditional } from "
+                if memoize_context_ids
+                else "import { type WidgetConditional } from "
+            ) + "'evolution-common/lib/services/questionnaire/types';" f"{NEWLINE}"
             ts_code += (
                 "import * as odSurveyHelpers from "
                 "'evolution-common/lib/services/odSurvey/helpers';"
                 f"{NEWLINE}"
             )
+            if memoize_context_ids:
+                ts_code += ConditionalsGenerator._get_context_ids_resolver_code()
 
             # Emit one exported WidgetConditional (const) per conditional_name
             for conditional_name, conditionals in conditional_by_name.items():
 
+                # Share the implementation of the first conditional with the same expression
+                if conditional_name in duplicate_names:
+                    ts_code += (
+                        f"\nexport const {conditional_name}: WidgetConditional = "
+                        f"{duplicate_names[conditional_name]}; // Same conditional{NEWLINE}"
+                    )
+                    continue
+
                 # Get the first non-None 'value_when_hidden' from the conditionals, or None if none is found.
                 value_when_hidden = next(
                     (
@@ -638,7 +1169,14 @@ class ConditionalsGenerator:
                 # If so, declare the current context variables
                 if conditionals_has_current_context:
                     for spec in current_context_specs:
-                        if spec["id_var"] in current_context_vars_needed:
+                        if spec["id_var"] not in current_context_vars_needed:
+                            continue
+                        if memoize_context_ids:
+                            ts_code += (
+                                f"{INDENT}const {spec['id_var']} = getCurrentContextId(odSurveyHelpers.{spec['helper']}, interview, path); "
+                                f"// {spec['comment']}{NEWLINE}"
+                            )
+                        else:
                             ts_code += (
                                 f"{INDENT}const {spec['id_var']} = odSurveyHelpers.{spec['helper']}({{ interview, path }}); "
                                 f"// {spec['comment']}{NEWLINE}"
@@ -667,25 +1205,14 @@ class ConditionalsGenerator:
                         conditional["value"]
                     )
                     new_value = json.dumps(prim)
-                    conditional_has_path = (
-                        "${relativePath}" in conditional["path"]
-                        # Check if any conditional has a path that contains "${currentPerson}", "${currentJourney}", "${currentTrip}", "${currentSegment}", or "${currentVisitedPlace}"
-                        or any(
-                            spec["token"] in conditional["path"]
-                            for spec in current_context_specs
-                        )
-                    )
-                    quote = "`" if conditional_has_path else "'"
-
-                    # Check if any conditional has a path that contains "${currentPerson}", "${currentJourney}", "${currentTrip}", "${currentSegment}", or "${currentVisitedPlace}"
-                    # If so, expand the path
+                    # Expand the path with a "${relativePath}" or "${current...}" token to a template string
                     expanded_path = ConditionalsGenerator._expand_tokenized_path(
                         conditional["path"], current_context_specs=current_context_specs
                     )
                     path = (
                         expanded_path
                         if expanded_path is not None
-                        else f"{quote}{conditional['path']}{quote}"
+                        else f"'{conditional['path']}'"
                     )
 
                     ts_code += f"{INDENT}{INDENT}{INDENT}{{{NEWLINE}"
@@ -721,10 +1248,152 @@ class ConditionalsGenerator:
 
         return ts_code
 
+    @staticmethod
+    def _get_context_ids_resolver_code() -> str:
+        """
+        Get the TypeScript of the resolver of the current context ids shared by the conditionals.
+
+        The ids are cached by interview object, then by path and helper. The
+        odSurveyHelpers only read the ids in the path up to its last key, unless the
+        last key is itself an id (e.g. ``...journeys.{journeyId}``), so the widgets of
+        the same object share the ids of their parent path. The cache of an interview
+        is cleared when its response object or its active ids change, and the ids of a
+        path are resolved again when an object of the path (e.g. the visited place of
+        the widget) is added, removed or replaced, even in place. Only a change of the
+        ``_uuid`` of an object in place is not seen.
+        """
+        return """
+// Resolve each current context id once per interview and object, for every conditional below.
+// The ids are resolved again when the response, its active ids or an object of the path change.
+type CurrentContextIdGetter = (options: { interview: UserInterviewAttributes; path?: string }) => string | null;
+type ContextPathIds = {
+    keys: string[];
+    objects: unknown[];
+    idsByGetter: Map<CurrentContextIdGetter, string | null>;
+};
+type CurrentContextIds = {
+    response: UserInterviewAttributes['response'];
+    activePersonId?: string;
+    activeJourneyId?: string;
+    activeTripId?: string;
+    activeVisitedPlaceId?: string;
+    idsByPath: Map<string, ContextPathIds>;
+};
+const currentContextIdsByInterview = new WeakMap<UserInterviewAttributes, CurrentContextIds>();
+// Get the objects of the response at each key of the path
+const getPathObjects = (response: unknown, keys: string[]): unknown[] => {
+    const objects: unknown[] = [];
+    let value: any = response;
+    for (const key of keys) {
+        value = value === undefined || value === null ? undefined : value[key];
+        objects.push(value);
+    }
+    return objects;
+};
+const hasSamePathObjects = (response: unknown, pathIds: ContextPathIds): boolean => {
+    let value: any = response;
+    for (let index = 0; index < pathIds.keys.length; index++) {
+        value = value === undefined || value === null ? undefined : value[pathIds.keys[index]];
+        if (value !== pathIds.objects[index]) {
+            return false;
+        }
+    }
+    return true;
+};
+const getCurrentContextId = (
+    getCurrentId: CurrentContextIdGetter,
+    interview: UserInterviewAttributes,
+    path: string
+): string | null => {
+    const response = interview.response;
+    let contextIds = currentContextIdsByInterview.get(interview);
+    if (
+        contextIds === undefined ||
+        contextIds.response !== response ||
+        contextIds.activePersonId !== response?._activePersonId ||
+        contextIds.activeJourneyId !== response?._activeJourneyId ||
+        contextIds.activeTripId !== response?._activeTripId ||
+        contextIds.activeVisitedPlaceId !== response?._activeVisitedPlaceId
+    ) {
+        contextIds = {
+            response,
+            activePersonId: response?._activePersonId,
+            activeJourneyId: response?._activeJourneyId,
+            activeTripId: response?._activeTripId,
+            activeVisitedPlaceId: response?._activeVisitedPlaceId,
+            idsByPath: new Map()
+        };
+        currentContextIdsByInterview.set(interview, contextIds);
+    }
+    let pathIds = contextIds.idsByPath.get(path);
+    if (pathIds === undefined) {
+        // The helpers read the ids of the parent path, or of the path ending with an id
+        const contextPath = /\\.(journeys|trips|visitedPlaces|segments)\\.[^.]+$/.test(path)
+            ? path
+            : path.substring(0, path.lastIndexOf('.') + 1);
+        pathIds = contextIds.idsByPath.get(contextPath);
+        if (pathIds === undefined) {
+            const keys = contextPath.split('.').filter((key) => key !== '');
+            pathIds = { keys, objects: getPathObjects(response, keys), idsByGetter: new Map() };
+            contextIds.idsByPath.set(contextPath, pathIds);
+        }
+        contextIds.idsByPath.set(path, pathIds);
+    }
+    if (!hasSamePathObjects(response, pathIds)) {
+        // An object of the path was added, removed or replaced in place, resolve its ids again
+        pathIds.objects = getPathObjects(response, pathIds.keys);
+        pathIds.idsByGetter.clear();
+    }
+    let id = pathIds.idsByGetter.get(getCurrentId);
+    if (id === undefined) {
+        id = getCurrentId({ interview, path });
+        pathIds.idsByGetter.set(getCurrentId, id);
+    }
+    return id;
+};
+"""
+
     @classmethod
-    def generate_conditionals(cls, input_file: str, output_file: str) -> None:
-        """Read the Conditionals sheet from ``input_file`` and write generated TypeScript to ``output_file`` (e.g. conditionals.tsx)."""
-        rows, headers = get_data_from_excel(input_file, sheet_name="Conditionals")
-        conditional_by_name = cls.extract_conditionals_from_data(rows, headers)
-        ts_code = cls.generate_typescript_code(conditional_by_name)
+    def generate_conditionals(
+        cls,
+        input_file: ExcelSource,
+        output_file: str,
+        memoize_context_ids: bool = False,
+        alias_duplicates: bool = True,
+    ) -> None:
+        """
+        Read the Conditionals sheet from ``input_file`` and write generated TypeScript to ``output_file`` (e.g. conditionals.tsx).
+
+        With memoize_context_ids, the ``${current...}`` ids are resolved once per
+        interview and path for all the conditionals. With alias_duplicates, the
+        conditionals with the same expression share one implementation (see
+        ``generate_typescript_code``).
+        """
+        table = get_table_from_excel(input_file, sheet_name="Conditionals")
+        conditional_by_name = cls.extract_conditionals_from_data(table)
+        duplicate_names = (
+            cls.get_duplicate_conditionals(conditional_by_name)
+            if alias_duplicates
+            else {}
+        )
+        if duplicate_names:
+            print(
+                f"{len(duplicate_names)} conditionals are the same as another one and share its implementation: "
+                + ", ".join(
+                    f"{name} (same as {first_name})"
+                    for name, first_name in duplicate_names.items()
+                )
+            )
+        ts_code = cls.generate_typescript_code(
+            conditional_by_name,
+            duplicate_names,
+            memoize_context_ids=memoize_context_ids,
+            alias_duplicates=alias_duplicates,
+        )
         generate_output_file(ts_code, output_file)
+
+
+# Get the hash of the code of the checks, so the cached issues of another version are not used
+@functools.cache
+def _get_checks_signature() -> str:
+    return get_file_sha256(__file__)
@@ -6,12 +6,19 @@
 # so changes are easier to review in git diffs. It is intended to be invoked
 # from the generate_survey.py script.
 import csv
+import io
 import os
 import re
 
-import openpyxl
-
-from helpers.generator_helpers import is_excel_file, get_data_from_excel
+from helpers.generator_helpers import (
+    ExcelSource,
+    WorkbookSnapshot,
+    generate_output_file,
+    get_data_from_excel,
+    get_excel_file_path,
+    get_workbook_snapshot,
+)
+from helpers.output_writer import get_output_sink
 
 
 class ExcelToCsvGenerator:
@@ -21,12 +28,14 @@ class ExcelToCsvGenerator:
 
     def __init__(
         self,
-        excel_file_path: str,
+        excel_file_path: ExcelSource,
         clean_output_folder: bool = True,
     ):
-        """Configure the generator for a given Excel file."""
+        """Configure the generator for a given Excel file or its loaded snapshot."""
         self.excel_file_path = excel_file_path
-        self.output_folder_path = self.get_output_folder_path(excel_file_path)
+        self.output_folder_path = self.get_output_folder_path(
+            get_excel_file_path(excel_file_path)
+        )
         self.clean_output_folder = clean_output_folder
 
     @staticmethod
@@ -45,65 +54,64 @@ class ExcelToCsvGenerator:
 
     def copy(self) -> list[str]:
         """Write one CSV file per sheet and return their paths."""
-        is_excel_file(self.excel_file_path)
-        os.makedirs(self.output_folder_path, exist_ok=True)
+        workbook_snapshot = get_workbook_snapshot(self.excel_file_path)
+        get_output_sink().make_folder(self.output_folder_path)
+
+        csv_file_paths = [
+            self.write_sheet_to_csv(workbook_snapshot, sheet_name)
+            for sheet_name in workbook_snapshot.sheetnames
+        ]
 
         if self.clean_output_folder:
-            self.delete_existing_csv_files()
+            self.delete_existing_csv_files(keep_file_paths=csv_file_paths)
 
-        workbook = openpyxl.load_workbook(
-            self.excel_file_path, data_only=True, read_only=True
-        )
-        try:
-            generated_files = []
-            for worksheet in workbook.worksheets:
-                generated_files.append(self.write_sheet_to_csv(worksheet))
-            return generated_files
-        finally:
-            workbook.close()
-
-    def delete_existing_csv_files(self) -> None:
-        """Remove any .csv file already present in the output folder."""
-        for file_name in os.listdir(self.output_folder_path):
-            file_path = os.path.join(self.output_folder_path, file_name)
-            if os.path.isfile(file_path) and file_name.lower().endswith(".csv"):
-                os.remove(file_path)
+        return csv_file_paths
 
-    def write_sheet_to_csv(self, worksheet) -> str:
+    def delete_existing_csv_files(self, keep_file_paths: list[str] = ()) -> None:
+        """Remove any .csv file present in the output folder, except the kept files."""
+        output_sink = get_output_sink()
+        for file_name in output_sink.list_files(self.output_folder_path):
+            file_path = os.path.join(self.output_folder_path, file_name)
+            if file_path in keep_file_paths:
+                continue
+            if file_name.lower().endswith(".csv"):
+                output_sink.remove(file_path)
+
+    def write_sheet_to_csv(
+        self, workbook_snapshot: WorkbookSnapshot, sheet_name: str
+    ) -> str:
         """Write a single sheet to "<SheetName>.csv" and return its path."""
-        csv_file_name = f"{self.sanitize_sheet_title(worksheet.title)}.csv"
+        csv_file_name = f"{self.sanitize_sheet_title(sheet_name)}.csv"
         csv_file_path = os.path.join(self.output_folder_path, csv_file_name)
 
-        with open(csv_file_path, mode="w", encoding="utf-8", newline="") as csv_file:
-            writer = csv.writer(csv_file)
+        csv_buffer = io.StringIO(newline="")
+        writer = csv.writer(csv_buffer)
 
-            # Use get_data_from_excel to properly bound rows and headers
-            try:
-                rows, headers = get_data_from_excel(
-                    self.excel_file_path, worksheet.title
-                )
+        # Use get_data_from_excel to properly bound rows and headers
+        try:
+            rows, headers = get_data_from_excel(workbook_snapshot, sheet_name)
 
-                # Write headers
-                writer.writerow(headers)
+            # Write headers
+            writer.writerow(headers)
 
-                # Write data rows (skip header row at index 0)
-                for row in rows[1:]:
-                    values = ["" if cell.value is None else cell.value for cell in row]
-                    # Trim trailing None/empty values to match header count
-                    values = values[: len(headers)]
-                    writer.writerow(values)
+            # Write data rows (skip header row at index 0)
+            for row in rows[1:]:
+                values = ["" if value is None else value for value in row]
+                # Trim trailing None/empty values to match header count
+                values = values[: len(headers)]
+                writer.writerow(values)
 
-            except Exception as e:
-                print(f"Error processing sheet '{worksheet.title}': {e}")
-                raise
+        except Exception as e:
+            print(f"Error processing sheet '{sheet_name}': {e}")
+            raise
 
-        print(f"Generated {csv_file_path} successfully")
+        generate_output_file(csv_buffer.getvalue(), csv_file_path)
         return csv_file_path
 
     @classmethod
     def generate_csv_copy(
         cls,
-        excel_file_path: str,
+        excel_file_path: ExcelSource,
         clean_output_folder: bool = True,
     ) -> list[str]:
         """Copy every Excel sheet to a CSV file and return the generated file paths."""
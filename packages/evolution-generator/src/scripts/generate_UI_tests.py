@@ -6,28 +6,28 @@
 # These functions are intended to be invoked from the generate_survey.py script.
 from helpers.generator_helpers import (
     INDENT,
+    ExcelSource,
     add_generator_comment,
-    is_excel_file,
     is_ts_file,
-    get_workbook,
+    get_workbook_snapshot,
     sheet_exists,
     get_headers,
+    generate_output_file,
 )
 
 
 # Function to generate common-UI-tests-helpers-template.ts.ts
-def generate_UI_tests(input_file: str, output_file: str):
+def generate_UI_tests(input_file: ExcelSource, output_file: str):
     try:
-        is_excel_file(input_file)  # Check if the input file is an Excel file
         is_ts_file(output_file)  # Check if the output file is an TypeScript file
-        workbook = get_workbook(input_file)  # Get workbook from Excel file
+        workbook = get_workbook_snapshot(input_file)  # Get workbook from Excel file
         sheet_exists(workbook, "Widgets")  # Check if the sheet exists
-        sheet = workbook["Widgets"]  # Get Widgets sheet
+        table = workbook.get_table("Widgets")  # Get Widgets sheet values
         current_section = None
 
-        # Get headers from the first row
-        headers = get_headers(
-            sheet,
+        # Check the headers of the sheet
+        get_headers(
+            table,
             expected_headers=[
                 "questionName",
                 "inputType",
@@ -95,20 +95,17 @@ def generate_UI_tests(input_file: str, output_file: str):
         ts_code += f"// Start the survey without email\n"
         ts_code += f"surveyTestHelpers.startAndLoginAnonymously({{ context, title: '?', hasUser: false }});\n\n"
 
-        # Iterate through each row in the sheet, starting from the second row
-        for row in list(sheet.rows)[1:]:
-            # Create a dictionary from the row values and headers
-            row_dict = dict(zip(headers, (cell.value for cell in row)))
-
-            # Get values from the row dictionary
-            question_name = row_dict["questionName"]
-            input_type = row_dict["inputType"]
-            active = row_dict["active"]
-            section = row_dict["section"]
-            group = row_dict.get("group") if row_dict.get("group") else None
-            path = row_dict["path"]
-            conditional = row_dict["conditional"]
-            choices = row_dict["choices"]
+        # Iterate through each data row in the sheet
+        for row in table:
+            # Get values from the row
+            question_name = row["questionName"]
+            input_type = row["inputType"]
+            active = row["active"]
+            section = row["section"]
+            group = row.get("group") if row.get("group") else None
+            path = row["path"]
+            conditional = row["conditional"]
+            choices = row["choices"]
 
             # Check if we've moved to a new section
             if section != current_section:
@@ -201,10 +198,7 @@ def generate_UI_tests(input_file: str, output_file: str):
             ts_code += f"}};\n"
 
         # Write TypeScript code to a file
-        with open(output_file, mode="w", encoding="utf-8", newline="\n") as ts_file:
-            ts_file.write(ts_code)
-
-        print(f"Generated {output_file} successfully")
+        generate_output_file(ts_code, output_file)
 
     except Exception as e:
         # Handle any other exceptions that might occur during script execution
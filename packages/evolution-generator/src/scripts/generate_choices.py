@@ -8,15 +8,16 @@ from collections import defaultdict
 import os
 from helpers.generator_helpers import (
     INDENT,
+    ExcelSource,
     add_generator_comment,
     add_generator_yaml_header,
     generate_label_typescript_with_context,
     get_label_context_flags,
-    is_excel_file,
     is_ts_file,
-    get_workbook,
+    get_workbook_snapshot,
     sheet_exists,
     get_headers,
+    generate_output_file,
 )
 from scripts.labels_generator import LabelFormatter, LabelsGenerator
 
@@ -220,42 +221,47 @@ def _generate_choices_yaml_locales(choices_by_name, labels_output_folder_path: s
 
             rowNumber += 1  # Increment row number
 
-    # Delete existing files first to avoid stale keys if some choices are removed
-    LabelsGenerator.delete_all_labels_yaml_files(
-        labels_output_folder_path=labels_output_folder_path,
-        languages=["fr", "en"],
-        sections=["choices"],
-    )
-
-    # Save translations
+    # Save translations, replacing the existing files to avoid stale keys if some choices are removed
+    generated_files = {}
     for language, translations in translations_dict.items():
         LabelsGenerator.save_translations(
             language,
             "choices",
             labels_output_folder_path,
             translations,
+            generated_files=generated_files,
         )
+    LabelsGenerator.write_generated_files(generated_files)
+
+    # Delete the files of the languages without choices
+    LabelsGenerator.delete_all_labels_yaml_files(
+        labels_output_folder_path=labels_output_folder_path,
+        languages=["fr", "en"],
+        sections=["choices"],
+        keep_file_paths=generated_files,
+    )
 
 
 # Function to generate choices.tsx
 def generate_choices(
-    input_file: str, output_file: str, labels_output_folder_path: str | None = None
+    input_file: ExcelSource,
+    output_file: str,
+    labels_output_folder_path: str | None = None,
 ):
     try:
-        is_excel_file(input_file)  # Check if the input file is an Excel file
         is_ts_file(output_file)  # Check if the output file is an TypeScript file
 
         # Read data from Excel and group choices by choiceName
         choices_by_name = defaultdict(list)
 
-        workbook = get_workbook(input_file)  # Get workbook from Excel file
+        workbook = get_workbook_snapshot(input_file)  # Get workbook from Excel file
 
         sheet_exists(workbook, "Choices")  # Check if the sheet exists
-        sheet = workbook["Choices"]  # Get Choices sheet
+        table = workbook.get_table("Choices")  # Get Choices sheet values
 
-        # Get headers from the first row
-        headers = get_headers(
-            sheet,
+        # Check the headers of the sheet
+        get_headers(
+            table,
             expected_headers=[
                 "choicesName",
                 "value",
@@ -273,21 +279,18 @@ def generate_choices(
         has_conditionals_import = False
         has_custom_conditionals_import = False
 
-        # Iterate through each row in the sheet, starting from the second row
-        for row in list(sheet.rows)[1:]:
-            # Create a dictionary from the row values and headers
-            row_dict = dict(zip(headers, (cell.value for cell in row)))
-
-            # Get values from the row dictionary
-            choice_name = row_dict["choicesName"]
-            value = row_dict["value"]
-            label_fr_yaml = _process_label(row_dict["label::fr"])
-            label_en_yaml = _process_label(row_dict["label::en"])
-            label_fr_one_yaml = _process_label(row_dict.get("label_one::fr"))
-            label_en_one_yaml = _process_label(row_dict.get("label_one::en"))
-            spread_choices_name = row_dict["spreadChoicesName"]
-            conditional = row_dict["conditional"]
-            hidden = row_dict.get("hidden", False)
+        # Iterate through each data row in the sheet
+        for row in table:
+            # Get values from the row
+            choice_name = row["choicesName"]
+            value = row["value"]
+            label_fr_yaml = _process_label(row["label::fr"])
+            label_en_yaml = _process_label(row["label::en"])
+            label_fr_one_yaml = _process_label(row.get("label_one::fr"))
+            label_en_one_yaml = _process_label(row.get("label_one::en"))
+            spread_choices_name = row["spreadChoicesName"]
+            conditional = row["conditional"]
+            hidden = row.get("hidden", False)
 
             # Check if the row is valid
             if choice_name is None or (value is None and spread_choices_name is None):
@@ -325,10 +328,7 @@ def generate_choices(
         )
 
         # Write TypeScript code to a file
-        with open(output_file, mode="w", encoding="utf-8", newline="\n") as ts_file:
-            ts_file.write(ts_code)
-
-        print(f"Generated {output_file} successfully")
+        generate_output_file(ts_code, output_file)
 
         # Generate locales/<lang>/choices.yaml files
         if labels_output_folder_path is not None:
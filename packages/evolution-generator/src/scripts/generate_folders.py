@@ -7,30 +7,31 @@
 
 import os  # For file operations
 from helpers.generator_helpers import (
-    get_data_from_excel,
+    ExcelSource,
+    get_table_from_excel,
     get_sections_names,
 )
+from helpers.output_writer import get_output_sink
 
 
 # Function to generate the folders for the survey
 def generate_folders(
-    excel_file_path: str, survey_folder_path: str, enabled_scripts: dict
+    excel_file_path: ExcelSource, survey_folder_path: str, enabled_scripts: dict
 ):
     try:
         enabled_generate_questionnaire_list = enabled_scripts.get(
             "generate_questionnaire_list", False
         )
 
-        # Read data from Excel and return rows and headers
-        rows, headers = get_data_from_excel(excel_file_path, sheet_name="Sections")
+        # Read data from Excel and return a table of the sheet values
+        table = get_table_from_excel(excel_file_path, sheet_name="Sections")
 
         # Get sections names of Sections sheet
-        sections_names = get_sections_names(rows, headers)
+        sections_names = get_sections_names(table)
 
         def generate_folder(folder_path: str):
-            if not os.path.exists(folder_path):
+            if get_output_sink().make_folder(folder_path):
                 print(f"Generated {folder_path} folder successfully")
-                os.makedirs(folder_path)
 
         # Create the common folder
         common_folder_path = os.path.join(survey_folder_path, "src", "survey", "common")
@@ -6,12 +6,13 @@
 # These functions are intended to be invoked from the generate_survey.py script.
 from helpers.generator_helpers import (
     INDENT,
+    ExcelSource,
     add_generator_comment,
-    is_excel_file,
     is_ts_file,
-    get_workbook,
+    get_workbook_snapshot,
     sheet_exists,
     get_headers,
+    generate_output_file,
 )
 
 
@@ -23,17 +24,16 @@ def replaces_quotes_and_stringify(text):
 
 
 # Function to generate inputRange.tsx
-def generate_input_range(input_file: str, output_file: str):
+def generate_input_range(input_file: ExcelSource, output_file: str):
     try:
-        is_excel_file(input_file)  # Check if the input file is an Excel file
         is_ts_file(output_file)  # Check if the output file is an TypeScript file
-        workbook = get_workbook(input_file)  # Get workbook from Excel file
+        workbook = get_workbook_snapshot(input_file)  # Get workbook from Excel file
         sheet_exists(workbook, "InputRange")  # Check if the sheet exists
-        sheet = workbook["InputRange"]  # Get InputRange sheet
+        table = workbook.get_table("InputRange")  # Get InputRange sheet values
 
-        # Get headers from the first row
-        headers = get_headers(
-            sheet,
+        # Check the headers of the sheet
+        get_headers(
+            table,
             expected_headers=[
                 "inputRangeName",
                 "labelFrMin",
@@ -57,30 +57,23 @@ def generate_input_range(input_file: str, output_file: str):
         # Add imports
         ts_code += f"import {{ type InputRangeType }} from 'evolution-common/lib/services/questionnaire/types';\n\n"
 
-        # Iterate through each row in the sheet, starting from the second row
-        for row in list(sheet.rows)[1:]:
-            # Create a dictionary from the row values and headers
-            row_dict = dict(zip(headers, (cell.value for cell in row)))
-
-            # Get values from the row dictionary
-            input_range_name = row_dict["inputRangeName"]
-            label_fr_min = replaces_quotes_and_stringify(row_dict.get("labelFrMin"))
-            label_fr_middle = replaces_quotes_and_stringify(
-                row_dict.get("labelFrMiddle")
-            )
-            label_fr_max = replaces_quotes_and_stringify(row_dict.get("labelFrMax"))
-            label_en_min = replaces_quotes_and_stringify(row_dict.get("labelEnMin"))
-            label_en_middle = replaces_quotes_and_stringify(
-                row_dict.get("labelEnMiddle")
-            )
-            label_en_max = replaces_quotes_and_stringify(row_dict.get("labelEnMax"))
-            min_value = str(row_dict["minValue"])
-            max_value = str(row_dict["maxValue"])
-            unit_fr = replaces_quotes_and_stringify(row_dict.get("unitFr"))
-            unit_en = replaces_quotes_and_stringify(row_dict.get("unitEn"))
+        # Iterate through each data row in the sheet
+        for row in table:
+            # Get values from the row
+            input_range_name = row["inputRangeName"]
+            label_fr_min = replaces_quotes_and_stringify(row.get("labelFrMin"))
+            label_fr_middle = replaces_quotes_and_stringify(row.get("labelFrMiddle"))
+            label_fr_max = replaces_quotes_and_stringify(row.get("labelFrMax"))
+            label_en_min = replaces_quotes_and_stringify(row.get("labelEnMin"))
+            label_en_middle = replaces_quotes_and_stringify(row.get("labelEnMiddle"))
+            label_en_max = replaces_quotes_and_stringify(row.get("labelEnMax"))
+            min_value = str(row["minValue"])
+            max_value = str(row["maxValue"])
+            unit_fr = replaces_quotes_and_stringify(row.get("unitFr"))
+            unit_en = replaces_quotes_and_stringify(row.get("unitEn"))
             input_color = (
-                row_dict["input_color"]
-                if "input_color" in row_dict and row_dict["input_color"] is not None
+                row["input_color"]
+                if "input_color" in row and row["input_color"] is not None
                 else "blue"
             )
 
@@ -123,10 +116,7 @@ def generate_input_range(input_file: str, output_file: str):
             ts_code += "};\n\n"
 
         # Write TypeScript code to a file
-        with open(output_file, mode="w", encoding="utf-8", newline="\n") as ts_file:
-            ts_file.write(ts_code)
-
-        print(f"Generated {output_file} successfully")
+        generate_output_file(ts_code, output_file)
 
     except Exception as e:
         # Handle any other exceptions that might occur during script execution
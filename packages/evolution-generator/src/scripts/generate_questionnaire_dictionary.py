@@ -6,84 +6,66 @@
 # These functions are intended to be invoked from the generate_survey.py script.
 import os
 import csv
+import io
 from typing import Literal
-from helpers.generator_helpers import get_data_from_excel, clean_text
+from helpers.generator_helpers import (
+    ExcelSource,
+    SheetTable,
+    get_table_from_excel,
+    get_workbook_snapshot,
+    clean_text,
+    generate_output_file,
+)
 
 
 # Function to generate questionnaire_test for each section
 def generate_questionnaire_dictionary(
-    excel_file_path: str,
+    excel_file_path: ExcelSource,
     questionnaire_dictionary_output_folder: str,
     language: Literal["en", "fr"],
 ):
     try:
-        # Read data from Excel and return rows and headers
-        widgets_rows, widgets_headers = get_data_from_excel(
-            excel_file_path, sheet_name="Widgets"
+        # Load the Excel file once for all the sheets read below
+        workbook_snapshot = get_workbook_snapshot(excel_file_path)
+
+        # Read data from Excel and return tables of the sheets values
+        widgets_table = get_table_from_excel(workbook_snapshot, sheet_name="Widgets")
+        sections_table = get_table_from_excel(workbook_snapshot, sheet_name="Sections")
+        choices_table = get_table_from_excel(workbook_snapshot, sheet_name="Choices")
+        ranges_table = get_table_from_excel(workbook_snapshot, sheet_name="InputRange")
+        conditionals_table = get_table_from_excel(
+            workbook_snapshot, sheet_name="Conditionals"
         )
-        sections_rows, sections_headers = get_data_from_excel(
-            excel_file_path, sheet_name="Sections"
-        )
-        choices_rows, choices_headers = get_data_from_excel(
-            excel_file_path, sheet_name="Choices"
-        )
-        ranges_rows, ranges_headers = get_data_from_excel(
-            excel_file_path, sheet_name="InputRange"
-        )
-        conditionals_rows, conditionals_headers = get_data_from_excel(
-            excel_file_path, sheet_name="Conditionals"
-        )
-
-        # Find the index
-        widgets_language_index = widgets_headers.index("label::" + language)
-        widgets_section_index = widgets_headers.index("section")
-        widgets_input_type_index = widgets_headers.index("inputType")
-        widgets_active_index = widgets_headers.index("active")
-        widgets_path_index = widgets_headers.index("path")
-        widgets_conditional_index = widgets_headers.index("conditional")
-        widgets_choices_index = widgets_headers.index("choices")
-        widgets_input_range_index = widgets_headers.index("inputRange")
-        section_name_index = sections_headers.index("section")
-        section_title_language_index = sections_headers.index(f"title_{language}")
-        section_title_abbreviation_index = sections_headers.index("abbreviation")
 
         # Map section names to their titles and abbreviations
         sections = {
-            row[section_name_index].value: {
-                "title": row[section_title_language_index].value,
-                "abbreviation": (
-                    row[section_title_abbreviation_index].value
-                    if row[section_title_abbreviation_index].value
-                    else ""
-                ),
+            row["section"]: {
+                "title": row[f"title_{language}"],
+                "abbreviation": row["abbreviation"] if row["abbreviation"] else "",
             }
-            for row in sections_rows[1:]
+            for row in sections_table
         }
 
         # Process conditionals and get the conditionals_map
-        conditionals_map = process_conditionals(
-            conditionals_rows, conditionals_headers, sections
-        )
+        conditionals_map = process_conditionals(conditionals_table, sections)
 
         # Process choices and get the choices_map
-        choices_map = process_choices(
-            choices_rows, choices_headers, language, conditionals_map
-        )
+        choices_map = process_choices(choices_table, language, conditionals_map)
 
         # Process ranges and get the ranges_map
-        ranges_map = process_range(ranges_rows, ranges_headers, language)
+        ranges_map = process_range(ranges_table, language)
 
         # Group questions by section
         sections_questions = {}
-        for row in widgets_rows[1:]:
-            section_name = row[widgets_section_index].value
-            question_text = clean_text(row[widgets_language_index].value)
-            active = row[widgets_active_index].value
-            choices_name = row[widgets_choices_index].value
-            input_range = row[widgets_input_range_index].value
-            question_path = row[widgets_path_index].value
-            conditional = row[widgets_conditional_index].value
-            input_type = row[widgets_input_type_index].value
+        for row in widgets_table:
+            section_name = row["section"]
+            question_text = clean_text(row["label::" + language])
+            active = row["active"]
+            choices_name = row["choices"]
+            input_range = row["inputRange"]
+            question_path = row["path"]
+            conditional = row["conditional"]
+            input_type = row["inputType"]
 
             # Skip questions with input_type equal to 'NextButton' or 'InfoText'
             # Because they are not questions with values
@@ -193,45 +175,35 @@ def generate_questionnaire_dictionary(
             questionnaire_dictionary_output_folder,
             f"questionnaire_dictionary_{language}.csv",
         )
-        with open(
-            questionnaire_dictionary_path, mode="w", encoding="utf-8", newline=""
-        ) as f:
-            writer = csv.writer(f)
-            writer.writerows(questionnaire_data)
-            print(f"Generated {questionnaire_dictionary_path} successfully")
+        csv_buffer = io.StringIO(newline="")
+        csv.writer(csv_buffer).writerows(questionnaire_data)
+        generate_output_file(csv_buffer.getvalue(), questionnaire_dictionary_path)
 
     except Exception as e:
         print(f"Error with questionnaire dictionary: {e}")
         raise e
 
 
-def process_choices(choices_rows, choices_headers, language, conditionals_map):
+def process_choices(choices_table: SheetTable, language, conditionals_map):
     """
     Process the choices from the Excel sheet and group them by choicesName.
     Concatenate their values and handle spreadChoicesName.
 
     Args:
-        choices_rows (list): Rows from the Choices sheet.
-        choices_headers (list): Headers from the Choices sheet.
+        choices_table (SheetTable): Values of the Choices sheet.
         language (str): Language code ('en' or 'fr').
         conditionals_map (dict): A dictionary mapping conditional names to their descriptions.
 
     Returns:
         dict: A dictionary mapping choicesName to their concatenated values.
     """
-    choices_name_index = choices_headers.index("choicesName")
-    choices_value_index = choices_headers.index("value")
-    choices_language_index = choices_headers.index("label::" + language)
-    choices_spread_choices_name_index = choices_headers.index("spreadChoicesName")
-    choices_conditional_index = choices_headers.index("conditional")
-
     choices_map = {}
-    for row in choices_rows[1:]:
-        choices_name = row[choices_name_index].value
-        choice_text = clean_text(row[choices_language_index].value)
-        choice_value = row[choices_value_index].value
-        choices_spread_choices_name = row[choices_spread_choices_name_index].value
-        choice_conditional = row[choices_conditional_index].value
+    for row in choices_table:
+        choices_name = row["choicesName"]
+        choice_text = clean_text(row["label::" + language])
+        choice_value = row["value"]
+        choices_spread_choices_name = row["spreadChoicesName"]
+        choice_conditional = row["conditional"]
 
         # Add choice to choices_map if it has a value and text
         if choice_text and choice_value is not None:
@@ -288,39 +260,33 @@ def process_choices(choices_rows, choices_headers, language, conditionals_map):
     return choices_map
 
 
-def process_range(ranges_rows, ranges_headers, language):
+def process_range(ranges_table: SheetTable, language):
     """
     Process the ranges from the Excel sheet and group them by inputRangeName.
     Concatenate their min and max values with their corresponding labels.
 
     Args:
-        ranges_rows (list): Rows from the InputRange sheet.
-        ranges_headers (list): Headers from the InputRange sheet.
+        ranges_table (SheetTable): Values of the InputRange sheet.
         language (str): Language code ('en' or 'fr').
 
     Returns:
         dict: A dictionary mapping inputRangeName to their concatenated values.
     """
-    input_range_name_index = ranges_headers.index("inputRangeName")
-    min_value_index = ranges_headers.index("minValue")
-    max_value_index = ranges_headers.index("maxValue")
-    label_min_index = ranges_headers.index(f"label{language.capitalize()}Min")
-    label_middle_index = ranges_headers.index(f"label{language.capitalize()}Middle")
-    label_max_index = ranges_headers.index(f"label{language.capitalize()}Max")
+    label_prefix = f"label{language.capitalize()}"
 
     ranges_map = {}
-    for row in ranges_rows[1:]:
-        input_range_name = row[input_range_name_index].value
+    for row in ranges_table:
+        input_range_name = row["inputRangeName"]
         # Ensure min_value is not negative
-        min_value = max(0, row[min_value_index].value)
-        max_value = row[max_value_index].value
-        label_min = clean_text(row[label_min_index].value)
+        min_value = max(0, row["minValue"])
+        max_value = row["maxValue"]
+        label_min = clean_text(row[f"{label_prefix}Min"])
         label_middle = (
-            clean_text(row[label_middle_index].value)
-            if row[label_middle_index].value
+            clean_text(row[f"{label_prefix}Middle"])
+            if row[f"{label_prefix}Middle"]
             else None
         )
-        label_max = clean_text(row[label_max_index].value)
+        label_max = clean_text(row[f"{label_prefix}Max"])
 
         # Add range to ranges_map if it has min and max values and labels
         if min_value is not None and max_value is not None and label_min and label_max:
@@ -334,34 +300,26 @@ def process_range(ranges_rows, ranges_headers, language):
     return ranges_map
 
 
-def process_conditionals(conditionals_rows, conditionals_headers, sections):
+def process_conditionals(conditionals_table: SheetTable, sections):
     """
     Process the conditionals from the Excel sheet and group them by conditional_name.
     Concatenate their logical operators, paths, comparison operators, and values.
 
     Args:
-        conditionals_rows (list): Rows from the Conditionals sheet.
-        conditionals_headers (list): Headers from the Conditionals sheet.
+        conditionals_table (SheetTable): Values of the Conditionals sheet.
         sections (dict): A dictionary mapping section names to their titles and abbreviations.
 
     Returns:
         dict: A dictionary mapping conditional_name to their concatenated conditionals.
     """
-    conditional_name_index = conditionals_headers.index("conditional_name")
-    logical_operator_index = conditionals_headers.index("logical_operator")
-    path_index = conditionals_headers.index("path")
-    comparison_operator_index = conditionals_headers.index("comparison_operator")
-    value_index = conditionals_headers.index("value")
-    parentheses_index = conditionals_headers.index("parentheses")
-
     conditionals_map = {}
-    for row in conditionals_rows[1:]:
-        conditional_name = row[conditional_name_index].value
-        logical_operator = row[logical_operator_index].value
-        path = row[path_index].value
-        comparison_operator = row[comparison_operator_index].value
-        value = row[value_index].value
-        parentheses = row[parentheses_index].value
+    for row in conditionals_table:
+        conditional_name = row["conditional_name"]
+        logical_operator = row["logical_operator"]
+        path = row["path"]
+        comparison_operator = row["comparison_operator"]
+        value = row["value"]
+        parentheses = row["parentheses"]
         transformed_path = transform_path(path, sections)
 
         # Construct the conditional string
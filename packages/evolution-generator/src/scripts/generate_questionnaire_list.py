@@ -6,50 +6,46 @@
 # These functions are intended to be invoked from the generate_survey.py script.
 import os
 from typing import Literal
-from helpers.generator_helpers import get_data_from_excel, clean_text
+from helpers.generator_helpers import (
+    ExcelSource,
+    get_table_from_excel,
+    get_workbook_snapshot,
+    clean_text,
+    generate_output_file,
+)
 
 
 # Function to generate questionnaire_test for each section
 def generate_questionnaire_list(
-    excel_file_path: str,
+    excel_file_path: ExcelSource,
     questionnaire_list_output_folder: str,
     language: Literal["en", "fr"],
 ):
     try:
-        # Read data from Excel and return rows and headers
-        widgets_rows, widgets_headers = get_data_from_excel(
-            excel_file_path, sheet_name="Widgets"
-        )
-        sections_rows, sections_headers = get_data_from_excel(
-            excel_file_path, sheet_name="Sections"
-        )
-        choices_rows, choices_headers = get_data_from_excel(
-            excel_file_path, sheet_name="Choices"
-        )
+        # Load the Excel file once for all the sheets read below
+        workbook_snapshot = get_workbook_snapshot(excel_file_path)
 
-        # Find the index
-        widgets_language_index = widgets_headers.index("label::" + language)
-        widgets_section_index = widgets_headers.index("section")
-        widgets_active_index = widgets_headers.index("active")
-        widgets_choices_index = widgets_headers.index("choices")
-        section_name_index = sections_headers.index("section")
-        section_title_language_index = sections_headers.index(f"title_{language}")
-        choices_name_index = choices_headers.index("choicesName")
-        choices_language_index = choices_headers.index("label::" + language)
-        choices_spread_choices_name_index = choices_headers.index("spreadChoicesName")
+        # Read data from Excel and return tables of the sheets values
+        widgets_table = get_table_from_excel(workbook_snapshot, sheet_name="Widgets")
+        sections_table = get_table_from_excel(workbook_snapshot, sheet_name="Sections")
+        choices_table = get_table_from_excel(workbook_snapshot, sheet_name="Choices")
 
         # Map section names to their titles
-        section_titles = {
-            row[section_name_index].value: row[section_title_language_index].value
-            for row in sections_rows[1:]
-        }
+        section_titles = dict(
+            zip(
+                sections_table.column("section"),
+                sections_table.column(f"title_{language}"),
+            )
+        )
 
         # Group choices by choicesName and concatenate their 'en' values
         choices_map = {}
-        for row in choices_rows[1:]:
-            choices_name = row[choices_name_index].value
-            choice_text = clean_text(row[choices_language_index].value)
-            choices_spread_choices_name = row[choices_spread_choices_name_index].value
+        for choices_name, choice_label, choices_spread_choices_name in zip(
+            choices_table.column("choicesName"),
+            choices_table.column("label::" + language),
+            choices_table.column("spreadChoicesName"),
+        ):
+            choice_text = clean_text(choice_label)
 
             if choice_text is not None:
                 if choices_name in choices_map:
@@ -70,11 +66,13 @@ def generate_questionnaire_list(
 
         # Group questions by section
         sections = {}
-        for row in widgets_rows[1:]:
-            section_name = row[widgets_section_index].value
-            question_text = clean_text(row[widgets_language_index].value)
-            active = row[widgets_active_index].value
-            choices_name = row[widgets_choices_index].value
+        for section_name, question_label, active, choices_name in zip(
+            widgets_table.column("section"),
+            widgets_table.column("label::" + language),
+            widgets_table.column("active"),
+            widgets_table.column("choices"),
+        ):
+            question_text = clean_text(question_label)
 
             # Add question to section if it has a section name, question text, and is active
             if section_name and question_text and active:
@@ -103,11 +101,7 @@ def generate_questionnaire_list(
         questionnaire_list_path = os.path.join(
             questionnaire_list_output_folder, f"questionnaire_list_{language}.txt"
         )
-        with open(
-            questionnaire_list_path, mode="w", encoding="utf-8", newline="\n"
-        ) as f:
-            f.write(questionnaire_text)
-            print(f"Generated {questionnaire_list_path} successfully")
+        generate_output_file(questionnaire_text, questionnaire_list_path)
 
     except Exception as e:
         print(f"Error with questionnaire list: {e}")
@@ -6,16 +6,16 @@
 # These functions are intended to be invoked from the generate_survey.py script.
 from helpers.generator_helpers import (
     INDENT,
+    ExcelSource,
     add_generator_comment,
-    is_excel_file,
-    get_workbook,
+    get_workbook_snapshot,
     sheet_exists,
     get_headers,
-    get_data_from_excel,
-    get_values_from_row,
+    get_table_from_excel,
+    generate_output_file,
 )
+from helpers.output_writer import get_output_sink, write_output_file
 import os
-import shutil
 
 
 def _section_conditional_ts_expression(name: str) -> str:
@@ -32,21 +32,23 @@ def _section_conditional_ts_expression(name: str) -> str:
 
 
 # Function to generate sectionConfigs.ts for each section
-def generate_section_configs(excel_file_path: str, section_config_output_folder: str):
+def generate_section_configs(
+    excel_file_path: ExcelSource, section_config_output_folder: str
+):
     try:
-        is_excel_file(excel_file_path)  # Check if the input file path is an Excel file
-        workbook = get_workbook(excel_file_path)  # Get workbook from Excel file
+        workbook = get_workbook_snapshot(
+            excel_file_path
+        )  # Get workbook from Excel file
         sheet_exists(workbook, "Sections")  # Check if the sheet exists
-        sheet = workbook["Sections"]  # Get Sections sheet
         previousSection = None  # Initialize previousSection as None
         nextSection = None  # Initialize nextSection as None
 
-        # Read data from Excel and return rows and headers
-        rows, headers = get_data_from_excel(excel_file_path, sheet_name="Sections")
+        # Read data from Excel and return a table of the sheet values
+        table = get_table_from_excel(workbook, sheet_name="Sections")
 
         # Test headers
         get_headers(
-            sheet,
+            table,
             expected_headers=[
                 "section",
                 "title_fr",
@@ -58,28 +60,24 @@ def generate_section_configs(excel_file_path: str, section_config_output_folder:
             sheet_name="Sections",
         )
 
-        # Find the index of 'section' in headers
-        section_index = headers.index("section")
-
-        # Iterate through each row in the sheet, starting from the second row
-        for row_number, row in enumerate(rows[1:], start=2):
+        # Iterate through each data row in the sheet
+        for row in table:
             # Get values from the row
-            row_dict = dict(zip(headers, (cell.value for cell in row)))
-            section = row_dict.get("section")
-            title_fr = row_dict.get("title_fr")
-            title_en = row_dict.get("title_en")
-            in_nav = row_dict.get("in_nav")
-            template = row_dict.get("template")
-            parent_section = row_dict.get("parent_section")
-            section_has_preload = row_dict.get("has_preload")
+            section = row.get("section")
+            title_fr = row.get("title_fr")
+            title_en = row.get("title_en")
+            in_nav = row.get("in_nav")
+            template = row.get("template")
+            parent_section = row.get("parent_section")
+            section_has_preload = row.get("has_preload")
             has_preload = section_has_preload is None or section_has_preload == True
-            enable_conditional = row_dict.get("enable_conditional", None)
+            enable_conditional = row.get("enable_conditional", None)
             enable_conditional_name = (
                 (str(enable_conditional).strip() or None)
                 if enable_conditional is not None
                 else None
             )
-            completion_conditional = row_dict.get("completion_conditional", None)
+            completion_conditional = row.get("completion_conditional", None)
             completion_conditional_name = (
                 (str(completion_conditional).strip() or None)
                 if completion_conditional is not None
@@ -157,7 +155,8 @@ def generate_section_configs(excel_file_path: str, section_config_output_folder:
                     )
 
                     # Check if the template file exists in the destination folder
-                    if not os.path.exists(destination_template_file):
+                    output_sink = get_output_sink()
+                    if not output_sink.is_file(destination_template_file):
                         # Define the source path for the template file
                         source_template_file = os.path.abspath(
                             os.path.join(
@@ -169,11 +168,14 @@ def generate_section_configs(excel_file_path: str, section_config_output_folder:
                                 f"Template file not found: {source_template_file}"
                             )
                         # Ensure the destination directory exists
-                        os.makedirs(
-                            os.path.dirname(destination_template_file), exist_ok=True
+                        output_sink.make_folder(
+                            os.path.dirname(destination_template_file)
                         )
                         # If the template file does not exist, copy it from the source
-                        shutil.copyfile(source_template_file, destination_template_file)
+                        with open(
+                            source_template_file, "r", encoding="utf-8", newline=""
+                        ) as file:
+                            write_output_file(file.read(), destination_template_file)
                         print(f"Copied template.tsx to {destination_template_file}")
 
                 # Generate currentSectionName
@@ -189,10 +191,10 @@ def generate_section_configs(excel_file_path: str, section_config_output_folder:
 
                 # Generate nextSectionName
                 # Check if there is a next row
-                if row_number <= len(rows) - 1:
-                    next_row = rows[row_number]  # Get the next row
+                if row.index + 1 < len(table):
+                    next_row = table[row.index + 1]  # Get the next row
                     # Get the next section from the next row
-                    nextSection = get_values_from_row(next_row, headers)[section_index]
+                    nextSection = next_row["section"]
                     ts_section_code += f"const nextSectionName: SectionConfig['nextSection'] = '{nextSection}';\n"
                 else:
                     ts_section_code += (
@@ -272,15 +274,7 @@ def generate_section_configs(excel_file_path: str, section_config_output_folder:
                 ts_section_code += f"export default sectionConfig;\n"
 
                 # Write TypeScript code to a file
-                with open(
-                    section_output_file,
-                    mode="w",
-                    encoding="utf-8",
-                    newline="\n",
-                ) as ts_file:
-                    ts_file.write(ts_section_code)
-
-                print(f"Generated {section_output_file} successfully")
+                generate_output_file(ts_section_code, section_output_file)
 
             # Generate section code
             generate_section_code(previousSection, nextSection)
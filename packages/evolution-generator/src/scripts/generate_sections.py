@@ -6,21 +6,23 @@
 # These functions are intended to be invoked from the generate_survey.py script.
 
 from helpers.generator_helpers import (
+    ExcelSource,
     INDENT,
-    get_data_from_excel,
+    get_table_from_excel,
     get_sections_names,
     add_generator_comment,
+    generate_output_file,
 )
 
 
 # Function to generate sections.ts
-def generate_sections(excel_file_path: str, sections_output_file_path: str):
+def generate_sections(excel_file_path: ExcelSource, sections_output_file_path: str):
     try:
-        # Read data from Excel and return rows and headers
-        rows, headers = get_data_from_excel(excel_file_path, sheet_name="Sections")
+        # Read data from Excel and return a table of the sheet values
+        table = get_table_from_excel(excel_file_path, sheet_name="Sections")
 
         # Get sections names of Sections sheet
-        sections_names = get_sections_names(rows, headers)
+        sections_names = get_sections_names(table)
 
         ts_code: str = ""  # TypeScript code to be written to file
 
@@ -45,12 +47,7 @@ def generate_sections(excel_file_path: str, sections_output_file_path: str):
         ts_code += "export default getAndValidateSurveySections(sectionsConfigs);\n"
 
         # Write TypeScript code to a file
-        with open(
-            sections_output_file_path, mode="w", encoding="utf-8", newline="\n"
-        ) as ts_file:
-            ts_file.write(ts_code)
-
-        print(f"Generated {sections_output_file_path} successfully")
+        generate_output_file(ts_code, sections_output_file_path)
 
     except Exception as e:
         # Handle any other exceptions that might occur during script execution
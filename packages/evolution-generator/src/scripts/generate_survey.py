@@ -7,24 +7,35 @@
 # can be overridden with the --only argument to only run a subset of the
 # scripts, which is useful for development and debugging.
 import argparse  # For command-line arguments
-from dotenv import load_dotenv  # For environment variables
+import contextlib  # For the steps that are not profiled
+import glob  # For the config paths patterns
+import io  # For the output of the surveys generated in parallel
 import os  # For file operations
-import yaml  # For reading the yaml file
-from scripts.excel_to_csv_generator import ExcelToCsvGenerator
-from scripts.generate_excel import generate_excel
-from scripts.generate_folders import generate_folders
-from scripts.generate_section_configs import generate_section_configs
-from scripts.generate_sections import generate_sections
-from scripts.generate_widgets_configs import generate_widgets_configs
-from scripts.generate_widgets import generate_widgets
-from scripts.generate_choices import generate_choices
-from scripts.generate_input_range import generate_input_range
-from scripts.labels_generator import LabelsGenerator
-from scripts.generate_UI_tests import generate_UI_tests
-from scripts.generate_questionnaire_list import generate_questionnaire_list
-from scripts.generate_questionnaire_dictionary import generate_questionnaire_dictionary
+import sys  # For the exit code of the --check argument and of failed surveys
+import time  # For the polling of the watch mode
+from helpers.generator_helpers import (
+    ExcelSource,
+    WorkbookSnapshot,
+    get_excel_file_path,
+)
+from helpers.build_manifest import BuildManifest, get_sheet_sha256
+from helpers.output_writer import (
+    MemoryOutputSink,
+    OutputCounts,
+    OutputSink,
+    get_output_counts,
+    reset_output_counts,
+    use_output_sink,
+)
+from helpers.step_profiler import StepProfile, StepProfiler
+from helpers.step_scheduler import GeneratorStep, run_steps
+from helpers.workbook_cache import load_workbook_snapshot
 from scripts.conditionals_generator import ConditionalsGenerator
 
+# The scripts of the generation steps are imported when their step is enabled, so
+# the entry points do not pay the import of the scripts they do not run (e.g. the
+# office365 stack of generate_excel for verifyExcel or --only labels).
+
 # Supported script aliases for the --only argument, mapping to the actual script
 # keys in the config file's enabled_scripts section.
 SUPPORTED_SCRIPT_ALIASES = {
@@ -102,10 +113,9 @@ def _override_enabled_scripts(only_scripts):
 
 
 # TODO: Add some validation for the config file
-# Generate the survey from the config file
-def generate_survey(config_path, only_scripts=None):
-    # Load environment variables from .env file
-    load_dotenv()
+# Read the survey folder, Excel file, enabled scripts and options of the scripts from the config file
+def _read_config(config_path, only_scripts=None):
+    import yaml  # For reading the yaml file, not needed by verifyExcel
 
     # Load the data from the YAML file
     with open(config_path, "r") as file:
@@ -118,117 +128,560 @@ def generate_survey(config_path, only_scripts=None):
         # Override enabled_scripts from config file if --only argument is provided
         if only_scripts is not None:
             enabled_scripts = _override_enabled_scripts(only_scripts)
-        enabled_generate_excel = enabled_scripts.get("generate_excel", False)
-        enabled_copy_excel_to_csv = enabled_scripts.get("copy_excel_to_csv", False)
-        enabled_generate_section_configs = enabled_scripts.get(
-            "generate_section_configs", False
-        )
-        enabled_generate_sections = enabled_scripts.get("generate_sections", False)
-        enabled_generate_widgets_configs = enabled_scripts.get(
-            "generate_widgets_configs", False
-        )
-        enabled_generate_widgets = enabled_scripts.get("generate_widgets", False)
-        enabled_generate_conditionals = enabled_scripts.get(
-            "generate_conditionals", False
-        )
-        enabled_generate_choices = enabled_scripts.get("generate_choices", False)
-        enabled_generate_input_range = enabled_scripts.get(
-            "generate_input_range", False
-        )
-        enabled_generate_labels = enabled_scripts.get("generate_labels", False)
-        enabled_generate_UI_tests = enabled_scripts.get("generate_UI_tests", False)
-        enabled_generate_questionnaire_list = enabled_scripts.get(
-            "generate_questionnaire_list", False
-        )
-        enabled_generate_questionnaire_dictionary = enabled_scripts.get(
-            "generate_questionnaire_dictionary", False
-        )
+        # Options of each script, e.g. script_options.generate_conditionals.memoize_context_ids
+        script_options = surveyGenerator.get("script_options") or {}
 
-    # Find the labels output folder path
-    labels_output_folder_path = os.path.join(survey_folder_path, "locales")
+    return survey_folder_path, excel_file_path, enabled_scripts, script_options
+
+
+# Load the environment variables from the .env file
+def _load_dotenv():
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
+# Download the Excel file from SharePoint, importing the office365 stack only when enabled
+def _generate_excel(excel_file_path):
+    from scripts.generate_excel import generate_excel
+
+    generate_excel(
+        os.getenv("SHAREPOINT_URL"),
+        os.getenv("EXCEL_FILE_PATH"),
+        excel_file_path,
+        os.getenv("OFFICE365_USERNAME_EMAIL"),
+        os.getenv("OFFICE365_PASSWORD"),
+    )
+
+
+# Generate the survey from the config file
+def generate_survey(
+    config_path,
+    only_scripts=None,
+    use_cache=True,
+    jobs=1,
+    force=False,
+    profiler=None,
+    output_sink=None,
+):
+    # Load environment variables from .env file
+    _load_dotenv()
+
+    survey_folder_path, excel_file_path, enabled_scripts, script_options = _read_config(
+        config_path, only_scripts
+    )
 
     # Call the generate_excel function to generate the Excel file if script enabled
-    if enabled_generate_excel:
-        generate_excel(
-            os.getenv("SHAREPOINT_URL"),
-            os.getenv("EXCEL_FILE_PATH"),
-            excel_file_path,
-            os.getenv("OFFICE365_USERNAME_EMAIL"),
-            os.getenv("OFFICE365_PASSWORD"),
+    if enabled_scripts.get("generate_excel", False):
+        _generate_excel(excel_file_path)
+
+    generate_survey_from_excel(
+        survey_folder_path,
+        excel_file_path,
+        enabled_scripts,
+        use_cache=use_cache,
+        jobs=jobs,
+        force=force,
+        profiler=profiler,
+        output_sink=output_sink,
+        script_options=script_options,
+    )
+
+
+# Get the config files of the paths, where a path with wildcards matches several config files
+def get_config_paths(config_path_patterns: list[str]) -> list[str]:
+    config_paths = []
+    for config_path_pattern in config_path_patterns:
+        if glob.has_magic(config_path_pattern):
+            matched_paths = sorted(glob.glob(config_path_pattern, recursive=True))
+            if not matched_paths:
+                raise Exception(f"No config file matches {config_path_pattern}")
+        else:
+            matched_paths = [config_path_pattern]
+        for config_path in matched_paths:
+            if config_path not in config_paths:
+                config_paths.append(config_path)
+    return config_paths
+
+
+# Generate the surveys of several config files, returning the config files that failed
+def generate_surveys(
+    config_paths: list[str],
+    only_scripts=None,
+    use_cache=True,
+    jobs=1,
+    force=False,
+    profiler=None,
+) -> list[str]:
+    """
+    Generate the surveys one after the other in this process, or with more than
+    one job, on a pool of jobs worker processes generating one survey each.
+
+    The surveys share the imported modules and the parsed Excel files cache. The
+    output of each survey is printed in the order of the config files. When a
+    survey fails, its error is printed and the other surveys are still generated.
+    """
+    failed_config_paths = []
+    total_output_counts = OutputCounts()
+
+    if jobs <= 1:
+        for config_path in config_paths:
+            print(f"Generating the survey of {config_path}")
+            reset_output_counts()
+            try:
+                generate_survey(
+                    config_path,
+                    only_scripts=only_scripts,
+                    use_cache=use_cache,
+                    force=force,
+                    profiler=profiler,
+                )
+            except Exception as e:
+                print(f"Error generating the survey of {config_path}: {e}")
+                failed_config_paths.append(config_path)
+            total_output_counts.add(reset_output_counts())
+    else:
+        # Imported here as it loads multiprocessing, which the sequential runs do not need
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Each worker generates a whole survey, with its steps run one after the other
+        with ProcessPoolExecutor(max_workers=min(jobs, len(config_paths))) as executor:
+            futures = [
+                executor.submit(
+                    _generate_survey_in_worker,
+                    config_path,
+                    only_scripts,
+                    use_cache,
+                    force,
+                    profiler,
+                )
+                for config_path in config_paths
+            ]
+            for config_path, future in zip(config_paths, futures):
+                output, error, output_counts = future.result()
+                print(f"Generating the survey of {config_path}")
+                print(output, end="")
+                if error is not None:
+                    print(f"Error generating the survey of {config_path}: {error}")
+                    failed_config_paths.append(config_path)
+                total_output_counts.add(output_counts)
+
+    print(
+        f"Generated {len(config_paths) - len(failed_config_paths)} of "
+        f"{len(config_paths)} surveys, generated files: {total_output_counts}"
+    )
+    if failed_config_paths:
+        print(f"Failed surveys: {', '.join(failed_config_paths)}")
+    return failed_config_paths
+
+
+# Generate a survey in a worker process, returning its output, error and generated files counts
+def _generate_survey_in_worker(
+    config_path, only_scripts, use_cache, force, profiler
+) -> tuple[str, str | None, OutputCounts]:
+    output = io.StringIO()
+    error = None
+    reset_output_counts()
+    with contextlib.redirect_stdout(output):
+        try:
+            generate_survey(
+                config_path,
+                only_scripts=only_scripts,
+                use_cache=use_cache,
+                force=force,
+                profiler=profiler,
+            )
+        except Exception as e:
+            error = str(e)
+    return output.getvalue(), error, reset_output_counts()
+
+
+# Generate the survey from the Excel file, returning the loaded workbook snapshot
+def generate_survey_from_excel(
+    survey_folder_path: str,
+    excel_file_path: str,
+    enabled_scripts: dict,
+    use_cache: bool = True,
+    jobs: int = 1,
+    force: bool = False,
+    profiler: StepProfiler | None = None,
+    output_sink: OutputSink | None = None,
+    script_options: dict | None = None,
+    previous_snapshot: WorkbookSnapshot | None = None,
+) -> WorkbookSnapshot:
+    """
+    Generate the survey in survey_folder_path from the Excel file.
+
+    The generated files are written to output_sink when set (e.g. a
+    MemoryOutputSink keeping them in memory), to the disk otherwise.
+    script_options has the options of the scripts, by script key. The tables of
+    the sheets with the same values in previous_snapshot, the snapshot of a
+    previous run, are reused instead of being built again.
+    """
+    # Profile the loading of the Excel file and its integrity check like the steps
+    if profiler is not None:
+        profiler.profiles = []
+    profile_stage = profiler.profile if profiler else _no_profile
+
+    # Load the Excel file once and share it with every script below. When the
+    # file did not change since a previous run, its sheets are read from the cache.
+    with profile_stage("load_workbook") as stage_profile:
+        workbook_snapshot = load_workbook_snapshot(excel_file_path, use_cache=use_cache)
+        if previous_snapshot is not None:
+            workbook_snapshot.reuse_unchanged_sheets(previous_snapshot)
+        stage_profile.rows_read = sum(
+            max(0, len(workbook_snapshot.get_rows(sheet_name)) - 1)
+            for sheet_name in workbook_snapshot.sheetnames
         )
 
     # Check the integrity of the Excel file to avoid generating the survey with invalid data
-    integrity_ok = check_excel_integrity(excel_file_path)
+    with profile_stage("check_excel_integrity"):
+        integrity_ok = check_excel_integrity(workbook_snapshot, use_cache=use_cache)
     if not integrity_ok:
         raise Exception(
             f"Excel integrity check failed for {excel_file_path}. Aborting generation."
         )
 
+    # Run the enabled scripts, the independent ones at the same time when jobs > 1
+    steps = get_survey_steps(
+        survey_folder_path,
+        excel_file_path,
+        workbook_snapshot,
+        enabled_scripts,
+        script_options,
+        jobs=jobs,
+    )
+    # The files of a sink that is not the disk cannot be checked by the build manifest
+    # or written by the worker processes, so every step runs in this process
+    writes_to_disk = output_sink is None or output_sink.writes_to_disk
+    # Skip the steps whose sheets and outputs did not change since the last run, unless forced
+    manifest = (
+        BuildManifest(survey_folder_path, workbook_snapshot, force=force)
+        if writes_to_disk
+        else None
+    )
+    reset_output_counts()
+    with use_output_sink(output_sink):
+        try:
+            run_steps(
+                steps,
+                workbook_snapshot,
+                jobs=jobs if writes_to_disk else 1,
+                skip_step=manifest.is_step_up_to_date if manifest else None,
+                profiler=profiler,
+            )
+        except Exception:
+            if manifest is not None:
+                manifest.save(steps, succeeded=False)
+            raise
+    if manifest is not None:
+        manifest.save(steps)
+        manifest.print_summary(steps)
+    print(f"Generated files: {get_output_counts()}")
+    if profiler is not None:
+        profiler.report()
+    return workbook_snapshot
+
+
+# Stand-in for StepProfiler.profile when the generation is not profiled
+@contextlib.contextmanager
+def _no_profile(name: str):
+    yield StepProfile(name=name)
+
+
+# Generate the survey, then generate it again each time the Excel file is saved
+def watch_survey(
+    config_path,
+    only_scripts=None,
+    use_cache=True,
+    jobs=1,
+    force=False,
+    profiler=None,
+    poll_interval=0.2,
+    debounce_delay=0.3,
+):
+    """
+    Keep the process alive and generate the survey again when the Excel file changes.
+
+    The Excel file is polled every poll_interval seconds, and read once it did not
+    change for debounce_delay seconds, so a save in progress is not read. The
+    whole file is read again, but the tables of the sheets with the same values
+    as the previous run are reused, and the build manifest skips the scripts
+    whose sheets and outputs did not change, so only the scripts reading the
+    changed sheets run again. An error is printed
+    and the watch goes on, until the process is interrupted (Ctrl+C).
+    """
+    _load_dotenv()
+    survey_folder_path, excel_file_path, enabled_scripts, script_options = _read_config(
+        config_path, only_scripts
+    )
+    # The Excel file is not downloaded again while watching, only on the first run
+    if enabled_scripts.get("generate_excel", False):
+        _generate_excel(excel_file_path)
+
+    file_state = get_file_state(excel_file_path)
+    workbook_snapshot = None
+    try:
+        while True:
+            start_time = time.perf_counter()
+            try:
+                new_snapshot = generate_survey_from_excel(
+                    survey_folder_path,
+                    excel_file_path,
+                    enabled_scripts,
+                    use_cache=use_cache,
+                    jobs=jobs,
+                    # Only the first run is forced, the next ones run the changed scripts
+                    force=force and workbook_snapshot is None,
+                    profiler=profiler,
+                    script_options=script_options,
+                    previous_snapshot=workbook_snapshot,
+                )
+                if workbook_snapshot is not None:
+                    changed_sheets = get_changed_sheets(workbook_snapshot, new_snapshot)
+                    print(f"Changed sheets: {', '.join(changed_sheets) or 'none'}")
+                workbook_snapshot = new_snapshot
+                print(
+                    f"Generated the survey in {time.perf_counter() - start_time:.2f}s"
+                )
+            except Exception as e:
+                print(f"Error generating the survey: {e}")
+
+            print(f"Watching {excel_file_path} for changes (Ctrl+C to stop)...")
+            file_state = wait_for_file_change(
+                excel_file_path, file_state, poll_interval, debounce_delay
+            )
+            print(f"{excel_file_path} changed, generating the survey again")
+    except KeyboardInterrupt:
+        print("Stopped watching")
+
+
+# Get the modification time and size of a file, or None if it does not exist
+def get_file_state(file_path: str) -> tuple[int, int] | None:
+    try:
+        file_stat = os.stat(file_path)
+    except FileNotFoundError:
+        return None
+    return (file_stat.st_mtime_ns, file_stat.st_size)
+
+
+# Wait until a file changed, then until it did not change for debounce_delay seconds
+def wait_for_file_change(
+    file_path: str,
+    file_state: tuple[int, int] | None,
+    poll_interval: float,
+    debounce_delay: float,
+) -> tuple[int, int]:
+    new_state = get_file_state(file_path)
+    while True:
+        while new_state is None or new_state == file_state:
+            time.sleep(poll_interval)
+            new_state = get_file_state(file_path)
+
+        # Excel can write the file in many steps, wait until it is stable
+        time.sleep(debounce_delay)
+        current_state = get_file_state(file_path)
+        if current_state == new_state:
+            return new_state
+        new_state = current_state
+
+
+# Get the names of the sheets added, removed or changed between two snapshots
+def get_changed_sheets(
+    previous_snapshot: WorkbookSnapshot, workbook_snapshot: WorkbookSnapshot
+) -> list[str]:
+    sheet_names = list(workbook_snapshot.sheetnames) + [
+        sheet_name
+        for sheet_name in previous_snapshot.sheetnames
+        if sheet_name not in workbook_snapshot.sheetnames
+    ]
+    return [
+        sheet_name
+        for sheet_name in sheet_names
+        if sheet_name not in previous_snapshot.sheetnames
+        or sheet_name not in workbook_snapshot.sheetnames
+        or get_sheet_sha256(previous_snapshot, sheet_name)
+        != get_sheet_sha256(workbook_snapshot, sheet_name)
+    ]
+
+
+# Get the generation steps of the enabled scripts, in the order they are declared
+def get_survey_steps(
+    survey_folder_path: str,
+    excel_file_path: str,
+    workbook_snapshot: WorkbookSnapshot,
+    enabled_scripts: dict,
+    script_options: dict | None = None,
+    jobs: int = 1,
+) -> list[GeneratorStep]:
+    """
+    Declare the generation steps with the sheets they read and the outputs they
+    write. A step waits for the previous steps writing overlapping outputs (e.g.
+    every step writing in a section folder waits for generate_folders), the
+    others are independent. The options of a script in script_options are passed
+    to its step as keyword arguments, so they are part of the build manifest inputs.
+    generate_widgets uses jobs worker processes when its options have no jobs.
+    """
+    script_options = script_options or {}
+    survey_path = os.path.join(survey_folder_path, "src", "survey")
+    sections_path = os.path.join(survey_path, "sections")
+    common_path = os.path.join(survey_path, "common")
+    labels_output_folder_path = os.path.join(survey_folder_path, "locales")
+    references_path = os.path.join(survey_folder_path, "references")
+    steps: list[GeneratorStep] = []
+
     # Copy every Excel sheet to CSV if script enabled, so changes are easier to review in git diffs.
-    if enabled_copy_excel_to_csv:
-        ExcelToCsvGenerator.generate_csv_copy(excel_file_path=excel_file_path)
+    if enabled_scripts.get("copy_excel_to_csv", False):
+        from scripts.excel_to_csv_generator import ExcelToCsvGenerator
+
+        steps.append(
+            GeneratorStep(
+                name="copy_excel_to_csv",
+                function=ExcelToCsvGenerator.generate_csv_copy,
+                reads=tuple(workbook_snapshot.sheetnames),
+                writes=(ExcelToCsvGenerator.get_output_folder_path(excel_file_path),),
+            )
+        )
 
     # Call the generate_folders function to generate the folders for the survey
-    generate_folders(excel_file_path, survey_folder_path, enabled_scripts)
+    from scripts.generate_folders import generate_folders
+
+    steps.append(
+        GeneratorStep(
+            name="generate_folders",
+            function=generate_folders,
+            args=(survey_folder_path, enabled_scripts),
+            reads=("Sections",),
+            writes=(
+                common_path,
+                os.path.join(survey_folder_path, "tests"),
+                os.path.join(labels_output_folder_path, "fr"),
+                os.path.join(labels_output_folder_path, "en"),
+                references_path,
+                os.path.join(sections_path, "*"),
+            ),
+        )
+    )
 
     # Call the generate_section_configs function to generate sectionConfigs.ts if script enabled
-    if enabled_generate_section_configs:
-        section_config_output_folder = os.path.join(
-            survey_folder_path, "src", "survey", "sections"
+    if enabled_scripts.get("generate_section_configs", False):
+        from scripts.generate_section_configs import generate_section_configs
+
+        steps.append(
+            GeneratorStep(
+                name="generate_section_configs",
+                function=generate_section_configs,
+                args=(sections_path,),
+                reads=("Sections",),
+                writes=(
+                    os.path.join(sections_path, "*", "sectionConfigs.ts"),
+                    os.path.join(sections_path, "*", "template.tsx"),
+                ),
+            )
         )
-        generate_section_configs(excel_file_path, section_config_output_folder)
 
     # Call the generate_sections function to generate sections.tsx if script enabled
-    if enabled_generate_sections:
-        sections_output_file_path = os.path.join(
-            survey_folder_path, "src", "survey", "sections.ts"
+    if enabled_scripts.get("generate_sections", False):
+        from scripts.generate_sections import generate_sections
+
+        steps.append(
+            GeneratorStep(
+                name="generate_sections",
+                function=generate_sections,
+                args=(os.path.join(survey_path, "sections.ts"),),
+                reads=("Sections",),
+                writes=(os.path.join(survey_path, "sections.ts"),),
+            )
         )
-        generate_sections(excel_file_path, sections_output_file_path)
 
     # Call the generate_widgets_config function to generate widgetsConfigs.tsx if script enabled
-    if enabled_generate_widgets_configs:
-        widgets_configs_output_file_path = os.path.join(
-            survey_folder_path, "src", "survey", "widgetsConfigs.tsx"
+    if enabled_scripts.get("generate_widgets_configs", False):
+        from scripts.generate_widgets_configs import generate_widgets_configs
+
+        steps.append(
+            GeneratorStep(
+                name="generate_widgets_configs",
+                function=generate_widgets_configs,
+                args=(os.path.join(survey_path, "widgetsConfigs.tsx"),),
+                reads=("Sections",),
+                writes=(os.path.join(survey_path, "widgetsConfigs.tsx"),),
+            )
         )
-        generate_widgets_configs(excel_file_path, widgets_configs_output_file_path)
 
     # Call the generate_widgets function to generate widgets.tsx for each section if script enabled
-    if enabled_generate_widgets:
-        widgets_output_folder = os.path.join(
-            survey_folder_path, "src", "survey", "sections"
+    if enabled_scripts.get("generate_widgets", False):
+        from scripts.generate_widgets import (
+            WIDGETS_HASHES_FILE_NAME,
+            generate_widgets,
         )
-        generate_widgets(excel_file_path, widgets_output_folder)
 
-    # Call the generate_conditionals function to generate conditionals.tsx if script enabled
-    if enabled_generate_conditionals:
-        conditionals_output_file_path = os.path.join(
-            survey_folder_path, "src", "survey", "common", "conditionals.tsx"
+        widgets_options = dict(script_options.get("generate_widgets") or {})
+        steps.append(
+            GeneratorStep(
+                name="generate_widgets",
+                function=generate_widgets,
+                args=(sections_path,),
+                kwargs=widgets_options,
+                # The number of workers does not change the files, so it is not in the manifest
+                run_kwargs={} if "jobs" in widgets_options else {"jobs": jobs},
+                reads=("Widgets",),
+                writes=(
+                    os.path.join(sections_path, "*", "widgets.tsx"),
+                    os.path.join(sections_path, "*", "widgetsNames.ts"),
+                    os.path.join(sections_path, WIDGETS_HASHES_FILE_NAME),
+                ),
+            )
         )
-        ConditionalsGenerator.generate_conditionals(
-            excel_file_path, conditionals_output_file_path
+
+    # Call the generate_conditionals function to generate conditionals.tsx if script enabled
+    if enabled_scripts.get("generate_conditionals", False):
+        steps.append(
+            GeneratorStep(
+                name="generate_conditionals",
+                function=ConditionalsGenerator.generate_conditionals,
+                args=(os.path.join(common_path, "conditionals.tsx"),),
+                kwargs=dict(script_options.get("generate_conditionals") or {}),
+                reads=("Conditionals",),
+                writes=(os.path.join(common_path, "conditionals.tsx"),),
+            )
         )
 
     # Call the generate_choices function to generate choices.tsx if script enabled
-    if enabled_generate_choices:
-        choices_output_file_path = os.path.join(
-            survey_folder_path, "src", "survey", "common", "choices.tsx"
-        )
-        generate_choices(
-            excel_file_path,
-            choices_output_file_path,
-            labels_output_folder_path=labels_output_folder_path,
+    if enabled_scripts.get("generate_choices", False):
+        from scripts.generate_choices import generate_choices
+
+        steps.append(
+            GeneratorStep(
+                name="generate_choices",
+                function=generate_choices,
+                args=(os.path.join(common_path, "choices.tsx"),),
+                kwargs={"labels_output_folder_path": labels_output_folder_path},
+                reads=("Choices",),
+                writes=(
+                    os.path.join(common_path, "choices.tsx"),
+                    os.path.join(labels_output_folder_path, "*", "choices.yaml"),
+                ),
+            )
         )
 
     # Call the generate_input_range function to generate labels.tsx if script enabled
-    if enabled_generate_input_range:
-        input_range_output_file_path = os.path.join(
-            survey_folder_path, "src", "survey", "common", "inputRange.tsx"
+    if enabled_scripts.get("generate_input_range", False):
+        from scripts.generate_input_range import generate_input_range
+
+        steps.append(
+            GeneratorStep(
+                name="generate_input_range",
+                function=generate_input_range,
+                args=(os.path.join(common_path, "inputRange.tsx"),),
+                reads=("InputRange",),
+                writes=(os.path.join(common_path, "inputRange.tsx"),),
+            )
         )
-        generate_input_range(excel_file_path, input_range_output_file_path)
 
     # Call the generate_labels function to generate the labels locales folder if script enabled
-    if enabled_generate_labels:
-        # TODO: At some point, we should consider only read the Excel sheet one time, to avoid reading it multiple times.
+    if enabled_scripts.get("generate_labels", False):
+        from scripts.labels_generator import LabelsGenerator
+
         # TODO: We might consider extracting the sheet names from the Excel file or config file instead of hardcoding them.
         # Generate the labels for the specified sheets
         sheets_with_labels = [
@@ -239,50 +692,122 @@ def generate_survey(config_path, only_scripts=None):
             },
             {"sheetName": "Labels", "namespaceHeader": "namespace", "keyHeader": "key"},
         ]
-        LabelsGenerator.generate_labels(
-            excel_file_path,
-            labels_output_folder_path,
-            sheets_with_labels=sheets_with_labels,
+        steps.append(
+            GeneratorStep(
+                name="generate_labels",
+                function=LabelsGenerator.generate_labels,
+                args=(labels_output_folder_path,),
+                kwargs={"sheets_with_labels": sheets_with_labels},
+                reads=tuple(sheet["sheetName"] for sheet in sheets_with_labels),
+                # One YAML file per namespace, so the step is independent of
+                # generate_choices unless a namespace is named choices
+                writes=tuple(
+                    os.path.join(labels_output_folder_path, "*", f"{section}.yaml")
+                    for section in _get_labels_sections(
+                        workbook_snapshot, sheets_with_labels
+                    )
+                ),
+            )
         )
 
     # Call the generate_UI_tests function to generate the common-UI-tests-helpers-template.ts.ts if script enabled
-    if enabled_generate_UI_tests:
+    if enabled_scripts.get("generate_UI_tests", False):
+        from scripts.generate_UI_tests import generate_UI_tests
+
         UI_tests_output_file_path = os.path.join(
             survey_folder_path, "tests", "common-UI-tests-helpers-template.ts"
         )
-        generate_UI_tests(excel_file_path, UI_tests_output_file_path)
+        steps.append(
+            GeneratorStep(
+                name="generate_UI_tests",
+                function=generate_UI_tests,
+                args=(UI_tests_output_file_path,),
+                reads=("Widgets",),
+                writes=(UI_tests_output_file_path,),
+            )
+        )
 
     # Call the generate_questionnaire_list function to generate the questionnaire_list_en.txt if script enabled
-    if enabled_generate_questionnaire_list:
-        questionnaire_list_output_folder = os.path.join(
-            survey_folder_path, "references"
-        )
-        generate_questionnaire_list(
-            excel_file_path, questionnaire_list_output_folder, language="en"
-        )
-        generate_questionnaire_list(
-            excel_file_path, questionnaire_list_output_folder, language="fr"
-        )
+    if enabled_scripts.get("generate_questionnaire_list", False):
+        from scripts.generate_questionnaire_list import generate_questionnaire_list
+
+        for language in ["en", "fr"]:
+            steps.append(
+                GeneratorStep(
+                    name=f"generate_questionnaire_list_{language}",
+                    function=generate_questionnaire_list,
+                    args=(references_path,),
+                    kwargs={"language": language},
+                    reads=("Widgets", "Sections", "Choices"),
+                    writes=(
+                        os.path.join(
+                            references_path, f"questionnaire_list_{language}.txt"
+                        ),
+                    ),
+                )
+            )
 
     # Call the generate_questionnaire_dictionary function to generate the questionnaire_dictionary_en.txt if script enabled
-    if enabled_generate_questionnaire_dictionary:
-        questionnaire_dictionary_output_folder = os.path.join(
-            survey_folder_path, "references"
-        )
-        generate_questionnaire_dictionary(
-            excel_file_path, questionnaire_dictionary_output_folder, language="en"
-        )
-        generate_questionnaire_dictionary(
-            excel_file_path, questionnaire_dictionary_output_folder, language="fr"
+    if enabled_scripts.get("generate_questionnaire_dictionary", False):
+        from scripts.generate_questionnaire_dictionary import (
+            generate_questionnaire_dictionary,
         )
 
+        for language in ["en", "fr"]:
+            steps.append(
+                GeneratorStep(
+                    name=f"generate_questionnaire_dictionary_{language}",
+                    function=generate_questionnaire_dictionary,
+                    args=(references_path,),
+                    kwargs={"language": language},
+                    reads=(
+                        "Widgets",
+                        "Sections",
+                        "Choices",
+                        "InputRange",
+                        "Conditionals",
+                    ),
+                    writes=(
+                        os.path.join(
+                            references_path, f"questionnaire_dictionary_{language}.csv"
+                        ),
+                    ),
+                )
+            )
+
+    return steps
+
+
+# Get the namespaces of the labels, which are the names of the YAML files written by generate_labels
+def _get_labels_sections(
+    workbook_snapshot: WorkbookSnapshot, sheets_with_labels: list[dict]
+) -> list[str]:
+    sections = []
+    for sheet in sheets_with_labels:
+        # A missing sheet is reported when the labels are generated
+        if sheet["sheetName"] not in workbook_snapshot.sheetnames:
+            continue
+        table = workbook_snapshot.get_table(sheet["sheetName"])
+        if not table.has_column(sheet["namespaceHeader"]):
+            continue
+        for section in table.unique(sheet["namespaceHeader"]):
+            if section and str(section) not in sections:
+                sections.append(str(section))
+    return sections
+
 
 # Call the generate_survey function with the config_path argument
 def main():
     # Parse command-line arguments
     parser = argparse.ArgumentParser()
     parser.add_argument(
-        "--config_path", required=True, help="Path to the Generator config file"
+        "--config_path",
+        required=True,
+        nargs="+",
+        help=(
+            "Paths to the Generator config files, or patterns matching them "
+            "(e.g. 'surveys/*/generatorConfigs.yaml'), to generate several surveys"
+        ),
     )
     parser.add_argument(
         "--only",
@@ -292,18 +817,126 @@ def main():
             "Example: --only section_configs,widget_configs"
         ),
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always parse the Excel file, without reading or writing the parsed sheets cache",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "Number of scripts, or of surveys with several config files, to run "
+            "at the same time, and of workers generating the widgets "
+            "(default: 1, 0 uses every CPU)"
+        ),
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and generate the survey again each time the Excel file is saved",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print the wall time, CPU time, memory peak, rows read and bytes written by each script",
+    )
+    parser.add_argument(
+        "--profile-json",
+        help="Also write the --profile report to this JSON file",
+    )
+    parser.add_argument(
+        "--profile-dir",
+        help="Also save a cProfile file per script in this folder, for --profile",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Run every script, even when its sheets and generated files did not change",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Generate the survey in memory and fail if a generated file differs from the survey folder",
+    )
     args = parser.parse_args()
-    config_path = args.config_path
+    config_paths = get_config_paths(args.config_path)
     only_scripts = _parse_only_scripts(args.only)
+    jobs = args.jobs if args.jobs > 0 else os.cpu_count() or 1
+    profiler = None
+    if args.profile or args.profile_json or args.profile_dir:
+        profiler = StepProfiler(
+            profile_folder_path=args.profile_dir, json_file_path=args.profile_json
+        )
+
+    # Call the watch_survey function to keep generating the survey when the Excel file changes
+    if args.watch:
+        if len(config_paths) > 1:
+            parser.error("--watch takes a single config file")
+        watch_survey(
+            config_paths[0],
+            only_scripts=only_scripts,
+            use_cache=not args.no_cache,
+            jobs=jobs,
+            force=args.force,
+            profiler=profiler,
+        )
+        return
+
+    # Generate the surveys in memory and list the files a normal run would write or remove
+    if args.check:
+        output_sink = MemoryOutputSink(read_from_disk=True)
+        for config_path in config_paths:
+            generate_survey(
+                config_path,
+                only_scripts=only_scripts,
+                use_cache=not args.no_cache,
+                profiler=profiler,
+                output_sink=output_sink,
+            )
+        changed_paths = output_sink.get_changed_paths()
+        for changed_path in changed_paths:
+            print(f"Out of date: {changed_path}")
+        if changed_paths:
+            sys.exit(
+                f"{len(changed_paths)} generated files are out of date, run generateSurvey to update them"
+            )
+        print("Every generated file is up to date")
+        return
+
+    # Generate several surveys in this process, or one survey per job with --jobs
+    if len(config_paths) > 1:
+        failed_config_paths = generate_surveys(
+            config_paths,
+            only_scripts=only_scripts,
+            use_cache=not args.no_cache,
+            jobs=jobs,
+            force=args.force,
+            profiler=profiler,
+        )
+        if failed_config_paths:
+            sys.exit(f"{len(failed_config_paths)} surveys failed")
+        return
 
     # Call the generate_survey function with the config_path argument
-    generate_survey(config_path, only_scripts=only_scripts)
+    generate_survey(
+        config_paths[0],
+        only_scripts=only_scripts,
+        use_cache=not args.no_cache,
+        jobs=jobs,
+        force=args.force,
+        profiler=profiler,
+    )
 
 
 # Check the integrity of the Excel file to avoid generating the survey with invalid data
-def check_excel_integrity(excel_file_path: str) -> bool:
+def check_excel_integrity(excel_source: ExcelSource, use_cache: bool = False) -> bool:
     """Check the integrity of the Excel file. Entry point for scripts and UI."""
-    ok, messages = ConditionalsGenerator().check_with_messages(excel_file_path)
+    from scripts.references_checker import check_workbook_integrity
+
+    ok, messages = check_workbook_integrity(excel_source, use_cache=use_cache)
+    excel_file_path = get_excel_file_path(excel_source)
     if ok:
         print(f"Excel integrity check passed for {excel_file_path}")
     else:
@@ -324,4 +957,5 @@ def verify_excel_cli_main() -> int:
     if len(sys.argv) < 2:
         print("Usage: verifyExcel <path-to-file.xlsx>", file=sys.stderr)
         return 2
-    return 0 if check_excel_integrity(sys.argv[1]) else 1
+    # Designers run it again after each fix, only the changed rows are validated again
+    return 0 if check_excel_integrity(sys.argv[1], use_cache=True) else 1
@@ -5,15 +5,31 @@
 # Note: This script includes functions that generate the widgets.tsx and widgetsNames.ts files.
 # These functions are intended to be invoked from the generate_survey.py script.
 from helpers.generator_helpers import (
+    ExcelSource,
     INDENT,
-    get_data_from_excel,
+    SheetTable,
+    get_table_from_excel,
     add_generator_comment,
     generate_label_typescript_with_context,
     get_label_context_flags,
+    generate_output_file,
 )
+from helpers.build_manifest import get_generator_version
+from helpers.output_writer import get_output_counts, get_output_sink
+from helpers.validation_cache import get_group_hash, get_values_hash
+import hashlib  # Hashes of the sections rows and generated files
+import json  # Format of the sections hashes file
+import os  # Get the number of CPUs for the worker processes
 import re  # Regular expression module for pattern matching
-from typing import TypedDict
-from dataclasses import dataclass
+from typing import Iterator, Optional, TypedDict
+from dataclasses import dataclass, replace
+
+# Files generated in the folder of each section
+WIDGETS_FILE_NAMES = ("widgets.tsx", "widgetsNames.ts")
+# Hashes of the sections generated by the last run, in the sections folder
+WIDGETS_HASHES_FILE_NAME = ".widgets_hashes.json"
+# Bump when the content of the hashes file changes, so older files are ignored
+WIDGETS_HASHES_FORMAT_VERSION = 1
 
 
 @dataclass
@@ -111,129 +127,293 @@ class WidgetResult(TypedDict):
 
 
 # Function to generate widgets.tsx for each section
-def generate_widgets(excel_file_path: str, widgets_output_folder: str):
+def generate_widgets(
+    excel_file_path: ExcelSource,
+    widgets_output_folder: str,
+    jobs: int = 1,
+    incremental: bool = True,
+):
+    """
+    Generate the widgets.tsx and widgetsNames.ts files of each section.
+
+    With jobs > 1, the files of the sections are generated on a pool of jobs
+    worker processes (0 uses every CPU), and written in the order of the
+    sections, like a sequential run.
+
+    With incremental, the hash of the rows and gender fields of each section
+    is saved in the WIDGETS_HASHES_FILE_NAME file of widgets_output_folder, and
+    the next runs only generate the sections whose hash or files changed.
+    """
     try:
-        # Read data from Excel and return rows and headers
-        rows, headers = get_data_from_excel(excel_file_path, sheet_name="Widgets")
-
-        # Find the index of 'section' in headers
-        section_index = headers.index("section")
-
-        # Get all unique section names while preserving order from the section sheet
-        seen_sections: set[str] = set()
-        section_names: list[str] = []
-        for row in rows[1:]:
-            section = row[section_index].value
-            if section and section not in seen_sections:
-                seen_sections.add(section)
-                section_names.append(section)
-
-        # Track gender-related fields. It will be done one section at a time, so
-        # it's not possible to use gender field in a section before it is
-        # defined, but subsequent sections can use it.
-        gender_fields = GenderFields()
-
-        # Transform Excel content into TypeScript code
-        def convert_excel_to_typescript(section):
-            headers = [cell.value for cell in rows[0]]
-
-            section_rows = []
-            for row in rows[1:]:
-                values = [cell.value if cell.value is not None else "" for cell in row]
-
-                if len(values) != len(headers):
-                    print(
-                        f"Skipping row {row}: Number of values ({len(values)}) does not match the number of headers ({len(headers)})."
-                    )
-                    continue
-
-                row_dict = dict(zip(headers, values))
-                section_rows.append(row_dict)
-
-            # Filter rows based on section
-            section_rows = [row for row in section_rows if row["section"] == section]
-
-            # See if the section contains a gender field and store it
-            for row in section_rows:
-                path = row.get("path", "")
-                if path == "gender":
-                    gender_fields.has_gender = True
-                elif path == "sexAssignedAtBirth":
-                    gender_fields.has_sex_assigned_at_birth = True
-
-            # Get the widgets file import flags
-            import_flags = get_widgets_file_import_flags(section_rows)
-
-            # Generate widgets statements with gender fields info
-            widget_results = [
-                generate_widget_statement(row, gender_fields) for row in section_rows
-            ]
-
-            # Check if any widget has specific import flags and update import_flags accordingly
-            import_flags.has_helper_import = any(
-                result["has_helper_import"] for result in widget_results
-            )
-            import_flags.has_formatter_import = any(
-                result.get("has_formatter_import") for result in widget_results
+        # Read data from Excel and return a table of the sheet values
+        table = get_table_from_excel(excel_file_path, sheet_name="Widgets")
+        table = table.fill_empty("")  # Empty cells as empty strings
+
+        # Group the rows by section in one pass, the sections and their rows in sheet order
+        rows_by_section = {
+            section: section_rows
+            for section, section_rows in table.group_by("section").items()
+            if section
+        }
+
+        # Get the gender fields of each section before generating any section,
+        # so the sections can be generated independently
+        gender_fields_by_section = get_gender_fields_by_section(rows_by_section)
+
+        # Only generate the sections that changed since the last run
+        hashes_file_path = os.path.join(widgets_output_folder, WIDGETS_HASHES_FILE_NAME)
+        previous_section_hashes = (
+            read_widgets_hashes(hashes_file_path) if incremental else {}
+        )
+        section_hashes = {
+            section: {
+                "inputs": get_section_widgets_hash(
+                    section_rows, gender_fields_by_section[section]
+                )
+            }
+            for section, section_rows in rows_by_section.items()
+        }
+        changed_rows_by_section = {
+            section: section_rows
+            for section, section_rows in rows_by_section.items()
+            if not _is_section_up_to_date(
+                widgets_output_folder,
+                section,
+                section_hashes[section]["inputs"],
+                previous_section_hashes.get(section),
             )
-            import_flags.has_custom_formatter_import = any(
-                result.get("has_custom_formatter_import") for result in widget_results
+        }
+
+        if jobs <= 0:
+            jobs = os.cpu_count() or 1
+        if jobs > 1 and len(changed_rows_by_section) > 1:
+            transformed_contents = _generate_sections_widgets_in_workers(
+                table,
+                changed_rows_by_section,
+                {
+                    section: gender_fields_by_section[section]
+                    for section in changed_rows_by_section
+                },
+                jobs,
             )
-
-            # Generate import statements
-            import_statements = generate_import_statements(import_flags=import_flags)
-
-            # Generate the widgets statements
-            widgets_statements = [result["statement"] for result in widget_results]
-            widgets_statements = (
-                f"{import_statements}\n{'\n\n'.join(widgets_statements)}\n"
+        else:
+            transformed_contents = (
+                generate_section_widgets(
+                    section_rows, gender_fields_by_section[section]
+                )
+                for section, section_rows in changed_rows_by_section.items()
             )
 
-            # Generate widgets names
-            widgets_names_statements = generate_widgets_names_statements(section_rows)
-
-            return {
-                "widgetsStatements": widgets_statements,
-                "widgetsNamesStatements": widgets_names_statements,
-            }
-
         # Process the output files based on sections
-        for section in section_names:
-            if section is None:
-                continue
-            transformed_content = convert_excel_to_typescript(section)
+        for section in rows_by_section:
             widgets_output_path = widgets_output_folder + "/" + section
+            if section not in changed_rows_by_section:
+                # Keep the files of the last run, which match the section rows
+                section_hashes[section] = previous_section_hashes[section]
+                for file_name in WIDGETS_FILE_NAMES:
+                    print(f"Unchanged {widgets_output_path}/{file_name}")
+                    get_output_counts().unchanged += 1
+                continue
+            transformed_content = next(transformed_contents)
 
             # Add Generator comment at the start of the file
             ts_code = add_generator_comment()
+            files_content = {
+                "widgets.tsx": ts_code + transformed_content["widgetsStatements"],
+                "widgetsNames.ts": ts_code
+                + transformed_content["widgetsNamesStatements"],
+            }
 
-            # Write the transformed content to the widgets output file
-            with open(
-                widgets_output_path + "/widgets.tsx",
-                mode="w",
-                encoding="utf-8",
-                newline="\n",
-            ) as f:
-                f.write(ts_code)
-                f.write(transformed_content["widgetsStatements"])
-                print(f"Generated {widgets_output_path}/widgets.tsx successfully")
-
-            # Write the transformed content to the widgetsNames output file
-            with open(
-                widgets_output_path + "/widgetsNames.ts",
-                mode="w",
-                encoding="utf-8",
-                newline="\n",
-            ) as f:
-                f.write(ts_code)
-                f.write(transformed_content["widgetsNamesStatements"])
-                print(f"Generated {widgets_output_path}/widgetsNames.ts successfully")
+            # Write the transformed content to the widgets and widgetsNames output files
+            for file_name, content in files_content.items():
+                generate_output_file(content, widgets_output_path + "/" + file_name)
+            section_hashes[section]["outputs"] = {
+                file_name: hashlib.sha256(content.encode("utf-8")).hexdigest()
+                for file_name, content in files_content.items()
+            }
+
+        if incremental:
+            write_widgets_hashes(hashes_file_path, section_hashes)
 
     except Exception as e:
         print(f"Error with widgets: {e}")
         raise e
 
 
+# Get the hash of the rows of a section and of the gender fields it can use
+def get_section_widgets_hash(section_rows, gender_fields: GenderFields) -> str:
+    # The headers are hashed with the values, as the rows are read by header
+    row_hashes = [
+        get_values_hash(tuple((header, row[header]) for header in row))
+        for row in section_rows
+    ]
+    row_hashes.append(
+        get_values_hash(
+            (gender_fields.has_gender, gender_fields.has_sex_assigned_at_birth)
+        )
+    )
+    return get_group_hash(row_hashes).hex()
+
+
+# Read the hashes of the sections generated by the last run, by section
+def read_widgets_hashes(hashes_file_path: str) -> dict[str, dict]:
+    content = get_output_sink().read(hashes_file_path)
+    if content is None:
+        return {}
+    try:
+        widgets_hashes = json.loads(content)
+    except ValueError as e:
+        print(f"Warning: ignoring unreadable widgets hashes {hashes_file_path}: {e}")
+        return {}
+
+    # Ignore the hashes of another Generator version, which may generate other files
+    if (
+        not isinstance(widgets_hashes, dict)
+        or widgets_hashes.get("version") != WIDGETS_HASHES_FORMAT_VERSION
+        or widgets_hashes.get("generator_version") != get_generator_version()
+    ):
+        return {}
+    return widgets_hashes.get("sections", {})
+
+
+# Save the hashes of the sections, for the next run
+def write_widgets_hashes(hashes_file_path: str, section_hashes: dict[str, dict]):
+    widgets_hashes = {
+        "version": WIDGETS_HASHES_FORMAT_VERSION,
+        "generator_version": get_generator_version(),
+        "sections": section_hashes,
+    }
+    generate_output_file(
+        json.dumps(widgets_hashes, indent=2, sort_keys=True) + "\n", hashes_file_path
+    )
+
+
+# Check if the files of a section were generated by the last run from the same rows
+def _is_section_up_to_date(
+    widgets_output_folder: str,
+    section: str,
+    inputs_hash: str,
+    previous_hashes: Optional[dict],
+) -> bool:
+    if (
+        not isinstance(previous_hashes, dict)
+        or previous_hashes.get("inputs") != inputs_hash
+    ):
+        return False
+    outputs = previous_hashes.get("outputs") or {}
+    for file_name in WIDGETS_FILE_NAMES:
+        content = get_output_sink().read(
+            widgets_output_folder + "/" + section + "/" + file_name
+        )
+        # The file was removed or edited since the last run
+        if content is None or hashlib.sha256(content).hexdigest() != outputs.get(
+            file_name
+        ):
+            return False
+    return True
+
+
+# Get the gender fields known by each section, in sheet order
+def get_gender_fields_by_section(rows_by_section: dict) -> dict[str, GenderFields]:
+    """
+    Get the gender-related fields available to each section.
+
+    A section can use the gender fields defined in itself and in the previous
+    sections, but not the ones of the next sections.
+    """
+    gender_fields = GenderFields()
+    gender_fields_by_section = {}
+    for section, section_rows in rows_by_section.items():
+        # See if the section contains a gender field and store it
+        for row in section_rows:
+            path = row.get("path", "")
+            if path == "gender":
+                gender_fields.has_gender = True
+            elif path == "sexAssignedAtBirth":
+                gender_fields.has_sex_assigned_at_birth = True
+        gender_fields_by_section[section] = replace(gender_fields)
+    return gender_fields_by_section
+
+
+# Transform the Excel rows of a section into the TypeScript code of its files
+def generate_section_widgets(section_rows, gender_fields: GenderFields) -> dict:
+    # Get the widgets file import flags
+    import_flags = get_widgets_file_import_flags(section_rows)
+
+    # Generate widgets statements with gender fields info
+    widget_results = [
+        generate_widget_statement(row, gender_fields) for row in section_rows
+    ]
+
+    # Check if any widget has specific import flags and update import_flags accordingly
+    import_flags.has_helper_import = any(
+        result["has_helper_import"] for result in widget_results
+    )
+    import_flags.has_formatter_import = any(
+        result.get("has_formatter_import") for result in widget_results
+    )
+    import_flags.has_custom_formatter_import = any(
+        result.get("has_custom_formatter_import") for result in widget_results
+    )
+
+    # Generate import statements
+    import_statements = generate_import_statements(import_flags=import_flags)
+
+    # Generate the widgets statements
+    widgets_statements = [result["statement"] for result in widget_results]
+    widgets_statements = f"{import_statements}\n{'\n\n'.join(widgets_statements)}\n"
+
+    # Generate widgets names
+    widgets_names_statements = generate_widgets_names_statements(section_rows)
+
+    return {
+        "widgetsStatements": widgets_statements,
+        "widgetsNamesStatements": widgets_names_statements,
+    }
+
+
+# Generate the files of the sections on a pool of worker processes, yielding them in order
+def _generate_sections_widgets_in_workers(
+    table: SheetTable,
+    rows_by_section: dict,
+    gender_fields_by_section: dict[str, GenderFields],
+    jobs: int,
+) -> Iterator[dict]:
+    # Imported here as it loads multiprocessing, which the sequential runs do not need
+    from concurrent.futures import ProcessPoolExecutor
+
+    # The table is sent once to each worker, and each section by its rows indexes
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(rows_by_section)),
+        initializer=_init_widgets_worker,
+        initargs=(table,),
+    ) as executor:
+        yield from executor.map(
+            _generate_section_widgets_in_worker,
+            [
+                [row.index for row in section_rows]
+                for section_rows in rows_by_section.values()
+            ],
+            gender_fields_by_section.values(),
+        )
+
+
+# Widgets table of the worker process, sent once when the worker starts
+_worker_widgets_table: Optional[SheetTable] = None
+
+
+def _init_widgets_worker(table: SheetTable) -> None:
+    global _worker_widgets_table
+    _worker_widgets_table = table
+
+
+def _generate_section_widgets_in_worker(
+    row_indexes: list[int], gender_fields: GenderFields
+) -> dict:
+    section_rows = [_worker_widgets_table[index] for index in row_indexes]
+    return generate_section_widgets(section_rows, gender_fields)
+
+
 # Input types that emit helpPopup or confirmPopup in generated widget code.
 _HELP_POPUP_INPUT_TYPES = frozenset(
     {
@@ -6,23 +6,25 @@
 # These functions are intended to be invoked from the generate_survey.py script.
 
 from helpers.generator_helpers import (
+    ExcelSource,
     INDENT,
-    get_data_from_excel,
+    get_table_from_excel,
     get_sections_names,
     add_generator_comment,
+    generate_output_file,
 )
 
 
 # Function to generate widgetsConfigs.tsx
 def generate_widgets_configs(
-    excel_file_path: str, widgets_configs_output_file_path: str
+    excel_file_path: ExcelSource, widgets_configs_output_file_path: str
 ):
     try:
-        # Read data from Excel and return rows and headers
-        rows, headers = get_data_from_excel(excel_file_path, sheet_name="Sections")
+        # Read data from Excel and return a table of the sheet values
+        table = get_table_from_excel(excel_file_path, sheet_name="Sections")
 
         # Get sections names of Sections sheet
-        sections_names = get_sections_names(rows, headers)
+        sections_names = get_sections_names(table)
 
         ts_code: str = ""  # TypeScript code to be written to file
 
@@ -68,12 +70,7 @@ def generate_widgets_configs(
         ts_code += "export { widgets };\n"
 
         # Write TypeScript code to a file
-        with open(
-            widgets_configs_output_file_path, mode="w", encoding="utf-8", newline="\n"
-        ) as ts_file:
-            ts_file.write(ts_code)
-
-        print(f"Generated {widgets_configs_output_file_path} successfully")
+        generate_output_file(ts_code, widgets_configs_output_file_path)
 
     except Exception as e:
         # Handle any other exceptions that might occur during script execution
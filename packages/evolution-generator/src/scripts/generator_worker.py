@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# Copyright 2026, Polytechnique Montreal and contributors
+# This file is licensed under the MIT License.
+# License text available at https://opensource.org/licenses/MIT
+
+# Note: This script is a long-lived Generator worker for the admin API. It reads
+# one JSON request per line on stdin and writes one JSON response per line on
+# stdout, so the modules are imported once and the parsed workbooks are kept in
+# memory between requests, instead of starting a new Python process per request.
+#
+# Requests (the optional "id" is copied to the response):
+#   {"id": 1, "command": "check", "excelFilePath": "/tmp/survey.xlsx", "maxErrors": 100}
+#   {"id": 2, "command": "generate", "configPath": "config.yaml", "only": "widgets", "force": false, "inMemory": false}
+#   {"id": 3, "command": "ping"}
+#   {"id": 4, "command": "shutdown"}
+# Responses have "ok": true with the result of the command, or "ok": false with "error".
+import contextlib  # Keep the output of the commands out of the responses stream
+import io  # Buffer for the output of the commands
+import json  # Requests and responses format
+import sys  # Standard input and output streams
+from collections import OrderedDict
+from typing import Optional, TextIO
+
+from helpers.generator_helpers import WorkbookSnapshot
+from helpers.output_writer import MemoryOutputSink, get_output_counts
+from helpers.validation_issues import IssueStream, ValidationIssue
+from helpers.workbook_cache import get_file_sha256
+from scripts.generate_survey import _parse_only_scripts, generate_survey
+from scripts.references_checker import check_workbook_integrity
+
+# Parsed workbooks kept in memory, the admin UI often verifies the same file again
+WORKBOOK_SNAPSHOTS_MAX_COUNT = 8
+
+
+class WorkbookSnapshotCache:
+    """Parsed workbooks by SHA-256 of the Excel file content, the least recently used removed first."""
+
+    def __init__(self, max_count: int = WORKBOOK_SNAPSHOTS_MAX_COUNT):
+        self.max_count = max_count
+        self._snapshots: OrderedDict[str, WorkbookSnapshot] = OrderedDict()
+
+    def get(self, excel_file_path: str) -> WorkbookSnapshot:
+        excel_sha256 = get_file_sha256(excel_file_path)
+        snapshot = self._snapshots.get(excel_sha256)
+        if snapshot is not None:
+            self._snapshots.move_to_end(excel_sha256)
+            return snapshot
+
+        snapshot = WorkbookSnapshot(excel_file_path)
+        self._snapshots[excel_sha256] = snapshot
+        while len(self._snapshots) > self.max_count:
+            self._snapshots.popitem(last=False)
+        return snapshot
+
+
+class GeneratorWorker:
+    """Run the check and generate commands of the JSON requests."""
+
+    def __init__(self, workbook_snapshots: Optional[WorkbookSnapshotCache] = None):
+        self.workbook_snapshots = workbook_snapshots or WorkbookSnapshotCache()
+
+    # Check the integrity of an Excel file, with the same result as check_excel_integrity_cli.py
+    def check(self, request: dict) -> dict:
+        excel_file_path = request["excelFilePath"]
+        max_errors = request.get("maxErrors")
+        workbook_snapshot = self.workbook_snapshots.get(excel_file_path)
+        issues: list[ValidationIssue] = []
+        issue_stream = IssueStream(issues.append, max_errors)
+        integrity_ok, errors = check_workbook_integrity(
+            workbook_snapshot, issue_stream=issue_stream
+        )
+        return {
+            "ok": True,
+            "integrityOk": integrity_ok,
+            "excelFilePath": excel_file_path,
+            "errors": list(errors),
+            "issues": [issue.to_dict() for issue in issues],
+            "maxErrorsReached": issue_stream.max_errors_reached,
+        }
+
+    # Generate the survey of a config file, in memory when inMemory is true
+    def generate(self, request: dict) -> dict:
+        output_sink = MemoryOutputSink() if request.get("inMemory") else None
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            generate_survey(
+                request["configPath"],
+                only_scripts=_parse_only_scripts(request.get("only")),
+                force=bool(request.get("force", False)),
+                output_sink=output_sink,
+            )
+        response = {
+            "ok": True,
+            "output": output.getvalue(),
+            "generatedFiles": str(get_output_counts()),
+        }
+        if output_sink is not None:
+            response["files"] = output_sink.get_text_files()
+        return response
+
+    # Run one request, returning its response and if the worker must stop
+    def handle(self, request: dict) -> tuple[dict, bool]:
+        command = request.get("command")
+        if command == "check":
+            return self.check(request), False
+        if command == "generate":
+            return self.generate(request), False
+        if command == "ping":
+            return {"ok": True}, False
+        if command == "shutdown":
+            return {"ok": True}, True
+        raise ValueError(f"Unknown command: {command}")
+
+    def serve(self, input_stream: TextIO, output_stream: TextIO) -> None:
+        """Answer the requests of the input stream, one JSON line each, until shutdown or end of input."""
+        for line in input_stream:
+            if not line.strip():
+                continue
+            request_id = None
+            stop = False
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("The request must be a JSON object")
+                request_id = request.get("id")
+                # The commands must not print in the responses stream
+                with contextlib.redirect_stdout(sys.stderr):
+                    response, stop = self.handle(request)
+            except Exception as error:
+                response = {"ok": False, "error": str(error)}
+            response = {"id": request_id, **response}
+            output_stream.write(json.dumps(response) + "\n")
+            output_stream.flush()
+            if stop:
+                return
+
+
+def main() -> int:
+    GeneratorWorker().serve(sys.stdin, sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
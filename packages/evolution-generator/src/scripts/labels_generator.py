@@ -4,14 +4,21 @@
 
 # Note: This module defines LabelsGenerator (locales labels YAML generation) and LabelFormatter.
 # It is intended to be invoked from the generate_survey.py script.
+import io  # For dumping the YAML before writing it
 import os  # For interacting with the operating system
 import ruamel.yaml  # For working with YAML files
 import re  # For regular expressions
 from typing import TypedDict
 from helpers.generator_helpers import (
     add_generator_yaml_header,
-    get_data_from_excel,
+    get_table_from_excel,
     get_label_context_flags,
+    get_workbook_snapshot,
+)
+from helpers.output_writer import (
+    OUTPUT_UNCHANGED,
+    get_output_sink,
+    write_output_file,
 )
 
 
@@ -139,18 +146,19 @@ class LabelsGenerator:
 
     @classmethod
     def delete_all_labels_yaml_files(
-        cls, labels_output_folder_path, languages, sections
+        cls, labels_output_folder_path, languages, sections, keep_file_paths=()
     ):
         """
         Deletes all YAML label files for the specified languages and sections.
 
-        This function is typically called once before generating new label files to ensure
+        This function is typically called once after generating new label files to ensure
         that old or outdated files are removed, preventing duplicate or stale content.
 
         Args:
             labels_output_folder_path (str): The root directory where label files are stored.
             languages (list of str): List of language codes (e.g., ['fr', 'en']) for which files should be deleted.
             sections (iterable of str): List or set of section names corresponding to survey sections.
+            keep_file_paths (iterable of str): Files generated in this run, which are not deleted.
 
         Side Effects:
             Removes files matching the pattern {labels_output_folder_path}/{language}/{section}.yaml
@@ -164,10 +172,10 @@ class LabelsGenerator:
                 file_path = cls.get_labels_file_path(
                     labels_output_folder_path, language, section
                 )
-                if os.path.exists(file_path):
+                if file_path not in keep_file_paths:
                     try:
-                        os.remove(file_path)
-                        print(f"Removed {file_path} successfully")
+                        if get_output_sink().remove(file_path):
+                            print(f"Removed {file_path} successfully")
                     except Exception as e:
                         print(
                             f"An error occurred while deleting the file {file_path}: {e}"
@@ -221,9 +229,17 @@ class LabelsGenerator:
         section,
         labels_output_folder_path,
         translations,
+        generated_files=None,
     ):
         """
         Saves the translations to the appropriate YAML file with a header.
+
+        The translations are merged with the existing file, which is only written if
+        its content changed. When generated_files is set (file path -> YAML content
+        generated in this run), the translations are merged with the content generated
+        for the file instead, and the new content is stored in generated_files to be
+        written later by write_generated_files. Returns the file path, or None if the
+        section has no translations.
         """
         try:
             # Construct the file path depending on the section, language, and labels_sheet_name
@@ -255,17 +271,28 @@ class LabelsGenerator:
 
             # Make sure the locales directory exists
             lang_dir = os.path.join(labels_output_folder_path, language)
-            os.makedirs(lang_dir, exist_ok=True)
+            get_output_sink().make_folder(lang_dir)
 
-            # Merge with existing file if present
-            if os.path.exists(file_path):
-                with open(file_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-                    try:
-                        # Note: Use yaml.load instead of .safe_load because .safe_load is deprecated in ruamel.yaml.
-                        existing = cls.yaml.load(content) or {}
-                    except Exception:
-                        existing = {}
+            # Merge with the content generated in this run, or with the existing file if present
+            if generated_files is not None:
+                content = generated_files.get(file_path)
+            else:
+                existing_content = get_output_sink().read(file_path)
+                content = (
+                    # Read with universal newlines, like a file opened in text mode
+                    existing_content.decode("utf-8")
+                    .replace("\r\n", "\n")
+                    .replace("\r", "\n")
+                    if existing_content is not None
+                    else None
+                )
+
+            if content is not None:
+                try:
+                    # Note: Use yaml.load instead of .safe_load because .safe_load is deprecated in ruamel.yaml.
+                    existing = cls.yaml.load(content) or {}
+                except Exception:
+                    existing = {}
                 merged = cls.merged_section_translations(existing, yaml_data)
                 # Check if header already exists
                 if content.startswith(header):
@@ -281,17 +308,40 @@ class LabelsGenerator:
                 header_to_write = header
                 print_msg = f"Generated {file_path.replace('\\', '/') } successfully"
 
-            with open(file_path, "w", encoding="utf-8") as file:
-                # Write the header only if not already present
-                if header_to_write:
-                    file.write(header_to_write)
-                cls.yaml.dump(merged, file)
+            yaml_buffer = io.StringIO()
+            # Write the header only if not already present
+            if header_to_write:
+                yaml_buffer.write(header_to_write)
+            cls.yaml.dump(merged, yaml_buffer)
+            if generated_files is not None:
+                generated_files[file_path] = yaml_buffer.getvalue()
+                return file_path
+
+            status = write_output_file(
+                yaml_buffer.getvalue(), file_path, newline=os.linesep
+            )
+            if status == OUTPUT_UNCHANGED:
+                print_msg = f"Unchanged {file_path.replace('\\', '/') }"
             print(print_msg)
+            return file_path
 
         except Exception as e:
             print(f"An error occurred while saving translations to {file_path}: {e}")
             raise e
 
+    @staticmethod
+    def write_generated_files(generated_files):
+        """
+        Writes the YAML contents generated by save_translations, by file path.
+        The files whose content did not change are not written again.
+        """
+        for file_path, content in generated_files.items():
+            status = write_output_file(content, file_path, newline=os.linesep)
+            if status == OUTPUT_UNCHANGED:
+                print(f"Unchanged {file_path.replace('\\', '/') }")
+            else:
+                print(f"Generated {file_path.replace('\\', '/') } successfully")
+
     @classmethod
     def __add_nested_translation(
         cls,
@@ -434,62 +484,42 @@ class LabelsGenerator:
         excel_file_path,
         labels_output_folder_path,
         sheet_with_labels: SheetWithLabels = DEFAULT_SHEETS_WITH_LABELS[0],
+        generated_files=None,
     ):
         """
         Reads translations from an Excel file and adds them to the appropriate YAML files.
 
         Args:
-            excel_file_path (str): The path to the Excel file containing translations.
+            excel_file_path (ExcelSource): The path to the Excel file containing translations, or its loaded snapshot.
             labels_output_folder_path (str): The output folder path for the labels.
             sheet_with_labels (SheetWithLabels): Sheet configuration containing sheetName and header names.
+            generated_files (dict of str to str): YAML contents generated in this run, by file path.
+                When set, the translations are merged in these contents instead of the files.
         """
         try:
-            # Read data from Excel and return rows and headers
-            widgets_rows, widgets_headers = get_data_from_excel(
+            # Read data from Excel and return a table of the sheet values
+            table = get_table_from_excel(
                 excel_file_path, sheet_name=sheet_with_labels["sheetName"]
             )
+            namespace_header = sheet_with_labels["namespaceHeader"]
+            key_header = sheet_with_labels["keyHeader"]
 
-            # Find the index
-            section_index = widgets_headers.index(sheet_with_labels["namespaceHeader"])
-            label_key_index = widgets_headers.index(sheet_with_labels["keyHeader"])
-            label_fr_index = widgets_headers.index("label::fr")
-            label_en_index = widgets_headers.index("label::en")
-            label_fr_one_index = (
-                widgets_headers.index("label_one::fr")
-                if "label_one::fr" in widgets_headers
-                else None
-            )
-            label_en_one_index = (
-                widgets_headers.index("label_one::en")
-                if "label_one::en" in widgets_headers
-                else None
-            )
-
-            rowNumber = 2  # Start from the second row
-            processed_sections = set()  # Track processed sections
+            processed_sections = []  # Track processed sections, in sheet order
             translations_dict = {
                 "fr": {},
                 "en": {},
             }  # Store translations for each language
 
             # Parse the widget sheet to add the translations
-            for row in widgets_rows[1:]:
+            for row in table:
                 # Get the row values
-                # question_name = row[question_name_index].value
-                section = row[section_index].value
-                label_key = row[label_key_index].value
-                fr_label = row[label_fr_index].value
-                en_label = row[label_en_index].value
-                fr_label_one = (
-                    row[label_fr_one_index].value
-                    if label_fr_one_index is not None
-                    else None
-                )
-                en_label_one = (
-                    row[label_en_one_index].value
-                    if label_en_one_index is not None
-                    else None
-                )
+                section = row[namespace_header]
+                label_key = row[key_header]
+                fr_label = row["label::fr"]
+                en_label = row["label::en"]
+                fr_label_one = row.get("label_one::fr")
+                en_label_one = row.get("label_one::en")
+                rowNumber = row.row_number
 
                 # Expand gender context for labels, by language
                 gender_fr = cls.expand_gender(fr_label)
@@ -497,9 +527,9 @@ class LabelsGenerator:
                 gender_en = cls.expand_gender(en_label)
                 gender_en_one = cls.expand_gender(en_label_one)
 
-                # Add section to processed section set if not already processed
+                # Add section to processed sections if not already processed
                 if section not in processed_sections:
-                    processed_sections.add(section)  # Mark section as processed
+                    processed_sections.append(section)  # Mark section as processed
 
                 # Add French translations
                 cls.add_gender_or_base_translations(
@@ -544,8 +574,6 @@ class LabelsGenerator:
                     translations_dict,
                 )
 
-                rowNumber += 1  # Increment row number
-
             # Save all translations
             for language, translations in translations_dict.items():
                 for section in processed_sections:
@@ -554,6 +582,7 @@ class LabelsGenerator:
                         section,
                         labels_output_folder_path,
                         translations,
+                        generated_files=generated_files,
                     )
 
         except Exception as e:
@@ -748,11 +777,12 @@ class LabelsGenerator:
 
         This function:
         1. Collects all unique section names from all specified sheets.
-        2. Deletes all YAML files for all sections/languages once before any processing.
-        3. Processes each sheet, merging translations into the same YAML files per section/language.
+        2. Processes each sheet, merging translations into the same YAML files per section/language.
+        3. Writes the YAML files whose content changed, replacing the files of the previous run.
+        4. Deletes the YAML files of the sections/languages without translations.
 
         Args:
-            excel_file_path (str): The path to the Excel file containing translations.
+            excel_file_path (ExcelSource): The path to the Excel file containing translations, or its loaded snapshot.
             labels_output_folder_path (str): The output folder path for the labels.
             sheets_with_labels (list[SheetWithLabels]): Sheet configurations for labels extraction.
         """
@@ -761,32 +791,41 @@ class LabelsGenerator:
                 print("Error: No sheets_with_labels provided.")
                 return
 
+            # Load the Excel file once for all the sheets with labels
+            workbook_snapshot = get_workbook_snapshot(excel_file_path)
+
             # Step 1: Collect all unique section names from all sheets
             all_sections = set()
             for sheet in sheets_with_labels:
-                widgets_rows, widgets_headers = get_data_from_excel(
-                    excel_file_path, sheet_name=sheet["sheetName"]
+                table = get_table_from_excel(
+                    workbook_snapshot, sheet_name=sheet["sheetName"]
+                )
+                all_sections.update(
+                    section
+                    for section in table.column(sheet["namespaceHeader"])
+                    if section
                 )
-                section_index = widgets_headers.index(sheet["namespaceHeader"])
-                for row in widgets_rows[1:]:
-                    section = row[section_index].value
-                    if section:
-                        all_sections.add(section)
-
-            # Step 2: Delete all YAML files for all sections/languages ONCE before any processing
-            cls.delete_all_labels_yaml_files(
-                labels_output_folder_path,
-                ["fr", "en"],
-                all_sections,
-            )
 
-            # Step 3: Process each sheet and merge translations into the same files
+            # Step 2: Process each sheet and merge translations into the same files
+            generated_files = {}
             for sheet in sheets_with_labels:
                 cls.add_translations_from_excel(
-                    excel_file_path=excel_file_path,
+                    excel_file_path=workbook_snapshot,
                     labels_output_folder_path=labels_output_folder_path,
                     sheet_with_labels=sheet,
+                    generated_files=generated_files,
                 )
+
+            # Step 3: Write the files whose content changed
+            cls.write_generated_files(generated_files)
+
+            # Step 4: Delete the stale YAML files of the sections without translations
+            cls.delete_all_labels_yaml_files(
+                labels_output_folder_path,
+                ["fr", "en"],
+                all_sections,
+                keep_file_paths=generated_files,
+            )
         except Exception as e:
             print(f"An error occurred: {e}")
             raise e
@@ -0,0 +1,273 @@
+# Copyright 2026, Polytechnique Montreal and contributors
+# This file is licensed under the MIT License.
+# License text available at https://opensource.org/licenses/MIT
+
+# Note: This module defines ReferencesChecker: the check of the names that a sheet
+# references in another sheet (e.g. the conditional of a widget), which would
+# otherwise only fail when compiling the generated TypeScript. It is used with the
+# Conditionals checks by check_workbook_integrity, from generate_survey.py and from CLI/API checks.
+
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass
+
+from helpers.generator_helpers import (
+    ExcelSource,
+    get_workbook_snapshot,
+)
+from helpers.validation_issues import (
+    IssueStream,
+    MaxErrorsReached,
+    ValidationIssue,
+    report_issue,
+)
+from scripts.conditionals_generator import ConditionalsGenerator
+
+
+# Return a filter of the active widgets, of the input types or of any input type but the excluded ones
+def _active_widgets(
+    input_types: frozenset[str] | None = None,
+    excluded_input_types: frozenset[str] = frozenset(),
+) -> Callable[[Mapping], bool]:
+    def is_referencing_widget(row: Mapping) -> bool:
+        # Inactive widgets are generated as a comment, without their references
+        if not row.get("active", False):
+            return False
+        input_type = row.get("inputType")
+        if input_types is not None:
+            return input_type in input_types
+        return input_type not in excluded_input_types
+
+    return is_referencing_widget
+
+
+@dataclass(frozen=True)
+class _ReferenceSpec:
+    """Spec for one column referencing the names defined in a column of another sheet."""
+
+    # The sheet and column with the references.
+    sheet_name: str
+    column: str
+    # The sheet and column defining the referenced names.
+    target_sheet_name: str
+    target_column: str
+    # If not None, references ending with this suffix are defined in custom
+    # TypeScript files, not in a sheet, and are not checked. The suffix is compared
+    # with the same case sensitivity as the generator using the reference.
+    custom_suffix: str | None = None
+    custom_suffix_ignore_case: bool = False
+    # If True, spaces around the reference are ignored, like the generator using it.
+    strip: bool = False
+    # If not None, only the rows for which it returns True are generated with the reference.
+    row_filter: Callable[[Mapping], bool] | None = None
+
+
+class ReferencesChecker:
+    """Check that every name referenced in the Excel sheets is defined in its sheet."""
+
+    # Columns referencing names of another sheet, with how the generators use them.
+    REFERENCE_SPECS: tuple[_ReferenceSpec, ...] = (
+        _ReferenceSpec(
+            sheet_name="Widgets",
+            column="conditional",
+            target_sheet_name="Conditionals",
+            target_column="conditional_name",
+            custom_suffix="CustomConditional",
+            row_filter=_active_widgets(
+                excluded_input_types=frozenset({"Custom", "BuiltIn"})
+            ),
+        ),
+        _ReferenceSpec(
+            sheet_name="Widgets",
+            column="choices",
+            target_sheet_name="Choices",
+            target_column="choicesName",
+            custom_suffix="CustomChoices",
+            # generate_widgets.generate_choices ignores the case of the suffix
+            custom_suffix_ignore_case=True,
+            row_filter=_active_widgets(frozenset({"Radio", "Select", "Checkbox"})),
+        ),
+        _ReferenceSpec(
+            sheet_name="Widgets",
+            column="inputRange",
+            target_sheet_name="InputRange",
+            target_column="inputRangeName",
+            row_filter=_active_widgets(frozenset({"Range"})),
+        ),
+        _ReferenceSpec(
+            sheet_name="Choices",
+            column="spreadChoicesName",
+            target_sheet_name="Choices",
+            target_column="choicesName",
+        ),
+        _ReferenceSpec(
+            sheet_name="Choices",
+            column="conditional",
+            target_sheet_name="Conditionals",
+            target_column="conditional_name",
+            custom_suffix="CustomConditional",
+        ),
+        _ReferenceSpec(
+            sheet_name="Sections",
+            column="enable_conditional",
+            target_sheet_name="Conditionals",
+            target_column="conditional_name",
+            custom_suffix="CustomConditional",
+            strip=True,
+        ),
+        _ReferenceSpec(
+            sheet_name="Sections",
+            column="completion_conditional",
+            target_sheet_name="Conditionals",
+            target_column="conditional_name",
+            custom_suffix="CustomConditional",
+            strip=True,
+        ),
+    )
+
+    def check_with_messages(
+        self,
+        excel_source: ExcelSource,
+        on_issue: Callable[[ValidationIssue], None] | None = None,
+    ) -> tuple[bool, list[str]]:
+        """
+        Check the references of the Excel file (path or already loaded snapshot).
+
+        Returns (True, []) when every reference is defined, or (False, messages) with
+        the sheet, row and column of each undefined reference. on_issue is called with
+        each issue as soon as it is found, and stops the check early by raising
+        ``MaxErrorsReached`` (see ``IssueStream``).
+        """
+        workbook = get_workbook_snapshot(excel_source)
+        name_indexes = self._get_name_indexes(workbook)
+        messages: list[str] = []
+        try:
+            for spec in self.REFERENCE_SPECS:
+                for issue in self._get_reference_issues(
+                    workbook,
+                    spec,
+                    name_indexes[(spec.target_sheet_name, spec.target_column)],
+                ):
+                    if on_issue is not None:
+                        on_issue(issue)
+                    messages.append(issue.message)
+        except MaxErrorsReached:
+            pass
+        return len(messages) == 0, messages
+
+    def _get_name_indexes(self, workbook) -> dict[tuple[str, str], frozenset]:
+        """
+        Build the set of names defined in each referenced column, reading each column once.
+
+        A missing sheet or column defines no names, so every reference to it is reported.
+        """
+        name_indexes: dict[tuple[str, str], frozenset] = {}
+        for spec in self.REFERENCE_SPECS:
+            key = (spec.target_sheet_name, spec.target_column)
+            if key in name_indexes:
+                continue
+            table = self._get_table(workbook, spec.target_sheet_name)
+            name_indexes[key] = (
+                frozenset(table.column(spec.target_column))
+                if table is not None and table.has_column(spec.target_column)
+                else frozenset()
+            )
+        return name_indexes
+
+    def _get_reference_issues(
+        self, workbook, spec: _ReferenceSpec, defined_names: frozenset
+    ) -> Iterator[ValidationIssue]:
+        """Yield an issue for each reference of the spec column that is not a defined name, as it is found."""
+        table = self._get_table(workbook, spec.sheet_name)
+        if table is None or not table.has_column(spec.column):
+            return
+        prefix = ConditionalsGenerator._sheet_error_prefix(spec.sheet_name)
+        custom_suffix = spec.custom_suffix
+        if custom_suffix is not None and spec.custom_suffix_ignore_case:
+            custom_suffix = custom_suffix.lower()
+        for index, value in enumerate(table.column(spec.column)):
+            if isinstance(value, str) and spec.strip:
+                value = value.strip()
+            if value is None or value == "" or value in defined_names:
+                continue
+            if spec.row_filter is not None and not spec.row_filter(table[index]):
+                continue
+            if (
+                custom_suffix is not None
+                and isinstance(value, str)
+                and (
+                    value.lower() if spec.custom_suffix_ignore_case else value
+                ).endswith(custom_suffix)
+            ):
+                continue
+            # The first data row is row 2 of the Excel sheet
+            yield ValidationIssue(
+                sheet=spec.sheet_name,
+                row=index + 2,
+                column=spec.column,
+                rule="undefined_reference",
+                message=f"{prefix}Undefined reference in row {index + 2}, column {spec.column}: "
+                f"{repr(value)} is not defined in the {spec.target_column} column "
+                f"of the {spec.target_sheet_name} sheet",
+            )
+
+    @staticmethod
+    def _get_table(workbook, sheet_name: str):
+        """Return the table of the sheet, or None if the workbook has no such sheet."""
+        if sheet_name not in workbook.sheetnames:
+            return None
+        return workbook.get_table(sheet_name)
+
+
+def check_workbook_integrity(
+    excel_source: ExcelSource,
+    use_cache: bool = False,
+    on_issue: Callable[[ValidationIssue], None] | None = None,
+    max_errors: int | None = None,
+    issue_stream: IssueStream | None = None,
+) -> tuple[bool, list[str]]:
+    """
+    Check the Conditionals sheet and the references between the sheets of the Excel file.
+
+    Returns (True, []) when valid, or (False, messages) with every issue of both checks.
+    With use_cache, the Conditionals rows that did not change since the last check of
+    the file are not validated again. on_issue is called with each issue as soon as it
+    is found, and with max_errors, the checks stop after that many issues. Pass an
+    issue_stream instead of on_issue and max_errors to know, from its
+    max_errors_reached, if issues were left out.
+    """
+    if issue_stream is None:
+        issue_stream = IssueStream(on_issue, max_errors)
+    try:
+        workbook = get_workbook_snapshot(excel_source)
+    except Exception as e:
+        issue = _get_check_error_issue(
+            f"An error occurred during the Excel integrity check: {e}"
+        )
+        report_issue(issue_stream, issue)
+        return False, [issue.message]
+    conditionals_ok, messages = ConditionalsGenerator().check_with_messages(
+        workbook, use_cache=use_cache, on_issue=issue_stream
+    )
+    messages = list(messages)
+    if issue_stream.max_errors_reached:
+        return False, messages
+    try:
+        references_ok, reference_messages = ReferencesChecker().check_with_messages(
+            workbook, on_issue=issue_stream
+        )
+    except Exception as e:
+        issue = _get_check_error_issue(
+            f"An error occurred during the Excel references check: {e}"
+        )
+        report_issue(issue_stream, issue)
+        references_ok = False
+        reference_messages = [issue.message]
+    messages.extend(reference_messages)
+    return conditionals_ok and references_ok, messages
+
+
+# Get the issue of an unexpected error of a check, not related to a sheet
+def _get_check_error_issue(message: str) -> ValidationIssue:
+    return ValidationIssue(
+        sheet=None, row=None, column=None, rule="check_error", message=message
+    )
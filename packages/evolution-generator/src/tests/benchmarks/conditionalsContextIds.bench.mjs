@@ -0,0 +1,160 @@
+/*
+ * Copyright 2026, Polytechnique Montreal and contributors
+ *
+ * This file is licensed under the MIT License.
+ * License text available at https://opensource.org/licenses/MIT
+ */
+
+// Micro-benchmark of the conditionals.tsx generated with and without the
+// memoised current context ids (script_options.generate_conditionals.memoize_context_ids).
+// Each pass evaluates every conditional once for each interview, at the path of
+// a widget of a person or of a visited place, like the widgets of a section.
+// Run by src/tests/test_benchmarks.py, which generates both files, or directly
+// with Node 22.6 or later (the generated TypeScript is run with its types stripped):
+//   node --experimental-strip-types conditionalsContextIds.bench.mjs conditionals.mts memoizedConditionals.mts
+// Prints the fastest time and the calls of the current id getters of each file
+// as JSON, and fails if their results differ, also after changes made in place
+// in an interview.
+import { pathToFileURL } from 'node:url';
+import { currentIdGetterCalls } from './evolutionCommonStubs.mjs';
+
+const [plainFilePath, memoizedFilePath, interviewsCountArg = '200', repeatArg = '5'] = process.argv.slice(2);
+const interviewsCount = Number(interviewsCountArg);
+const repeat = Number(repeatArg);
+
+// Get an interview with 3 persons, each with a journey of 4 visited places and 3 trips
+const getInterview = (index) => {
+    const persons = {};
+    for (let personIndex = 0; personIndex < 3; personIndex++) {
+        const visitedPlaces = {};
+        const trips = {};
+        for (let placeIndex = 0; placeIndex < 4; placeIndex++) {
+            visitedPlaces[`place${placeIndex}`] = { _uuid: `place${placeIndex}`, activity: 'work' };
+        }
+        for (let tripIndex = 0; tripIndex < 3; tripIndex++) {
+            trips[`trip${tripIndex}`] = { _uuid: `trip${tripIndex}`, segments: { segment0: { _uuid: 'segment0' } } };
+        }
+        persons[`person${personIndex}`] = {
+            _uuid: `person${personIndex}`,
+            age: (index * 7 + personIndex * 13) % 90,
+            journeys: { journey0: { _uuid: 'journey0', visitedPlaces, trips } }
+        };
+    }
+    return {
+        response: {
+            _activePersonId: 'person0',
+            _activeJourneyId: 'journey0',
+            household: { size: 3, persons }
+        }
+    };
+};
+
+// Get the paths of the widgets of the persons and of their visited places
+const getWidgetPaths = () => {
+    const paths = [];
+    for (let personIndex = 0; personIndex < 3; personIndex++) {
+        const personPath = `household.persons.person${personIndex}`;
+        ['age', 'gender', 'occupation', 'drivingLicenseOwnership'].forEach((key) => paths.push(`${personPath}.${key}`));
+        for (let placeIndex = 0; placeIndex < 4; placeIndex++) {
+            const placePath = `${personPath}.journeys.journey0.visitedPlaces.place${placeIndex}`;
+            ['activity', 'name', 'geography'].forEach((key) => paths.push(`${placePath}.${key}`));
+        }
+    }
+    return paths;
+};
+
+// Evaluate every conditional of the module once per interview, returning the time and results
+const runPass = (conditionals, interviews, widgetPaths) => {
+    const results = [];
+    currentIdGetterCalls.count = 0;
+    const start = process.hrtime.bigint();
+    for (const interview of interviews) {
+        for (let index = 0; index < conditionals.length; index++) {
+            results.push(conditionals[index](interview, widgetPaths[index % widgetPaths.length]));
+        }
+    }
+    const milliseconds = Number(process.hrtime.bigint() - start) / 1e6;
+    return { milliseconds, results, currentIdGetterCalls: currentIdGetterCalls.count };
+};
+
+// Get the fastest pass of the module, each pass with new interview objects
+const benchmark = async (filePath, widgetPaths) => {
+    const module = await import(pathToFileURL(filePath).href);
+    const conditionals = Object.keys(module)
+        .sort()
+        .map((name) => module[name]);
+    let fastest = Infinity;
+    let lastPass;
+    // The first pass warms up the JIT and is not timed
+    for (let run = 0; run <= repeat; run++) {
+        const interviews = Array.from({ length: interviewsCount }, (_, index) => getInterview(index));
+        const pass = runPass(conditionals, interviews, widgetPaths);
+        if (run > 0) {
+            fastest = Math.min(fastest, pass.milliseconds);
+        }
+        lastPass = pass;
+    }
+    return {
+        conditionalsCount: conditionals.length,
+        milliseconds: fastest,
+        results: lastPass.results,
+        currentIdGetterCalls: lastPass.currentIdGetterCalls
+    };
+};
+
+// Evaluate every conditional of the module at every widget path after each change made in place in an interview
+const getInPlaceChangesResults = async (filePath, widgetPaths) => {
+    const module = await import(pathToFileURL(filePath).href);
+    const conditionals = Object.keys(module)
+        .sort()
+        .map((name) => module[name]);
+    const interview = getInterview(0);
+    const { response } = interview;
+    const person = response.household.persons.person1;
+    const { visitedPlaces } = person.journeys.journey0;
+    const results = [];
+    // The widgets of a removed visited place get the active one, with another activity
+    const changes = [
+        () => {
+            response._activeVisitedPlaceId = 'place1';
+            visitedPlaces.place1.activity = 'activity0';
+        },
+        () => delete visitedPlaces.place0,
+        () => (visitedPlaces.place0 = { _uuid: 'place0', activity: 'activity1' }),
+        () => delete response.household.persons.person1,
+        () => (response.household.persons.person1 = person)
+    ];
+    for (const change of changes) {
+        change();
+        conditionals.forEach((conditional) =>
+            widgetPaths.forEach((widgetPath) => results.push(conditional(interview, widgetPath)))
+        );
+    }
+    return results;
+};
+
+const widgetPaths = getWidgetPaths();
+const plain = await benchmark(plainFilePath, widgetPaths);
+const memoized = await benchmark(memoizedFilePath, widgetPaths);
+if (JSON.stringify(plain.results) !== JSON.stringify(memoized.results)) {
+    console.error('The memoized conditionals do not return the same results');
+    process.exit(1);
+}
+const plainInPlaceResults = await getInPlaceChangesResults(plainFilePath, widgetPaths);
+const memoizedInPlaceResults = await getInPlaceChangesResults(memoizedFilePath, widgetPaths);
+if (JSON.stringify(plainInPlaceResults) !== JSON.stringify(memoizedInPlaceResults)) {
+    console.error('The memoized conditionals do not follow the changes made in place in the interview');
+    process.exit(1);
+}
+console.log(
+    JSON.stringify({
+        conditionalsCount: plain.conditionalsCount,
+        interviewsCount,
+        widgetPathsCount: widgetPaths.length,
+        plainMilliseconds: plain.milliseconds,
+        memoizedMilliseconds: memoized.milliseconds,
+        plainCurrentIdGetterCalls: plain.currentIdGetterCalls,
+        memoizedCurrentIdGetterCalls: memoized.currentIdGetterCalls,
+        speedup: plain.milliseconds / memoized.milliseconds
+    })
+);
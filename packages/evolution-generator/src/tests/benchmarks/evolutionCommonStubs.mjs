@@ -0,0 +1,103 @@
+/*
+ * Copyright 2026, Polytechnique Montreal and contributors
+ *
+ * This file is licensed under the MIT License.
+ * License text available at https://opensource.org/licenses/MIT
+ */
+
+// Stand-ins of the evolution-common functions imported by the generated
+// conditionals.tsx, so the benchmark runs without building evolution-common.
+// The current id getters find the ids in the path like odSurvey/helpers.ts,
+// and count their calls in currentIdGetterCalls.
+
+export const currentIdGetterCalls = { count: 0 };
+
+const getResponse = (interview, path) =>
+    path.split('.').reduce((value, key) => (value === undefined || value === null ? undefined : value[key]), interview.response);
+
+const compare = (value, comparisonOperator, expected) => {
+    switch (comparisonOperator) {
+    case '===':
+        return Array.isArray(value) ? value.includes(expected) : value === expected;
+    case '!==':
+        return Array.isArray(value) ? !value.includes(expected) : value !== expected;
+    case '>':
+        return value > expected;
+    case '>=':
+        return value >= expected;
+    case '<':
+        return value < expected;
+    case '<=':
+        return value <= expected;
+    default:
+        return false;
+    }
+};
+
+// Evaluate the conditionals from left to right, the parentheses and precedence do not change the cost
+export const checkConditionals = ({ interview, valueWhenHidden, conditionals }) => {
+    let result = true;
+    conditionals.forEach(({ logicalOperator, path, comparisonOperator, value }) => {
+        const conditionalResult = compare(getResponse(interview, path), comparisonOperator, value);
+        result = logicalOperator === '||' ? result || conditionalResult : result && conditionalResult;
+    });
+    return valueWhenHidden === undefined ? result : [result, valueWhenHidden];
+};
+
+export const getCurrentPersonId = ({ interview, path }) => {
+    currentIdGetterCalls.count++;
+    if (path) {
+        const match = path.match(/household\.persons\.([^.]+)\./);
+        if (match) {
+            return match[1];
+        }
+    }
+    return interview.response._activePersonId ?? null;
+};
+
+export const getCurrentJourneyId = ({ interview, path }) => {
+    currentIdGetterCalls.count++;
+    const match = path && path.match(/household\.persons\.([^.]+)\.journeys\.([^.]+)(?:\.|$)/);
+    if (match && getResponse(interview, `household.persons.${match[1]}.journeys.${match[2]}`)) {
+        return match[2];
+    }
+    return interview.response._activeJourneyId ?? null;
+};
+
+export const getCurrentTripId = ({ interview, path }) => {
+    currentIdGetterCalls.count++;
+    const match = path && path.match(/household\.persons\.([^.]+)\.journeys\.([^.]+)\.trips\.([^.]+)(?:\.|$)/);
+    if (match && getResponse(interview, `household.persons.${match[1]}.journeys.${match[2]}.trips.${match[3]}`)) {
+        return match[3];
+    }
+    return interview.response._activeTripId ?? null;
+};
+
+export const getCurrentSegmentId = ({ interview, path }) => {
+    currentIdGetterCalls.count++;
+    const match =
+        path &&
+        path.match(/household\.persons\.([^.]+)\.journeys\.([^.]+)\.trips\.([^.]+)\.segments\.([^.]+)(?:\.|$)/);
+    if (
+        match &&
+        getResponse(
+            interview,
+            `household.persons.${match[1]}.journeys.${match[2]}.trips.${match[3]}.segments.${match[4]}`
+        )
+    ) {
+        return match[4];
+    }
+    return null;
+};
+
+export const getCurrentVisitedPlaceId = ({ interview, path }) => {
+    currentIdGetterCalls.count++;
+    const match = path && path.match(/household\.persons\.([^.]+)\.journeys\.([^.]+)\.visitedPlaces\.([^.]+)(?:\.|$)/);
+    if (
+        match &&
+        getResponse(interview, `household.persons.${match[1]}.journeys.${match[2]}.visitedPlaces.${match[3]}`)
+    ) {
+        return match[3];
+    }
+    return interview.response._activeVisitedPlaceId ?? null;
+};
@@ -0,0 +1,232 @@
+# Copyright 2026, Polytechnique Montreal and contributors
+# This file is licensed under the MIT License.
+# License text available at https://opensource.org/licenses/MIT
+
+# The benchmark of the generation steps only runs with GENERATOR_BENCHMARK=1:
+#   GENERATOR_BENCHMARK=1 pytest src/tests/test_benchmarks.py
+# Optional environment variables:
+#   GENERATOR_BENCHMARK_SCALE: tiny, small (default) or large synthetic workbook
+#   GENERATOR_BENCHMARK_REPEAT: runs per step, the fastest one is kept (default 3)
+#   GENERATOR_BENCHMARK_THRESHOLD: allowed slowdown of a step (default 0.25, 25%)
+#   GENERATOR_BENCHMARK_BASELINES: baselines file (default benchmarks/benchmark_baselines.json)
+#   GENERATOR_BENCHMARK_UPDATE=1: save the times as the new baselines
+# The test fails when the baselines file has no times for the scale, it only
+# writes them with GENERATOR_BENCHMARK_UPDATE=1.
+# The benchmark of the generated conditionals also needs Node 22.6 or later.
+import json
+import os
+import shutil
+import subprocess
+import pytest
+from helpers.benchmark_baselines import (
+    get_benchmark_regressions,
+    read_benchmark_baselines,
+    write_benchmark_baselines,
+)
+from helpers.step_profiler import StepProfiler
+from helpers.synthetic_workbook import (
+    SYNTHETIC_WORKBOOK_SCALES,
+    get_synthetic_sheets_rows,
+    save_synthetic_workbook,
+)
+from helpers.generator_helpers import SheetTable
+from scripts.conditionals_generator import ConditionalsGenerator
+from scripts.generate_survey import SUPPORTED_SCRIPT_KEYS, generate_survey_from_excel
+
+NODE_BENCHMARKS_FOLDER_PATH = os.path.join(os.path.dirname(__file__), "benchmarks")
+# Reference times of the generation steps, committed with the benchmarks
+DEFAULT_BASELINES_FILE_PATH = os.path.join(
+    NODE_BENCHMARKS_FOLDER_PATH, "benchmark_baselines.json"
+)
+
+
+# Get the version of Node as a tuple of ints, or None if Node is not installed
+def _get_node_version() -> tuple[int, ...] | None:
+    node_path = shutil.which("node")
+    if node_path is None:
+        return None
+    version = subprocess.run(
+        [node_path, "--version"], capture_output=True, text=True, check=True
+    ).stdout
+    return tuple(int(part) for part in version.strip().lstrip("v").split("."))
+
+
+# Get the generated conditionals.tsx importing the stubs of evolution-common, to run in Node
+def _get_benchmark_conditionals_code(
+    conditional_by_name: dict, memoize_context_ids: bool
+) -> str:
+    ts_code = ConditionalsGenerator.generate_typescript_code(
+        conditional_by_name, memoize_context_ids=memoize_context_ids
+    )
+    for module_path in (
+        "evolution-common/lib/services/widgets/conditionals/checkConditionals",
+        "evolution-common/lib/services/questionnaire/types",
+        "evolution-common/lib/services/odSurvey/helpers",
+    ):
+        ts_code = ts_code.replace(f"'{module_path}'", "'./evolutionCommonStubs.mjs'")
+    return ts_code
+
+
+class TestGetBenchmarkRegressions:
+    def test_reports_the_steps_slower_than_the_threshold(self):
+        regressions = get_benchmark_regressions(
+            {"generate_widgets": 2.0, "generate_labels": 1.2, "generate_choices": 0.1},
+            {"generate_widgets": 1.0, "generate_labels": 1.0},
+            threshold=0.25,
+        )
+
+        assert len(regressions) == 1
+        assert regressions[0].startswith("generate_widgets: 2.000s, baseline 1.000s")
+
+    def test_allows_a_slack_for_the_fastest_steps(self):
+        assert (
+            get_benchmark_regressions(
+                {"load_workbook": 0.03}, {"load_workbook": 0.01}, threshold=0.25
+            )
+            == []
+        )
+        assert get_benchmark_regressions(
+            {"load_workbook": 0.03},
+            {"load_workbook": 0.01},
+            threshold=0.25,
+            slack_seconds=0,
+        )
+
+
+class TestBenchmarkBaselines:
+    def test_writes_and_reads_the_baselines(self, tmp_path):
+        baselines_file_path = str(tmp_path / "benchmarks" / "baselines.json")
+        assert read_benchmark_baselines(baselines_file_path) == {}
+
+        write_benchmark_baselines(
+            baselines_file_path, {"small": {"generate_widgets": 1.5}}
+        )
+
+        assert read_benchmark_baselines(baselines_file_path) == {
+            "small": {"generate_widgets": 1.5}
+        }
+
+
+@pytest.mark.skipif(
+    not os.getenv("GENERATOR_BENCHMARK"),
+    reason="Set GENERATOR_BENCHMARK=1 to run the benchmark of the generation steps",
+)
+def test_generation_steps_do_not_regress(tmp_path):
+    scale_name = os.getenv("GENERATOR_BENCHMARK_SCALE", "small")
+    repeat = int(os.getenv("GENERATOR_BENCHMARK_REPEAT", "3"))
+    threshold = float(os.getenv("GENERATOR_BENCHMARK_THRESHOLD", "0.25"))
+    baselines_file_path = os.getenv(
+        "GENERATOR_BENCHMARK_BASELINES", DEFAULT_BASELINES_FILE_PATH
+    )
+
+    excel_file_path = str(tmp_path / "survey.xlsx")
+    save_synthetic_workbook(
+        excel_file_path,
+        get_synthetic_sheets_rows(SYNTHETIC_WORKBOOK_SCALES[scale_name]),
+    )
+    enabled_scripts = {
+        script_key: script_key != "generate_excel"
+        for script_key in SUPPORTED_SCRIPT_KEYS
+    }
+
+    # Keep the fastest time of each step, every run generating a new survey folder
+    step_times: dict[str, float] = {}
+    for run_index in range(repeat):
+        profiler = StepProfiler(trace_memory=False)
+        generate_survey_from_excel(
+            str(tmp_path / f"survey{run_index}"),
+            excel_file_path,
+            enabled_scripts,
+            use_cache=False,
+            profiler=profiler,
+        )
+        for step_profile in profiler.profiles:
+            step_times[step_profile.name] = min(
+                step_times.get(step_profile.name, step_profile.wall_time),
+                step_profile.wall_time,
+            )
+
+    baselines = read_benchmark_baselines(baselines_file_path)
+    if os.getenv("GENERATOR_BENCHMARK_UPDATE"):
+        baselines[scale_name] = step_times
+        write_benchmark_baselines(baselines_file_path, baselines)
+        return
+    step_baselines = baselines.get(scale_name)
+    if not step_baselines:
+        pytest.fail(
+            f"No {scale_name} baselines in {baselines_file_path}, "
+            "run the benchmark with GENERATOR_BENCHMARK_UPDATE=1 to save them"
+        )
+
+    regressions = get_benchmark_regressions(step_times, step_baselines, threshold)
+    assert not regressions, (
+        f"Steps slower than their {scale_name} baseline in {baselines_file_path}:\n"
+        + "\n".join(regressions)
+    )
+
+
+@pytest.mark.skipif(
+    not os.getenv("GENERATOR_BENCHMARK"),
+    reason="Set GENERATOR_BENCHMARK=1 to run the benchmark of the generated conditionals",
+)
+def test_memoized_context_ids_call_the_getters_less_under_node(tmp_path):
+    node_version = _get_node_version()
+    if node_version is None or node_version < (22, 6):
+        pytest.skip("Node 22.6 or later is needed to run the generated TypeScript")
+    scale_name = os.getenv("GENERATOR_BENCHMARK_SCALE", "small")
+    repeat = os.getenv("GENERATOR_BENCHMARK_REPEAT", "3")
+
+    conditionals_rows = get_synthetic_sheets_rows(
+        SYNTHETIC_WORKBOOK_SCALES[scale_name]
+    )["Conditionals"]
+    conditional_by_name = ConditionalsGenerator.extract_conditionals_from_data(
+        SheetTable.from_rows(conditionals_rows, "Conditionals")
+    )
+    # The synthetic conditionals only use the current person, add visited places ones
+    for index in range(len(conditional_by_name) // 4):
+        conditional_by_name[f"visitedPlace{index}Conditional"] = [
+            {
+                "logical_operator": None,
+                "path": "${currentVisitedPlace}.activity",
+                "comparison_operator": "===",
+                "value": f"activity{index}",
+                "parentheses": None,
+            }
+        ]
+    for file_name in ("evolutionCommonStubs.mjs", "conditionalsContextIds.bench.mjs"):
+        shutil.copy(os.path.join(NODE_BENCHMARKS_FOLDER_PATH, file_name), tmp_path)
+    for file_name, memoize_context_ids in (
+        ("conditionals.mts", False),
+        ("memoizedConditionals.mts", True),
+    ):
+        (tmp_path / file_name).write_text(
+            _get_benchmark_conditionals_code(conditional_by_name, memoize_context_ids)
+        )
+
+    completed = subprocess.run(
+        [
+            "node",
+            "--experimental-strip-types",
+            "--no-warnings",
+            "conditionalsContextIds.bench.mjs",
+            "conditionals.mts",
+            "memoizedConditionals.mts",
+            "200",
+            repeat,
+        ],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+    )
+
+    assert completed.returncode == 0, completed.stderr
+    result = json.loads(completed.stdout)
+    print(
+        f"{result['conditionalsCount']} conditionals for {result['interviewsCount']} interviews: "
+        f"{result['plainMilliseconds']:.1f} ms and {result['plainCurrentIdGetterCalls']} id getter calls, "
+        f"memoized {result['memoizedMilliseconds']:.1f} ms and {result['memoizedCurrentIdGetterCalls']} calls"
+    )
+    # The times are only printed, the stubs of the getters being much faster than odSurveyHelpers
+    assert (
+        result["memoizedCurrentIdGetterCalls"] * 4 < result["plainCurrentIdGetterCalls"]
+    )
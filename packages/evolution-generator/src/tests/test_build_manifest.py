@@ -0,0 +1,104 @@
+# Copyright 2026, Polytechnique Montreal and contributors
+# This file is licensed under the MIT License.
+# License text available at https://opensource.org/licenses/MIT
+
+import json
+import os
+from helpers.build_manifest import MANIFEST_FILE_NAME, BuildManifest
+from helpers.generator_helpers import WorkbookSnapshot
+from helpers.step_scheduler import GeneratorStep, run_steps
+
+SHEETS_ROWS = {
+    "Sections": [("section",), ("home",)],
+    "Choices": [("choicesName", "value"), ("yesNo", "yes")],
+}
+
+
+# Step function writing the values of a sheet to a file
+def write_sheet(workbook_snapshot, sheet_name, output_file_path, jobs=1):
+    with open(output_file_path, "w", encoding="utf-8") as file:
+        file.write(repr(workbook_snapshot.get_rows(sheet_name)))
+
+
+def make_steps(survey_folder_path, run_kwargs=None):
+    return [
+        GeneratorStep(
+            name=f"write_{sheet_name}",
+            function=write_sheet,
+            args=(sheet_name, os.path.join(survey_folder_path, f"{sheet_name}.txt")),
+            run_kwargs=run_kwargs or {},
+            reads=(sheet_name,),
+            writes=(os.path.join(survey_folder_path, f"{sheet_name}.txt"),),
+        )
+        for sheet_name in SHEETS_ROWS
+    ]
+
+
+# Run the steps as generate_survey does, returning the names of the skipped steps
+def run_with_manifest(
+    survey_folder_path, sheets_rows=SHEETS_ROWS, force=False, run_kwargs=None
+):
+    snapshot = WorkbookSnapshot("survey.xlsx", sheets_rows)
+    steps = make_steps(survey_folder_path, run_kwargs)
+    manifest = BuildManifest(survey_folder_path, snapshot, force=force)
+    run_steps(steps, snapshot, skip_step=manifest.is_step_up_to_date)
+    manifest.save(steps)
+    return manifest.skipped_steps
+
+
+class TestBuildManifest:
+    def test_first_run_runs_every_step_and_saves_the_manifest(self, tmp_path):
+        assert run_with_manifest(str(tmp_path)) == []
+
+        with open(tmp_path / MANIFEST_FILE_NAME, encoding="utf-8") as file:
+            manifest = json.load(file)
+        assert sorted(manifest["steps"]) == ["write_Choices", "write_Sections"]
+        assert list(manifest["steps"]["write_Sections"]["outputs"]) == ["Sections.txt"]
+
+    def test_unchanged_steps_are_skipped(self, tmp_path):
+        run_with_manifest(str(tmp_path))
+        assert run_with_manifest(str(tmp_path)) == ["write_Sections", "write_Choices"]
+
+    def test_step_reading_a_changed_sheet_runs_again(self, tmp_path):
+        run_with_manifest(str(tmp_path))
+        sheets_rows = {**SHEETS_ROWS, "Choices": [("choicesName",), ("other",)]}
+
+        assert run_with_manifest(str(tmp_path), sheets_rows) == ["write_Sections"]
+        assert (tmp_path / "Choices.txt").read_text() == repr(sheets_rows["Choices"])
+
+    def test_step_with_a_changed_or_missing_output_runs_again(self, tmp_path):
+        run_with_manifest(str(tmp_path))
+        (tmp_path / "Sections.txt").write_text("edited by hand")
+        os.remove(tmp_path / "Choices.txt")
+
+        assert run_with_manifest(str(tmp_path)) == []
+        assert (tmp_path / "Sections.txt").read_text() == repr(SHEETS_ROWS["Sections"])
+
+    def test_run_kwargs_are_not_inputs_of_the_steps(self, tmp_path):
+        run_with_manifest(str(tmp_path))
+        assert run_with_manifest(str(tmp_path), run_kwargs={"jobs": 4}) == [
+            "write_Sections",
+            "write_Choices",
+        ]
+
+    def test_force_runs_every_step(self, tmp_path):
+        run_with_manifest(str(tmp_path))
+        assert run_with_manifest(str(tmp_path), force=True) == []
+
+    def test_unreadable_manifest_is_ignored(self, tmp_path):
+        run_with_manifest(str(tmp_path))
+        (tmp_path / MANIFEST_FILE_NAME).write_text("{not json")
+
+        assert run_with_manifest(str(tmp_path)) == []
+        assert run_with_manifest(str(tmp_path)) == ["write_Sections", "write_Choices"]
+
+    def test_failed_run_forgets_the_steps_that_ran(self, tmp_path):
+        run_with_manifest(str(tmp_path))
+        snapshot = WorkbookSnapshot("survey.xlsx", SHEETS_ROWS)
+        steps = make_steps(str(tmp_path))
+        (tmp_path / "Choices.txt").write_text("edited by hand")
+        manifest = BuildManifest(str(tmp_path), snapshot)
+        run_steps(steps, snapshot, skip_step=manifest.is_step_up_to_date)
+        manifest.save(steps, succeeded=False)
+
+        assert run_with_manifest(str(tmp_path)) == ["write_Sections"]
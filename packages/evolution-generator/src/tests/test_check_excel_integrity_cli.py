@@ -0,0 +1,86 @@
+# Copyright 2026, Polytechnique Montreal and contributors
+# This file is licensed under the MIT License.
+# License text available at https://opensource.org/licenses/MIT
+
+# Note: This file contains the tests of the Excel integrity check CLI.
+import json
+from helpers.synthetic_workbook import (
+    SYNTHETIC_WORKBOOK_SCALES,
+    get_synthetic_sheets_rows,
+    save_synthetic_workbook,
+)
+from scripts.check_excel_integrity_cli import main
+
+
+# Save a synthetic workbook with an invalid logical operator on every Conditionals row
+def save_invalid_workbook(tmp_path) -> str:
+    sheets_rows = get_synthetic_sheets_rows(SYNTHETIC_WORKBOOK_SCALES["tiny"])
+    headers, *rows = sheets_rows["Conditionals"]
+    sheets_rows["Conditionals"] = [headers] + [
+        (row[0], "xor") + row[2:] for row in rows
+    ]
+    excel_file_path = str(tmp_path / "invalid.xlsx")
+    save_synthetic_workbook(excel_file_path, sheets_rows)
+    return excel_file_path
+
+
+# Run the CLI and return its exit code and its JSON output lines
+def run_cli(capsys, args: list[str]) -> tuple[int, list[dict]]:
+    exit_code = main(args)
+    lines = capsys.readouterr().out.splitlines()
+    return exit_code, [json.loads(line) for line in lines]
+
+
+class TestCheckExcelIntegrityCli:
+    def test_prints_every_issue_in_one_json_object(self, tmp_path, capsys):
+        exit_code, [payload] = run_cli(capsys, [save_invalid_workbook(tmp_path)])
+
+        assert exit_code == 0
+        assert payload["integrityOk"] is False
+        assert payload["maxErrorsReached"] is False
+        assert payload["errorsCount"] == len(payload["errors"]) > 1
+        assert [issue["message"] for issue in payload["issues"]] == payload["errors"]
+
+    def test_streams_json_lines_until_the_max_errors(self, tmp_path, capsys):
+        excel_file_path = save_invalid_workbook(tmp_path)
+
+        exit_code, lines = run_cli(
+            capsys, [excel_file_path, "--jsonl", "--max-errors", "3"]
+        )
+
+        assert exit_code == 0
+        *issue_lines, summary = lines
+        assert [line["issue"]["row"] for line in issue_lines] == [2, 3, 4]
+        assert {line["issue"]["rule"] for line in issue_lines} == {"column_value"}
+        assert summary == {
+            "ok": True,
+            "integrityOk": False,
+            "excelFilePath": excel_file_path,
+            "errorsCount": 3,
+            "maxErrorsReached": True,
+        }
+
+    def test_exactly_the_max_errors_is_not_reported_as_reached(self, tmp_path, capsys):
+        excel_file_path = save_invalid_workbook(tmp_path)
+        _exit_code, [payload] = run_cli(capsys, [excel_file_path])
+        errors_count = payload["errorsCount"]
+
+        exit_code, [payload] = run_cli(
+            capsys, [excel_file_path, "--max-errors", str(errors_count)]
+        )
+
+        assert exit_code == 0
+        assert payload["errorsCount"] == errors_count
+        assert payload["maxErrorsReached"] is False
+
+        _exit_code, [payload] = run_cli(
+            capsys, [excel_file_path, "--max-errors", str(errors_count - 1)]
+        )
+        assert payload["errorsCount"] == errors_count - 1
+        assert payload["maxErrorsReached"] is True
+
+    def test_reports_the_missing_excel_file_path(self, capsys):
+        assert run_cli(capsys, []) == (
+            2,
+            [{"ok": False, "error": "Missing excel file path argument"}],
+        )
@@ -0,0 +1,279 @@
+# Copyright 2026, Polytechnique Montreal and contributors
+# This file is licensed under the MIT License.
+# License text available at https://opensource.org/licenses/MIT
+
+# Note: This file contains the tests of the conditionals evaluator, with the cases of
+# the checkConditionals tests of evolution-common.
+import json
+import pytest
+from scripts.conditionals_evaluator import ConditionalsEvaluator, main
+
+INTERVIEW = {
+    "response": {
+        "_activePersonId": "personA",
+        "_activeJourneyId": "journeyA",
+        "_isNull": None,
+        "_isArray": ["a", "b", "c"],
+        "_isEmptyArray": [],
+        "_isString": "a",
+        "_isNumericString": "0.5",
+        "_isEmptyString": "",
+        "_isTrueBoolean": True,
+        "_isFalseBoolean": False,
+        "_isNumber1": 1,
+        "household": {
+            "size": 1,
+            "persons": {
+                "personA": {
+                    "age": 33,
+                    "journeys": {
+                        "journeyA": {
+                            "_uuid": "journeyA",
+                            "visitedPlaces": {"placeA": {"_uuid": "placeA"}},
+                        }
+                    },
+                },
+                "personB": {"age": 12},
+            },
+        },
+    }
+}
+
+
+# Get a row of the Conditionals sheet, as extracted by ConditionalsGenerator
+def row(path, comparison_operator, value, logical_operator=None, parentheses=None):
+    return {
+        "logical_operator": logical_operator,
+        "path": path,
+        "comparison_operator": comparison_operator,
+        "value": value,
+        "parentheses": parentheses,
+    }
+
+
+# Evaluate the rows of one conditional for the interview
+def evaluate(rows: list[dict], path: str | None = None, interview=INTERVIEW):
+    evaluator = ConditionalsEvaluator({"cond": rows})
+    assert evaluator.errors == {}
+    return evaluator.evaluate(interview, path)["cond"]
+
+
+class TestConditionalsEvaluator:
+    @pytest.mark.parametrize(
+        "rows, expected",
+        [
+            ([row("wrongPath", "===", None)], True),
+            ([row("wrongPath", "===", "something")], False),
+            ([row("_isString", "===", "a")], True),
+            ([row("_isString", "!==", "a")], False),
+            ([row("_isNull", "!==", "null")], False),
+            ([row("_isNull", "===", "null")], True),
+            ([row("_isArray", "!==", None)], True),
+            ([row("_isEmptyArray", "===", None)], True),
+            ([row("_isArray", "===", None)], False),
+            ([row("_isNull", ">=", None)], False),
+            ([row("_isArray", "===", "a")], True),
+            ([row("_isArray", "!==", "d")], True),
+            ([row("_isArray", ">", "a")], False),
+            ([row("_isTrueBoolean", "===", True)], True),
+            ([row("_isTrueBoolean", ">", True)], False),
+            ([row("_isFalseBoolean", "!==", False)], False),
+            ([row("_isNumber1", "===", True)], False),
+            ([row("_isNumber1", "===", 1)], True),
+            ([row("_isNumber1", "!==", 2)], True),
+            ([row("_isNumber1", ">", 1)], False),
+            ([row("_isNumber1", ">=", 1)], True),
+            ([row("_isNumber1", "<=", 0)], False),
+            ([row("_isNumericString", "<=", 2)], True),
+            ([row("_isNumericString", "===", 0.5)], True),
+            ([row("_isEmptyString", "===", 0)], False),
+            ([row("_isEmptyString", "<", 0)], False),
+            ([row("_isString", "===", 0)], False),
+            ([row("_isString", "!==", 0)], True),
+            ([row("_isTrueBoolean", "!==", 0)], False),
+        ],
+    )
+    def test_compares_like_checkConditionals(self, rows, expected):
+        assert evaluate(rows) == (expected, None)
+
+    @pytest.mark.parametrize(
+        "rows, expected",
+        [
+            (
+                [
+                    row("_isNumber1", "===", 1),
+                    row("_isNumber1", "===", 0, logical_operator="&&"),
+                ],
+                False,
+            ),
+            (
+                [
+                    row("_isNumber1", "===", 1),
+                    row("_isNumber1", "===", 0, logical_operator="||"),
+                ],
+                True,
+            ),
+            (
+                [
+                    row("_isNumber1", "===", 1),
+                    row("_isNumber1", "===", 0, "&&", "("),
+                    row("_isNumber1", "===", 1, "||", ")"),
+                ],
+                True,
+            ),
+            (
+                # && before ||: true || (false && ...)
+                [
+                    row("_isNumber1", "===", 1),
+                    row("_isNumber1", "===", 0, "||"),
+                    row("_isNumber1", "===", 0, "&&"),
+                ],
+                True,
+            ),
+            (
+                [
+                    row("_isNumber1", "===", 1, parentheses="("),
+                    row("_isNumber1", "===", 0, "||", ")"),
+                    row("_isNumber1", "===", 0, "&&"),
+                ],
+                False,
+            ),
+        ],
+    )
+    def test_combines_the_rows_with_the_logical_operators(self, rows, expected):
+        assert evaluate(rows) == (expected, None)
+
+    def test_returns_the_value_when_hidden(self):
+        rows = [row("_isString", "===", "notTheResponseValue")]
+        rows[0]["value_when_hidden"] = "false"
+
+        assert evaluate(rows) == (False, False)
+
+    @pytest.mark.parametrize(
+        "path, widget_path, expected",
+        [
+            ("household.persons.{_activePersonId}.age", None, True),
+            ("household.persons.{wrongField}.age", None, False),
+            ("${currentPerson}.age", None, True),
+            ("${currentPerson}.age", "household.persons.personB.age", False),
+            ("${relativePath}.age", "household.persons.personA.gender", True),
+            (
+                "${currentVisitedPlace}._uuid",
+                "household.persons.personA.journeys.journeyA.visitedPlaces.placeA.name",
+                True,
+            ),
+        ],
+    )
+    def test_expands_the_paths_like_the_generated_code(
+        self, path, widget_path, expected
+    ):
+        value = "placeA" if path.endswith("_uuid") else 33
+
+        assert evaluate([row(path, "===", value)], widget_path) == (expected, None)
+
+    def test_lists_the_conditionals_that_checkConditionals_rejects(self):
+        evaluator = ConditionalsEvaluator(
+            {
+                "missingOperator": [
+                    row("_isNumber1", "===", 1),
+                    row("_isNumber1", "===", 0),
+                ],
+                "unclosed": [
+                    row("_isNumber1", "===", 1, parentheses="("),
+                ],
+                "valid": [row("_isNumber1", "===", 1)],
+            }
+        )
+
+        assert evaluator.errors == {
+            "missingOperator": "Missing logicalOperator for non-first conditional (index=1)",
+            "unclosed": "Unbalanced parentheses (missing closing parenthesis) in conditionals (balance=1)",
+        }
+        assert evaluator.evaluate(INTERVIEW) == {"valid": (True, None)}
+
+    def test_evaluates_a_batch_like_each_interview(self):
+        evaluator = ConditionalsEvaluator(
+            {
+                "isAdult": [row("${currentPerson}.age", ">=", 18)],
+                "hasArray": [row("_isArray", "===", "b")],
+                "isHalf": [
+                    row("_isNumericString", "===", 0.5),
+                    row("_isNull", "!==", None, "&&"),
+                ],
+            }
+        )
+        interviews = [
+            INTERVIEW,
+            {"response": {**INTERVIEW["response"], "_activePersonId": "personB"}},
+            {"response": {"_isArray": "b", "_isNumericString": ".5", "_isNull": 1}},
+            {"response": None},
+        ]
+
+        results = evaluator.evaluate_batch(interviews)
+
+        for index, interview in enumerate(interviews):
+            assert {name: bool(result[index]) for name, result in results.items()} == {
+                name: result
+                for name, (result, _value_when_hidden) in evaluator.evaluate(
+                    interview
+                ).items()
+            }
+        assert results == {
+            "isAdult": bytes([1, 0, 0, 0]),
+            "hasArray": bytes([1, 1, 1, 0]),
+            "isHalf": bytes([0, 0, 1, 0]),
+        }
+
+
+class TestConditionalsEvaluatorCli:
+    def test_counts_the_true_conditionals_of_the_interviews(
+        self, tmp_path, capsys, monkeypatch
+    ):
+        interviews_path = tmp_path / "interviews.jsonl"
+        interviews_path.write_text(
+            "\n".join(
+                json.dumps(interview)
+                for interview in (
+                    {"uuid": "a", "response": {"household": {"size": 1}}},
+                    {"uuid": "b", "response": {"household": {"size": 3}}},
+                    {"household": {"size": 5}},
+                )
+            )
+        )
+        output_path = tmp_path / "results.jsonl"
+        monkeypatch.setattr(
+            ConditionalsEvaluator,
+            "from_excel",
+            classmethod(
+                lambda cls, input_file: cls(
+                    {
+                        "isAlone": [row("household.size", "===", 1)],
+                        "isLarge": [row("household.size", ">", 2)],
+                    }
+                )
+            ),
+        )
+
+        exit_code = main(
+            [
+                "survey.xlsx",
+                str(interviews_path),
+                "--output",
+                str(output_path),
+                "--chunk-size",
+                "2",
+            ]
+        )
+
+        assert exit_code == 0
+        assert json.loads(capsys.readouterr().out) == {
+            "interviewsCount": 3,
+            "trueCounts": {"isAlone": 1, "isLarge": 2},
+            "errors": {},
+            "needWidgetPath": [],
+        }
+        assert [json.loads(line) for line in output_path.read_text().splitlines()] == [
+            {"uuid": "a", "trueConditionals": ["isAlone"]},
+            {"uuid": "b", "trueConditionals": ["isLarge"]},
+            {"uuid": None, "trueConditionals": ["isLarge"]},
+        ]
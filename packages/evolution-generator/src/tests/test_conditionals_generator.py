@@ -8,9 +8,21 @@ import datetime
 from collections import defaultdict
 import pytest  # pyright: ignore[reportMissingImports]
 
-from scripts.conditionals_generator import ConditionalsGenerator
+from scripts import conditionals_generator
+from scripts.conditionals_generator import (
+    ConditionalsGenerator,
+    _ConditionalRule,
+    _PathExpansion,
+    _get_path_token_expander,
+)
 from scripts.generate_survey import check_excel_integrity
-from helpers.generator_helpers import create_mocked_excel_data, delete_file_if_exists
+from helpers.validation_issues import ValidationIssue
+from helpers.generator_helpers import (
+    WorkbookSnapshot,
+    create_mocked_excel_data,
+    delete_file_if_exists,
+    get_workbook_snapshot,
+)
 
 # TODO: Add tests for the remaining ConditionalsGenerator class methods:
 # - ConditionalsGenerator.extract_conditionals_from_data (grouping logic for raw rows/headers).
@@ -328,6 +340,198 @@ class TestGenerateTypescriptCode:
         assert case["expected_helper_line"] in ts_code
         assert case["expected_path_snippet"] in ts_code
 
+    def test_shares_the_memoized_context_ids_between_conditionals(self):
+        conditional_by_name = {
+            name: [
+                {
+                    "logical_operator": "",
+                    "path": path,
+                    "comparison_operator": "===",
+                    "value": "test",
+                    "parentheses": "",
+                }
+            ]
+            for name, path in (
+                ("isAdultConditional", "${currentPerson}.age"),
+                ("isWorkConditional", "${currentVisitedPlace}.activity"),
+                ("hasCarConditional", "household.carNumber"),
+            )
+        }
+
+        ts_code = ConditionalsGenerator.generate_typescript_code(
+            conditional_by_name, memoize_context_ids=True
+        )
+
+        assert (
+            "import { type UserInterviewAttributes, type WidgetConditional } from "
+            in ts_code
+        )
+        assert ts_code.count("const getCurrentContextId = (") == 1
+        assert (
+            ts_code.count(
+                "const currentPersonId = getCurrentContextId(odSurveyHelpers.getCurrentPersonId, interview, path);"
+            )
+            == 2
+        )
+        assert (
+            "const currentVisitedPlaceId = getCurrentContextId(odSurveyHelpers.getCurrentVisitedPlaceId, interview, path);"
+            in ts_code
+        )
+        assert "odSurveyHelpers.getCurrentPersonId({ interview, path })" not in ts_code
+        assert "`household.persons.${currentPersonId}.age`" in ts_code
+
+    def test_resolves_the_memoized_ids_again_when_an_object_of_the_path_changes(
+        self,
+    ):
+        """The objects of the path are compared on each call, so changes in place are seen."""
+        resolver_code = ConditionalsGenerator._get_context_ids_resolver_code()
+
+        assert "if (!hasSamePathObjects(response, pathIds)) {" in resolver_code
+        assert (
+            "pathIds.objects = getPathObjects(response, pathIds.keys);" in resolver_code
+        )
+        assert "pathIds.idsByGetter.clear();" in resolver_code
+
+    def test_does_not_emit_the_context_ids_resolver_without_current_context_paths(
+        self,
+    ):
+        conditional_by_name = {
+            "hasCarConditional": [
+                {
+                    "logical_operator": "",
+                    "path": "household.carNumber",
+                    "comparison_operator": ">",
+                    "value": 0,
+                    "parentheses": "",
+                }
+            ]
+        }
+
+        assert ConditionalsGenerator.generate_typescript_code(
+            conditional_by_name, memoize_context_ids=True
+        ) == ConditionalsGenerator.generate_typescript_code(conditional_by_name)
+
+
+class TestDuplicateConditionals:
+    @staticmethod
+    def _rows(value, value_when_hidden=None, logical_operator="") -> list[dict]:
+        """Rows of a conditional comparing household.size with value, then the car number."""
+        first_row = {
+            "logical_operator": logical_operator,
+            "path": "household.size",
+            "comparison_operator": "===",
+            "value": value,
+            "parentheses": "",
+        }
+        if value_when_hidden is not None:
+            first_row["value_when_hidden"] = value_when_hidden
+        return [
+            first_row,
+            {
+                "logical_operator": "&&",
+                "path": "household.carNumber",
+                "comparison_operator": ">",
+                "value": 0,
+                "parentheses": None,
+            },
+        ]
+
+    def test_finds_the_conditionals_with_the_same_expression(self):
+        """Cells emitted as the same TypeScript (e.g. "1" and 1, "" and None) are the same expression."""
+        conditional_by_name = {
+            "condA": self._rows("1"),
+            "condB": self._rows(1, logical_operator=None),
+            "condC": self._rows(2),
+            "condD": self._rows(1, value_when_hidden=False),
+            "condE": self._rows("2.0"),
+            "condF": self._rows(1, value_when_hidden="false"),
+        }
+
+        assert ConditionalsGenerator.get_duplicate_conditionals(
+            conditional_by_name
+        ) == {"condB": "condA", "condE": "condC", "condF": "condD"}
+
+    def test_emits_the_duplicates_as_aliases(self):
+        conditional_by_name = {
+            "condA": self._rows(1),
+            "condB": self._rows(1),
+        }
+
+        ts_code = ConditionalsGenerator.generate_typescript_code(conditional_by_name)
+
+        assert ts_code.count("return checkConditionals({") == 1
+        assert (
+            "export const condB: WidgetConditional = condA; // Same conditional\n"
+            in ts_code
+        )
+        assert ts_code.index("export const condA") < ts_code.index("export const condB")
+
+    def test_normalises_the_whitespace_and_the_outer_parentheses(self):
+        """Trimmed cells and parentheses around all the rows give the same expression."""
+        rows = self._rows(1)
+        spaced_rows = [
+            {**rows[0], "path": " household.size ", "parentheses": "("},
+            {**rows[1], "logical_operator": "&& ", "parentheses": ")"},
+        ]
+        table = [
+            {"conditional_name": name, **row}
+            for name, name_rows in (("condA", rows), ("condB", spaced_rows))
+            for row in name_rows
+        ]
+
+        conditional_by_name = ConditionalsGenerator.extract_conditionals_from_data(
+            table
+        )
+
+        assert conditional_by_name["condB"][0]["path"] == "household.size"
+        assert ConditionalsGenerator.get_duplicate_conditionals(
+            conditional_by_name
+        ) == {"condB": "condA"}
+
+    def test_keeps_the_inner_parentheses_and_the_order_of_the_rows(self):
+        rows = self._rows(1)
+        inner_rows = rows + [
+            {
+                "logical_operator": "||",
+                "path": "household.bicycleNumber",
+                "comparison_operator": ">",
+                "value": 0,
+                "parentheses": None,
+            }
+        ]
+        # (a && b) || c is not a && b || c with parentheses around all the rows
+        grouped_rows = [
+            {**inner_rows[0], "parentheses": "("},
+            {**inner_rows[1], "parentheses": ")"},
+            inner_rows[2],
+        ]
+        conditional_by_name = {
+            "condA": rows,
+            "condB": [
+                {**rows[1], "logical_operator": ""},
+                {**rows[0], "logical_operator": "&&"},
+            ],
+            "condC": inner_rows,
+            "condD": grouped_rows,
+        }
+
+        assert (
+            ConditionalsGenerator.get_duplicate_conditionals(conditional_by_name) == {}
+        )
+
+    def test_emits_every_implementation_without_alias_duplicates(self):
+        conditional_by_name = {
+            "condA": self._rows(1),
+            "condB": self._rows(1),
+        }
+
+        ts_code = ConditionalsGenerator.generate_typescript_code(
+            conditional_by_name, alias_duplicates=False
+        )
+
+        assert ts_code.count("return checkConditionals({") == 2
+        assert "// Same conditional" not in ts_code
+
 
 class TestCheckConditionalsSheet:
     """
@@ -558,6 +762,113 @@ class TestCheckConditionalsSheet:
         )
 
 
+class TestCheckWithMessagesCache:
+    """Tests for the incremental check of check_with_messages with use_cache."""
+
+    HEADERS = tuple(ConditionalsGenerator.CONDITIONALS_ALL_HEADERS)
+    ROWS = [
+        ("condA", None, "household.size", "===", 1, None, None),
+        ("condB", None, "household.size", "===", 2, "(", None),
+        ("condA", "&&", "household.carNumber", ">", 0, None, None),
+        ("condB", "||", "household.carNumber", "===", 0, ")", None),
+    ]
+
+    def _check(self, rows, tmp_path, use_cache=True):
+        snapshot = WorkbookSnapshot(
+            "survey.xlsx", {"Conditionals": [self.HEADERS] + rows}
+        )
+        return ConditionalsGenerator().check_with_messages(
+            snapshot, use_cache=use_cache, cache_folder_path=str(tmp_path)
+        )
+
+    @staticmethod
+    def _replace(rows, index, **values):
+        """Copy the rows, with new values in the columns of one row."""
+        headers = ConditionalsGenerator.CONDITIONALS_ALL_HEADERS
+        row = list(rows[index])
+        for header, value in values.items():
+            row[headers.index(header)] = value
+        return rows[:index] + [tuple(row)] + rows[index + 1 :]
+
+    def test_gives_the_same_messages_as_a_full_check_after_each_edit(self, tmp_path):
+        edits = [
+            self.ROWS,
+            self.ROWS,
+            # Cross-row issue in condB only
+            self._replace(self.ROWS, 3, parentheses=None),
+            # Row issue, the cross-row checks are skipped
+            self._replace(self.ROWS, 0, comparison_operator="=="),
+            # Back to the cross-row issue, then fixed
+            self._replace(self.ROWS, 3, parentheses=None),
+            self.ROWS,
+            # Inserted row, shifting the row numbers of the messages
+            [("condC", "&&", "household.size", "===", 3, None, "a")]
+            + self._replace(self.ROWS, 3, parentheses=None),
+        ]
+        for rows in edits:
+            assert self._check(rows, tmp_path) == self._check(
+                rows, tmp_path, use_cache=False
+            )
+
+    def test_validates_again_only_the_changed_rows_and_groups(
+        self, tmp_path, monkeypatch
+    ):
+        self._check(self.ROWS, tmp_path)
+        validated_rows = []
+        checked_rows = []
+        collect_row_issues = ConditionalsGenerator._collect_row_issues
+        get_conditional_rules_issues = (
+            ConditionalsGenerator._get_conditional_rules_issues
+        )
+
+        def spy_collect_row_issues(self, row_dict, row_number):
+            validated_rows.append(row_number)
+            return collect_row_issues(self, row_dict, row_number)
+
+        def spy_get_conditional_rules_issues(row_data, rules):
+            checked_rows.extend(row_number for row_number, _row_dict in row_data)
+            return get_conditional_rules_issues(row_data, rules)
+
+        monkeypatch.setattr(
+            ConditionalsGenerator,
+            "_collect_row_issues",
+            spy_collect_row_issues,
+        )
+        monkeypatch.setattr(
+            ConditionalsGenerator,
+            "_get_conditional_rules_issues",
+            staticmethod(spy_get_conditional_rules_issues),
+        )
+
+        integrity_ok, messages = self._check(
+            self._replace(self.ROWS, 3, parentheses=None), tmp_path
+        )
+
+        assert not integrity_ok
+        assert messages == [
+            "Error in Conditionals sheet - Unbalanced parentheses for conditional_name 'condB' (e.g. row 5): "
+            "1 unclosed opening parenthesis/parentheses."
+        ]
+        assert validated_rows == [5]
+        assert checked_rows == [3, 5]
+
+    def test_ignores_the_cache_of_other_checks(self, tmp_path, monkeypatch):
+        self._check(self.ROWS, tmp_path)
+        validated_rows = []
+        monkeypatch.setattr(
+            conditionals_generator, "_get_checks_signature", lambda: "other checks"
+        )
+        monkeypatch.setattr(
+            ConditionalsGenerator,
+            "_collect_row_issues",
+            lambda self, row_dict, row_number: validated_rows.append(row_number) or [],
+        )
+
+        self._check(self.ROWS, tmp_path)
+
+        assert validated_rows == [2, 3, 4, 5]
+
+
 class TestExtractConditionalsFromData:
     """
     Regression test: extract_conditionals_from_data must not depend on column order.
@@ -582,9 +893,8 @@ class TestExtractConditionalsFromData:
         ]
         try:
             workbook = create_mocked_excel_data("Conditionals", headers, rows)
-            sheet = workbook["Conditionals"]
             extracted = ConditionalsGenerator.extract_conditionals_from_data(
-                list(sheet.rows), headers
+                get_workbook_snapshot(workbook).get_table("Conditionals")
             )
             assert extracted["cond1"] == [
                 {
@@ -850,6 +1160,113 @@ class TestValidateConditionalsParenthesesBalance:
         ]
 
 
+class TestRunConditionalRules:
+    """Unit tests for the single-pass rules engine of the cross-row validations."""
+
+    class RecordingRule(_ConditionalRule):
+        """Rule recording its events, with one issue per group end."""
+
+        def __init__(self, events: list, issue: str):
+            self.events = events
+            self.issue = issue
+
+        def on_row(self, state, name, row_number, row_dict, is_first_row):
+            self.events.append(("row", name, row_number, is_first_row))
+            return []
+
+        def on_group_end(self, state, name):
+            self.events.append(("end", name))
+            return [
+                ValidationIssue(
+                    sheet="Conditionals",
+                    row=None,
+                    column=None,
+                    rule=self.issue,
+                    message=f"{self.issue} {name}",
+                )
+            ]
+
+    def test_dispatches_each_row_once_to_every_rule(self):
+        """Each rule gets every row once with its group, then the end of each group."""
+        first_events, second_events = [], []
+        row_data = [
+            (2, {"conditional_name": "condA"}),
+            (3, {"conditional_name": "condB"}),
+            (4, {"conditional_name": "condA"}),
+        ]
+        checker = ConditionalsGenerator()
+
+        checker._run_conditional_rules(
+            row_data,
+            (
+                self.RecordingRule(first_events, "first"),
+                self.RecordingRule(second_events, "second"),
+            ),
+        )
+
+        assert first_events == [
+            ("row", "condA", 2, True),
+            ("row", "condB", 3, True),
+            ("row", "condA", 4, False),
+            ("end", "condA"),
+            ("end", "condB"),
+        ]
+        assert second_events == first_events
+        # Issues are ordered by rule, then by group
+        assert checker._validation_errors == [
+            "first condA",
+            "first condB",
+            "second condA",
+            "second condB",
+        ]
+
+    def test_default_rules_collect_every_issue(self):
+        """The registered rules report their issues for the same rows, in the order of the rules."""
+        row_data = [
+            (2, {"conditional_name": "condA", "logical_operator": "&&"}),
+            (3, {"conditional_name": "condB", "parentheses": "("}),
+            (4, {"conditional_name": "condA", "value_when_hidden": "a"}),
+            (5, {"conditional_name": "condA", "logical_operator": "||"}),
+            (6, {"conditional_name": "condA", "value_when_hidden": "b"}),
+        ]
+        checker = ConditionalsGenerator()
+
+        checker._validate_conditional_logic(row_data)
+
+        prefix = "Error in Conditionals sheet - "
+        assert checker._validation_errors == [
+            f"{prefix}Unbalanced parentheses for conditional_name 'condB' (e.g. row 3): "
+            "1 unclosed opening parenthesis/parentheses.",
+            f"{prefix}Invalid logical_operator in row 2: "
+            "first row of a conditional must have empty logical_operator, got '&&'",
+            f"{prefix}Missing logical_operator in row 4: "
+            "non-first row of a conditional must have a logical_operator for conditional_name 'condA'",
+            f"{prefix}Missing logical_operator in row 6: "
+            "non-first row of a conditional must have a logical_operator for conditional_name 'condA'",
+            f"{prefix}Multiple value_when_hidden for conditional_name 'condA': ['a', 'b']",
+        ]
+        assert [
+            (issue.sheet, issue.row, issue.column, issue.rule)
+            for issue in checker._validation_issues
+        ] == [
+            ("Conditionals", 3, "parentheses", "parentheses_balance"),
+            ("Conditionals", 2, "logical_operator", "first_row_logical_operator"),
+            (
+                "Conditionals",
+                4,
+                "logical_operator",
+                "logical_operator_on_non_first_rows",
+            ),
+            (
+                "Conditionals",
+                6,
+                "logical_operator",
+                "logical_operator_on_non_first_rows",
+            ),
+            ("Conditionals", None, "value_when_hidden", "unique_value_when_hidden"),
+        ]
+
+
 class TestValidateConditionalsFirstRowNoLogicalOperator:
     """
     Unit tests for _validate_conditionals_first_row_no_logical_operator.
@@ -1051,6 +1468,59 @@ class TestExpandTokenizedPath:
         )
 
 
+class TestPathTokenExpander:
+    def test_returns_the_tokens_template_path_and_id_vars_in_one_pass(self):
+        expander = _get_path_token_expander(
+            ConditionalsGenerator.CONDITIONALS_CURRENT_CONTEXT_SPECS
+        )
+
+        assert expander.expand("${currentVisitedPlace}.activity") == _PathExpansion(
+            tokens=("${currentVisitedPlace}",),
+            template_path="`household.persons.${currentPersonId}.journeys.${currentJourneyId}"
+            ".visitedPlaces.${currentVisitedPlaceId}.activity`",
+            id_vars=frozenset(
+                {"currentPersonId", "currentJourneyId", "currentVisitedPlaceId"}
+            ),
+        )
+        assert expander.expand("${currentTrip}.x.${relativePath}") == _PathExpansion(
+            tokens=("${relativePath}", "${currentTrip}"),
+            template_path="`${currentTrip}.x.${relativePath}`",
+            id_vars=frozenset({"currentPersonId", "currentJourneyId", "currentTripId"}),
+        )
+        assert expander.expand("household.size") == _PathExpansion(
+            tokens=(), template_path=None, id_vars=frozenset()
+        )
+
+    def test_compiles_the_specs_once_and_caches_each_path(self):
+        specs = ({"token": "${currentPerson}", "prefix": "persons.${personId}."},)
+        expander = _get_path_token_expander(specs)
+
+        assert _get_path_token_expander(specs) is expander
+        assert expander.expand("${currentPerson}.age") is expander.expand(
+            "${currentPerson}.age"
+        )
+        assert (
+            _get_path_token_expander(
+                ConditionalsGenerator.CONDITIONALS_CURRENT_CONTEXT_SPECS
+            )
+            is not expander
+        )
+
+    def test_caches_the_expanders_by_content_of_the_specs(self):
+        specs = ({"token": "${currentPerson}", "prefix": "persons.${personId}."},)
+        expander = _get_path_token_expander(specs)
+
+        # Equal specs built again share the expander
+        assert _get_path_token_expander((dict(specs[0]),)) is expander
+
+        # A spec changed in place gets a new expander
+        specs[0]["prefix"] = "people.${personId}."
+        assert (
+            _get_path_token_expander(specs).expand("${currentPerson}.age").template_path
+            == "`people.${personId}.age`"
+        )
+
+
 class TestCurrentContextVarsNeeded:
     @pytest.mark.parametrize(
         "case",
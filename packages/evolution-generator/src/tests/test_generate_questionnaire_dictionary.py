@@ -2,6 +2,7 @@
 # This file is licensed under the MIT License.
 # License text available at https://opensource.org/licenses/MIT
 
+from helpers.generator_helpers import SheetTable
 from scripts.generate_questionnaire_dictionary import process_choices
 
 CHOICES_HEADERS = [
@@ -16,11 +17,6 @@ CHOICES_HEADERS = [
 ]
 
 
-class MockCell:
-    def __init__(self, value):
-        self.value = value
-
-
 def choices_row(**kwargs):
     header_aliases = {
         "label_en": "label::en",
@@ -31,23 +27,22 @@ def choices_row(**kwargs):
     }
     values = {header: None for header in CHOICES_HEADERS}
     values.update(normalized_kwargs)
-    return [MockCell(values[header]) for header in CHOICES_HEADERS]
+    return tuple(values[header] for header in CHOICES_HEADERS)
 
 
-def choices_data_rows(*rows):
-    """process_choices skips the first row, like Excel sheet data."""
-    return [[MockCell(header) for header in CHOICES_HEADERS], *rows]
+def choices_table(*rows):
+    return SheetTable(CHOICES_HEADERS, list(rows), "Choices")
 
 
 class TestProcessChoices:
     def test_includes_zero_value_in_dictionary(self):
-        rows = choices_data_rows(
+        table = choices_table(
             choices_row(choicesName="likert5", value=-2, label_en="Strongly disagree"),
             choices_row(choicesName="likert5", value=0, label_en="Neutral"),
             choices_row(choicesName="likert5", value=2, label_en="Strongly agree"),
         )
 
-        choices_map = process_choices(rows, CHOICES_HEADERS, "en", {})
+        choices_map = process_choices(table, "en", {})
 
         assert choices_map["likert5"] == [
             "-2 : Strongly disagree",
@@ -56,12 +51,12 @@ class TestProcessChoices:
         ]
 
     def test_skips_rows_without_value(self):
-        rows = choices_data_rows(
+        table = choices_table(
             choices_row(choicesName="yesNo", value="yes", label_en="Yes"),
             choices_row(choicesName="yesNo", value=None, label_en="Missing value"),
             choices_row(choicesName="yesNo", value=False, label_en="No"),
         )
 
-        choices_map = process_choices(rows, CHOICES_HEADERS, "en", {})
+        choices_map = process_choices(table, "en", {})
 
         assert choices_map["yesNo"] == ["yes : Yes", "False : No"]
@@ -0,0 +1,277 @@
+# Copyright 2026, Polytechnique Montreal and contributors
+# This file is licensed under the MIT License.
+# License text available at https://opensource.org/licenses/MIT
+
+import os
+import sys
+import threading
+import pytest
+import scripts.generate_survey as generate_survey_module
+from helpers.generator_helpers import WorkbookSnapshot
+from helpers.synthetic_workbook import (
+    SYNTHETIC_WORKBOOK_SCALES,
+    get_synthetic_sheets_rows,
+    save_synthetic_workbook,
+)
+from scripts.generate_survey import (
+    _read_config,
+    generate_surveys,
+    get_changed_sheets,
+    get_config_paths,
+    get_file_state,
+    get_survey_steps,
+    wait_for_file_change,
+)
+
+
+# Write a config file generating the sections of a survey in the folder
+def write_config_file(folder_path, excel_file_path) -> str:
+    os.makedirs(folder_path, exist_ok=True)
+    config_path = os.path.join(folder_path, "generatorConfigs.yaml")
+    with open(config_path, "w", encoding="utf-8") as file:
+        file.write(
+            f"survey_folder_path: {os.path.join(folder_path, 'survey')}\n"
+            f"excel_file_path: {excel_file_path}\n"
+            "enabled_scripts:\n"
+            "    generate_sections: true\n"
+        )
+    return config_path
+
+
+class TestWaitForFileChange:
+    def test_returns_once_the_changed_file_is_stable(self, tmp_path):
+        excel_file = tmp_path / "survey.xlsx"
+        excel_file.write_bytes(b"first save")
+        file_state = get_file_state(str(excel_file))
+
+        def save_twice():
+            excel_file.write_bytes(b"second save, partial")
+            excel_file.write_bytes(b"second save, complete")
+            os.utime(excel_file, ns=(10**18, 10**18))
+
+        timer = threading.Timer(0.05, save_twice)
+        timer.start()
+        new_state = wait_for_file_change(
+            str(excel_file), file_state, poll_interval=0.01, debounce_delay=0.05
+        )
+        timer.join()
+
+        assert new_state == (10**18, len(b"second save, complete"))
+
+    def test_waits_for_a_missing_file(self, tmp_path):
+        excel_file = tmp_path / "survey.xlsx"
+        assert get_file_state(str(excel_file)) is None
+
+        timer = threading.Timer(0.05, excel_file.write_bytes, args=(b"saved",))
+        timer.start()
+        new_state = wait_for_file_change(
+            str(excel_file), None, poll_interval=0.01, debounce_delay=0.02
+        )
+        timer.join()
+
+        assert new_state == get_file_state(str(excel_file))
+
+
+class TestGetChangedSheets:
+    def test_lists_changed_added_and_removed_sheets(self):
+        previous_snapshot = WorkbookSnapshot(
+            "survey.xlsx",
+            {
+                "Sections": [("section",), ("home",)],
+                "Widgets": [("questionName",), ("age",)],
+                "Old": [("key",)],
+            },
+        )
+        workbook_snapshot = WorkbookSnapshot(
+            "survey.xlsx",
+            {
+                "Sections": [("section",), ("home",)],
+                "Widgets": [("questionName",), ("gender",)],
+                "New": [("key",)],
+            },
+        )
+
+        assert get_changed_sheets(previous_snapshot, workbook_snapshot) == [
+            "Widgets",
+            "New",
+            "Old",
+        ]
+
+
+class TestGetConfigPaths:
+    def test_expands_the_patterns_once_per_file(self, tmp_path):
+        for region in ["north", "south"]:
+            (tmp_path / region).mkdir()
+            (tmp_path / region / "generatorConfigs.yaml").write_text("")
+
+        config_paths = get_config_paths(
+            [
+                str(tmp_path / "south" / "generatorConfigs.yaml"),
+                str(tmp_path / "*" / "generatorConfigs.yaml"),
+            ]
+        )
+
+        assert config_paths == [
+            str(tmp_path / "south" / "generatorConfigs.yaml"),
+            str(tmp_path / "north" / "generatorConfigs.yaml"),
+        ]
+
+    def test_raises_when_a_pattern_matches_nothing(self, tmp_path):
+        with pytest.raises(Exception, match="No config file matches"):
+            get_config_paths([str(tmp_path / "*" / "generatorConfigs.yaml")])
+
+
+class TestGenerateSurveys:
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_generates_every_survey_and_reports_the_failed_ones(
+        self, tmp_path, capsys, monkeypatch, jobs
+    ):
+        # Keep the parsed Excel cache out of the user cache folder
+        monkeypatch.setenv("GENERATOR_CACHE_FOLDER", str(tmp_path / "cache"))
+        excel_file_path = str(tmp_path / "survey.xlsx")
+        save_synthetic_workbook(
+            excel_file_path,
+            get_synthetic_sheets_rows(SYNTHETIC_WORKBOOK_SCALES["tiny"]),
+        )
+        config_paths = [
+            write_config_file(str(tmp_path / "north"), excel_file_path),
+            write_config_file(
+                str(tmp_path / "missing"), str(tmp_path / "missing.xlsx")
+            ),
+            write_config_file(str(tmp_path / "south"), excel_file_path),
+        ]
+
+        failed_config_paths = generate_surveys(config_paths, jobs=jobs)
+
+        assert failed_config_paths == [config_paths[1]]
+        for region in ["north", "south"]:
+            assert (
+                tmp_path / region / "survey" / "src" / "survey" / "sections.ts"
+            ).is_file()
+        output = capsys.readouterr().out
+        # The outputs of the surveys are printed in the order of the config files
+        assert output.index(f"survey of {config_paths[0]}") < output.index(
+            f"survey of {config_paths[2]}"
+        )
+        assert f"Error generating the survey of {config_paths[1]}" in output
+        assert (
+            "Generated 2 of 3 surveys, generated files: 2 created, 0 changed, 0 unchanged"
+            in output
+        )
+
+
+class TestScriptOptions:
+    def test_passes_the_options_of_a_script_to_its_step(self, tmp_path):
+        config_path = tmp_path / "generatorConfigs.yaml"
+        config_path.write_text(
+            "survey_folder_path: survey\n"
+            "excel_file_path: survey.xlsx\n"
+            "enabled_scripts:\n"
+            "    generate_conditionals: true\n"
+            "script_options:\n"
+            "    generate_conditionals:\n"
+            "        memoize_context_ids: true\n"
+        )
+        survey_folder_path, excel_file_path, enabled_scripts, script_options = (
+            _read_config(str(config_path))
+        )
+        workbook_snapshot = WorkbookSnapshot(
+            excel_file_path,
+            {"Sections": [("section",)], "Conditionals": [("conditional_name",)]},
+        )
+
+        steps = get_survey_steps(
+            survey_folder_path,
+            excel_file_path,
+            workbook_snapshot,
+            enabled_scripts,
+            script_options,
+        )
+
+        conditionals_step = next(
+            step for step in steps if step.name == "generate_conditionals"
+        )
+        assert conditionals_step.kwargs == {"memoize_context_ids": True}
+
+    def test_passes_the_jobs_of_the_widgets_to_their_step(self, tmp_path):
+        config_path = tmp_path / "generatorConfigs.yaml"
+        config_path.write_text(
+            "survey_folder_path: survey\n"
+            "excel_file_path: survey.xlsx\n"
+            "enabled_scripts:\n"
+            "    generate_widgets: true\n"
+            "script_options:\n"
+            "    generate_widgets:\n"
+            "        jobs: 4\n"
+        )
+        survey_folder_path, excel_file_path, enabled_scripts, script_options = (
+            _read_config(str(config_path))
+        )
+        workbook_snapshot = WorkbookSnapshot(
+            excel_file_path, {"Sections": [("section",)], "Widgets": [("section",)]}
+        )
+
+        steps = get_survey_steps(
+            survey_folder_path,
+            excel_file_path,
+            workbook_snapshot,
+            enabled_scripts,
+            script_options,
+        )
+
+        widgets_step = next(step for step in steps if step.name == "generate_widgets")
+        assert widgets_step.kwargs == {"jobs": 4}
+        assert widgets_step.run_kwargs == {}
+
+    def test_passes_the_jobs_of_the_command_to_the_widgets_step(self, tmp_path):
+        workbook_snapshot = WorkbookSnapshot(
+            "survey.xlsx", {"Sections": [("section",)], "Widgets": [("section",)]}
+        )
+
+        steps = get_survey_steps(
+            str(tmp_path / "survey"),
+            "survey.xlsx",
+            workbook_snapshot,
+            {"generate_widgets": True},
+            jobs=3,
+        )
+
+        widgets_step = next(step for step in steps if step.name == "generate_widgets")
+        # The number of workers does not change the files, so it is not in the manifest
+        assert widgets_step.kwargs == {}
+        assert widgets_step.run_kwargs == {"jobs": 3}
+
+    def test_jobs_argument_reaches_the_widgets_step(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("GENERATOR_CACHE_FOLDER", str(tmp_path / "cache"))
+        excel_file_path = str(tmp_path / "survey.xlsx")
+        save_synthetic_workbook(
+            excel_file_path,
+            get_synthetic_sheets_rows(SYNTHETIC_WORKBOOK_SCALES["tiny"]),
+        )
+        config_path = tmp_path / "generatorConfigs.yaml"
+        config_path.write_text(
+            f"survey_folder_path: {tmp_path / 'survey'}\n"
+            f"excel_file_path: {excel_file_path}\n"
+            "enabled_scripts:\n"
+            "    generate_widgets: true\n"
+        )
+        run_steps_calls = []
+        monkeypatch.setattr(
+            generate_survey_module,
+            "run_steps",
+            lambda steps, workbook_snapshot, jobs, **kwargs: run_steps_calls.append(
+                (steps, jobs)
+            ),
+        )
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            ["generateSurvey", "--config_path", str(config_path), "--jobs", "3"],
+        )
+
+        generate_survey_module.main()
+
+        [(steps, jobs)] = run_steps_calls
+        widgets_step = next(step for step in steps if step.name == "generate_widgets")
+        assert jobs == 3
+        assert widgets_step.run_kwargs == {"jobs": 3}
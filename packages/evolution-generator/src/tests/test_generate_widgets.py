@@ -33,6 +33,17 @@ from scripts.generate_widgets import (
     get_widgets_file_import_flags,
     GenderFields,
     generate_widgets,
+    generate_section_widgets,
+    get_gender_fields_by_section,
+    WIDGETS_HASHES_FILE_NAME,
+)
+import scripts.generate_widgets as generate_widgets_module
+from helpers.generator_helpers import WorkbookSnapshot
+from helpers.output_writer import MemoryOutputSink, use_output_sink
+from helpers.synthetic_workbook import (
+    SYNTHETIC_WORKBOOK_SCALES,
+    WIDGETS_HEADERS,
+    get_synthetic_sheets_rows,
 )
 
 # TODO: Test generate_widgets
@@ -1992,3 +2003,175 @@ def test_demo_generator_help_popup_from_excel(
     next_export = content.find("\nexport const ", start + 1)
     widget_block = content[start:] if next_export == -1 else content[start:next_export]
     assert f"helpPopup: customHelpPopup.{help_popup_name}" in widget_block
+
+
+# Columns of the Widgets rows of the generate_widgets tests, the other columns being empty
+WIDGETS_ROW_HEADERS = (
+    "questionName",
+    "inputType",
+    "section",
+    "path",
+    "label::fr",
+    "active",
+)
+
+
+# Generate the widgets of the rows in memory, returning the files by section and name
+def generate_widgets_in_memory(rows, output_sink=None, **kwargs) -> dict[str, str]:
+    sheet_rows = [
+        tuple(
+            dict(zip(WIDGETS_ROW_HEADERS, row)).get(header)
+            for header in WIDGETS_HEADERS
+        )
+        for row in rows
+    ]
+    snapshot = WorkbookSnapshot("", {"Widgets": [WIDGETS_HEADERS, *sheet_rows]})
+    output_sink = output_sink or MemoryOutputSink()
+    with use_output_sink(output_sink):
+        generate_widgets(snapshot, "/survey/widgets", **kwargs)
+    return {
+        os.path.relpath(path, os.path.abspath("/survey/widgets")): content.decode()
+        for path, content in output_sink.files.items()
+    }
+
+
+class TestGenerateWidgetsSections:
+    """Tests for the grouping of the Widgets rows by section in generate_widgets"""
+
+    def test_interleaved_section_rows_keep_the_sheet_order(self):
+        files = generate_widgets_in_memory(
+            [
+                ("first_a", "InfoText", "first", "a", "A", True),
+                ("second_a", "InfoText", "second", "a", "A", True),
+                ("first_b", "InfoText", "first", "b", "B", True),
+                ("ignored", "InfoText", None, "c", "C", True),
+            ]
+        )
+        assert sorted(files) == [
+            WIDGETS_HASHES_FILE_NAME,
+            "first/widgets.tsx",
+            "first/widgetsNames.ts",
+            "second/widgets.tsx",
+            "second/widgetsNames.ts",
+        ]
+        first_names = files["first/widgetsNames.ts"]
+        assert first_names.index("'first_a'") < first_names.index("'first_b'")
+        assert "second_a" not in first_names
+        assert "ignored" not in "".join(files.values())
+
+    def test_gender_field_is_used_from_its_section_on(self):
+        gendered_label = "Né{{gender:/e/·e}}"
+        files = generate_widgets_in_memory(
+            [
+                ("before_label", "InfoText", "before", "label", gendered_label, True),
+                ("person_gender", "String", "person", "gender", "Genre", True),
+                ("after_label", "InfoText", "after", "label", gendered_label, True),
+                ("before_other", "InfoText", "before", "other", "Autre", True),
+            ]
+        )
+        assert "activePerson?.gender" not in files["before/widgets.tsx"]
+        assert "activePerson?.gender" in files["after/widgets.tsx"]
+
+    def test_gender_fields_by_section(self):
+        rows_by_section = {
+            "before": [{"path": "label"}],
+            "person": [{"path": "sexAssignedAtBirth"}, {"path": "gender"}],
+            "after": [{"path": "label"}],
+        }
+        assert get_gender_fields_by_section(rows_by_section) == {
+            "before": GenderFields(),
+            "person": GenderFields(has_gender=True, has_sex_assigned_at_birth=True),
+            "after": GenderFields(has_gender=True, has_sex_assigned_at_birth=True),
+        }
+
+    def test_parallel_generation_writes_the_same_files(self):
+        sheets_rows = get_synthetic_sheets_rows(SYNTHETIC_WORKBOOK_SCALES["tiny"])
+        widgets_rows = sheets_rows["Widgets"]
+        rows = [
+            tuple(row[WIDGETS_HEADERS.index(header)] for header in WIDGETS_ROW_HEADERS)
+            for row in widgets_rows[1:]
+        ]
+        # Define the gender in the second section, used by the next sections only
+        rows.insert(
+            len(rows) // 2, ("gender", "String", "section1", "gender", "Genre", True)
+        )
+
+        files = generate_widgets_in_memory(rows, jobs=2)
+        assert files == generate_widgets_in_memory(rows)
+        assert len(files) == 2 * SYNTHETIC_WORKBOOK_SCALES["tiny"].sections + 1
+
+
+class TestGenerateWidgetsIncremental:
+    """Tests for the regeneration of the changed sections only in generate_widgets"""
+
+    ROWS = [
+        ("first_label", "InfoText", "first", "label", "Né{{gender:/e/·e}}", True),
+        ("person_gender", "String", "person", "gender", "Genre", True),
+        ("last_label", "InfoText", "last", "label", "Né{{gender:/e/·e}}", True),
+    ]
+
+    @pytest.fixture
+    def generated_sections(self, monkeypatch):
+        """Record the sections generated, by their first question name"""
+        generated_sections = []
+
+        def record_section_widgets(section_rows, gender_fields):
+            generated_sections.append(section_rows[0]["questionName"])
+            return generate_section_widgets(section_rows, gender_fields)
+
+        monkeypatch.setattr(
+            generate_widgets_module,
+            "generate_section_widgets",
+            record_section_widgets,
+        )
+        return generated_sections
+
+    def test_unchanged_sections_are_not_generated_again(self, generated_sections):
+        output_sink = MemoryOutputSink()
+        files = generate_widgets_in_memory(self.ROWS, output_sink)
+        assert generated_sections == ["first_label", "person_gender", "last_label"]
+
+        generated_sections.clear()
+        rows = [
+            *self.ROWS[:2],
+            ("last_label", "InfoText", "last", "other", "Autre", True),
+        ]
+        new_files = generate_widgets_in_memory(rows, output_sink)
+        assert generated_sections == ["last_label"]
+        assert new_files["first/widgets.tsx"] == files["first/widgets.tsx"]
+        assert "path: 'other'" in new_files["last/widgets.tsx"]
+
+    def test_gender_field_change_generates_the_next_sections(self, generated_sections):
+        output_sink = MemoryOutputSink()
+        generate_widgets_in_memory(self.ROWS, output_sink)
+
+        generated_sections.clear()
+        rows = [
+            self.ROWS[0],
+            ("person_gender", "String", "person", "sexAssignedAtBirth", "Sexe", True),
+            self.ROWS[2],
+        ]
+        generate_widgets_in_memory(rows, output_sink)
+        assert generated_sections == ["person_gender", "last_label"]
+
+    def test_edited_or_removed_files_are_generated_again(self, generated_sections):
+        output_sink = MemoryOutputSink()
+        files = generate_widgets_in_memory(self.ROWS, output_sink)
+
+        generated_sections.clear()
+        output_sink.files[os.path.abspath("/survey/widgets/first/widgets.tsx")] = b""
+        output_sink.remove("/survey/widgets/last/widgetsNames.ts")
+        new_files = generate_widgets_in_memory(self.ROWS, output_sink)
+        assert generated_sections == ["first_label", "last_label"]
+        assert new_files == files
+
+    def test_without_incremental_every_section_is_generated(self, generated_sections):
+        output_sink = MemoryOutputSink()
+        generate_widgets_in_memory(self.ROWS, output_sink)
+
+        generated_sections.clear()
+        files = generate_widgets_in_memory(
+            self.ROWS, MemoryOutputSink(), incremental=False
+        )
+        assert generated_sections == ["first_label", "person_gender", "last_label"]
+        assert WIDGETS_HASHES_FILE_NAME not in files
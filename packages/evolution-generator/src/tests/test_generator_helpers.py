@@ -2,10 +2,24 @@
 # This file is licensed under the MIT License.
 # License text available at https://opensource.org/licenses/MIT
 
+import openpyxl
+import pytest
+
 from helpers.generator_helpers import (
     INDENT,
+    MOCKER_EXCEL_FILE,
+    SheetTable,
+    WorkbookSnapshot,
+    create_mocked_excel_data,
+    delete_file_if_exists,
     generate_label_typescript_with_context,
+    get_data_from_excel,
+    get_excel_file_path,
     get_label_context_flags,
+    get_workbook_snapshot,
+    get_sections_names,
+    get_table_from_excel,
+    read_sheet_table,
 )
 
 
@@ -142,3 +156,195 @@ class TestGenerateLabelTypescriptWithContext:
             in result
         )
         assert "context: activePerson?.gender," in result
+
+
+class TestWorkbookSnapshot:
+    @pytest.fixture(autouse=True)
+    def mocked_excel_file(self):
+        create_mocked_excel_data(
+            "Sections",
+            ["section", "title_en"],
+            [["home", "Home"], ["end", "End"]],
+        )
+        yield
+        delete_file_if_exists(MOCKER_EXCEL_FILE)
+
+    def test_get_data_reads_rows_and_headers(self):
+        snapshot = WorkbookSnapshot(MOCKER_EXCEL_FILE)
+        rows, headers = snapshot.get_data("Sections")
+        assert headers == ["section", "title_en"]
+        assert rows == [("section", "title_en"), ("home", "Home"), ("end", "End")]
+
+    def test_get_data_reads_each_sheet_once(self):
+        snapshot = WorkbookSnapshot(MOCKER_EXCEL_FILE)
+        assert snapshot.get_data("Sections") is snapshot.get_data("Sections")
+        assert get_data_from_excel(snapshot, "Sections") is snapshot.get_data(
+            "Sections"
+        )
+
+    def test_helpers_reuse_the_given_snapshot(self):
+        snapshot = WorkbookSnapshot(MOCKER_EXCEL_FILE)
+        assert get_workbook_snapshot(snapshot) is snapshot
+        assert get_excel_file_path(snapshot) == MOCKER_EXCEL_FILE
+        assert get_excel_file_path(MOCKER_EXCEL_FILE) == MOCKER_EXCEL_FILE
+
+    def test_rejects_non_excel_files(self):
+        with pytest.raises(Exception) as e_info:
+            WorkbookSnapshot("survey.csv")
+        assert str(e_info.value).startswith("Invalid input file extension")
+
+    def test_get_table_returns_the_sheet_values_once(self):
+        snapshot = WorkbookSnapshot(MOCKER_EXCEL_FILE)
+        table = snapshot.get_table("Sections")
+        assert table.headers == ["section", "title_en"]
+        assert table.column("section") == ["home", "end"]
+        assert get_table_from_excel(snapshot, "Sections") is table
+
+    def test_reuses_the_tables_of_the_unchanged_sheets(self):
+        previous_snapshot = WorkbookSnapshot(
+            "survey.xlsx",
+            {
+                "Sections": [("section",), ("home",)],
+                "Widgets": [("questionName", "active"), ("age", 1)],
+            },
+        )
+        sections_table = previous_snapshot.get_table("Sections")
+        previous_snapshot.get_table("Widgets")
+        snapshot = WorkbookSnapshot(
+            "survey.xlsx",
+            {
+                "Sections": [("section",), ("home",)],
+                # True == 1, but it is not the same value in the generated files
+                "Widgets": [("questionName", "active"), ("age", True)],
+                "Choices": [("choicesName",)],
+            },
+        )
+
+        assert snapshot.reuse_unchanged_sheets(previous_snapshot) == ["Sections"]
+        assert snapshot.get_table("Sections") is sections_table
+        assert snapshot.get_table("Widgets").column("active") == [True]
+
+    def test_get_rows_raises_for_missing_sheet(self):
+        snapshot = WorkbookSnapshot(MOCKER_EXCEL_FILE)
+        with pytest.raises(KeyError):
+            snapshot.get_rows("Widgets")
+
+    def test_from_workbook_reads_loaded_workbook(self):
+        workbook = create_mocked_excel_data("Choices", ["choicesName"], [["yesNo"]])
+        snapshot = get_workbook_snapshot(workbook)
+        assert snapshot.sheetnames == ["Choices"]
+        assert snapshot.get_rows("Choices") == [("choicesName",), ("yesNo",)]
+
+
+class TestReadSheetTable:
+    @pytest.fixture
+    def formatted_excel_file(self):
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.title = "Widgets"
+        sheet.append(["questionName", "section", "label::en"])
+        sheet.append(["q1", "home", "Question 1"])
+        sheet.append([])  # Empty row in the middle of the data is kept
+        sheet.append(["q2", "home"])
+        # Stray formatting far below the data inflates max_row
+        sheet.cell(row=500, column=5).font = openpyxl.styles.Font(bold=True)
+        workbook.save(MOCKER_EXCEL_FILE)
+        yield MOCKER_EXCEL_FILE
+        delete_file_if_exists(MOCKER_EXCEL_FILE)
+
+    def test_stops_at_the_last_row_with_data(self, formatted_excel_file):
+        table = read_sheet_table(formatted_excel_file, "Widgets")
+        assert table.header_index == {"questionName": 0, "section": 1, "label::en": 2}
+        assert len(table) == 3
+        assert dict(table[0]) == {
+            "questionName": "q1",
+            "section": "home",
+            "label::en": "Question 1",
+        }
+        assert all(value is None for value in table[1].values())
+        assert table[2]["label::en"] is None
+
+    def test_columns_have_the_same_length(self, formatted_excel_file):
+        table = read_sheet_table(formatted_excel_file, "Widgets")
+        assert {len(table.column(header)) for header in table.headers} == {3}
+
+    def test_raises_for_missing_sheet(self, formatted_excel_file):
+        with pytest.raises(Exception) as e_info:
+            read_sheet_table(formatted_excel_file, "Choices")
+        assert str(e_info.value) == "Sheet with name Choices does not exist"
+
+
+class TestSheetTable:
+    HEADERS = ["section", "path", "label::en"]
+    ROWS = [
+        ("home", "home.region", "Region"),
+        ("household", "household.size", None),
+        ("home", "home.address", "Address"),
+        ("household", "household.carNumber", "Cars"),
+    ]
+
+    @pytest.fixture
+    def table(self):
+        return SheetTable(self.HEADERS, self.ROWS, "Widgets")
+
+    def test_rows_read_values_by_header(self, table):
+        row = table[1]
+        assert row["path"] == "household.size"
+        assert row.get("label::en") is None
+        assert row.get("missing", "default") == "default"
+        assert "path" in row and "missing" not in row
+        assert row.row_number == 3
+        with pytest.raises(KeyError):
+            row["missing"]
+
+    def test_rows_compare_like_dicts(self, table):
+        assert table[0] == {
+            "section": "home",
+            "path": "home.region",
+            "label::en": "Region",
+        }
+
+    def test_rows_do_not_have_a_dict(self, table):
+        with pytest.raises(AttributeError):
+            table[0].__dict__
+
+    def test_iterates_over_every_row(self, table):
+        assert [row["path"] for row in table] == [row[1] for row in self.ROWS]
+
+    def test_first_column_is_used_for_duplicated_headers(self):
+        table = SheetTable(["path", "path"], [("first", "second")])
+        assert table[0]["path"] == "first"
+
+    def test_short_rows_are_padded_with_none(self):
+        table = SheetTable(["section", "path"], [("home",), ("end", "end.path")])
+        assert table.column("path") == [None, "end.path"]
+
+    def test_column_raises_for_missing_header(self, table):
+        with pytest.raises(KeyError) as e_info:
+            table.column("choices")
+        assert "Missing header in Widgets sheet: choices" in str(e_info.value)
+
+    def test_unique_keeps_the_first_appearance_order(self, table):
+        assert table.unique("section") == ["home", "household"]
+
+    def test_where_and_filter_return_matching_rows(self, table):
+        assert [row.index for row in table.where("section", "home")] == [0, 2]
+        assert [
+            row.index for row in table.filter(lambda row: row["label::en"] is None)
+        ] == [1]
+
+    def test_group_by_keeps_the_rows_order(self, table):
+        groups = table.group_by("section")
+        assert list(groups) == ["home", "household"]
+        assert [row["path"] for row in groups["household"]] == [
+            "household.size",
+            "household.carNumber",
+        ]
+
+    def test_fill_empty_returns_a_new_table(self, table):
+        filled = table.fill_empty("")
+        assert filled[1]["label::en"] == ""
+        assert table[1]["label::en"] is None
+
+    def test_get_sections_names(self, table):
+        assert get_sections_names(table) == ["home", "household"]
@@ -0,0 +1,160 @@
+# Copyright 2026, Polytechnique Montreal and contributors
+# This file is licensed under the MIT License.
+# License text available at https://opensource.org/licenses/MIT
+
+import io
+import json
+import shutil
+import pytest
+from helpers.synthetic_workbook import (
+    SYNTHETIC_WORKBOOK_SCALES,
+    get_synthetic_sheets_rows,
+    save_synthetic_workbook,
+)
+from scripts.generator_worker import GeneratorWorker, WorkbookSnapshotCache
+
+
+@pytest.fixture
+def excel_file_path(tmp_path):
+    excel_file_path = str(tmp_path / "survey.xlsx")
+    save_synthetic_workbook(
+        excel_file_path, get_synthetic_sheets_rows(SYNTHETIC_WORKBOOK_SCALES["tiny"])
+    )
+    return excel_file_path
+
+
+# Send the requests to a worker and return its responses
+def serve(requests: list, worker=None) -> list[dict]:
+    input_stream = io.StringIO(
+        "".join(
+            (request if isinstance(request, str) else json.dumps(request)) + "\n"
+            for request in requests
+        )
+    )
+    output_stream = io.StringIO()
+    (worker or GeneratorWorker()).serve(input_stream, output_stream)
+    return [json.loads(line) for line in output_stream.getvalue().splitlines()]
+
+
+class TestWorkbookSnapshotCache:
+    def test_reuses_the_snapshot_of_the_same_content(self, tmp_path, excel_file_path):
+        copy_file_path = str(tmp_path / "upload.xlsx")
+        shutil.copyfile(excel_file_path, copy_file_path)
+        workbook_snapshots = WorkbookSnapshotCache(max_count=1)
+
+        snapshot = workbook_snapshots.get(excel_file_path)
+
+        assert workbook_snapshots.get(copy_file_path) is snapshot
+
+
+class TestGeneratorWorker:
+    def test_checks_the_excel_files(self, excel_file_path):
+        responses = serve(
+            [
+                {"id": 1, "command": "check", "excelFilePath": excel_file_path},
+                {"id": 2, "command": "ping"},
+            ]
+        )
+
+        assert responses == [
+            {
+                "id": 1,
+                "ok": True,
+                "integrityOk": True,
+                "excelFilePath": excel_file_path,
+                "errors": [],
+                "issues": [],
+                "maxErrorsReached": False,
+            },
+            {"id": 2, "ok": True},
+        ]
+
+    def test_stops_the_check_after_the_max_errors(self, tmp_path):
+        sheets_rows = get_synthetic_sheets_rows(SYNTHETIC_WORKBOOK_SCALES["tiny"])
+        headers, *rows = sheets_rows["Conditionals"]
+        # An invalid logical operator on every row
+        sheets_rows["Conditionals"] = [headers] + [
+            (row[0], "xor") + row[2:] for row in rows
+        ]
+        excel_file_path = str(tmp_path / "invalid.xlsx")
+        save_synthetic_workbook(excel_file_path, sheets_rows)
+
+        [response] = serve(
+            [
+                {
+                    "id": 1,
+                    "command": "check",
+                    "excelFilePath": excel_file_path,
+                    "maxErrors": 2,
+                }
+            ]
+        )
+
+        assert response["integrityOk"] is False
+        assert response["maxErrorsReached"] is True
+        assert len(response["errors"]) == 2
+        assert [issue["message"] for issue in response["issues"]] == response["errors"]
+        assert response["issues"][0] == {
+            "sheet": "Conditionals",
+            "row": 2,
+            "column": "logical_operator",
+            "rule": "column_value",
+            "message": response["errors"][0],
+        }
+
+    def test_answers_the_invalid_requests_with_an_error(self, tmp_path):
+        responses = serve(
+            [
+                "not json",
+                {"id": 1, "command": "unknown"},
+                {
+                    "id": 2,
+                    "command": "check",
+                    "excelFilePath": str(tmp_path / "missing.xlsx"),
+                },
+            ]
+        )
+
+        assert [response["ok"] for response in responses] == [False, False, False]
+        assert responses[1] == {
+            "id": 1,
+            "ok": False,
+            "error": "Unknown command: unknown",
+        }
+        assert responses[2]["id"] == 2
+
+    def test_stops_on_shutdown(self):
+        responses = serve(
+            [{"id": 1, "command": "shutdown"}, {"id": 2, "command": "ping"}]
+        )
+
+        assert responses == [{"id": 1, "ok": True}]
+
+    def test_generates_the_survey_in_memory(self, tmp_path, excel_file_path):
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(
+            f"survey_folder_path: {tmp_path / 'survey'}\n"
+            f"excel_file_path: {excel_file_path}\n"
+            "enabled_scripts:\n"
+            "    generate_excel: false\n"
+            "    generate_sections: true\n"
+        )
+
+        responses = serve(
+            [
+                {
+                    "id": 1,
+                    "command": "generate",
+                    "configPath": str(config_path),
+                    "inMemory": True,
+                }
+            ]
+        )
+
+        assert responses[0]["ok"] is True
+        assert "Excel integrity check passed" in responses[0]["output"]
+        assert responses[0]["generatedFiles"] == "1 created, 0 changed, 0 unchanged"
+        assert list(responses[0]["files"]) == [
+            str(tmp_path / "survey" / "src" / "survey" / "sections.ts")
+        ]
+        assert not (tmp_path / "survey").exists()
@@ -2,9 +2,10 @@
 # This file is licensed under the MIT License.
 # License text available at https://opensource.org/licenses/MIT
 
+import os
 from typing import NamedTuple
 
-from helpers.generator_helpers import add_generator_yaml_header
+from helpers.generator_helpers import WorkbookSnapshot, add_generator_yaml_header
 from scripts.labels_generator import LabelsGenerator, LabelFormatter
 import pytest
 from helpers.generator_helpers import create_mocked_excel_data, delete_file_if_exists
@@ -240,7 +241,11 @@ class TestAddTranslationsFromExcel:
         calls = []
 
         def mock_save_translation(
-            language, section, labels_output_folder_path, translations
+            language,
+            section,
+            labels_output_folder_path,
+            translations,
+            generated_files=None,
         ):
             calls.append((language, section, labels_output_folder_path, translations))
 
@@ -1229,6 +1234,72 @@ class TestSaveTranslations:
         assert not (tmp_path / "locales" / "fr" / "home.yaml").exists()
 
 
+class TestGenerateLabels:
+    """Tests for generate_labels function"""
+
+    SHEETS_WITH_LABELS = [
+        {"sheetName": "Widgets", "namespaceHeader": "section", "keyHeader": "key"},
+        {"sheetName": "Labels", "namespaceHeader": "namespace", "keyHeader": "key"},
+    ]
+    HEADERS = ("key", "label::fr", "label::en")
+
+    def make_snapshot(self, widgets_sections):
+        return WorkbookSnapshot(
+            "survey.xlsx",
+            {
+                "Widgets": [("section",) + self.HEADERS]
+                + [
+                    (section, "region", "Région?", "Region?")
+                    for section in widgets_sections
+                ],
+                "Labels": [
+                    ("namespace",) + self.HEADERS,
+                    ("home", "title", "Accueil", "Home"),
+                ],
+            },
+        )
+
+    def test_merges_sheets_and_keeps_unchanged_files(self, tmp_path, capsys):
+        labels_output_folder_path = str(tmp_path / "locales")
+        snapshot = self.make_snapshot(["home", "end"])
+        LabelsGenerator.generate_labels(
+            snapshot, labels_output_folder_path, self.SHEETS_WITH_LABELS
+        )
+        home_file = tmp_path / "locales" / "en" / "home.yaml"
+        content = home_file.read_text(encoding="utf-8")
+        assert "\nregion: Region?\n" in content
+        assert "\ntitle: Home\n" in content
+        os.utime(home_file, (1000, 1000))
+        capsys.readouterr()
+
+        LabelsGenerator.generate_labels(
+            snapshot, labels_output_folder_path, self.SHEETS_WITH_LABELS
+        )
+
+        assert home_file.read_text(encoding="utf-8") == content
+        assert os.path.getmtime(home_file) == 1000
+        assert f"Unchanged {home_file.as_posix()}" in capsys.readouterr().out
+
+    def test_deletes_files_of_sections_without_labels(self, tmp_path):
+        labels_output_folder_path = str(tmp_path / "locales")
+        LabelsGenerator.generate_labels(
+            self.make_snapshot(["home", "end"]),
+            labels_output_folder_path,
+            self.SHEETS_WITH_LABELS,
+        )
+        assert (tmp_path / "locales" / "fr" / "end.yaml").exists()
+
+        # The end section is still in the sheet, but without labels
+        snapshot = self.make_snapshot(["home"])
+        snapshot.get_rows("Widgets").append(("end", None, None, None))
+        LabelsGenerator.generate_labels(
+            snapshot, labels_output_folder_path, self.SHEETS_WITH_LABELS
+        )
+
+        assert not (tmp_path / "locales" / "fr" / "end.yaml").exists()
+        assert (tmp_path / "locales" / "fr" / "home.yaml").exists()
+
+
 # TODO: test generate_labels
 # TODO: test delete_all_labels_yaml_files (check that generate_labels() call this function only once)
 # TODO: test add_translation
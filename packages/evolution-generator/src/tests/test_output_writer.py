@@ -0,0 +1,175 @@
+# Copyright 2026, Polytechnique Montreal and contributors
+# This file is licensed under the MIT License.
+# License text available at https://opensource.org/licenses/MIT
+
+import os
+import pytest
+from helpers.output_writer import (
+    OUTPUT_CHANGED,
+    OUTPUT_CREATED,
+    OUTPUT_UNCHANGED,
+    MemoryOutputSink,
+    OutputCounts,
+    OutputSink,
+    get_output_counts,
+    get_output_sink,
+    reset_output_counts,
+    use_output_sink,
+    write_output_file,
+)
+from helpers.generator_helpers import WorkbookSnapshot
+from helpers.step_scheduler import GeneratorStep, run_steps
+
+
+@pytest.fixture(autouse=True)
+def output_counts():
+    reset_output_counts()
+    yield get_output_counts
+    reset_output_counts()
+
+
+# Step function writing a file, defined at the module level so the workers can run it
+def write_file(workbook_snapshot, output_file, content):
+    write_output_file(content, output_file)
+
+
+class TestWriteOutputFile:
+    def test_creates_changes_and_keeps_unchanged_files(self, tmp_path, output_counts):
+        output_file = str(tmp_path / "widgets.tsx")
+
+        assert write_output_file("const a = 1;\n", output_file) == OUTPUT_CREATED
+        assert write_output_file("const a = 2;\n", output_file) == OUTPUT_CHANGED
+        assert write_output_file("const a = 2;\n", output_file) == OUTPUT_UNCHANGED
+
+        assert (tmp_path / "widgets.tsx").read_bytes() == b"const a = 2;\n"
+        assert output_counts() == OutputCounts(
+            created=1, changed=1, unchanged=1, bytes_written=26
+        )
+
+    def test_unchanged_file_is_not_written(self, tmp_path):
+        output_file = tmp_path / "choices.tsx"
+        write_output_file("export const choices = {};\n", str(output_file))
+        os.utime(output_file, (1000, 1000))
+
+        write_output_file("export const choices = {};\n", str(output_file))
+
+        assert os.path.getmtime(output_file) == 1000
+
+    def test_same_size_with_different_bytes_is_written(self, tmp_path):
+        output_file = str(tmp_path / "sections.ts")
+        write_output_file("home", output_file)
+
+        assert write_output_file("end!", output_file) == OUTPUT_CHANGED
+        assert (tmp_path / "sections.ts").read_text() == "end!"
+
+    def test_replaces_line_endings(self, tmp_path):
+        output_file = str(tmp_path / "home.yaml")
+        write_output_file("home:\n    title: Home\n", output_file, newline="\r\n")
+
+        assert (tmp_path / "home.yaml").read_bytes() == b"home:\r\n    title: Home\r\n"
+        assert (
+            write_output_file("home:\n    title: Home\n", output_file, newline="\r\n")
+            == OUTPUT_UNCHANGED
+        )
+
+
+class TestOutputCounts:
+    def test_counts_of_steps_run_in_workers_are_added(self, tmp_path, output_counts):
+        (tmp_path / "unchanged.ts").write_text("same\n")
+        steps = [
+            GeneratorStep(
+                name=name,
+                function=write_file,
+                args=(str(tmp_path / f"{name}.ts"), "same\n"),
+                writes=(str(tmp_path / f"{name}.ts"),),
+            )
+            for name in ["unchanged", "created"]
+        ]
+
+        run_steps(steps, WorkbookSnapshot("survey.xlsx", {}), jobs=2)
+
+        assert output_counts() == OutputCounts(
+            created=1, changed=0, unchanged=1, bytes_written=5
+        )
+        assert str(output_counts()) == "1 created, 0 changed, 1 unchanged"
+
+
+class TestOutputSink:
+    def test_incomplete_sink_cannot_be_created(self):
+        class WriteOnlyOutputSink(OutputSink):
+            def write(self, output_file, content):
+                return OUTPUT_CREATED
+
+        with pytest.raises(TypeError, match="abstract"):
+            WriteOnlyOutputSink()
+
+
+class TestMemoryOutputSink:
+    def test_keeps_the_files_in_memory(self, tmp_path, output_counts):
+        output_sink = MemoryOutputSink()
+
+        with use_output_sink(output_sink):
+            assert get_output_sink() is output_sink
+            assert (
+                write_output_file("const a = 1;\n", str(tmp_path / "widgets.tsx"))
+                == OUTPUT_CREATED
+            )
+            write_output_file("a: 1\n", str(tmp_path / "locales" / "fr" / "home.yaml"))
+            assert (
+                write_output_file("const a = 1;\n", str(tmp_path / "widgets.tsx"))
+                == OUTPUT_UNCHANGED
+            )
+
+        assert get_output_sink() is not output_sink
+        assert os.listdir(tmp_path) == []
+        assert output_sink.get_text_files(str(tmp_path)) == {
+            "locales/fr/home.yaml": "a: 1\n",
+            "widgets.tsx": "const a = 1;\n",
+        }
+        assert output_counts() == OutputCounts(
+            created=2, changed=0, unchanged=1, bytes_written=18
+        )
+
+    def test_lists_and_removes_the_files(self, tmp_path):
+        output_sink = MemoryOutputSink()
+        output_sink.write(str(tmp_path / "Widgets.csv"), b"questionName\n")
+        output_sink.write(str(tmp_path / "Choices.csv"), b"choicesName\n")
+
+        assert output_sink.remove(str(tmp_path / "Choices.csv"))
+        assert not output_sink.remove(str(tmp_path / "Choices.csv"))
+        assert output_sink.list_files(str(tmp_path)) == ["Widgets.csv"]
+        assert output_sink.make_folder(str(tmp_path / "locales"))
+        assert not output_sink.make_folder(str(tmp_path / "locales"))
+
+    def test_reads_from_disk_and_lists_changed_paths(self, tmp_path):
+        (tmp_path / "unchanged.ts").write_text("same\n")
+        (tmp_path / "changed.ts").write_text("old\n")
+        (tmp_path / "stale.csv").write_text("old\n")
+        output_sink = MemoryOutputSink(read_from_disk=True)
+
+        assert output_sink.write(str(tmp_path / "unchanged.ts"), b"same\n") == (
+            OUTPUT_UNCHANGED
+        )
+        assert output_sink.write(str(tmp_path / "changed.ts"), b"new\n") == (
+            OUTPUT_CHANGED
+        )
+        assert output_sink.write(str(tmp_path / "created.ts"), b"new\n") == (
+            OUTPUT_CREATED
+        )
+        assert output_sink.list_files(str(tmp_path)) == [
+            "changed.ts",
+            "created.ts",
+            "stale.csv",
+            "unchanged.ts",
+        ]
+        assert output_sink.remove(str(tmp_path / "stale.csv"))
+
+        assert output_sink.read(str(tmp_path / "stale.csv")) is None
+        assert output_sink.get_changed_paths() == [
+            str(tmp_path / "changed.ts"),
+            str(tmp_path / "created.ts"),
+            str(tmp_path / "stale.csv"),
+        ]
+        # The disk is left untouched
+        assert (tmp_path / "changed.ts").read_text() == "old\n"
+        assert (tmp_path / "stale.csv").is_file()
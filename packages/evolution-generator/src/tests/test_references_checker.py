@@ -0,0 +1,209 @@
+# Copyright 2026, Polytechnique Montreal and contributors
+# This file is licensed under the MIT License.
+# License text available at https://opensource.org/licenses/MIT
+
+# Note: This file contains the tests of the references checker.
+from helpers.generator_helpers import WorkbookSnapshot
+from helpers.synthetic_workbook import (
+    SYNTHETIC_WORKBOOK_SCALES,
+    get_synthetic_sheets_rows,
+)
+from scripts.references_checker import ReferencesChecker, check_workbook_integrity
+
+WIDGETS_HEADERS = (
+    "questionName",
+    "inputType",
+    "active",
+    "conditional",
+    "choices",
+    "inputRange",
+)
+
+
+# Build a snapshot with the Widgets rows and the sheets defining the referenced names
+def get_snapshot(widgets_rows: list[tuple], choices_rows=None) -> WorkbookSnapshot:
+    return WorkbookSnapshot(
+        "survey.xlsx",
+        {
+            "Widgets": [WIDGETS_HEADERS] + widgets_rows,
+            "Conditionals": [
+                ("conditional_name", "logical_operator", "path"),
+                ("hasCarConditional", None, "household.carNumber"),
+                ("hasCarConditional", "&&", "household.size"),
+            ],
+            "Choices": [("choicesName", "value", "spreadChoicesName", "conditional")]
+            + (choices_rows or [("yesNoChoices", "yes", None, None)]),
+            "InputRange": [("inputRangeName",), ("agreementRange",)],
+        },
+    )
+
+
+class TestReferencesChecker:
+    def test_passes_when_every_reference_is_defined(self):
+        snapshot = get_snapshot(
+            [
+                ("q1", "Radio", True, "hasCarConditional", "yesNoChoices", None),
+                ("q2", "Range", True, None, None, "agreementRange"),
+                ("q3", "String", True, "hasCarCustomConditional", None, None),
+                ("q4", "Checkbox", True, None, "modesCustomChoices", None),
+            ],
+            choices_rows=[
+                ("yesNoChoices", "yes", None, "hasCarConditional"),
+                ("yesNoDontKnowChoices", None, "yesNoChoices", None),
+            ],
+        )
+
+        assert ReferencesChecker().check_with_messages(snapshot) == (True, [])
+
+    def test_reports_the_sheet_row_and_column_of_each_undefined_reference(self):
+        snapshot = get_snapshot(
+            [
+                ("q1", "Radio", True, "hasBikeConditional", "colorsChoices", None),
+                ("q2", "Range", True, None, None, "satisfactionRange"),
+            ],
+            choices_rows=[
+                ("yesNoChoices", "yes", None, "hasBikeConditional"),
+                ("yesNoDontKnowChoices", None, "noChoices", None),
+            ],
+        )
+
+        assert ReferencesChecker().check_with_messages(snapshot) == (
+            False,
+            [
+                "Error in Widgets sheet - Undefined reference in row 2, column conditional: "
+                "'hasBikeConditional' is not defined in the conditional_name column of the Conditionals sheet",
+                "Error in Widgets sheet - Undefined reference in row 2, column choices: "
+                "'colorsChoices' is not defined in the choicesName column of the Choices sheet",
+                "Error in Widgets sheet - Undefined reference in row 3, column inputRange: "
+                "'satisfactionRange' is not defined in the inputRangeName column of the InputRange sheet",
+                "Error in Choices sheet - Undefined reference in row 3, column spreadChoicesName: "
+                "'noChoices' is not defined in the choicesName column of the Choices sheet",
+                "Error in Choices sheet - Undefined reference in row 2, column conditional: "
+                "'hasBikeConditional' is not defined in the conditional_name column of the Conditionals sheet",
+            ],
+        )
+
+    def test_custom_suffixes_have_the_case_of_the_generators(self):
+        """The conditionals are custom with the exact suffix only, the choices with any case."""
+        snapshot = get_snapshot(
+            [
+                ("q1", "String", True, "hasCarCustomconditional", None, None),
+                ("q2", "Checkbox", True, None, "modesCUSTOMCHOICES", None),
+            ],
+            choices_rows=[("yesNoChoices", "yes", None, "hasBikecustomConditional")],
+        )
+
+        integrity_ok, messages = ReferencesChecker().check_with_messages(snapshot)
+
+        assert not integrity_ok
+        assert [message.split(": ", 1)[1] for message in messages] == [
+            "'hasCarCustomconditional' is not defined in the conditional_name column of the Conditionals sheet",
+            "'hasBikecustomConditional' is not defined in the conditional_name column of the Conditionals sheet",
+        ]
+
+    def test_ignores_the_references_that_are_not_generated(self):
+        """Inactive widgets and input types without choices or input range do not use the reference."""
+        snapshot = get_snapshot(
+            [
+                ("q1", "Radio", False, "hasBikeConditional", "colorsChoices", None),
+                ("q2", "InfoText", True, None, "colorsChoices", "satisfactionRange"),
+                ("q3", "Custom", True, "hasBikeConditional", None, None),
+            ]
+        )
+
+        assert ReferencesChecker().check_with_messages(snapshot) == (True, [])
+
+    def test_reports_the_references_to_a_missing_sheet(self):
+        snapshot = WorkbookSnapshot(
+            "survey.xlsx",
+            {
+                "Widgets": [
+                    WIDGETS_HEADERS,
+                    ("q1", "Range", True, None, None, "agreementRange"),
+                ]
+            },
+        )
+
+        integrity_ok, messages = ReferencesChecker().check_with_messages(snapshot)
+
+        assert not integrity_ok
+        assert messages == [
+            "Error in Widgets sheet - Undefined reference in row 2, column inputRange: "
+            "'agreementRange' is not defined in the inputRangeName column of the InputRange sheet"
+        ]
+
+
+class TestCheckWorkbookIntegrity:
+    def test_passes_for_a_synthetic_workbook(self):
+        snapshot = WorkbookSnapshot(
+            "survey.xlsx",
+            get_synthetic_sheets_rows(SYNTHETIC_WORKBOOK_SCALES["tiny"]),
+        )
+
+        assert check_workbook_integrity(snapshot) == (True, [])
+
+    def test_reports_the_conditionals_and_references_issues(self):
+        sheets_rows = get_synthetic_sheets_rows(SYNTHETIC_WORKBOOK_SCALES["tiny"])
+        headers, first_row, *other_rows = sheets_rows["Conditionals"]
+        conditional_name = first_row[0]
+        # Rename the first conditional, with an invalid logical operator on its first row
+        sheets_rows["Conditionals"] = [
+            headers,
+            ("renamedConditional", "&&") + first_row[2:],
+            *(row for row in other_rows if row[0] != conditional_name),
+        ]
+
+        integrity_ok, messages = check_workbook_integrity(
+            WorkbookSnapshot("survey.xlsx", sheets_rows)
+        )
+
+        assert not integrity_ok
+        assert messages[0].startswith(
+            "Error in Conditionals sheet - Invalid logical_operator in row 2"
+        )
+        assert any(
+            f"'{conditional_name}' is not defined" in message
+            for message in messages[1:]
+        )
+
+    def test_streams_the_issues_in_the_order_of_the_messages(self):
+        snapshot = get_snapshot(
+            [
+                ("q1", "Radio", True, "hasBikeConditional", "colorsChoices", None),
+                ("q2", "Range", True, None, None, "satisfactionRange"),
+            ]
+        )
+        issues = []
+
+        integrity_ok, messages = check_workbook_integrity(
+            snapshot, on_issue=issues.append
+        )
+
+        assert not integrity_ok
+        assert [issue.message for issue in issues] == messages
+        # The snapshot Conditionals sheet has only the headers used by the references
+        assert [
+            (issue.sheet, issue.row, issue.column, issue.rule) for issue in issues
+        ] == [
+            ("Conditionals", None, None, "sheet_structure"),
+            ("Widgets", 2, "conditional", "undefined_reference"),
+            ("Widgets", 2, "choices", "undefined_reference"),
+            ("Widgets", 3, "inputRange", "undefined_reference"),
+        ]
+
+    def test_stops_after_the_max_errors(self):
+        snapshot = get_snapshot(
+            [
+                ("q1", "Radio", True, "hasBikeConditional", "colorsChoices", None),
+                ("q2", "Range", True, None, None, "satisfactionRange"),
+            ]
+        )
+        issues = []
+
+        integrity_ok, messages = check_workbook_integrity(
+            snapshot, on_issue=issues.append, max_errors=2
+        )
+
+        assert not integrity_ok
+        assert len(messages) == 2
+        assert [issue.message for issue in issues] == messages
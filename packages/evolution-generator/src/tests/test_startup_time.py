@@ -0,0 +1,119 @@
+# Copyright 2026, Polytechnique Montreal and contributors
+# This file is licensed under the MIT License.
+# License text available at https://opensource.org/licenses/MIT
+
+# Cold start of the verifyExcel and generateSurvey entry points, measured in a new
+# Python process with `python -X importtime`. The imports must stay under the
+# budget, in seconds, of GENERATOR_STARTUP_BUDGET (default 1.0).
+import os
+import subprocess
+import sys
+import pytest
+from helpers.synthetic_workbook import (
+    SYNTHETIC_WORKBOOK_SCALES,
+    get_synthetic_sheets_rows,
+    save_synthetic_workbook,
+)
+
+SRC_FOLDER_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STARTUP_BUDGET_SECONDS = float(os.getenv("GENERATOR_STARTUP_BUDGET", "1.0"))
+# Dependencies of generate_excel (SharePoint download), only needed when it runs
+SHAREPOINT_MODULES = ("office365", "msal", "cryptography", "requests")
+
+
+# Run the code in a new Python process, with the environment variables added,
+# returning the names of the imported modules and the total import time, in seconds
+def get_imports(
+    code: str, environment_variables: dict[str, str] | None = None
+) -> tuple[set[str], float]:
+    environment = dict(os.environ, **(environment_variables or {}))
+    environment["PYTHONPATH"] = os.pathsep.join(
+        [SRC_FOLDER_PATH] + [path for path in [os.getenv("PYTHONPATH")] if path]
+    )
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=environment,
+    )
+    assert process.returncode == 0, process.stderr
+
+    # Lines are "import time: <self us> | <cumulative us> | <module>", the
+    # imported modules indented by 2 spaces under the module importing them
+    module_names = set()
+    top_level_times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative_time, module_name = line.split("|")
+        if not cumulative_time.strip().isdigit():
+            continue  # Header line
+        module_names.add(module_name.strip())
+        if not module_name[1:].startswith(" "):
+            top_level_times[module_name.strip()] = int(cumulative_time) / 1_000_000
+
+    total_time = sum(top_level_times.values())
+    slowest_modules = sorted(top_level_times.items(), key=lambda item: -item[1])[:5]
+    print(
+        f"Imports took {total_time:.3f}s, slowest modules: "
+        + ", ".join(f"{name} {time:.3f}s" for name, time in slowest_modules)
+    )
+    return module_names, total_time
+
+
+# Get the SharePoint modules that were imported, matching their submodules too
+def get_sharepoint_modules(module_names: set[str]) -> list[str]:
+    return sorted(
+        module_name
+        for module_name in module_names
+        if module_name.split(".")[0] in SHAREPOINT_MODULES
+        or module_name == "scripts.generate_excel"
+    )
+
+
+@pytest.fixture(scope="module")
+def excel_file_path(tmp_path_factory):
+    excel_file_path = str(tmp_path_factory.mktemp("startup") / "survey.xlsx")
+    save_synthetic_workbook(
+        excel_file_path, get_synthetic_sheets_rows(SYNTHETIC_WORKBOOK_SCALES["tiny"])
+    )
+    return excel_file_path
+
+
+class TestStartupTime:
+    def test_verify_excel(self, tmp_path, excel_file_path):
+        # verifyExcel uses the parsed Excel cache, kept out of the user cache folder
+        module_names, total_time = get_imports(
+            "import sys\n"
+            f"sys.argv = ['verifyExcel', {excel_file_path!r}]\n"
+            "from scripts.generate_survey import verify_excel_cli_main\n"
+            "sys.exit(verify_excel_cli_main())\n",
+            {"GENERATOR_CACHE_FOLDER": str(tmp_path / "cache")},
+        )
+
+        assert get_sharepoint_modules(module_names) == []
+        assert total_time <= STARTUP_BUDGET_SECONDS
+
+    def test_generate_survey_only_labels(self, tmp_path, excel_file_path):
+        config_path = tmp_path / "config.yaml"
+        # generate_excel is enabled in the config, but not run with --only
+        config_path.write_text(
+            f"survey_folder_path: {tmp_path / 'survey'}\n"
+            f"excel_file_path: {excel_file_path}\n"
+            "enabled_scripts:\n"
+            "    generate_excel: true\n"
+            "    generate_labels: true\n"
+        )
+
+        module_names, total_time = get_imports(
+            "import sys\n"
+            "sys.argv = ['generateSurvey', '--config_path', "
+            f"{str(config_path)!r}, '--only', 'labels', '--no-cache']\n"
+            "from scripts.generate_survey import main\n"
+            "main()\n"
+        )
+
+        assert "scripts.labels_generator" in module_names
+        assert "scripts.generate_widgets" not in module_names
+        assert get_sharepoint_modules(module_names) == []
+        assert total_time <= STARTUP_BUDGET_SECONDS
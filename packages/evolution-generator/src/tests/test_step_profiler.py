@@ -0,0 +1,106 @@
+# Copyright 2026, Polytechnique Montreal and contributors
+# This file is licensed under the MIT License.
+# License text available at https://opensource.org/licenses/MIT
+
+import json
+import pytest
+from helpers.generator_helpers import WorkbookSnapshot
+from helpers.output_writer import reset_output_counts, write_output_file
+from helpers.step_profiler import StepProfile, StepProfiler
+from helpers.step_scheduler import GeneratorStep, run_steps
+
+WORKBOOK_SNAPSHOT = WorkbookSnapshot(
+    "survey.xlsx",
+    {
+        "Sections": [("section",), ("home",), ("end",)],
+        "Widgets": [("questionName",), ("age",)],
+    },
+)
+
+
+@pytest.fixture(autouse=True)
+def output_counts():
+    reset_output_counts()
+    yield
+    reset_output_counts()
+
+
+# Step function writing a file, defined at the module level so the workers can run it
+def write_file(workbook_snapshot, output_file, content):
+    write_output_file(content, output_file)
+
+
+class TestStepProfiler:
+    def test_measures_the_profiled_code(self, tmp_path):
+        profiler = StepProfiler()
+
+        with profiler.profile("generate_widgets", rows_read=12) as step_profile:
+            values = [str(index) for index in range(10000)]
+            write_output_file("const a = 1;\n", str(tmp_path / "widgets.tsx"))
+        del values
+
+        assert profiler.profiles == [step_profile]
+        assert step_profile.name == "generate_widgets"
+        assert step_profile.rows_read == 12
+        assert step_profile.bytes_written == len("const a = 1;\n")
+        assert step_profile.wall_time > 0
+        assert step_profile.memory_peak > 10000
+
+    def test_saves_a_cprofile_file_per_step(self, tmp_path):
+        profiler = StepProfiler(profile_folder_path=str(tmp_path / "profiles"))
+
+        with profiler.profile("generate_labels"):
+            sorted(range(100))
+
+        assert (tmp_path / "profiles" / "generate_labels.prof").is_file()
+
+    def test_prints_the_slowest_steps_first_and_writes_json(self, tmp_path, capsys):
+        json_file_path = str(tmp_path / "profile.json")
+        profiler = StepProfiler(json_file_path=json_file_path)
+        profiler.add(StepProfile(name="generate_widgets", wall_time=0.1))
+        profiler.add(StepProfile(name="generate_labels", wall_time=2.5))
+
+        profiler.report()
+
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[0].split() == [
+            "Step",
+            "Wall",
+            "(s)",
+            "CPU",
+            "(s)",
+            "Memory",
+            "(MB)",
+            "Rows",
+            "Bytes",
+        ]
+        assert lines[1].startswith("generate_labels ")
+        assert lines[2].startswith("generate_widgets ")
+        with open(json_file_path, encoding="utf-8") as file:
+            report = json.load(file)
+        assert [step["name"] for step in report["steps"]] == [
+            "generate_widgets",
+            "generate_labels",
+        ]
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_run_steps_profiles_each_step(self, tmp_path, jobs):
+        steps = [
+            GeneratorStep(
+                name=sheet_name,
+                function=write_file,
+                args=(str(tmp_path / f"{sheet_name}.ts"), sheet_name),
+                reads=(sheet_name,),
+                writes=(str(tmp_path / f"{sheet_name}.ts"),),
+            )
+            for sheet_name in ["Sections", "Widgets"]
+        ]
+        profiler = StepProfiler()
+
+        run_steps(steps, WORKBOOK_SNAPSHOT, jobs=jobs, profiler=profiler)
+
+        profiles = {profile.name: profile for profile in profiler.profiles}
+        assert sorted(profiles) == ["Sections", "Widgets"]
+        assert profiles["Sections"].rows_read == 2
+        assert profiles["Widgets"].rows_read == 1
+        assert profiles["Sections"].bytes_written == len("Sections")
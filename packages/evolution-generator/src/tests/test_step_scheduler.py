@@ -0,0 +1,150 @@
+# Copyright 2026, Polytechnique Montreal and contributors
+# This file is licensed under the MIT License.
+# License text available at https://opensource.org/licenses/MIT
+
+import time
+import pytest
+from helpers.generator_helpers import WorkbookSnapshot
+from helpers.step_scheduler import (
+    GeneratorStep,
+    StepError,
+    get_step_dependencies,
+    outputs_overlap,
+    run_steps,
+)
+
+WORKBOOK_SNAPSHOT = WorkbookSnapshot("survey.xlsx", {"Sections": [("section",)]})
+
+
+# Step functions are defined at the module level so the workers can run them
+def print_message(workbook_snapshot, message, delay=0.0):
+    time.sleep(delay)
+    print(f"{message} {workbook_snapshot.sheetnames}")
+
+
+def append_message(workbook_snapshot, messages, message):
+    messages.append(message)
+
+
+def fail(workbook_snapshot, message):
+    raise ValueError(message)
+
+
+def make_step(name, function=print_message, args=None, writes=(), **kwargs):
+    return GeneratorStep(
+        name=name,
+        function=function,
+        args=args if args is not None else (name,),
+        writes=writes,
+        **kwargs,
+    )
+
+
+class TestOutputsOverlap:
+    @pytest.mark.parametrize(
+        "first_path, second_path, expected",
+        [
+            ("survey/common/choices.tsx", "survey/common/choices.tsx", True),
+            ("survey/common/choices.tsx", "survey/common/inputRange.tsx", False),
+            ("survey/sections/*", "survey/sections/home/widgets.tsx", True),
+            (
+                "survey/sections/*/widgets.tsx",
+                "survey/sections/*/sectionConfigs.ts",
+                False,
+            ),
+            ("survey/sections.ts", "survey/sections/*", False),
+            ("locales/*/choices.yaml", "locales/*/home.yaml", False),
+            ("locales/fr", "locales/*/home.yaml", True),
+        ],
+    )
+    def test_outputs_overlap(self, first_path, second_path, expected):
+        assert outputs_overlap(first_path, second_path) == expected
+        assert outputs_overlap(second_path, first_path) == expected
+
+
+class TestGetStepDependencies:
+    def test_steps_wait_for_previous_steps_with_overlapping_outputs(self):
+        steps = [
+            make_step("folders", writes=("survey/sections/*",)),
+            make_step("sections", writes=("survey/sections.ts",)),
+            make_step("widgets", writes=("survey/sections/*/widgets.tsx",)),
+            make_step("configs", writes=("survey/sections/*/sectionConfigs.ts",)),
+        ]
+        assert get_step_dependencies(steps) == {
+            "folders": [],
+            "sections": [],
+            "widgets": ["folders"],
+            "configs": ["folders"],
+        }
+
+    def test_raises_for_duplicate_step_names(self):
+        with pytest.raises(Exception) as e_info:
+            get_step_dependencies([make_step("widgets"), make_step("widgets")])
+        assert str(e_info.value) == "Duplicate step name: widgets"
+
+
+class TestRunSteps:
+    def test_runs_steps_in_declared_order_with_one_job(self):
+        messages = []
+        steps = [
+            make_step(name, function=append_message, args=(messages, name))
+            for name in ["folders", "widgets", "labels"]
+        ]
+        run_steps(steps, WORKBOOK_SNAPSHOT, jobs=1)
+        assert messages == ["folders", "widgets", "labels"]
+
+    def test_prints_outputs_in_declared_order_with_many_jobs(self, capsys):
+        steps = [
+            make_step("slow", args=("slow", 0.3), writes=("a.ts",)),
+            make_step("fast", args=("fast",), writes=("b.ts",)),
+            make_step("after_slow", args=("after_slow",), writes=("a.ts",)),
+        ]
+        run_steps(steps, WORKBOOK_SNAPSHOT, jobs=3)
+        assert capsys.readouterr().out.splitlines() == [
+            "slow ['Sections']",
+            "fast ['Sections']",
+            "after_slow ['Sections']",
+        ]
+
+    def test_failed_step_skips_dependent_steps_only(self, capsys):
+        steps = [
+            make_step("broken", function=fail, args=("bad sheet",), writes=("a.ts",)),
+            make_step("dependent", writes=("a.ts",)),
+            make_step("independent", writes=("b.ts",)),
+        ]
+        with pytest.raises(StepError) as e_info:
+            run_steps(steps, WORKBOOK_SNAPSHOT, jobs=2)
+        assert str(e_info.value).startswith("Step broken failed:")
+        assert "ValueError: bad sheet" in str(e_info.value)
+        assert capsys.readouterr().out.splitlines() == [
+            "Skipped dependent: broken failed",
+            "independent ['Sections']",
+        ]
+
+    def test_skipped_steps_are_not_run(self):
+        messages = []
+        steps = [
+            make_step(name, function=append_message, args=(messages, name))
+            for name in ["folders", "widgets", "labels"]
+        ]
+        run_steps(
+            steps, WORKBOOK_SNAPSHOT, skip_step=lambda step: step.name == "widgets"
+        )
+        assert messages == ["folders", "labels"]
+
+    def test_skipped_steps_are_not_run_with_many_jobs(self, capsys):
+        steps = [
+            make_step("folders", writes=("a.ts",)),
+            make_step("widgets", writes=("a.ts",)),
+            make_step("labels", writes=("b.ts",)),
+        ]
+        run_steps(
+            steps,
+            WORKBOOK_SNAPSHOT,
+            jobs=2,
+            skip_step=lambda step: step.name == "folders",
+        )
+        assert capsys.readouterr().out.splitlines() == [
+            "widgets ['Sections']",
+            "labels ['Sections']",
+        ]
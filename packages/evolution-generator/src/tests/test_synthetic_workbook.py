@@ -0,0 +1,105 @@
+# Copyright 2026, Polytechnique Montreal and contributors
+# This file is licensed under the MIT License.
+# License text available at https://opensource.org/licenses/MIT
+
+import os
+from helpers.generator_helpers import WorkbookSnapshot
+from helpers.output_writer import MemoryOutputSink
+from helpers.synthetic_workbook import (
+    SYNTHETIC_WORKBOOK_SCALES,
+    get_synthetic_sheets_rows,
+    save_synthetic_workbook,
+)
+from scripts.generate_survey import (
+    SUPPORTED_SCRIPT_KEYS,
+    check_excel_integrity,
+    generate_survey_from_excel,
+)
+
+TINY_SCALE = SYNTHETIC_WORKBOOK_SCALES["tiny"]
+
+
+class TestGetSyntheticSheetsRows:
+    def test_has_the_rows_of_the_scale(self):
+        sheets_rows = get_synthetic_sheets_rows(TINY_SCALE)
+
+        # The first row of each sheet is its headers
+        assert len(sheets_rows["Sections"]) - 1 == TINY_SCALE.sections
+        assert len(sheets_rows["Widgets"]) - 1 == TINY_SCALE.widgets
+        assert len(sheets_rows["Conditionals"]) - 1 == TINY_SCALE.conditionals
+        assert len(sheets_rows["Choices"]) - 1 == TINY_SCALE.choices
+        assert len(sheets_rows["Labels"]) - 1 == TINY_SCALE.labels
+        assert len(sheets_rows["InputRange"]) - 1 == TINY_SCALE.input_ranges
+
+    def test_is_deterministic(self):
+        assert get_synthetic_sheets_rows(TINY_SCALE) == get_synthetic_sheets_rows(
+            TINY_SCALE
+        )
+        assert get_synthetic_sheets_rows(TINY_SCALE) != get_synthetic_sheets_rows(
+            TINY_SCALE, seed=1
+        )
+
+
+class TestSaveSyntheticWorkbook:
+    def test_saves_a_valid_workbook(self, tmp_path):
+        excel_file_path = str(tmp_path / "survey.xlsx")
+        sheets_rows = get_synthetic_sheets_rows(TINY_SCALE)
+
+        save_synthetic_workbook(excel_file_path, sheets_rows)
+        workbook_snapshot = WorkbookSnapshot(excel_file_path)
+
+        # The comparison operators starting with "=" are saved as text, not formulas
+        assert workbook_snapshot.get_rows("Conditionals") == [
+            tuple(row) for row in sheets_rows["Conditionals"]
+        ]
+        assert check_excel_integrity(workbook_snapshot)
+
+    def test_generates_the_survey(self, tmp_path):
+        excel_file_path = str(tmp_path / "survey.xlsx")
+        survey_folder_path = str(tmp_path / "survey")
+        save_synthetic_workbook(excel_file_path, get_synthetic_sheets_rows(TINY_SCALE))
+
+        generate_survey_from_excel(
+            survey_folder_path,
+            excel_file_path,
+            {
+                script_key: script_key != "generate_excel"
+                for script_key in SUPPORTED_SCRIPT_KEYS
+            },
+            use_cache=False,
+        )
+
+        assert os.path.isfile(
+            os.path.join(
+                survey_folder_path,
+                "src",
+                "survey",
+                "sections",
+                "section0",
+                "widgets.tsx",
+            )
+        )
+
+    def test_generates_the_survey_in_memory(self, tmp_path):
+        excel_file_path = str(tmp_path / "survey.xlsx")
+        survey_folder_path = str(tmp_path / "survey")
+        save_synthetic_workbook(excel_file_path, get_synthetic_sheets_rows(TINY_SCALE))
+        output_sink = MemoryOutputSink()
+
+        generate_survey_from_excel(
+            survey_folder_path,
+            excel_file_path,
+            {
+                script_key: script_key != "generate_excel"
+                for script_key in SUPPORTED_SCRIPT_KEYS
+            },
+            use_cache=False,
+            jobs=2,
+            output_sink=output_sink,
+        )
+
+        assert not os.path.exists(survey_folder_path)
+        generated_files = output_sink.get_text_files(survey_folder_path)
+        assert "src/survey/sections/section0/widgets.tsx" in generated_files
+        assert "locales/en/section0.yaml" in generated_files
+        assert generated_files["src/survey/sections.ts"].startswith("// ")
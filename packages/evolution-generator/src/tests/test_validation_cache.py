@@ -0,0 +1,82 @@
+# Copyright 2026, Polytechnique Montreal and contributors
+# This file is licensed under the MIT License.
+# License text available at https://opensource.org/licenses/MIT
+
+import os
+from helpers.validation_cache import (
+    get_group_hash,
+    get_validation_cache_file_path,
+    get_values_hash,
+    load_validation_cache,
+)
+
+
+class TestValuesHash:
+    def test_keeps_the_value_types_apart(self):
+        hashes = {get_values_hash((2, value)) for value in [1, 1.0, True, "1"]}
+
+        assert len(hashes) == 4
+
+    def test_group_hash_depends_on_the_rows_order(self):
+        first_hash, second_hash = get_values_hash((2,)), get_values_hash((3,))
+
+        assert get_group_hash([first_hash, second_hash]) != get_group_hash(
+            [second_hash, first_hash]
+        )
+
+
+class TestValidationCache:
+    def test_reads_the_issues_of_the_last_check(self, tmp_path):
+        cache = load_validation_cache("survey.xlsx", "checks", str(tmp_path))
+        cache.set_row_issues(b"row", ["row issue"])
+        cache.set_group_issues(b"group", [["rule issue"], []])
+        cache.save()
+
+        cache = load_validation_cache("survey.xlsx", "checks", str(tmp_path))
+
+        assert cache.get_row_issues(b"row") == ["row issue"]
+        assert cache.get_group_issues(b"group") == [["rule issue"], []]
+        assert cache.get_row_issues(b"other row") is None
+
+    def test_keeps_only_the_rows_of_the_last_check(self, tmp_path):
+        cache = load_validation_cache("survey.xlsx", "checks", str(tmp_path))
+        cache.set_row_issues(b"row", [])
+        cache.save()
+        cache = load_validation_cache("survey.xlsx", "checks", str(tmp_path))
+        cache.set_row_issues(b"changed row", [])
+        cache.save()
+
+        cache = load_validation_cache("survey.xlsx", "checks", str(tmp_path))
+
+        assert cache.get_row_issues(b"row") is None
+        assert cache.get_row_issues(b"changed row") == []
+
+    def test_keeps_the_groups_when_they_are_not_checked(self, tmp_path):
+        cache = load_validation_cache("survey.xlsx", "checks", str(tmp_path))
+        cache.set_group_issues(b"group", [[]])
+        cache.save()
+        # A check with row issues does not check the groups
+        load_validation_cache("survey.xlsx", "checks", str(tmp_path)).save()
+
+        cache = load_validation_cache("survey.xlsx", "checks", str(tmp_path))
+
+        assert cache.get_group_issues(b"group") == [[]]
+
+    def test_ignores_the_issues_of_other_checks(self, tmp_path):
+        cache = load_validation_cache("survey.xlsx", "checks", str(tmp_path))
+        cache.set_row_issues(b"row", [])
+        cache.save()
+
+        cache = load_validation_cache("survey.xlsx", "other checks", str(tmp_path))
+
+        assert cache.get_row_issues(b"row") is None
+
+    def test_cache_file_is_by_absolute_path(self, tmp_path):
+        assert get_validation_cache_file_path(
+            str(tmp_path), "survey.xlsx"
+        ) == get_validation_cache_file_path(
+            str(tmp_path), os.path.abspath("survey.xlsx")
+        )
+        assert get_validation_cache_file_path(
+            str(tmp_path), "survey.xlsx"
+        ) != get_validation_cache_file_path(str(tmp_path), "other.xlsx")
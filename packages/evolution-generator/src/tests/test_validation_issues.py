@@ -0,0 +1,73 @@
+# Copyright 2026, Polytechnique Montreal and contributors
+# This file is licensed under the MIT License.
+# License text available at https://opensource.org/licenses/MIT
+
+# Note: This file contains the tests of the validation issues stream.
+import pytest
+from helpers.validation_issues import (
+    IssueStream,
+    MaxErrorsReached,
+    ValidationIssue,
+    report_issue,
+)
+
+
+# Get an issue of the Conditionals sheet with a message
+def get_issue(message: str) -> ValidationIssue:
+    return ValidationIssue(
+        sheet="Conditionals",
+        row=2,
+        column="path",
+        rule="required_fields",
+        message=message,
+    )
+
+
+class TestIssueStream:
+    def test_sends_every_issue_without_max_errors(self):
+        received = []
+        issue_stream = IssueStream(received.append)
+
+        for index in range(3):
+            issue_stream(get_issue(f"issue {index}"))
+
+        assert [issue.message for issue in received] == [
+            "issue 0",
+            "issue 1",
+            "issue 2",
+        ]
+        assert issue_stream.count == 3
+        assert not issue_stream.max_errors_reached
+
+    def test_stops_after_the_max_errors(self):
+        received = []
+        issue_stream = IssueStream(received.append, max_errors=2)
+
+        issue_stream(get_issue("issue 0"))
+        issue_stream(get_issue("issue 1"))
+        assert not issue_stream.max_errors_reached
+        with pytest.raises(MaxErrorsReached):
+            issue_stream(get_issue("issue 2"))
+
+        assert [issue.message for issue in received] == ["issue 0", "issue 1"]
+        assert issue_stream.max_errors_reached
+
+    def test_report_issue_ignores_the_max_errors(self):
+        received = []
+        issue_stream = IssueStream(received.append, max_errors=1)
+
+        report_issue(issue_stream, get_issue("issue 0"))
+        report_issue(None, get_issue("issue 1"))
+
+        assert [issue.message for issue in received] == ["issue 0"]
+
+
+class TestValidationIssue:
+    def test_to_dict(self):
+        assert get_issue("Missing path").to_dict() == {
+            "sheet": "Conditionals",
+            "row": 2,
+            "column": "path",
+            "rule": "required_fields",
+            "message": "Missing path",
+        }
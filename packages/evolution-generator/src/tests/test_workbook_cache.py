@@ -0,0 +1,168 @@
+# Copyright 2026, Polytechnique Montreal and contributors
+# This file is licensed under the MIT License.
+# License text available at https://opensource.org/licenses/MIT
+
+import os
+import openpyxl
+import pytest
+from helpers.generator_helpers import (
+    MOCKER_EXCEL_FILE,
+    create_mocked_excel_data,
+    delete_file_if_exists,
+)
+from helpers.workbook_cache import (
+    CACHE_FILE_EXTENSION,
+    evict_cache_files,
+    get_cache_file_path,
+    get_file_sha256,
+    load_workbook_snapshot,
+)
+
+SECTIONS_HEADERS = ["section", "title_en"]
+
+
+@pytest.fixture
+def mocked_excel_file():
+    create_mocked_excel_data("Sections", SECTIONS_HEADERS, [["home", "Home"]])
+    yield MOCKER_EXCEL_FILE
+    delete_file_if_exists(MOCKER_EXCEL_FILE)
+
+
+@pytest.fixture
+def count_excel_parsing(monkeypatch):
+    """Count the calls to openpyxl.load_workbook made by the snapshots."""
+    calls = []
+    load_workbook = openpyxl.load_workbook
+
+    def counting_load_workbook(*args, **kwargs):
+        calls.append(args)
+        return load_workbook(*args, **kwargs)
+
+    monkeypatch.setattr(openpyxl, "load_workbook", counting_load_workbook)
+    return calls
+
+
+class TestLoadWorkbookSnapshot:
+    def test_unchanged_file_is_read_from_the_cache(
+        self, mocked_excel_file, count_excel_parsing, tmp_path
+    ):
+        first = load_workbook_snapshot(mocked_excel_file, cache_folder_path=tmp_path)
+        second = load_workbook_snapshot(mocked_excel_file, cache_folder_path=tmp_path)
+
+        assert len(count_excel_parsing) == 1
+        assert second.get_data("Sections") == first.get_data("Sections")
+        assert second.excel_file_path == mocked_excel_file
+        assert os.path.isfile(
+            get_cache_file_path(tmp_path, get_file_sha256(mocked_excel_file))
+        )
+
+    def test_changed_file_is_parsed_again(
+        self, mocked_excel_file, count_excel_parsing, tmp_path
+    ):
+        load_workbook_snapshot(mocked_excel_file, cache_folder_path=tmp_path)
+        create_mocked_excel_data("Sections", SECTIONS_HEADERS, [["end", "End"]])
+        snapshot = load_workbook_snapshot(mocked_excel_file, cache_folder_path=tmp_path)
+
+        assert len(count_excel_parsing) == 2
+        assert snapshot.get_table("Sections").column("section") == ["end"]
+
+    def test_no_cache_always_parses_the_file(
+        self, mocked_excel_file, count_excel_parsing, tmp_path
+    ):
+        load_workbook_snapshot(
+            mocked_excel_file, use_cache=False, cache_folder_path=tmp_path
+        )
+        load_workbook_snapshot(
+            mocked_excel_file, use_cache=False, cache_folder_path=tmp_path
+        )
+
+        assert len(count_excel_parsing) == 2
+        assert os.listdir(tmp_path) == []
+
+    def test_unreadable_cache_file_is_ignored(
+        self, mocked_excel_file, count_excel_parsing, tmp_path
+    ):
+        cache_file_path = get_cache_file_path(
+            tmp_path, get_file_sha256(mocked_excel_file)
+        )
+        with open(cache_file_path, "wb") as cache_file:
+            cache_file.write(b"not a cache file")
+
+        snapshot = load_workbook_snapshot(mocked_excel_file, cache_folder_path=tmp_path)
+
+        assert len(count_excel_parsing) == 1
+        assert snapshot.get_table("Sections").column("section") == ["home"]
+
+    def test_cache_file_that_cannot_be_touched_is_still_read(
+        self, mocked_excel_file, count_excel_parsing, tmp_path, monkeypatch
+    ):
+        load_workbook_snapshot(mocked_excel_file, cache_folder_path=tmp_path)
+
+        def utime(*args, **kwargs):
+            raise PermissionError("read-only cache folder")
+
+        monkeypatch.setattr(os, "utime", utime)
+        snapshot = load_workbook_snapshot(mocked_excel_file, cache_folder_path=tmp_path)
+
+        assert len(count_excel_parsing) == 1
+        assert snapshot.get_table("Sections").column("section") == ["home"]
+
+    def test_unwritable_cache_folder_is_ignored(
+        self, mocked_excel_file, count_excel_parsing, tmp_path, capsys
+    ):
+        # The cache folder cannot be created under a file
+        (tmp_path / "file").write_bytes(b"")
+        cache_folder_path = str(tmp_path / "file" / "cache")
+
+        first = load_workbook_snapshot(
+            mocked_excel_file, cache_folder_path=cache_folder_path
+        )
+        second = load_workbook_snapshot(
+            mocked_excel_file, cache_folder_path=cache_folder_path
+        )
+
+        assert len(count_excel_parsing) == 2
+        assert second.get_data("Sections") == first.get_data("Sections")
+        assert "Warning: could not write cache file" in capsys.readouterr().out
+
+
+class TestEvictCacheFiles:
+    def test_removes_least_recently_used_files_first(self, tmp_path):
+        for index, name in enumerate(["old", "middle", "recent"]):
+            file_path = tmp_path / f"{name}{CACHE_FILE_EXTENSION}"
+            file_path.write_bytes(b"x" * 100)
+            os.utime(file_path, (1000 + index, 1000 + index))
+        (tmp_path / "notes.txt").write_bytes(b"x" * 1000)
+
+        removed_files = evict_cache_files(tmp_path, max_size_bytes=250)
+
+        assert [os.path.basename(path) for path in removed_files] == [
+            f"old{CACHE_FILE_EXTENSION}"
+        ]
+        assert sorted(os.listdir(tmp_path)) == [
+            f"middle{CACHE_FILE_EXTENSION}",
+            "notes.txt",
+            f"recent{CACHE_FILE_EXTENSION}",
+        ]
+
+    def test_missing_cache_folder_removes_nothing(self, tmp_path):
+        assert evict_cache_files(tmp_path / "missing", max_size_bytes=0) == []
+
+    def test_keeps_the_files_that_cannot_be_removed(self, tmp_path, monkeypatch):
+        for index, name in enumerate(["locked", "old", "recent"]):
+            file_path = tmp_path / f"{name}{CACHE_FILE_EXTENSION}"
+            file_path.write_bytes(b"x" * 100)
+            os.utime(file_path, (1000 + index, 1000 + index))
+        remove = os.remove
+
+        def remove_unless_locked(file_path):
+            if os.path.basename(file_path).startswith("locked"):
+                raise PermissionError("not allowed")
+            remove(file_path)
+
+        monkeypatch.setattr(os, "remove", remove_unless_locked)
+        removed_files = evict_cache_files(tmp_path, max_size_bytes=250)
+
+        assert [os.path.basename(path) for path in removed_files] == [
+            f"old{CACHE_FILE_EXTENSION}"
+        ]